@@ -15,12 +15,14 @@ from app.database import Base
 from app.models import (
     User,
     Movie,
+    MovieExternalId,
     UserMovie,
     UserImage,
     Tag,
     MovieTag,
     Collection,
     CollectionMovie,
+    ImageMirror,
 )
 
 # this is the Alembic Config object, which provides
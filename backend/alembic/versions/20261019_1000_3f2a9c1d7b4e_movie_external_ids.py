@@ -0,0 +1,51 @@
+"""movie_external_ids
+
+Revision ID: 3f2a9c1d7b4e
+Revises: 9628abd51a8c
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f2a9c1d7b4e'
+down_revision: Union[str, None] = '9628abd51a8c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('movie_external_ids',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('movie_id', sa.Integer(), nullable=False),
+    sa.Column('source', sa.String(length=20), nullable=False),
+    sa.Column('external_id', sa.String(length=50), nullable=False),
+    sa.Column('created_at', sa.TIMESTAMP(), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['movie_id'], ['movies.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('source', 'external_id', name='uq_movie_external_id')
+    )
+    op.create_index(op.f('ix_movie_external_ids_id'), 'movie_external_ids', ['id'], unique=False)
+    op.create_index(op.f('ix_movie_external_ids_movie_id'), 'movie_external_ids', ['movie_id'], unique=False)
+
+    # 기존 movies의 외부 ID backfill
+    # 같은 외부 ID를 가진 중복 영화가 있으면 가장 먼저 생성된 영화(id가 작은 쪽)를 canonical로 사용
+    for source, column in (('tmdb', 'tmdb_id'), ('kobis', 'kobis_code'), ('kmdb', 'kmdb_id')):
+        op.execute(f"""
+            INSERT INTO movie_external_ids (movie_id, source, external_id)
+            SELECT id, '{source}', {column}::text
+            FROM movies
+            WHERE {column} IS NOT NULL
+            ORDER BY id
+            ON CONFLICT (source, external_id) DO NOTHING
+        """)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_movie_external_ids_movie_id'), table_name='movie_external_ids')
+    op.drop_index(op.f('ix_movie_external_ids_id'), table_name='movie_external_ids')
+    op.drop_table('movie_external_ids')
@@ -0,0 +1,44 @@
+"""image_mirrors
+
+Revision ID: 8b1e4d2f6a90
+Revises: 3f2a9c1d7b4e
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b1e4d2f6a90'
+down_revision: Union[str, None] = '3f2a9c1d7b4e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('image_mirrors',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('source_url', sa.Text(), nullable=False),
+    sa.Column('content_hash', sa.String(length=64), nullable=False),
+    sa.Column('kind', sa.String(length=20), nullable=False),
+    sa.Column('mirror_url', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.TIMESTAMP(), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('source_url')
+    )
+    op.create_index(op.f('ix_image_mirrors_id'), 'image_mirrors', ['id'], unique=False)
+    op.create_index(op.f('ix_image_mirrors_content_hash'), 'image_mirrors', ['content_hash'], unique=False)
+
+    op.add_column('movies', sa.Column('poster_mirror_url', sa.Text(), nullable=True))
+    op.add_column('movies', sa.Column('backdrop_mirror_url', sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('movies', 'backdrop_mirror_url')
+    op.drop_column('movies', 'poster_mirror_url')
+    op.drop_index(op.f('ix_image_mirrors_content_hash'), table_name='image_mirrors')
+    op.drop_index(op.f('ix_image_mirrors_id'), table_name='image_mirrors')
+    op.drop_table('image_mirrors')
@@ -0,0 +1,35 @@
+"""user_image_file_key
+
+Revision ID: c7d3a5e9f012
+Revises: 8b1e4d2f6a90
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d3a5e9f012'
+down_revision: Union[str, None] = '8b1e4d2f6a90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('user_images', sa.Column('file_key', sa.Text(), nullable=True))
+    op.create_index(op.f('ix_user_images_file_key'), 'user_images', ['file_key'], unique=False)
+
+    # 기존 이미지 backfill (이전 버전은 AWS 기본 도메인 URL만 사용)
+    op.execute(r"""
+        UPDATE user_images
+        SET file_key = substring(image_url from '\.amazonaws\.com/([^?]+)')
+        WHERE file_key IS NULL AND image_url LIKE '%.amazonaws.com/%'
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_user_images_file_key'), table_name='user_images')
+    op.drop_column('user_images', 'file_key')
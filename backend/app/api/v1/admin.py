@@ -0,0 +1,59 @@
+"""
+Admin API endpoints
+운영용 API (캐시 무효화 등) - X-Admin-Key 헤더 필요
+"""
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.middleware.auth_middleware import require_admin
+from app.services.cache_namespace import cache_namespace, NAMESPACE_SCHEMA_VERSIONS
+from app.schemas.common import BaseResponse
+
+router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin)])
+
+
+@router.post("/cache/namespaces/{namespace}/invalidate", response_model=BaseResponse[dict])
+async def invalidate_cache_namespace(namespace: str):
+    """
+    provider 캐시 네임스페이스 전체 무효화 (O(1))
+
+    - namespace: "kobis", "tmdb", "kmdb"
+    - generation 카운터를 올려서 기존 캐시 키를 더 이상 조회하지 않음
+    - 이전 캐시 항목은 TTL에 따라 자연 만료
+    """
+    if namespace not in NAMESPACE_SCHEMA_VERSIONS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid namespace. Must be one of: {', '.join(NAMESPACE_SCHEMA_VERSIONS)}"
+        )
+
+    generation = await cache_namespace.bump(namespace)
+
+    return BaseResponse(
+        success=True,
+        message=f"캐시 네임스페이스가 무효화되었습니다: {namespace}",
+        data={"namespace": namespace, "generation": generation}
+    )
+
+
+@router.post("/cache/movies/{source}/{movie_id}/invalidate", response_model=BaseResponse[dict])
+async def invalidate_movie_cache(source: str, movie_id: str):
+    """
+    특정 영화가 포함된 캐시 항목 무효화
+
+    - source: "kobis", "tmdb", "kmdb"
+    - movie_id: provider의 영화 ID
+    - 해당 영화의 메타데이터 캐시와 그 영화가 포함된 검색 결과 캐시를 삭제
+    """
+    if source not in NAMESPACE_SCHEMA_VERSIONS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid source. Must be one of: {', '.join(NAMESPACE_SCHEMA_VERSIONS)}"
+        )
+
+    deleted_count = await cache_namespace.invalidate_movie(source, movie_id)
+
+    return BaseResponse(
+        success=True,
+        message=f"영화 캐시가 무효화되었습니다: {source}/{movie_id}",
+        data={"source": source, "movie_id": movie_id, "deleted_count": deleted_count}
+    )
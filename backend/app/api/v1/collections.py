@@ -1,7 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func
+from sqlalchemy import and_, delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from typing import List
+from app.config import settings
 from app.database import get_db
 from app.middleware.auth_middleware import get_current_user
 from app.models.collection import Collection
@@ -9,15 +11,18 @@ from app.models.collection_movie import CollectionMovie
 from app.models.user_movie import UserMovie
 from app.models.movie import Movie
 from app.schemas.collection import (
-    CollectionCreate, CollectionUpdate, CollectionResponse, CollectionWithMovies
+    CollectionCreate, CollectionUpdate, CollectionResponse, CollectionWithMovies,
+    CollectionMoviesBatchRequest
 )
 from app.schemas.common import BaseResponse
 from app.services.auto_collection_service import auto_collection_service
+from app.services.response_cache import response_cache
 
 router = APIRouter(prefix="/collections", tags=["collections"])
 
 
 @router.get("/", response_model=List[CollectionResponse])
+@response_cache.cached("collections:list", List[CollectionResponse])
 async def get_user_collections(
     db: Session = Depends(get_db),
     user_id: str = Depends(get_current_user),
@@ -39,19 +44,7 @@ async def get_user_collections(
 
     result = []
     for collection, movie_count in collections:
-        collection_dict = CollectionResponse(
-            id=collection.id,
-            name=collection.name,
-            description=collection.description,
-            type=collection.type,
-            cover_image_url=collection.cover_image_url,
-            auto_rules=collection.auto_rules,
-            user_id=collection.user_id,
-            movie_count=movie_count,
-            created_at=collection.created_at,
-            updated_at=collection.updated_at,
-        )
-        result.append(collection_dict)
+        result.append(_collection_response(collection, movie_count))
 
     return result
 
@@ -85,18 +78,7 @@ async def get_collection_detail(
 
     collection, movie_count = result
 
-    return CollectionResponse(
-        id=collection.id,
-        name=collection.name,
-        description=collection.description,
-        type=collection.type,
-        cover_image_url=collection.cover_image_url,
-        auto_rules=collection.auto_rules,
-        user_id=collection.user_id,
-        movie_count=movie_count,
-        created_at=collection.created_at,
-        updated_at=collection.updated_at,
-    )
+    return _collection_response(collection, movie_count)
 
 
 @router.post("/", response_model=CollectionResponse, status_code=status.HTTP_201_CREATED)
@@ -118,25 +100,15 @@ async def create_collection(
     # Create collection
     collection = Collection(
         user_id=user_id,
-        **collection_data.model_dump()
+        **_collection_values(collection_data.model_dump())
     )
 
     db.add(collection)
     db.commit()
+    await response_cache.invalidate_user(user_id)
     db.refresh(collection)
 
-    return CollectionResponse(
-        id=collection.id,
-        name=collection.name,
-        description=collection.description,
-        type=collection.type,
-        cover_image_url=collection.cover_image_url,
-        auto_rules=collection.auto_rules,
-        user_id=collection.user_id,
-        movie_count=0,
-        created_at=collection.created_at,
-        updated_at=collection.updated_at,
-    )
+    return _collection_response(collection, 0)
 
 
 @router.put("/{collection_id}", response_model=CollectionResponse)
@@ -168,11 +140,12 @@ async def update_collection(
         )
 
     # Update only provided fields
-    update_dict = update_data.model_dump(exclude_unset=True)
+    update_dict = _collection_values(update_data.model_dump(exclude_unset=True))
     for field, value in update_dict.items():
         setattr(collection, field, value)
 
     db.commit()
+    await response_cache.invalidate_user(user_id)
     db.refresh(collection)
 
     # Get movie count
@@ -180,18 +153,7 @@ async def update_collection(
         CollectionMovie.collection_id == collection_id
     ).scalar()
 
-    return CollectionResponse(
-        id=collection.id,
-        name=collection.name,
-        description=collection.description,
-        type=collection.type,
-        cover_image_url=collection.cover_image_url,
-        auto_rules=collection.auto_rules,
-        user_id=collection.user_id,
-        movie_count=movie_count,
-        created_at=collection.created_at,
-        updated_at=collection.updated_at,
-    )
+    return _collection_response(collection, movie_count)
 
 
 @router.delete("/{collection_id}", response_model=BaseResponse[dict])
@@ -217,6 +179,7 @@ async def delete_collection(
 
     db.delete(collection)
     db.commit()
+    await response_cache.invalidate_user(user_id)
 
     return BaseResponse(
         success=True,
@@ -225,6 +188,95 @@ async def delete_collection(
     )
 
 
+@router.post("/{collection_id}/movies/batch", response_model=BaseResponse[dict])
+async def add_movies_to_collection(
+    collection_id: int,
+    batch_request: CollectionMoviesBatchRequest,
+    db: Session = Depends(get_db),
+    user_id: str = Depends(get_current_user),
+):
+    """
+    Add multiple movies to a collection
+
+    Path Parameters:
+    - collection_id: Collection ID
+
+    Request Body:
+    - user_movie_ids: UserMovie IDs (not Movie IDs!)
+
+    Movies already in the collection are skipped.
+    Auto collections are rejected (400); their movies come from the auto rule.
+    """
+    user_movie_ids = _validate_collection_movies(
+        db, collection_id, batch_request.user_movie_ids, user_id, manual_only=True
+    )
+
+    # Add movies to collection (multi-row INSERT, 이미 있는 영화는 건너뜀)
+    added = db.execute(
+        pg_insert(CollectionMovie)
+        .values([
+            {"collection_id": collection_id, "user_movie_id": user_movie_id}
+            for user_movie_id in user_movie_ids
+        ])
+        .on_conflict_do_nothing(constraint="uq_collection_user_movie")
+        .returning(CollectionMovie.user_movie_id)
+    ).scalars().all()
+    db.commit()
+    await response_cache.invalidate_user(user_id)
+
+    added_ids = set(added)
+    return BaseResponse(
+        success=True,
+        message=f"{len(added)} movies added to collection",
+        data={
+            "collection_id": collection_id,
+            "added": added,
+            "skipped": [user_movie_id for user_movie_id in user_movie_ids if user_movie_id not in added_ids]
+        }
+    )
+
+
+@router.post("/{collection_id}/movies/batch-delete", response_model=BaseResponse[dict])
+async def remove_movies_from_collection(
+    collection_id: int,
+    batch_request: CollectionMoviesBatchRequest,
+    db: Session = Depends(get_db),
+    user_id: str = Depends(get_current_user),
+):
+    """
+    Remove multiple movies from a collection
+
+    Path Parameters:
+    - collection_id: Collection ID
+
+    Request Body:
+    - user_movie_ids: UserMovie IDs (not Movie IDs!)
+    """
+    user_movie_ids = _validate_collection_movies(db, collection_id, batch_request.user_movie_ids, user_id)
+
+    removed = db.execute(
+        delete(CollectionMovie)
+        .where(
+            CollectionMovie.collection_id == collection_id,
+            CollectionMovie.user_movie_id.in_(user_movie_ids)
+        )
+        .returning(CollectionMovie.user_movie_id)
+    ).scalars().all()
+    db.commit()
+    await response_cache.invalidate_user(user_id)
+
+    removed_ids = set(removed)
+    return BaseResponse(
+        success=True,
+        message=f"{len(removed)} movies removed from collection",
+        data={
+            "collection_id": collection_id,
+            "removed": removed,
+            "not_in_collection": [user_movie_id for user_movie_id in user_movie_ids if user_movie_id not in removed_ids]
+        }
+    )
+
+
 @router.post("/{collection_id}/movies/{user_movie_id}", response_model=BaseResponse[dict], status_code=status.HTTP_201_CREATED)
 async def add_movie_to_collection(
     collection_id: int,
@@ -285,6 +337,7 @@ async def add_movie_to_collection(
 
     db.add(collection_movie)
     db.commit()
+    await response_cache.invalidate_user(user_id)
 
     return BaseResponse(
         success=True,
@@ -343,6 +396,7 @@ async def remove_movie_from_collection(
 
     db.delete(collection_movie)
     db.commit()
+    await response_cache.invalidate_user(user_id)
 
     return BaseResponse(
         success=True,
@@ -412,6 +466,7 @@ async def sync_auto_collection(
 
         # Sync collection
         result = auto_collection_service.sync_auto_collection(collection_id, db)
+        await response_cache.invalidate_user(user_id)
 
         return BaseResponse(
             success=True,
@@ -429,3 +484,91 @@ async def sync_auto_collection(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"동기화 실패: {str(e)}"
         )
+
+
+def _validate_collection_movies(
+    db: Session,
+    collection_id: int,
+    user_movie_ids: List[int],
+    user_id: str,
+    manual_only: bool = False,
+) -> List[int]:
+    """
+    컬렉션과 영화들의 소유권을 쿼리 1번으로 확인
+
+    Args:
+        manual_only: True면 자동 컬렉션 거부 (자동 컬렉션 영화는 규칙으로만 추가)
+
+    Returns:
+        중복 제거된 user_movie_ids (요청 순서 유지)
+
+    Raises:
+        HTTPException: 항목 수 초과(400), 자동 컬렉션(400), 컬렉션 없음(404), 라이브러리에 없는 영화(404)
+    """
+    user_movie_ids = list(dict.fromkeys(user_movie_ids))
+    if len(user_movie_ids) > settings.LIBRARY_BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Too many movies (max {settings.LIBRARY_BATCH_MAX_ITEMS})",
+        )
+
+    # collections LEFT JOIN user_movies (IN) → row가 없으면 컬렉션 없음
+    rows = db.execute(
+        select(Collection.is_auto, UserMovie.id)
+        .outerjoin(
+            UserMovie,
+            and_(UserMovie.user_id == Collection.user_id, UserMovie.id.in_(user_movie_ids))
+        )
+        .where(Collection.id == collection_id, Collection.user_id == user_id)
+    ).all()
+
+    if not rows:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Collection not found",
+        )
+
+    if manual_only and rows[0].is_auto:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Movies cannot be added to an auto collection",
+        )
+
+    owned = {user_movie_id for _, user_movie_id in rows if user_movie_id is not None}
+    missing = [user_movie_id for user_movie_id in user_movie_ids if user_movie_id not in owned]
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Movies not found in your library: {missing}",
+        )
+
+    return user_movie_ids
+
+
+def _collection_values(data: dict) -> dict:
+    """
+    요청 데이터를 collections 컬럼으로 변환
+    (type → is_auto, auto_rules → auto_rule, cover_image_url은 컬럼이 없어 저장하지 않음)
+    """
+    values = {key: data[key] for key in ("name", "description") if key in data}
+    if "type" in data:
+        values["is_auto"] = data["type"] == "auto"
+    if "auto_rules" in data:
+        values["auto_rule"] = data["auto_rules"]
+    return values
+
+
+def _collection_response(collection: Collection, movie_count: int) -> CollectionResponse:
+    """Collection → CollectionResponse (컬럼명이 스키마와 다른 필드 변환)"""
+    return CollectionResponse(
+        id=collection.id,
+        name=collection.name,
+        description=collection.description,
+        type="auto" if collection.is_auto else "manual",
+        cover_image_url=None,
+        auto_rules=collection.auto_rule,
+        user_id=collection.user_id,
+        movie_count=movie_count,
+        created_at=collection.created_at,
+        updated_at=collection.updated_at,
+    )
@@ -0,0 +1,139 @@
+"""
+Home API endpoint
+홈/통계 화면이 앱 시작 시 호출하는 여러 API를 요청 1번으로 묶은 집계 API
+
+- 인증 1번, DB 세션 1개를 모든 섹션이 공유
+- 각 섹션은 기존 API 함수를 그대로 호출하므로 응답 형식이 개별 API와 동일
+- 섹션 하나가 실패해도 나머지 섹션은 반환 (errors에 섹션별 사유)
+"""
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session
+
+from app.api.v1 import collections, movies, stats, users
+from app.database import get_db
+from app.middleware.auth_middleware import get_current_user
+from app.schemas.collection import CollectionResponse
+from app.schemas.home import HomeResponse
+from app.schemas.movie import UserMovieResponse
+from app.schemas.stats import StatsOverview, MonthlyStats, GenreStats, BestMovie
+from app.schemas.user import UserResponse
+
+router = APIRouter(prefix="/home", tags=["home"])
+
+
+# 섹션 이름 → (기존 API 호출 함수, 응답 검증용 TypeAdapter)
+# 호출 함수는 (db, user_id, params) → 코루틴
+SECTIONS: Dict[str, Tuple[Callable, TypeAdapter]] = {
+    "user": (
+        lambda db, user_id, params: users.get_current_user(user_id=user_id, db=db),
+        TypeAdapter(UserResponse),
+    ),
+    "stats": (
+        lambda db, user_id, params: stats.get_user_stats(year=params["year"], db=db, user_id=user_id),
+        TypeAdapter(StatsOverview),
+    ),
+    "monthly": (
+        lambda db, user_id, params: stats.get_monthly_stats(months=params["months"], db=db, user_id=user_id),
+        TypeAdapter(List[MonthlyStats]),
+    ),
+    "genres": (
+        lambda db, user_id, params: stats.get_genre_stats(db=db, user_id=user_id),
+        TypeAdapter(List[GenreStats]),
+    ),
+    "best_movies": (
+        lambda db, user_id, params: stats.get_best_movies(limit=params["best_limit"], db=db, user_id=user_id),
+        TypeAdapter(List[BestMovie]),
+    ),
+    "collections": (
+        lambda db, user_id, params: collections.get_user_collections(db=db, user_id=user_id),
+        TypeAdapter(List[CollectionResponse]),
+    ),
+    "movies": (
+        lambda db, user_id, params: movies.get_user_movies(status_filter=params["status_filter"], db=db, user_id=user_id),
+        TypeAdapter(List[UserMovieResponse]),
+    ),
+}
+
+
+@router.get("", response_model=HomeResponse)
+async def get_home(
+    include: Optional[str] = Query(
+        None,
+        description="Comma separated sections (default: all): " + ", ".join(SECTIONS),
+    ),
+    year: int = Query(default=datetime.now().year, description="Year for stats"),
+    months: int = Query(default=6, description="Number of months for monthly stats"),
+    best_limit: int = Query(default=5, description="Number of best movies"),
+    status_filter: Optional[str] = Query(None, description="Movies filter: watchlist, watching, completed"),
+    db: Session = Depends(get_db),
+    user_id: str = Depends(get_current_user),
+):
+    """
+    Home / Stats screen aggregate
+
+    Sections (same payload as the individual endpoints):
+    - user: /users/me
+    - stats: /stats/
+    - monthly: /stats/monthly
+    - genres: /stats/genres
+    - best_movies: /stats/best-movies
+    - collections: /collections/
+    - movies: /movies/
+
+    Sections run one after another on a single DB session (a Session is not safe
+    for concurrent use); the saving is the round trips and per-request auth.
+    """
+    if include:
+        names = [name.strip() for name in include.split(",") if name.strip()]
+        unknown = [name for name in names if name not in SECTIONS]
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown sections: {unknown}",
+            )
+    else:
+        names = list(SECTIONS)
+
+    params = {
+        "year": year,
+        "months": months,
+        "best_limit": best_limit,
+        "status_filter": status_filter,
+    }
+
+    result: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+    for name in dict.fromkeys(names):
+        value, error = await _run_section(name, db, user_id, params)
+        if error:
+            errors[name] = error
+        else:
+            result[name] = value
+
+    return HomeResponse(**result, errors=errors)
+
+
+async def _run_section(name: str, db: Session, user_id: str, params: Dict[str, Any]) -> Tuple[Any, Optional[str]]:
+    """
+    섹션 하나 실행 + 응답 검증
+
+    Returns:
+        (검증된 값, None) 또는 (None, 에러 메시지)
+    """
+    call, adapter = SECTIONS[name]
+    try:
+        value = await call(db, user_id, params)
+        # BaseResponse로 감싼 API(/users/me)는 data만 사용
+        value = getattr(value, "data", value)
+        return adapter.validate_python(value, from_attributes=True), None
+    except HTTPException as e:
+        return None, str(e.detail)
+    except Exception as e:
+        # 실패한 쿼리로 트랜잭션이 abort 상태가 되면 다음 섹션도 실패하므로 롤백
+        db.rollback()
+        print(f"⚠️  Home section '{name}' failed: {e}")
+        return None, "Internal error"
@@ -5,16 +5,26 @@ Media API endpoints
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import and_
-from typing import List
+from typing import Iterable, List, Optional, Set
 
+from app.config import settings
 from app.database import get_db
 from app.middleware.auth_middleware import get_current_user_id
 from app.models.user_image import UserImage
 from app.models.user_movie import UserMovie
-from app.services.s3_service import s3_service
+from app.services.response_cache import response_cache
+from app.services.s3_service import USER_IMAGE_FOLDER, s3_service
+from app.services.thumbnail_service import thumbnail_service
 from app.schemas.image import (
     UploadUrlRequest,
     UploadUrlResponse,
+    BatchUploadUrlRequest,
+    BatchUploadUrlResponse,
+    PresignedUpload,
+    MultipartUploadRequest,
+    MultipartUploadResponse,
+    MultipartCompleteRequest,
+    MultipartAbortRequest,
     UserImageCreate,
     UserImageResponse
 )
@@ -22,11 +32,62 @@ from app.schemas.common import BaseResponse
 
 router = APIRouter(prefix="/media", tags=["media"])
 
+ALLOWED_IMAGE_TYPES = ['image/jpeg', 'image/jpg', 'image/png', 'image/webp']
+UPLOAD_FOLDER = USER_IMAGE_FOLDER
+UPLOAD_EXPIRES_IN = 900  # 15분
+MULTIPART_EXPIRES_IN = 3600  # 1시간 (대용량 업로드)
+MULTIPART_MAX_PARTS = 10000  # S3 part 수 제한
+
+
+def _validate_upload(file_type: str, file_size: Optional[int], max_bytes: int):
+    """파일 타입 / 선언된 크기 검증"""
+    if file_type not in ALLOWED_IMAGE_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"지원하지 않는 파일 형식입니다. 허용: {', '.join(ALLOWED_IMAGE_TYPES)}"
+        )
+    if file_size is not None and file_size > max_bytes:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"파일 크기는 최대 {max_bytes // (1024 * 1024)}MB까지 업로드할 수 있습니다."
+        )
+
+
+def _user_folder(user_id: str) -> str:
+    """사용자별 업로드 폴더 (내용 기반 키의 중복 제거 범위 = 사용자)"""
+    return f"{UPLOAD_FOLDER}/{user_id}"
+
+
+def _validate_upload_key(file_key: str, user_id: str):
+    """multipart 완료/취소 대상이 본인 업로드 폴더의 객체인지 확인"""
+    if not file_key.startswith(f"{_user_folder(user_id)}/") or ".." in file_key:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="잘못된 file_key입니다."
+        )
+
+
+def _registered_keys(db: Session, user_id: str, file_keys: Iterable[str]) -> Set[str]:
+    """
+    이미 user_images에 등록된 file_key (같은 내용 재업로드 시 업로드 생략용)
+
+    등록되지 않은 객체는 orphan sweeper가 지울 수 있으므로 다시 업로드하도록 함
+    """
+    file_keys = list(file_keys)
+    if not file_keys:
+        return set()
+    rows = db.query(UserImage.file_key).filter(
+        UserImage.user_id == user_id,
+        UserImage.file_key.in_(file_keys)
+    ).distinct().all()
+    return {file_key for (file_key,) in rows}
+
 
 @router.post("/upload", response_model=BaseResponse[UploadUrlResponse])
 async def get_upload_url(
     request: UploadUrlRequest,
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
 ):
     """
     S3 Presigned URL 발급
@@ -34,44 +95,126 @@ async def get_upload_url(
     Frontend에서 사용 방법:
     1. 이 API로 upload_url, file_url 받기
     2. upload_url로 PUT 요청하여 이미지 업로드
-       - Content-Type 헤더 설정 필수
+       - upload_headers를 그대로 헤더로 설정 (Content-Type, x-amz-checksum-sha256)
        - Body에 이미지 파일 바이너리 데이터
-    3. 업로드 성공 후 file_url을 DB에 저장 (POST /user-images)
+       - already_uploaded=true면 업로드 생략
+    3. 업로드 성공 후 file_url, file_key를 DB에 저장 (POST /user-images)
 
     Args:
         file_name: 파일명 (e.g., 'ticket.jpg')
         file_type: MIME type (e.g., 'image/jpeg')
+        content_sha256: 파일 내용 SHA-256 (hex, 권장)
+            - 내용 기반 키 → 같은 사진을 다시 올려도 같은 객체
+            - S3가 업로드된 내용의 checksum을 검증
 
     Returns:
         upload_url: S3 업로드 URL (PUT 요청용, 15분 유효)
         file_url: 최종 파일 URL (GET 요청용)
+        file_key: S3 객체 키
         expires_in: URL 유효 시간 (초)
+        already_uploaded: 같은 내용의 이미지가 이미 등록되어 있는지
     """
     # 파일 타입 검증
-    allowed_types = ['image/jpeg', 'image/jpg', 'image/png', 'image/webp']
-    if request.file_type not in allowed_types:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"지원하지 않는 파일 형식입니다. 허용: {', '.join(allowed_types)}"
-        )
+    _validate_upload(request.file_type, request.file_size, settings.MEDIA_UPLOAD_MAX_BYTES)
 
     try:
         # S3 Presigned URL 생성
         result = s3_service.generate_presigned_url(
             file_name=request.file_name,
             file_type=request.file_type,
-            folder="filmory/user-images",
-            expiration=900  # 15분
+            folder=_user_folder(user_id),
+            expiration=UPLOAD_EXPIRES_IN,
+            content_sha256=request.content_sha256
         )
+        already_uploaded = bool(request.content_sha256) and bool(_registered_keys(db, user_id, [result["file_key"]]))
 
         return BaseResponse(
             success=True,
             message="업로드 URL이 생성되었습니다.",
             data=UploadUrlResponse(
                 upload_url=result["upload_url"],
+                upload_headers=result["upload_headers"],
                 file_url=result["file_url"],
                 file_key=result["file_key"],
-                expires_in=900
+                expires_in=UPLOAD_EXPIRES_IN,
+                already_uploaded=already_uploaded
+            )
+        )
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"업로드 URL 생성 실패: {str(e)}"
+        )
+
+
+@router.post("/upload/batch", response_model=BaseResponse[BatchUploadUrlResponse])
+async def get_upload_urls_batch(
+    request: BatchUploadUrlRequest,
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
+):
+    """
+    여러 파일의 Presigned URL 일괄 발급 (티켓 + 포토카드 여러 장을 한 번에)
+
+    서명은 로컬 연산이므로 S3 호출 없이 N개를 한 번에 생성
+
+    - method=put: presigned PUT (POST /upload와 동일한 방식)
+    - method=post: presigned POST - S3가 policy 조건을 검증하여 저장 전에 거부
+        - content-length-range: 1 ~ file_size (미지정 시 MEDIA_UPLOAD_MAX_BYTES)
+        - Content-Type: file_type과 일치해야 함
+        - Frontend: upload_url로 multipart/form-data POST, fields를 모두 포함하고 file 필드는 마지막에
+
+    Returns:
+        uploads: 요청 순서대로 upload_url, file_url, file_key, already_uploaded
+            (+ PUT의 경우 upload_headers, POST의 경우 fields, max_file_size)
+    """
+    if len(request.files) > settings.MEDIA_UPLOAD_BATCH_MAX_FILES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"한 번에 최대 {settings.MEDIA_UPLOAD_BATCH_MAX_FILES}개 파일까지 요청할 수 있습니다."
+        )
+    for file in request.files:
+        _validate_upload(file.file_type, file.file_size, settings.MEDIA_UPLOAD_MAX_BYTES)
+
+    try:
+        uploads = []
+        for file in request.files:
+            if request.method == "post":
+                max_bytes = file.file_size or settings.MEDIA_UPLOAD_MAX_BYTES
+                result = s3_service.generate_presigned_post(
+                    file_name=file.file_name,
+                    file_type=file.file_type,
+                    max_bytes=max_bytes,
+                    folder=_user_folder(user_id),
+                    expiration=UPLOAD_EXPIRES_IN,
+                    content_sha256=file.content_sha256
+                )
+                uploads.append(PresignedUpload(file_name=file.file_name, max_file_size=max_bytes, **result))
+            else:
+                result = s3_service.generate_presigned_url(
+                    file_name=file.file_name,
+                    file_type=file.file_type,
+                    folder=_user_folder(user_id),
+                    expiration=UPLOAD_EXPIRES_IN,
+                    content_sha256=file.content_sha256
+                )
+                uploads.append(PresignedUpload(file_name=file.file_name, **result))
+
+        # 내용 기반 키 중 이미 등록된 이미지 (DB 조회 1회)
+        registered = _registered_keys(
+            db, user_id, [upload.file_key for upload, file in zip(uploads, request.files) if file.content_sha256]
+        )
+        for upload in uploads:
+            upload.already_uploaded = upload.file_key in registered
+
+        return BaseResponse(
+            success=True,
+            message=f"업로드 URL {len(uploads)}개가 생성되었습니다.",
+            data=BatchUploadUrlResponse(
+                method=request.method,
+                uploads=uploads,
+                expires_in=UPLOAD_EXPIRES_IN
             )
         )
 
@@ -82,6 +225,115 @@ async def get_upload_url(
         )
 
 
+@router.post("/upload/multipart", response_model=BaseResponse[MultipartUploadResponse])
+async def create_multipart_upload(
+    request: MultipartUploadRequest,
+    user_id: str = Depends(get_current_user_id)
+):
+    """
+    대용량 이미지 multipart 업로드 시작
+
+    Frontend에서 사용 방법:
+    1. 이 API로 upload_id, part별 upload_url 받기
+    2. 파일을 part_size 단위로 잘라 각 upload_url로 PUT (병렬 가능), 응답의 ETag 헤더 보관
+    3. POST /upload/multipart/complete 로 part_number + etag 목록 전달
+    4. 중단 시 POST /upload/multipart/abort (업로드된 part 삭제)
+    """
+    _validate_upload(request.file_type, request.file_size, settings.MEDIA_MULTIPART_MAX_BYTES)
+
+    try:
+        result = await s3_service.create_multipart_upload(
+            file_name=request.file_name,
+            file_type=request.file_type,
+            file_size=request.file_size,
+            part_size=settings.MEDIA_MULTIPART_PART_SIZE,
+            folder=_user_folder(user_id),
+            expiration=MULTIPART_EXPIRES_IN
+        )
+
+        return BaseResponse(
+            success=True,
+            message="multipart 업로드가 시작되었습니다.",
+            data=MultipartUploadResponse(expires_in=MULTIPART_EXPIRES_IN, **result)
+        )
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"multipart 업로드 시작 실패: {str(e)}"
+        )
+
+
+@router.post("/upload/multipart/complete", response_model=BaseResponse[dict])
+async def complete_multipart_upload(
+    request: MultipartCompleteRequest,
+    user_id: str = Depends(get_current_user_id)
+):
+    """
+    multipart 업로드 완료
+
+    업로드된 크기가 MEDIA_MULTIPART_MAX_BYTES를 넘으면 업로드를 취소하고 400 반환
+    parts는 업로드한 part 전체여야 함 (S3에 업로드된 part 목록과 다르면 400)
+    완료 후 file_url을 POST /user-images로 등록
+    """
+    _validate_upload_key(request.file_key, user_id)
+    if len(request.parts) > MULTIPART_MAX_PARTS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"part는 최대 {MULTIPART_MAX_PARTS}개까지 완료할 수 있습니다."
+        )
+
+    try:
+        result = await s3_service.complete_multipart_upload(
+            file_key=request.file_key,
+            upload_id=request.upload_id,
+            parts=[part.model_dump() for part in request.parts],
+            max_bytes=settings.MEDIA_MULTIPART_MAX_BYTES
+        )
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"multipart 업로드 완료 실패: {str(e)}"
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"multipart 업로드 완료 실패: {str(e)}"
+        )
+
+    return BaseResponse(
+        success=True,
+        message="업로드가 완료되었습니다.",
+        data=result
+    )
+
+
+@router.post("/upload/multipart/abort", response_model=BaseResponse[dict])
+async def abort_multipart_upload(
+    request: MultipartAbortRequest,
+    user_id: str = Depends(get_current_user_id)
+):
+    """
+    multipart 업로드 취소 (업로드된 part 삭제)
+    """
+    _validate_upload_key(request.file_key, user_id)
+
+    try:
+        aborted = await s3_service.abort_multipart_upload(request.file_key, request.upload_id)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"multipart 업로드 취소 실패: {str(e)}"
+        )
+
+    return BaseResponse(
+        success=aborted,
+        message="업로드가 취소되었습니다." if aborted else "업로드 취소에 실패했습니다.",
+        data={"file_key": request.file_key, "aborted": aborted}
+    )
+
+
 @router.post("/user-images", response_model=BaseResponse[UserImageResponse], status_code=status.HTTP_201_CREATED)
 async def create_user_image(
     image_create: UserImageCreate,
@@ -94,9 +346,12 @@ async def create_user_image(
     이미지를 S3에 업로드한 후, 이 API로 DB에 기록
     - user_movie_id: 영화 ID (필수)
     - image_url: S3 file_url (필수)
+    - file_key: 업로드 응답의 file_key (미지정 시 image_url에서 추출)
     - image_type: 'ticket' or 'photocard'
 
     NOTE: user_movie 소유권 확인
+    NOTE: file_key는 본인 업로드 폴더의 객체만 허용
+    NOTE: thumbnail_url은 썸네일 worker가 처리한 뒤 채워짐 (그 전에는 null)
     """
     # user_movie 소유권 확인
     user_movie = db.query(UserMovie).filter(
@@ -109,17 +364,32 @@ async def create_user_image(
             detail="영화를 찾을 수 없습니다."
         )
 
+    # S3 객체 키 (우리 버킷 이미지가 아니면 None)
+    file_key = image_create.file_key or s3_service.key_from_url(image_create.image_url)
+    if file_key is not None:
+        legacy_key = file_key.startswith(f"{UPLOAD_FOLDER}/") and "/" not in file_key[len(UPLOAD_FOLDER) + 1:]
+        if not (file_key.startswith(f"{_user_folder(user_id)}/") or legacy_key) or ".." in file_key:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="잘못된 file_key입니다."
+            )
+
     # 새 UserImage 생성
     new_image = UserImage(
         user_id=user_id,
         user_movie_id=image_create.user_movie_id,
         image_url=image_create.image_url,
+        file_key=file_key,
         image_type=image_create.image_type
     )
 
     db.add(new_image)
     db.commit()
     db.refresh(new_image)
+    await response_cache.invalidate_user(user_id)
+
+    # 썸네일 생성은 worker가 비동기로 처리 (scripts/thumbnail_worker.py)
+    await thumbnail_service.enqueue(new_image.id)
 
     return BaseResponse(
         success=True,
@@ -129,6 +399,7 @@ async def create_user_image(
 
 
 @router.get("/user-images", response_model=BaseResponse[List[UserImageResponse]])
+@response_cache.conditional("media:user_images")
 async def get_user_images(
     user_movie_id: int = Query(..., description="영화 ID"),
     user_id: str = Depends(get_current_user_id),
@@ -173,7 +444,8 @@ async def delete_user_image(
     이미지 삭제
 
     - DB에서 UserImage 삭제
-    - S3에서도 파일 삭제 시도 (실패해도 계속 진행)
+    - 같은 file_key를 쓰는 다른 이미지가 없으면 S3 원본 + 썸네일 삭제 시도
+      (실패해도 계속 진행, 남은 객체는 scripts/sweep_orphan_images.py가 정리)
     """
     # 이미지 찾기 (본인 이미지만)
     image = db.query(UserImage).filter(
@@ -186,19 +458,21 @@ async def delete_user_image(
             detail="이미지를 찾을 수 없습니다."
         )
 
-    # S3에서 파일 삭제 시도 (file_key 추출)
-    # file_url 예시: https://bucket.s3.region.amazonaws.com/filmory/user-images/abc123.jpg
-    # file_key 추출: filmory/user-images/abc123.jpg
-    try:
-        if "amazonaws.com/" in image.image_url:
-            file_key = image.image_url.split("amazonaws.com/")[1]
-            s3_service.delete_file(file_key)
-    except Exception as e:
-        print(f"⚠️  S3 파일 삭제 실패 (계속 진행): {e}")
+    file_key = image.file_key
 
     # DB에서 삭제
     db.delete(image)
     db.commit()
+    await response_cache.invalidate_user(user_id)
+
+    # 내용 기반 키는 여러 이미지가 공유할 수 있으므로 마지막 참조일 때만 S3에서 삭제
+    if file_key:
+        shared = db.query(UserImage.id).filter(UserImage.file_key == file_key).first()
+        if not shared:
+            try:
+                await s3_service.delete_files([file_key] + thumbnail_service.thumbnail_keys(file_key))
+            except Exception as e:
+                print(f"⚠️  S3 파일 삭제 실패 (계속 진행): {e}")
 
     return BaseResponse(
         success=True,
@@ -1,6 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Path
-from sqlalchemy.orm import Session, joinedload
+import json
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Path, File, Form, UploadFile
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, literal, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, aliased, joinedload
+from sqlalchemy.orm.attributes import set_committed_value
 from typing import List, Optional
+from pydantic import BaseModel
+from app.config import settings
 from app.database import get_db
 from app.middleware.auth_middleware import get_current_user
 from app.models.user_movie import UserMovie
@@ -9,15 +16,38 @@ from app.models.movie_tag import MovieTag
 from app.models.tag import Tag
 from app.schemas.movie import (
     UserMovieCreate, UserMovieUpdate, UserMovieResponse,
-    MovieCreate, MovieResponse, MovieSearchResult, MovieMetadata
+    MovieCreate, MovieResponse, MovieSearchResult, MovieMetadata,
+    MovieMetadataBatchRequest, MovieMetadataBatchResult, UserMovieBatchUpdate
 )
+from app.responses import model_response
 from app.schemas.common import BaseResponse
 from app.services.external_api_service import external_api_service
+from app.services.library_export_service import library_export_service
+from app.services.library_import_service import library_import_service
+from app.services.movie_catalog_service import movie_catalog_service
+from app.services.poster_mirror_service import poster_mirror_service
+from app.services.response_cache import response_cache
 
 router = APIRouter(prefix="/movies", tags=["movies"])
 
 
+def _library_updated_at(db: Session, user_id: str):
+    """
+    /movies/ ETag validator
+
+    영화 메타데이터 갱신(prefetch, from-metadata)은 사용자 generation을 바꾸지 않으므로
+    라이브러리 영화의 max(updated_at)를 ETag에 포함 (집계 1번, 행/직렬화 없음)
+    """
+    return db.execute(
+        select(func.max(Movie.updated_at))
+        .join(UserMovie, UserMovie.movie_id == Movie.id)
+        .where(UserMovie.user_id == user_id)
+    ).scalar()
+
+
 @router.get("/", response_model=List[UserMovieResponse])
+@response_cache.conditional("movies:list", validator=_library_updated_at)
+@model_response(List[UserMovieResponse])
 async def get_user_movies(
     status_filter: Optional[str] = Query(None, description="Filter by status: watchlist, watching, completed"),
     db: Session = Depends(get_db),
@@ -39,6 +69,33 @@ async def get_user_movies(
     return user_movies
 
 
+@router.get("/export")
+async def export_library(
+    export_format: str = Query("ndjson", alias="format", pattern="^(csv|ndjson)$", description="csv or ndjson"),
+    user_id: str = Depends(get_current_user),
+):
+    """
+    Export user's movie library (streamed, constant memory)
+
+    Query Parameters:
+    - format: "csv" (import compatible) or "ndjson"
+
+    Each row includes movie info, user record, tags, collections and image URLs.
+    """
+    if export_format == "csv":
+        content = library_export_service.iter_csv(user_id)
+        media_type = "text/csv; charset=utf-8"
+    else:
+        content = library_export_service.iter_ndjson(user_id)
+        media_type = "application/x-ndjson"
+
+    return StreamingResponse(
+        content,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="filmory-library.{export_format}"'},
+    )
+
+
 @router.get("/{user_movie_id}", response_model=UserMovieResponse)
 async def get_movie_detail(
     user_movie_id: int,
@@ -80,43 +137,159 @@ async def add_movie(
     - review: Review text (optional)
     - watch_date: Date watched (optional)
     - progress: Minutes watched (optional, for "watching" status)
-    - is_favorite: Mark as favorite (default: false)
     - is_life_movie: Mark as life movie (default: false)
+    - is_favorite: not supported (422)
     """
-    # Check if movie exists
-    movie = db.query(Movie).filter(Movie.id == user_movie_data.movie_id).first()
-    if not movie:
+    values = _user_movie_values(user_movie_data)
+    movie_id = values.pop("movie_id")
+
+    # 영화 존재 확인 + 중복 확인 + INSERT를 1 statement로 처리
+    # - movies에 없는 movie_id면 INSERT ... SELECT가 아무것도 넣지 않음 (row 없음 → 404)
+    # - 이미 추가된 영화면 uq_user_movie 충돌로 건너뜀 (user_movie 없음 → 400)
+    inserted = (
+        pg_insert(UserMovie)
+        .from_select(
+            ["user_id", "movie_id", *values.keys()],
+            select(
+                literal(user_id, UserMovie.user_id.type),
+                Movie.id,
+                *[literal(value, UserMovie.__table__.c[key].type) for key, value in values.items()],
+            ).where(Movie.id == movie_id),
+        )
+        .on_conflict_do_nothing(constraint="uq_user_movie")
+        .returning(*UserMovie.__table__.c)
+        .cte("inserted")
+    )
+    inserted_user_movie = aliased(UserMovie, inserted)
+
+    row = db.execute(
+        select(Movie, inserted_user_movie)
+        .outerjoin(inserted_user_movie, inserted_user_movie.movie_id == Movie.id)
+        .where(Movie.id == movie_id)
+    ).first()
+
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Movie not found. Please add movie metadata first.",
         )
 
-    # Check if user already added this movie
-    existing = db.query(UserMovie).filter(
-        UserMovie.user_id == user_id,
-        UserMovie.movie_id == user_movie_data.movie_id
-    ).first()
-
-    if existing:
+    movie, user_movie = row
+    if not user_movie:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Movie already exists in your library",
         )
 
-    # Create user movie
-    user_movie = UserMovie(
-        user_id=user_id,
-        **user_movie_data.model_dump()
-    )
+    user_movie = _commit_user_movie(db, user_movie, movie)
+    await response_cache.invalidate_user(user_id)
 
-    db.add(user_movie)
-    db.commit()
-    db.refresh(user_movie)
+    return user_movie
 
-    # Load movie relationship
-    user_movie = db.query(UserMovie).options(joinedload(UserMovie.movie)).filter(UserMovie.id == user_movie.id).first()
 
-    return user_movie
+@router.post("/import")
+async def import_library(
+    file: UploadFile = File(..., description="CSV or JSON file (Letterboxd / Watcha export)"),
+    default_status: str = Form("completed", pattern="^(watching|completed|watchlist)$"),
+    db: Session = Depends(get_db),
+    user_id: str = Depends(get_current_user),
+):
+    """
+    Import movies into user's library from a CSV or JSON file
+
+    - Columns: title/Name/제목, year/Year/개봉연도, rating/Rating/별점,
+      watched date/Watched Date/본 날짜, review/Review/코멘트, tags/Tags/태그,
+      status, tmdb_id, kobis_code
+    - Movies are matched against the local catalog first, then external APIs
+    - Movies already in the library are skipped
+
+    Returns:
+    - NDJSON stream of progress events (parsed → matching → saving → done)
+    """
+    content = await file.read()
+
+    try:
+        rows, errors = library_import_service.parse(content, file.filename, default_status)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    if len(rows) + len(errors) > settings.LIBRARY_IMPORT_MAX_ROWS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Too many rows (max {settings.LIBRARY_IMPORT_MAX_ROWS})",
+        )
+
+    async def stream():
+        try:
+            async for event in library_import_service.run(db, user_id, rows, errors):
+                if event["stage"] == "done":
+                    await response_cache.invalidate_user(user_id)
+                yield json.dumps(event, ensure_ascii=False, default=str) + "\n"
+        except Exception as e:
+            db.rollback()
+            print(f"Library import error: {e}")
+            yield json.dumps({"stage": "error", "detail": "Import failed"}) + "\n"
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
+@router.patch("/batch", response_model=BaseResponse[dict])
+async def update_movies_batch(
+    batch_update: UserMovieBatchUpdate,
+    db: Session = Depends(get_db),
+    user_id: str = Depends(get_current_user),
+):
+    """
+    Update status and/or rating of multiple movies
+
+    Request Body:
+    - user_movie_ids: UserMovie IDs
+    - status: "watchlist", "watching", or "completed" (optional)
+    - rating: 1-5 (optional)
+    """
+    values = batch_update.model_dump(exclude_none=True, exclude={"user_movie_ids"})
+    if not values:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Nothing to update (status or rating required)",
+        )
+
+    user_movie_ids = list(dict.fromkeys(batch_update.user_movie_ids))
+    if len(user_movie_ids) > settings.LIBRARY_BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Too many movies (max {settings.LIBRARY_BATCH_MAX_ITEMS})",
+        )
+
+    # Ownership check (single IN query)
+    owned = set(db.execute(
+        select(UserMovie.id)
+        .where(UserMovie.user_id == user_id, UserMovie.id.in_(user_movie_ids))
+    ).scalars())
+
+    missing = [user_movie_id for user_movie_id in user_movie_ids if user_movie_id not in owned]
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Movies not found in your library: {missing}",
+        )
+
+    db.execute(
+        update(UserMovie)
+        .where(UserMovie.user_id == user_id, UserMovie.id.in_(user_movie_ids))
+        .values(**values, updated_at=func.now())
+    )
+    db.commit()
+    await response_cache.invalidate_user(user_id)
+
+    return BaseResponse(
+        success=True,
+        message=f"{len(user_movie_ids)} movies updated successfully",
+        data={"user_movie_ids": user_movie_ids, **values}
+    )
 
 
 @router.put("/{user_movie_id}", response_model=UserMovieResponse)
@@ -135,31 +308,35 @@ async def update_movie(
     - review: Review text (optional)
     - watch_date: Date watched (optional)
     - progress: Minutes watched (optional)
-    - is_favorite: Mark as favorite (optional)
     - is_life_movie: Mark as life movie (optional)
+    - is_favorite: not supported (422)
     """
-    user_movie = (
-        db.query(UserMovie)
-        .filter(UserMovie.user_id == user_id, UserMovie.id == user_movie_id)
-        .first()
+    # Update only provided fields (UPDATE ... RETURNING + movies JOIN, 1 statement)
+    values = _user_movie_values(update_data, exclude_unset=True)
+
+    updated = (
+        update(UserMovie)
+        .where(UserMovie.user_id == user_id, UserMovie.id == user_movie_id)
+        .values(**values, updated_at=func.now())
+        .returning(*UserMovie.__table__.c)
+        .cte("updated")
     )
+    updated_user_movie = aliased(UserMovie, updated)
 
-    if not user_movie:
+    row = db.execute(
+        select(updated_user_movie, Movie)
+        .join(Movie, Movie.id == updated_user_movie.movie_id)
+    ).first()
+
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Movie not found in your library",
         )
 
-    # Update only provided fields
-    update_dict = update_data.model_dump(exclude_unset=True)
-    for field, value in update_dict.items():
-        setattr(user_movie, field, value)
-
-    db.commit()
-    db.refresh(user_movie)
-
-    # Load movie relationship
-    user_movie = db.query(UserMovie).options(joinedload(UserMovie.movie)).filter(UserMovie.id == user_movie.id).first()
+    user_movie, movie = row
+    user_movie = _commit_user_movie(db, user_movie, movie)
+    await response_cache.invalidate_user(user_id)
 
     return user_movie
 
@@ -187,6 +364,7 @@ async def delete_movie(
 
     db.delete(user_movie)
     db.commit()
+    await response_cache.invalidate_user(user_id)
 
     return BaseResponse(
         success=True,
@@ -248,6 +426,41 @@ async def get_movie_metadata(
     return metadata
 
 
+@router.post("/metadata:batch", response_model=List[MovieMetadataBatchResult])
+async def get_movie_metadata_batch(
+    batch_request: MovieMetadataBatchRequest,
+    user_id: str = Depends(get_current_user),
+):
+    """
+    Get movie metadata for many movies in one request
+
+    Request Body:
+    - items: List of {source, id} (source: "kobis" or "tmdb", mixed allowed)
+
+    Returns:
+    - Results in request order; each item has either metadata or error
+    """
+    if len(batch_request.items) > settings.METADATA_BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Too many items. Maximum is {settings.METADATA_BATCH_MAX_ITEMS}"
+        )
+
+    entries = await external_api_service.get_metadata_batch(
+        [(item.source, item.id) for item in batch_request.items]
+    )
+
+    return [
+        MovieMetadataBatchResult(
+            source=item.source,
+            id=item.id,
+            metadata=metadata,
+            error=error,
+        )
+        for item, (metadata, error) in zip(batch_request.items, entries)
+    ]
+
+
 @router.post("/from-metadata", response_model=MovieResponse, status_code=status.HTTP_201_CREATED)
 async def create_movie_from_metadata(
     metadata: MovieMetadata,
@@ -261,25 +474,69 @@ async def create_movie_from_metadata(
     - metadata: MovieMetadata from external API
 
     Returns:
-    - Created movie
+    - Created (or existing) movie
     """
-    # Check if movie already exists
-    existing = None
-    if metadata.tmdb_id:
-        existing = db.query(Movie).filter(Movie.tmdb_id == metadata.tmdb_id).first()
-    elif metadata.kobis_code:
-        existing = db.query(Movie).filter(Movie.kobis_code == metadata.kobis_code).first()
-
-    if existing:
-        return existing
-
-    # Create new movie
-    movie = Movie(
-        **metadata.model_dump()
-    )
-
-    db.add(movie)
+    # 외부 ID(tmdb/kobis/kmdb)로 기존 영화 조회 또는 생성 (movie_external_ids 기반 upsert)
+    movie = movie_catalog_service.resolve_from_metadata(db, metadata)
     db.commit()
     db.refresh(movie)
 
+    # 포스터가 처음 사용되는 시점에 우리 버킷으로 미러링 (응답은 기다리지 않음)
+    if (movie.poster_url and not movie.poster_mirror_url) or (movie.backdrop_url and not movie.backdrop_mirror_url):
+        poster_mirror_service.schedule([movie.id])
+
     return movie
+
+
+# 요청 필드 → user_movies 컬럼
+USER_MOVIE_FIELD_COLUMNS = {
+    "review": "one_line_review",
+    "is_life_movie": "is_best_movie",
+}
+
+# 저장할 컬럼이 없는 요청 필드 (보내면 422)
+UNSUPPORTED_USER_MOVIE_FIELDS = ("is_favorite",)
+
+
+def _user_movie_values(data: BaseModel, exclude_unset: bool = False) -> dict:
+    """
+    요청 데이터를 user_movies 컬럼 값으로 변환
+    (INSERT/UPDATE statement에 직접 넣기 위함)
+
+    Args:
+        data: UserMovieCreate / UserMovieUpdate
+        exclude_unset: 요청에 없는 필드 제외 (수정 시)
+
+    Returns:
+        {컬럼명: 값}
+
+    Raises:
+        HTTPException(422): 저장할 컬럼이 없는 필드를 보낸 경우
+    """
+    unsupported = [field for field in UNSUPPORTED_USER_MOVIE_FIELDS if field in data.model_fields_set]
+    if unsupported:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Unsupported field(s): {', '.join(unsupported)}",
+        )
+
+    columns = UserMovie.__table__.c
+    values = {}
+    for field, value in data.model_dump(exclude_unset=exclude_unset).items():
+        column = USER_MOVIE_FIELD_COLUMNS.get(field, field)
+        if column in columns:
+            values[column] = value
+    return values
+
+
+def _commit_user_movie(db: Session, user_movie: UserMovie, movie: Movie) -> UserMovie:
+    """
+    RETURNING으로 받은 user_movie에 movie 관계를 연결하고 commit
+
+    commit 후 응답 직렬화 시 refresh 쿼리가 나가지 않도록 세션에서 분리
+    """
+    set_committed_value(user_movie, "movie", movie)
+    db.expunge(user_movie)
+    db.expunge(movie)
+    db.commit()
+    return user_movie
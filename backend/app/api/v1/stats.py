@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import func, extract, text
 from datetime import datetime, date, timedelta
-from typing import List
+from typing import Iterable, List, Optional
 from app.database import get_db
 from app.middleware.auth_middleware import get_current_user
 from app.models.user import User
@@ -13,11 +13,13 @@ from app.models.tag import Tag
 from app.schemas.stats import (
     StatsOverview, MonthlyStats, GenreStats, TagStats, BestMovie
 )
+from app.services.response_cache import response_cache
 
 router = APIRouter(prefix="/stats", tags=["stats"])
 
 
 @router.get("/", response_model=StatsOverview)
+@response_cache.cached("stats:overview", StatsOverview, vary_by_date=True)
 async def get_user_stats(
     year: int = Query(default=datetime.now().year, description="Year for statistics"),
     db: Session = Depends(get_db),
@@ -98,6 +100,7 @@ async def get_user_stats(
 
 
 @router.get("/monthly", response_model=List[MonthlyStats])
+@response_cache.cached("stats:monthly", List[MonthlyStats])
 async def get_monthly_stats(
     months: int = Query(default=6, description="Number of months to fetch"),
     db: Session = Depends(get_db),
@@ -132,6 +135,7 @@ async def get_monthly_stats(
 
 
 @router.get("/genres", response_model=List[GenreStats])
+@response_cache.cached("stats:genre", List[GenreStats])
 async def get_genre_stats(
     db: Session = Depends(get_db),
     user_id: str = Depends(get_current_user),
@@ -153,9 +157,22 @@ async def get_genre_stats(
         .all()
     )
 
+    return count_genres(genre_str for (genre_str,) in movies)
+
+
+def count_genres(genre_strings: Iterable[Optional[str]]) -> List[GenreStats]:
+    """
+    Count genres from comma-separated genre fields
+
+    Args:
+        genre_strings: Movie.genre values (e.g., "드라마, 스릴러")
+
+    Returns:
+        Genre stats sorted by count (descending)
+    """
     # Parse genres (comma-separated)
     genre_count = {}
-    for (genre_str,) in movies:
+    for genre_str in genre_strings:
         if genre_str:
             genres = [g.strip() for g in genre_str.split(",")]
             for genre in genres:
@@ -179,6 +196,7 @@ async def get_genre_stats(
 
 
 @router.get("/tags", response_model=List[TagStats])
+@response_cache.cached("stats:tag", List[TagStats])
 async def get_tag_stats(
     limit: int = Query(default=10, description="Number of top tags to return"),
     db: Session = Depends(get_db),
@@ -209,20 +227,21 @@ async def get_tag_stats(
 
 
 @router.get("/best-movies", response_model=List[BestMovie])
+@response_cache.cached("stats:best_movies", List[BestMovie])
 async def get_best_movies(
     limit: int = Query(default=5, description="Number of best movies to return"),
     db: Session = Depends(get_db),
     user_id: str = Depends(get_current_user),
 ):
     """
-    Get user's best movies (is_life_movie = true)
+    Get user's best movies (is_best_movie = true)
     """
     best_movies = (
         db.query(UserMovie)
         .options(joinedload(UserMovie.movie))
         .filter(
             UserMovie.user_id == user_id,
-            UserMovie.is_life_movie == True,
+            UserMovie.is_best_movie == True,
         )
         .order_by(UserMovie.rating.desc(), UserMovie.watch_date.desc())
         .limit(limit)
@@ -232,12 +251,12 @@ async def get_best_movies(
     return [
         BestMovie(
             id=um.id,
-            title=um.movie.title,
-            director=um.movie.director,
-            year=um.movie.year,
-            poster_url=um.movie.poster_url or "",
+            title=um.movie.title_ko,
+            director=um.movie.director or "",
+            year=um.movie.production_year or 0,
+            poster_url=um.movie.display_poster_url or "",
             rating=um.rating or 0,
-            review=um.review or "",
+            review=um.one_line_review or "",
             watch_date=um.watch_date or date.today(),
         )
         for um in best_movies
@@ -268,14 +287,24 @@ async def calculate_streak(db: Session, user_id: str) -> int:
         .all()
     )
 
-    if not watch_dates:
-        return 0
+    return streak_from_dates([row[0] for row in watch_dates], date.today())
 
-    # Convert to list of dates
-    dates = [row[0] for row in watch_dates]
+
+def streak_from_dates(dates: List[date], today: date) -> int:
+    """
+    Count consecutive viewing days ending today or yesterday
+
+    Args:
+        dates: Watch dates sorted descending
+        today: Reference date
+
+    Returns:
+        Current streak in days
+    """
+    if not dates:
+        return 0
 
     # Check if most recent date is today or yesterday
-    today = date.today()
     if dates[0] not in [today, today - timedelta(days=1)]:
         return 0
 
@@ -4,21 +4,25 @@ Tags API endpoints
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_
+from sqlalchemy import func, and_, or_, delete, literal, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from typing import Optional, List
 
+from app.config import settings
 from app.database import get_db
 from app.middleware.auth_middleware import get_current_user_id
 from app.models.tag import Tag
 from app.models.movie_tag import MovieTag
 from app.models.user_movie import UserMovie
-from app.schemas.tag import TagResponse, TagCreate, TagWithCount
+from app.schemas.tag import TagResponse, TagCreate, TagWithCount, MovieTagsBatchRequest
 from app.schemas.common import BaseResponse
+from app.services.response_cache import response_cache
 
 router = APIRouter(prefix="/tags", tags=["tags"])
 
 
 @router.get("", response_model=BaseResponse[List[TagResponse]])
+@response_cache.conditional("tags:list")
 async def get_tags(
     tag_type: Optional[str] = Query(None, description="필터: 'predefined' or 'custom'"),
     user_id: str = Depends(get_current_user_id),
@@ -55,6 +59,7 @@ async def get_tags(
 
 
 @router.get("/popular", response_model=BaseResponse[List[TagWithCount]])
+@response_cache.cached("tags:popular", BaseResponse[List[TagWithCount]])
 async def get_popular_tags(
     limit: int = Query(10, ge=1, le=50, description="최대 개수"),
     user_id: str = Depends(get_current_user_id),
@@ -91,10 +96,10 @@ async def get_popular_tags(
         tag_dict = {
             "id": tag.id,
             "name": tag.name,
-            "is_predefined": tag.is_predefined,
-            "user_id": str(tag.user_id) if tag.user_id else None,
+            "type": tag.type,
+            "user_id": tag.user_id,
             "created_at": tag.created_at,
-            "usage_count": count
+            "count": count
         }
         result.append(TagWithCount(**tag_dict))
 
@@ -137,6 +142,7 @@ async def create_tag(
 
     db.add(new_tag)
     db.commit()
+    await response_cache.invalidate_user(user_id)
     db.refresh(new_tag)
 
     return BaseResponse(
@@ -204,6 +210,7 @@ async def add_tag_to_movie(
 
     db.add(new_movie_tag)
     db.commit()
+    await response_cache.invalidate_user(user_id)
 
     return BaseResponse(
         success=True,
@@ -216,6 +223,78 @@ async def add_tag_to_movie(
     )
 
 
+@router.post("/movies/batch", response_model=BaseResponse[dict])
+async def add_tags_to_movies(
+    batch_request: MovieTagsBatchRequest,
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
+):
+    """
+    여러 영화에 여러 태그 일괄 추가
+
+    - user_movie 소유권 + 태그 존재 확인 (쿼리 1번)
+    - 모든 (영화, 태그) 조합을 multi-row INSERT (이미 추가된 조합은 건너뜀)
+    """
+    user_movie_ids, tag_ids = _validate_movie_tags(db, batch_request, user_id)
+
+    added = db.execute(
+        pg_insert(MovieTag)
+        .values([
+            {"user_movie_id": user_movie_id, "tag_id": tag_id}
+            for user_movie_id in user_movie_ids
+            for tag_id in tag_ids
+        ])
+        .on_conflict_do_nothing(constraint="uq_user_movie_tag")
+        .returning(MovieTag.id)
+    ).all()
+    db.commit()
+    await response_cache.invalidate_user(user_id)
+
+    return BaseResponse(
+        success=True,
+        message=f"영화에 태그가 추가되었습니다: {len(added)}개",
+        data={
+            "user_movie_ids": user_movie_ids,
+            "tag_ids": tag_ids,
+            "added": len(added),
+            "skipped": len(user_movie_ids) * len(tag_ids) - len(added)
+        }
+    )
+
+
+@router.post("/movies/batch-delete", response_model=BaseResponse[dict])
+async def remove_tags_from_movies(
+    batch_request: MovieTagsBatchRequest,
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
+):
+    """
+    여러 영화에서 여러 태그 일괄 제거
+
+    - user_movie 소유권 + 태그 존재 확인 (쿼리 1번)
+    - DELETE 1번
+    """
+    user_movie_ids, tag_ids = _validate_movie_tags(db, batch_request, user_id)
+
+    removed = db.execute(
+        delete(MovieTag)
+        .where(MovieTag.user_movie_id.in_(user_movie_ids), MovieTag.tag_id.in_(tag_ids))
+        .returning(MovieTag.id)
+    ).all()
+    db.commit()
+    await response_cache.invalidate_user(user_id)
+
+    return BaseResponse(
+        success=True,
+        message=f"영화에서 태그가 제거되었습니다: {len(removed)}개",
+        data={
+            "user_movie_ids": user_movie_ids,
+            "tag_ids": tag_ids,
+            "removed": len(removed)
+        }
+    )
+
+
 @router.delete("/movies/{user_movie_id}/tags/{tag_id}", response_model=BaseResponse[dict])
 async def remove_tag_from_movie(
     user_movie_id: int,
@@ -254,6 +333,7 @@ async def remove_tag_from_movie(
     # 태그 제거
     db.delete(movie_tag)
     db.commit()
+    await response_cache.invalidate_user(user_id)
 
     return BaseResponse(
         success=True,
@@ -296,9 +376,57 @@ async def delete_tag(
     tag_name = tag.name
     db.delete(tag)
     db.commit()
+    await response_cache.invalidate_user(user_id)
 
     return BaseResponse(
         success=True,
         message=f"태그가 삭제되었습니다: {tag_name}",
         data={"deleted_tag_id": tag_id}
     )
+
+
+def _validate_movie_tags(db: Session, batch_request: MovieTagsBatchRequest, user_id: str):
+    """
+    user_movie 소유권 + 태그 존재(사전 정의 or 본인 커스텀)를 쿼리 1번으로 확인
+
+    Returns:
+        (중복 제거된 user_movie_ids, 중복 제거된 tag_ids)
+
+    Raises:
+        HTTPException: 항목 수 초과(400), 없는 영화/태그(404)
+    """
+    user_movie_ids = list(dict.fromkeys(batch_request.user_movie_ids))
+    tag_ids = list(dict.fromkeys(batch_request.tag_ids))
+
+    if len(user_movie_ids) * len(tag_ids) > settings.LIBRARY_BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"한 번에 처리할 수 있는 (영화, 태그) 조합은 최대 {settings.LIBRARY_BATCH_MAX_ITEMS}개입니다."
+        )
+
+    rows = db.execute(
+        select(literal("movie").label("kind"), UserMovie.id)
+        .where(UserMovie.user_id == user_id, UserMovie.id.in_(user_movie_ids))
+        .union_all(
+            select(literal("tag").label("kind"), Tag.id)
+            .where(Tag.id.in_(tag_ids), or_(Tag.is_predefined == True, Tag.user_id == user_id))
+        )
+    ).all()
+
+    found = {(kind, found_id) for kind, found_id in rows}
+
+    missing_movies = [i for i in user_movie_ids if ("movie", i) not in found]
+    if missing_movies:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"영화를 찾을 수 없습니다: {missing_movies}"
+        )
+
+    missing_tags = [i for i in tag_ids if ("tag", i) not in found]
+    if missing_tags:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"태그를 찾을 수 없습니다: {missing_tags}"
+        )
+
+    return user_movie_ids, tag_ids
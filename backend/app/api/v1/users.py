@@ -11,6 +11,7 @@ from app.middleware.auth_middleware import get_current_user_id
 from app.models.user import User
 from app.schemas.user import UserResponse, UserUpdate, UserCreate
 from app.schemas.common import BaseResponse
+from app.services.response_cache import response_cache
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -68,6 +69,7 @@ async def update_current_user(
         setattr(user, field, value)
 
     db.commit()
+    await response_cache.invalidate_user(user_id)
     db.refresh(user)
 
     return BaseResponse(
@@ -142,6 +144,7 @@ async def delete_current_user(
 
     db.delete(user)
     db.commit()
+    await response_cache.invalidate_user(user_id)
 
     return BaseResponse(
         success=True,
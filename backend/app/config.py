@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -23,16 +23,106 @@ class Settings(BaseSettings):
     # Redis (for caching)
     REDIS_URL: str = "redis://localhost:6379"
 
+    # Cache serialization
+    CACHE_CODEC: str = "orjson"  # "json", "orjson", "msgpack"
+    CACHE_COMPRESSION: str = "zlib"  # "none", "zlib", "lz4"
+    CACHE_COMPRESSION_THRESHOLD: int = 1024  # bytes
+    CACHE_NAMESPACE_GENERATION_TTL: int = 5  # 네임스페이스 generation 로컬 캐시 (초)
+
+    # Response cache (사용자별 조회 API 응답 캐시)
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_TTL: int = 600  # Redis (초)
+    RESPONSE_CACHE_LOCAL_TTL: int = 30  # 로컬 메모리 (초)
+    RESPONSE_CACHE_LOCAL_MAX_ENTRIES: int = 1000
+
+    # Response compression (gzip)
+    GZIP_MINIMUM_SIZE: int = 1000  # bytes, 이보다 작은 응답은 압축하지 않음
+    GZIP_COMPRESS_LEVEL: int = 6
+
+    # Prometheus metrics (/metrics)
+    METRICS_ENABLED: bool = True
+
+    # SQL query counter (Server-Timing 헤더, N+1 감지)
+    QUERY_COUNTER_ENABLED: bool = True
+    QUERY_REPEAT_THRESHOLD: int = 5  # 한 요청에서 같은 SQL이 이 횟수를 넘으면 N+1 의심
+    QUERY_REPEAT_STRICT: bool = False  # True면 예외 발생 (테스트용)
+
+    # Slow query log (scripts/slow_query_report.py로 집계)
+    SLOW_QUERY_LOG_ENABLED: bool = False
+    SLOW_QUERY_THRESHOLD_MS: int = 200
+    SLOW_QUERY_EXPLAIN_SAMPLE_RATE: float = 0.1  # 느린 쿼리 중 EXPLAIN을 함께 기록할 비율
+    SLOW_QUERY_LOG_FILE: str = "logs/slow_queries.ndjson"
+
+    # Admin API (X-Admin-Key 헤더, 미설정 시 비활성화)
+    ADMIN_API_KEY: Optional[str] = None
+
     # External APIs
     TMDB_API_KEY: Optional[str] = None
     KOBIS_API_KEY: Optional[str] = None
     KMDB_API_KEY: Optional[str] = None
 
+    # External API base URLs (벤치마크/로컬 개발 시 devtools.fake_providers로 변경)
+    KOBIS_BASE_URL: str = "http://www.kobis.or.kr/kobisopenapi/webservice/rest"
+    TMDB_BASE_URL: str = "https://api.themoviedb.org/3"
+    KMDB_BASE_URL: str = "http://api.koreafilm.or.kr/openapi-data2/wisenut/search_api"
+
+    # External API concurrency (provider별 동시 요청 수 제한)
+    KOBIS_MAX_CONCURRENCY: int = 5
+    TMDB_MAX_CONCURRENCY: int = 10
+    KMDB_MAX_CONCURRENCY: int = 5
+    METADATA_BATCH_MAX_ITEMS: int = 50
+
+    # Batch mutation (컬렉션/태그/상태 일괄 변경 시 최대 항목 수)
+    LIBRARY_BATCH_MAX_ITEMS: int = 500
+
+    # Library import (CSV/JSON 일괄 가져오기)
+    LIBRARY_IMPORT_MAX_ROWS: int = 5000
+    LIBRARY_IMPORT_BATCH_SIZE: int = 500  # multi-row INSERT 1회당 row 수
+
+    # Prefetch (박스오피스/트렌딩 영화 캐시 워밍 + movies 테이블 upsert)
+    PREFETCH_ENABLED: bool = False
+    PREFETCH_INTERVAL_SECONDS: int = 21600  # 6시간
+    PREFETCH_TMDB_REGION: str = "KR"
+
     # AWS S3 (optional)
     AWS_ACCESS_KEY_ID: Optional[str] = None
     AWS_SECRET_ACCESS_KEY: Optional[str] = None
     AWS_S3_BUCKET: Optional[str] = None
     AWS_REGION: str = "ap-northeast-2"
+    AWS_S3_ENDPOINT_URL: Optional[str] = None  # MinIO / moto server 등 S3 호환 stand-in (e.g., http://localhost:9000)
+    AWS_S3_PUBLIC_URL: Optional[str] = None  # 파일 URL prefix (CDN 도메인 등, 미설정 시 버킷 URL)
+    S3_MAX_CONCURRENCY: int = 16  # S3 전용 스레드 풀 크기 = 커넥션 풀 크기
+    S3_CONNECT_TIMEOUT: float = 5.0
+    S3_READ_TIMEOUT: float = 30.0
+
+    # Media upload (이미지 업로드 제한)
+    MEDIA_UPLOAD_MAX_BYTES: int = 10 * 1024 * 1024  # presigned PUT/POST 1개 파일 최대 크기 (10MB)
+    MEDIA_UPLOAD_BATCH_MAX_FILES: int = 20  # 일괄 발급 최대 파일 수
+    MEDIA_MULTIPART_PART_SIZE: int = 8 * 1024 * 1024  # S3 최소 5MB (마지막 part 제외)
+    MEDIA_MULTIPART_MAX_BYTES: int = 100 * 1024 * 1024  # multipart 업로드 최대 크기
+    ORPHAN_IMAGE_GRACE_HOURS: int = 24  # 업로드 후 이 시간이 지나도 user_images에 없으면 orphan
+
+    # Thumbnail (POST /media/user-images 이후 Redis 큐 → scripts/thumbnail_worker.py)
+    THUMBNAIL_ENABLED: bool = True
+    THUMBNAIL_WIDTHS: List[int] = [240, 480]  # 가장 작은 크기가 thumbnail_url (목록 화면용)
+    THUMBNAIL_FORMAT: str = "webp"  # "webp", "avif" (Pillow AVIF 지원 시)
+    THUMBNAIL_QUALITY: int = 80
+    THUMBNAIL_PROCESSES: int = 2  # 디코딩/리사이즈/인코딩 process pool 크기
+    THUMBNAIL_WORKER_CONCURRENCY: int = 4  # worker 1개가 동시에 처리하는 작업 수
+    THUMBNAIL_MAX_ATTEMPTS: int = 3  # 초과 시 thumbnail:failed 리스트로 이동
+
+    # Poster mirror (TMDb/KMDb 포스터·배경 이미지를 우리 버킷/CDN으로 복사, S3 설정 필요)
+    POSTER_MIRROR_ENABLED: bool = False
+    POSTER_MIRROR_FOLDER: str = "filmory/mirrors"
+    POSTER_MIRROR_WIDTHS: List[int] = [185, 342, 500]  # 가장 큰 크기가 poster_mirror_url
+    BACKDROP_MIRROR_WIDTHS: List[int] = [780, 1280]
+    POSTER_MIRROR_CONCURRENCY: int = 4
+    POSTER_MIRROR_BATCH_SIZE: int = 200  # mirror_movies 1회 최대 영화 수 (backfill 페이지 크기)
+    POSTER_MIRROR_MAX_BYTES: int = 10 * 1024 * 1024
+    POSTER_MIRROR_TIMEOUT: float = 10.0
+    # 다운로드 허용 호스트 (https만, redirect도 매 hop 검사) - 클라이언트가 보낸 임의 URL로의 요청(SSRF) 방지
+    POSTER_MIRROR_ALLOWED_HOSTS: List[str] = ["image.tmdb.org", "file.koreafilm.or.kr", "www.kobis.or.kr"]
+    POSTER_MIRROR_MAX_REDIRECTS: int = 3
 
     # JWT Settings
     JWT_ALGORITHM: str = "RS256"
@@ -12,6 +12,11 @@ engine = create_engine(
     echo=settings.DEBUG,  # SQL 로그 출력 (디버그 모드)
 )
 
+# Slow query log (opt-in)
+if settings.SLOW_QUERY_LOG_ENABLED:
+    from app.services.slow_query_log import slow_query_log
+    slow_query_log.install(engine)
+
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
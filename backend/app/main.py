@@ -1,7 +1,18 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+from app.config import settings
+from app.database import engine
+from app.middleware import query_counter
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.metrics_middleware import MetricsMiddleware
+from app.responses import DefaultJSONResponse
+from app.services.metrics_service import metrics_service
 from app.services.redis_service import redis_service
+from app.services.prefetch_service import prefetch_service
+from app.services.poster_mirror_service import poster_mirror_service
+from app.services.s3_service import s3_service
+from app.services.thumbnail_service import thumbnail_service
 
 
 @asynccontextmanager
@@ -12,10 +23,17 @@ async def lifespan(app: FastAPI):
     # Startup
     await redis_service.connect()
     print("✅ Redis connected")
+    if settings.PREFETCH_ENABLED:
+        prefetch_service.start()
+        print("✅ Prefetch scheduler started")
     yield
     # Shutdown
+    await prefetch_service.stop()
+    await poster_mirror_service.stop()
     await redis_service.disconnect()
     print("✅ Redis disconnected")
+    thumbnail_service.close()
+    s3_service.close()
 
 
 app = FastAPI(
@@ -25,6 +43,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    default_response_class=DefaultJSONResponse,
 )
 
 # CORS 설정
@@ -36,6 +55,23 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청별 SQL 쿼리 수/DB 시간 (Server-Timing 헤더, N+1 감지)
+if settings.QUERY_COUNTER_ENABLED:
+    query_counter.install(engine)
+    app.add_middleware(query_counter.QueryCounterMiddleware)
+
+# 응답 압축 (영화 목록 등 큰 JSON 응답)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.GZIP_MINIMUM_SIZE,
+    compresslevel=settings.GZIP_COMPRESS_LEVEL,
+    exclude_paths=["/api/v1/movies/import"],
+)
+
+# 요청 메트릭 (가장 바깥에서 압축을 포함한 전체 처리 시간/응답 크기 기록)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 
 @app.get("/")
 async def root():
@@ -53,8 +89,17 @@ async def health_check():
     return {"status": "healthy", "service": "filmory-api"}
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus metrics endpoint"""
+    if not settings.METRICS_ENABLED:
+        return Response(status_code=404)
+    body, content_type = metrics_service.render()
+    return Response(content=body, headers={"Content-Type": content_type})
+
+
 # API 라우터 등록
-from app.api.v1 import movies, collections, stats, users, tags, media
+from app.api.v1 import movies, collections, stats, users, tags, media, admin, home
 
 app.include_router(movies.router, prefix="/api/v1")
 app.include_router(collections.router, prefix="/api/v1")
@@ -62,3 +107,5 @@ app.include_router(stats.router, prefix="/api/v1")
 app.include_router(users.router, prefix="/api/v1")
 app.include_router(tags.router, prefix="/api/v1")
 app.include_router(media.router, prefix="/api/v1")
+app.include_router(admin.router, prefix="/api/v1")
+app.include_router(home.router, prefix="/api/v1")
@@ -1,14 +1,22 @@
-from fastapi import HTTPException, Security, status
+from fastapi import Header, HTTPException, Security, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+import hmac
 import httpx
 import jwt
-import json
-from typing import Dict, Any
+import time
+from typing import Dict, Any, Optional, Tuple
 from app.config import settings
 from app.services.redis_service import redis_service
 
 security = HTTPBearer()
 
+# 파싱된 서명 키 캐시 {kid: (JWK dict, PyJWK)} - 요청마다 RSA 공개키를 다시 파싱하지 않도록
+_signing_keys: Dict[str, Tuple[Dict[str, Any], jwt.PyJWK]] = {}
+
+# 모르는 kid로 JWKS를 강제 갱신하는 최소 간격 (초) - 임의 kid 토큰으로 Supabase를 반복 호출하지 않도록
+JWKS_REFRESH_MIN_INTERVAL = 30
+_last_jwks_refresh = 0.0
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Security(security),
@@ -28,13 +36,13 @@ async def get_current_user(
     token = credentials.credentials
 
     try:
-        # Fetch JWKS from Supabase (should be cached in production)
-        jwks = await fetch_supabase_jwks()
+        # Select signing key from JWKS by kid (JWKS is cached in Redis)
+        signing_key = await get_signing_key(token)
 
         # Decode and verify JWT
         payload = jwt.decode(
             token,
-            jwks,
+            signing_key.key,
             algorithms=[settings.JWT_ALGORITHM],
             audience=settings.JWT_AUDIENCE,
         )
@@ -54,7 +62,7 @@ async def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token has expired",
         )
-    except jwt.InvalidTokenError as e:
+    except (jwt.InvalidTokenError, jwt.PyJWKError) as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Invalid token: {str(e)}",
@@ -66,21 +74,70 @@ async def get_current_user(
         )
 
 
-async def fetch_supabase_jwks() -> Dict[str, Any]:
+async def get_signing_key(token: str) -> jwt.PyJWK:
+    """
+    Select the JWKS key matching the token's kid header
+
+    - Parsed keys are cached in-process, but only reused while the kid is still in the current JWKS
+    - Unknown kid (key rotation) forces one JWKS refresh, at most every JWKS_REFRESH_MIN_INTERVAL seconds
+
+    Args:
+        token: JWT string
+
+    Returns:
+        PyJWK signing key
+
+    Raises:
+        jwt.InvalidTokenError: malformed header or no matching key
+    """
+    global _last_jwks_refresh
+
+    kid = jwt.get_unverified_header(token).get("kid")
+    jwk = _find_jwk(await fetch_supabase_jwks(), kid)
+
+    if jwk is None and time.monotonic() - _last_jwks_refresh >= JWKS_REFRESH_MIN_INTERVAL:
+        _last_jwks_refresh = time.monotonic()
+        jwk = _find_jwk(await fetch_supabase_jwks(force_refresh=True), kid)
+
+    if jwk is None:
+        raise jwt.InvalidTokenError(f"Unknown signing key: {kid}")
+
+    cached = _signing_keys.get(kid)
+    if cached and cached[0] == jwk:
+        return cached[1]
+
+    signing_key = jwt.PyJWK(jwk, algorithm=jwk.get("alg", settings.JWT_ALGORITHM))
+    _signing_keys[kid] = (jwk, signing_key)
+    return signing_key
+
+
+def _find_jwk(jwks: Dict[str, Any], kid: Optional[str]) -> Optional[Dict[str, Any]]:
+    """JWKS에서 kid가 일치하는 키 (kid 없는 토큰은 키가 하나뿐일 때만 허용)"""
+    keys = jwks.get("keys", [])
+    if kid is None:
+        return keys[0] if len(keys) == 1 else None
+    return next((key for key in keys if key.get("kid") == kid), None)
+
+
+async def fetch_supabase_jwks(force_refresh: bool = False) -> Dict[str, Any]:
     """
     Fetch JWKS (JSON Web Key Set) from Supabase
 
     Uses Redis caching for performance (1 hour cache)
 
+    Args:
+        force_refresh: skip the cache and fetch again (key rotation)
+
     Returns:
         JWKS dictionary
     """
     cache_key = "supabase_jwks"
 
     # Try to get from cache
-    cached_jwks = await redis_service.get(cache_key)
-    if cached_jwks:
-        return json.loads(cached_jwks)
+    if not force_refresh:
+        cached_jwks = await redis_service.get_json(cache_key)
+        if cached_jwks:
+            return cached_jwks
 
     # Fetch from Supabase
     try:
@@ -90,7 +147,7 @@ async def fetch_supabase_jwks() -> Dict[str, Any]:
             jwks = response.json()
 
             # Cache for 1 hour (3600 seconds)
-            await redis_service.set(cache_key, json.dumps(jwks), ttl=3600)
+            await redis_service.set_json(cache_key, jwks, ttl=3600)
 
             return jwks
 
@@ -125,3 +182,27 @@ async def get_current_user_optional(
         return await get_current_user(credentials)
     except HTTPException:
         return None
+
+
+async def require_admin(
+    x_admin_key: Optional[str] = Header(None, alias="X-Admin-Key"),
+) -> None:
+    """
+    Admin API key validation (X-Admin-Key header)
+
+    Admin endpoints are disabled unless ADMIN_API_KEY is configured
+
+    Raises:
+        HTTPException: 403 if admin API is disabled or key is invalid
+    """
+    if not settings.ADMIN_API_KEY:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin API is disabled",
+        )
+
+    if not x_admin_key or not hmac.compare_digest(x_admin_key, settings.ADMIN_API_KEY):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid admin key",
+        )
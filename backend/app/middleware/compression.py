@@ -0,0 +1,31 @@
+"""
+응답 압축 미들웨어
+GZipMiddleware + 압축 제외 경로
+
+진행 상황을 한 줄씩 보내는 스트리밍 응답(e.g., /movies/import NDJSON)은
+gzip 버퍼에 쌓여 클라이언트에 늦게 도착하므로 압축하지 않음
+"""
+from typing import Iterable
+
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """minimum_size 이상인 응답만 gzip 압축 (exclude_paths 제외)"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1000,
+        compresslevel: int = 6,
+        exclude_paths: Iterable[str] = (),
+    ) -> None:
+        super().__init__(app, minimum_size=minimum_size, compresslevel=compresslevel)
+        self.exclude_paths = frozenset(exclude_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
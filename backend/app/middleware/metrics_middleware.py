@@ -0,0 +1,52 @@
+"""
+요청 메트릭 미들웨어
+route별 latency, 응답 크기, 처리 중 요청 수를 metrics_service에 기록
+
+BaseHTTPMiddleware 대신 순수 ASGI 미들웨어로 구현
+(스트리밍 응답을 버퍼링하지 않고, 요청마다 추가 task를 만들지 않음)
+"""
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.services.metrics_service import UNMATCHED_ROUTE, metrics_service
+
+
+class MetricsMiddleware:
+    """HTTP 요청 메트릭 기록"""
+
+    def __init__(self, app: ASGIApp, exclude_paths=("/metrics",)) -> None:
+        self.app = app
+        self.exclude_paths = frozenset(exclude_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+        size = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        start = time.perf_counter()
+        with metrics_service.track_in_progress(method):
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                # 라우터가 매칭한 route를 scope에 기록 (path 템플릿을 라벨로 사용)
+                route = scope.get("route")
+                metrics_service.observe_request(
+                    method,
+                    getattr(route, "path", UNMATCHED_ROUTE),
+                    status,
+                    time.perf_counter() - start,
+                    size,
+                )
@@ -0,0 +1,143 @@
+"""
+요청별 SQL 쿼리 카운터 / N+1 감지
+SQLAlchemy engine 이벤트로 요청마다 쿼리 수와 DB 시간을 집계
+
+- 응답 헤더: Server-Timing: db;dur=12.3;desc="5 queries"
+- 메트릭: route별 요청당 쿼리 수 / DB 시간 histogram
+- 같은 SQL이 한 요청에서 QUERY_REPEAT_THRESHOLD번 넘게 실행되면 N+1 의심으로 경고
+  (QUERY_REPEAT_STRICT=True면 예외 발생 → 테스트에서 실패)
+
+요청 컨텍스트는 ContextVar로 전달 (run_in_threadpool / asyncio.to_thread도 컨텍스트를 복사하므로 집계됨)
+"""
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+from app.services.metrics_service import UNMATCHED_ROUTE, metrics_service
+
+
+class NPlusOneError(AssertionError):
+    """한 요청에서 같은 SQL이 반복 실행됨 (QUERY_REPEAT_STRICT 모드)"""
+
+
+class QueryStats:
+    """쿼리 집계 (요청 1개 또는 count_queries() 블록 1개)"""
+
+    __slots__ = ("count", "duration", "statements")
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0  # 초
+        self.statements: Counter = Counter()
+
+    def record(self, statement: str, duration: float):
+        self.count += 1
+        self.duration += duration
+        self.statements[statement] += 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """threshold번 넘게 실행된 SQL (실행 횟수 내림차순)"""
+        return [(statement, count) for statement, count in self.statements.most_common() if count > threshold]
+
+
+# 현재 요청의 집계 (요청 밖에서는 None → 기록하지 않음)
+_request_stats: ContextVar[Optional[QueryStats]] = ContextVar("request_query_stats", default=None)
+
+# count_queries() 블록들 (스레드/요청과 무관하게 모든 쿼리를 집계, 테스트용)
+_captures: List[QueryStats] = []
+
+
+def install(engine: Engine):
+    """engine에 쿼리 집계 이벤트 등록"""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    duration = time.perf_counter() - conn.info["query_start_time"].pop()
+
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.record(statement, duration)
+    for capture in _captures:
+        capture.record(statement, duration)
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryStats]:
+    """
+    블록 안에서 실행된 모든 쿼리 집계 (테스트의 query_budget fixture용)
+
+    Usage:
+        with count_queries() as stats:
+            client.get("/api/v1/stats/")
+        assert stats.count <= 3
+    """
+    stats = QueryStats()
+    _captures.append(stats)
+    try:
+        yield stats
+    finally:
+        _captures.remove(stats)
+
+
+def format_repeated(repeated: List[Tuple[str, int]]) -> str:
+    """반복 실행된 SQL 목록 문자열 (한 줄로 줄인 SQL 앞부분)"""
+    return "; ".join(f"{count}x {' '.join(statement.split())[:120]}" for statement, count in repeated)
+
+
+class QueryCounterMiddleware:
+    """요청별 쿼리 수/DB 시간 집계 + Server-Timing 헤더 + N+1 감지"""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _request_stats.set(stats)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # 응답 헤더 전송 시점까지의 쿼리 (스트리밍 응답은 이후 쿼리가 헤더에 포함되지 않음)
+                self._check_repeated(scope, stats)
+                headers = MutableHeaders(raw=message["headers"])
+                headers.append(
+                    "Server-Timing",
+                    f'db;dur={stats.duration * 1000:.1f};desc="{stats.count} queries"',
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _request_stats.reset(token)
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            metrics_service.observe_queries(route, stats.count, stats.duration)
+
+    @staticmethod
+    def _check_repeated(scope: Scope, stats: QueryStats):
+        """같은 SQL 반복 실행 감지 (N+1 의심)"""
+        repeated = stats.repeated(settings.QUERY_REPEAT_THRESHOLD)
+        if not repeated:
+            return
+
+        message = f"{scope['method']} {scope['path']}: {format_repeated(repeated)}"
+        if settings.QUERY_REPEAT_STRICT:
+            raise NPlusOneError(f"Repeated queries (N+1?) in {message}")
+        print(f"⚠️  Repeated queries (N+1?) in {message}")
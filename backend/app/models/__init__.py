@@ -1,21 +1,25 @@
 from app.database import Base
 from app.models.user import User
 from app.models.movie import Movie
+from app.models.movie_external_id import MovieExternalId
 from app.models.user_movie import UserMovie
 from app.models.user_image import UserImage
 from app.models.tag import Tag
 from app.models.movie_tag import MovieTag
 from app.models.collection import Collection
 from app.models.collection_movie import CollectionMovie
+from app.models.image_mirror import ImageMirror
 
 __all__ = [
     "Base",
     "User",
     "Movie",
+    "MovieExternalId",
     "UserMovie",
     "UserImage",
     "Tag",
     "MovieTag",
     "Collection",
     "CollectionMovie",
+    "ImageMirror",
 ]
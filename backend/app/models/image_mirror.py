@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Integer, String, Text, TIMESTAMP
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class ImageMirror(Base):
+    """외부 이미지(포스터/배경) → 우리 버킷 미러 매핑 (source URL / content hash 기준 중복 제거)"""
+    __tablename__ = "image_mirrors"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    source_url = Column(Text, nullable=False, unique=True)  # image.tmdb.org, KMDb 등 원본 URL
+    content_hash = Column(String(64), nullable=False, index=True)  # 원본 bytes의 SHA-256
+    kind = Column(String(20), nullable=False)  # 'poster', 'backdrop'
+    mirror_url = Column(Text, nullable=False)  # 기본 크기 variant URL
+
+    created_at = Column(TIMESTAMP, server_default=func.now())
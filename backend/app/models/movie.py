@@ -35,6 +35,8 @@ class Movie(Base):
     # 이미지
     poster_url = Column(Text)
     backdrop_url = Column(Text)
+    poster_mirror_url = Column(Text)  # 우리 버킷/CDN 미러 (poster_mirror_service)
+    backdrop_mirror_url = Column(Text)
 
     # 설명
     synopsis = Column(Text)
@@ -43,5 +45,16 @@ class Movie(Base):
     created_at = Column(TIMESTAMP, server_default=func.now())
     updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
 
+    @property
+    def display_poster_url(self):
+        """응답에 사용할 포스터 URL (미러가 있으면 미러)"""
+        return self.poster_mirror_url or self.poster_url
+
+    @property
+    def display_backdrop_url(self):
+        """응답에 사용할 배경 이미지 URL (미러가 있으면 미러)"""
+        return self.backdrop_mirror_url or self.backdrop_url
+
     # Relationships
     user_movies = relationship("UserMovie", back_populates="movie", cascade="all, delete-orphan")
+    external_ids = relationship("MovieExternalId", back_populates="movie", cascade="all, delete-orphan")
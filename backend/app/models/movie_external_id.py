@@ -0,0 +1,25 @@
+from sqlalchemy import Column, Integer, String, TIMESTAMP, ForeignKey, UniqueConstraint
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class MovieExternalId(Base):
+    """외부 API ID → movies.id 매핑 (영화 identity resolution)"""
+    __tablename__ = "movie_external_ids"
+
+    id = Column(Integer, primary_key=True, index=True)
+    movie_id = Column(Integer, ForeignKey("movies.id", ondelete="CASCADE"), nullable=False, index=True)
+
+    source = Column(String(20), nullable=False)  # 'kobis', 'tmdb', 'kmdb'
+    external_id = Column(String(50), nullable=False)
+
+    created_at = Column(TIMESTAMP, server_default=func.now())
+
+    # Constraints
+    __table_args__ = (
+        UniqueConstraint('source', 'external_id', name='uq_movie_external_id'),
+    )
+
+    # Relationships
+    movie = relationship("Movie", back_populates="external_ids")
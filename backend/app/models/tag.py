@@ -19,6 +19,11 @@ class Tag(Base):
         UniqueConstraint('name', 'user_id', name='uq_tag_name_user'),
     )
 
+    @property
+    def type(self):
+        """응답에 사용할 태그 유형 ("predefined" / "custom")"""
+        return "predefined" if self.is_predefined else "custom"
+
     # Relationships
     user = relationship("User", back_populates="custom_tags")
     movie_tags = relationship("MovieTag", back_populates="tag", cascade="all, delete-orphan")
@@ -13,6 +13,7 @@ class UserImage(Base):
 
     image_type = Column(String(20), nullable=False)  # 'ticket', 'photocard', 'other'
     image_url = Column(Text, nullable=False)
+    file_key = Column(Text, index=True)  # S3 객체 키 (우리 버킷 이미지만, 내용 기반 키는 여러 row가 공유 가능)
     thumbnail_url = Column(Text)
 
     created_at = Column(TIMESTAMP, server_default=func.now())
@@ -6,17 +6,20 @@ from .common import BaseResponse, PaginationParams, PaginatedResponse
 from .user import UserBase, UserCreate, UserUpdate, UserResponse
 from .movie import (
     MovieBase, MovieCreate, MovieUpdate, MovieResponse,
-    UserMovieBase, UserMovieCreate, UserMovieUpdate, UserMovieResponse,
-    MovieSearchResult, MovieMetadata
+    UserMovieBase, UserMovieCreate, UserMovieUpdate, UserMovieResponse, UserMovieBatchUpdate,
+    MovieSearchResult, MovieMetadata,
+    MovieMetadataBatchItem, MovieMetadataBatchRequest, MovieMetadataBatchResult,
+    LibraryImportRow
 )
-from .tag import TagBase, TagCreate, TagUpdate, TagResponse, TagWithCount
+from .tag import TagBase, TagCreate, TagUpdate, TagResponse, TagWithCount, MovieTagsBatchRequest
 from .collection import (
     CollectionBase, CollectionCreate, CollectionUpdate,
-    CollectionResponse, CollectionWithMovies
+    CollectionResponse, CollectionWithMovies, CollectionMoviesBatchRequest
 )
 from .stats import (
     StatsOverview, MonthlyStats, GenreStats, TagStats, BestMovie
 )
+from .home import HomeResponse
 from .image import (
     UserImageBase, UserImageCreate, UserImageUpdate, UserImageResponse,
     UploadUrlRequest, UploadUrlResponse
@@ -43,8 +46,13 @@ __all__ = [
     "UserMovieCreate",
     "UserMovieUpdate",
     "UserMovieResponse",
+    "UserMovieBatchUpdate",
     "MovieSearchResult",
     "MovieMetadata",
+    "MovieMetadataBatchItem",
+    "MovieMetadataBatchRequest",
+    "MovieMetadataBatchResult",
+    "LibraryImportRow",
 
     # Tag
     "TagBase",
@@ -52,6 +60,7 @@ __all__ = [
     "TagUpdate",
     "TagResponse",
     "TagWithCount",
+    "MovieTagsBatchRequest",
 
     # Collection
     "CollectionBase",
@@ -59,6 +68,7 @@ __all__ = [
     "CollectionUpdate",
     "CollectionResponse",
     "CollectionWithMovies",
+    "CollectionMoviesBatchRequest",
 
     # Stats
     "StatsOverview",
@@ -67,6 +77,9 @@ __all__ = [
     "TagStats",
     "BestMovie",
 
+    # Home
+    "HomeResponse",
+
     # Image
     "UserImageBase",
     "UserImageCreate",
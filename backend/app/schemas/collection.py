@@ -3,8 +3,9 @@ Collection Pydantic schemas
 컬렉션 관련 스키마
 """
 from datetime import datetime
-from typing import Optional, TYPE_CHECKING
-from pydantic import BaseModel
+from typing import List, Optional, TYPE_CHECKING
+from uuid import UUID
+from pydantic import BaseModel, Field
 
 if TYPE_CHECKING:
     from .movie import MovieResponse
@@ -35,7 +36,7 @@ class CollectionUpdate(BaseModel):
 class CollectionResponse(CollectionBase):
     """Collection 응답 스키마"""
     id: int
-    user_id: str
+    user_id: UUID
     movie_count: int  # 영화 개수 (JOIN으로 계산)
     created_at: datetime
     updated_at: datetime
@@ -47,3 +48,8 @@ class CollectionResponse(CollectionBase):
 class CollectionWithMovies(CollectionResponse):
     """Collection with movies 응답 스키마"""
     movies: list["MovieResponse"]
+
+
+class CollectionMoviesBatchRequest(BaseModel):
+    """컬렉션에 여러 영화 추가/제거 요청"""
+    user_movie_ids: List[int] = Field(..., min_length=1)
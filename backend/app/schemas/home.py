@@ -0,0 +1,27 @@
+"""
+Home Pydantic schemas
+홈/통계 화면 집계 응답 스키마
+"""
+from typing import Dict, List, Optional
+from pydantic import BaseModel
+
+from .collection import CollectionResponse
+from .movie import UserMovieResponse
+from .stats import StatsOverview, MonthlyStats, GenreStats, BestMovie
+from .user import UserResponse
+
+
+class HomeResponse(BaseModel):
+    """
+    홈 화면 집계 응답
+
+    요청하지 않았거나 실패한 섹션은 null (실패 사유는 errors에 섹션별로 기록)
+    """
+    user: Optional[UserResponse] = None
+    stats: Optional[StatsOverview] = None
+    monthly: Optional[List[MonthlyStats]] = None
+    genres: Optional[List[GenreStats]] = None
+    best_movies: Optional[List[BestMovie]] = None
+    collections: Optional[List[CollectionResponse]] = None
+    movies: Optional[List[UserMovieResponse]] = None
+    errors: Dict[str, str] = {}
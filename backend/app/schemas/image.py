@@ -3,15 +3,16 @@ Image Pydantic schemas
 이미지 관련 스키마 (티켓, 포토카드 등)
 """
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel
+from typing import Dict, List, Optional
+from pydantic import BaseModel, Field
 
 
 class UserImageBase(BaseModel):
     """UserImage 기본 스키마"""
     user_movie_id: int
-    type: str  # "ticket" or "photocard"
+    image_type: str  # "ticket" or "photocard"
     image_url: str
+    file_key: Optional[str] = None  # 업로드 응답의 file_key (미지정 시 image_url에서 추출)
     caption: Optional[str] = None
 
 
@@ -28,6 +29,7 @@ class UserImageUpdate(BaseModel):
 class UserImageResponse(UserImageBase):
     """UserImage 응답 스키마"""
     id: int
+    thumbnail_url: Optional[str] = None  # 썸네일 생성 전에는 None
     created_at: datetime
 
     class Config:
@@ -38,10 +40,82 @@ class UploadUrlRequest(BaseModel):
     """S3 Presigned URL 요청"""
     file_name: str
     file_type: str  # "image/jpeg", "image/png", etc.
+    file_size: Optional[int] = Field(None, ge=1)  # bytes, 지정 시 presigned POST 최대 크기로 사용
+    content_sha256: Optional[str] = Field(None, pattern="^[0-9a-f]{64}$")  # 파일 내용 SHA-256 (hex), 지정 시 내용 기반 키
 
 
 class UploadUrlResponse(BaseModel):
     """S3 Presigned URL 응답"""
     upload_url: str
+    upload_headers: Dict[str, str] = {}  # PUT 요청에 그대로 포함할 헤더 (Content-Type, x-amz-checksum-sha256)
     file_url: str  # 업로드 후 사용할 public URL
+    file_key: str  # S3 객체 키
     expires_in: int  # seconds
+    already_uploaded: bool = False  # 같은 내용의 이미지가 이미 등록되어 있으면 업로드 생략 가능
+
+
+class BatchUploadUrlRequest(BaseModel):
+    """여러 파일의 Presigned URL 일괄 요청"""
+    files: List[UploadUrlRequest] = Field(..., min_length=1)
+    method: str = Field("put", pattern="^(put|post)$")  # put: presigned PUT, post: presigned POST (크기/타입 조건)
+
+
+class PresignedUpload(BaseModel):
+    """Presigned 업로드 정보 (PUT 또는 POST)"""
+    file_name: str
+    upload_url: str
+    file_url: str
+    file_key: str
+    upload_headers: Optional[Dict[str, str]] = None  # PUT: 요청에 그대로 포함할 헤더
+    fields: Optional[Dict[str, str]] = None  # POST: multipart/form-data에 그대로 포함할 필드 (file 필드는 마지막)
+    max_file_size: Optional[int] = None  # POST: content-length-range 상한 (bytes)
+    already_uploaded: bool = False
+
+
+class BatchUploadUrlResponse(BaseModel):
+    """여러 파일의 Presigned URL 일괄 응답"""
+    method: str
+    uploads: List[PresignedUpload]
+    expires_in: int  # seconds
+
+
+class MultipartUploadRequest(BaseModel):
+    """대용량 이미지 multipart 업로드 시작 요청 (S3가 전체 내용을 검증할 수 없으므로 content_sha256 없이 항상 UUID 키)"""
+    file_name: str
+    file_type: str
+    file_size: int = Field(..., ge=1)  # bytes
+
+
+class MultipartUploadPart(BaseModel):
+    """Part별 presigned URL"""
+    part_number: int
+    upload_url: str
+
+
+class MultipartUploadResponse(BaseModel):
+    """Multipart 업로드 시작 응답"""
+    upload_id: str
+    file_url: str
+    file_key: str
+    part_size: int  # 마지막 part를 제외한 각 part 크기 (bytes)
+    parts: List[MultipartUploadPart]
+    expires_in: int  # seconds
+
+
+class CompletedPart(BaseModel):
+    """업로드 완료된 part (PUT 응답의 ETag 헤더)"""
+    part_number: int = Field(..., ge=1, le=10000)
+    etag: str
+
+
+class MultipartCompleteRequest(BaseModel):
+    """Multipart 업로드 완료 요청"""
+    file_key: str
+    upload_id: str
+    parts: List[CompletedPart] = Field(..., min_length=1)
+
+
+class MultipartAbortRequest(BaseModel):
+    """Multipart 업로드 취소 요청"""
+    file_key: str
+    upload_id: str
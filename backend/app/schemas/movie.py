@@ -3,8 +3,9 @@ Movie Pydantic schemas
 영화 관련 스키마
 """
 from datetime import datetime, date
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import List, Optional
+from uuid import UUID
+from pydantic import AliasChoices, BaseModel, Field
 
 
 class MovieBase(BaseModel):
@@ -34,8 +35,18 @@ class MovieUpdate(BaseModel):
 
 
 class MovieResponse(MovieBase):
-    """Movie 응답 스키마"""
+    """Movie 응답 스키마 (movies 컬럼명은 validation_alias로 매핑)"""
     id: int
+    title: str = Field(..., validation_alias=AliasChoices("title_ko", "title"))
+    original_title: Optional[str] = Field(None, validation_alias=AliasChoices("title_original", "original_title"))
+    # 외부 API에 없을 수 있어 movies에서 nullable
+    director: Optional[str] = None
+    year: Optional[int] = Field(None, validation_alias=AliasChoices("production_year", "year"))
+    runtime: Optional[int] = None
+    genre: Optional[str] = None
+    # 미러(우리 버킷/CDN)가 있으면 미러 URL 사용 (Movie.display_*_url)
+    poster_url: Optional[str] = Field(None, validation_alias=AliasChoices("display_poster_url", "poster_url"))
+    backdrop_url: Optional[str] = Field(None, validation_alias=AliasChoices("display_backdrop_url", "backdrop_url"))
     created_at: datetime
     updated_at: datetime
 
@@ -74,7 +85,11 @@ class UserMovieUpdate(BaseModel):
 class UserMovieResponse(UserMovieBase):
     """UserMovie 응답 스키마"""
     id: int
-    user_id: str
+    user_id: UUID
+    rating: Optional[float] = None  # user_movies.rating은 0.5 단위 DECIMAL
+    # user_movies 컬럼명: one_line_review / is_best_movie
+    review: Optional[str] = Field(None, validation_alias=AliasChoices("one_line_review", "review"))
+    is_life_movie: bool = Field(False, validation_alias=AliasChoices("is_best_movie", "is_life_movie"))
     movie: MovieResponse
     created_at: datetime
     updated_at: datetime
@@ -83,6 +98,13 @@ class UserMovieResponse(UserMovieBase):
         from_attributes = True
 
 
+class UserMovieBatchUpdate(BaseModel):
+    """여러 UserMovie 일괄 업데이트 스키마 (상태/별점)"""
+    user_movie_ids: List[int] = Field(..., min_length=1)
+    status: Optional[str] = Field(None, pattern="^(watching|completed|watchlist)$")
+    rating: Optional[int] = Field(None, ge=1, le=5)
+
+
 class MovieSearchResult(BaseModel):
     """외부 API 영화 검색 결과"""
     title: str
@@ -113,3 +135,35 @@ class MovieMetadata(BaseModel):
     kobis_code: Optional[str] = None
     tmdb_id: Optional[int] = None
     kmdb_id: Optional[str] = None
+
+
+class MovieMetadataBatchItem(BaseModel):
+    """배치 메타데이터 요청 항목"""
+    source: str  # "kobis" or "tmdb"
+    id: str  # kobis_code or tmdb_id
+
+
+class MovieMetadataBatchRequest(BaseModel):
+    """배치 메타데이터 요청"""
+    items: List[MovieMetadataBatchItem] = Field(..., min_length=1)
+
+
+class MovieMetadataBatchResult(BaseModel):
+    """배치 메타데이터 응답 항목 (요청 순서 유지, 항목별 에러)"""
+    source: str
+    id: str
+    metadata: Optional[MovieMetadata] = None
+    error: Optional[str] = None
+
+
+class LibraryImportRow(BaseModel):
+    """라이브러리 가져오기 항목 (CSV/JSON 한 줄, Letterboxd/Watcha 컬럼명 정규화 후)"""
+    title: str = Field(..., min_length=1)
+    year: Optional[int] = None
+    status: str = Field("completed", pattern="^(watching|completed|watchlist)$")
+    rating: Optional[float] = Field(None, ge=0, le=5)
+    watch_date: Optional[date] = None
+    review: Optional[str] = None
+    tags: List[str] = []
+    tmdb_id: Optional[int] = None
+    kobis_code: Optional[str] = None
@@ -43,7 +43,7 @@ class BestMovie(BaseModel):
     director: str
     year: int
     poster_url: str
-    rating: int
+    rating: float  # user_movies.rating은 0.5 단위 DECIMAL
     review: str
     watch_date: date
 
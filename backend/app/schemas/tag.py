@@ -3,8 +3,9 @@ Tag Pydantic schemas
 태그 관련 스키마
 """
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel
+from typing import List, Optional
+from uuid import UUID
+from pydantic import BaseModel, Field
 
 
 class TagBase(BaseModel):
@@ -26,7 +27,7 @@ class TagUpdate(BaseModel):
 class TagResponse(TagBase):
     """Tag 응답 스키마"""
     id: int
-    user_id: Optional[str] = None  # custom tag has user_id, predefined tag is None
+    user_id: Optional[UUID] = None  # custom tag has user_id, predefined tag is None
     created_at: datetime
 
     class Config:
@@ -36,3 +37,9 @@ class TagResponse(TagBase):
 class TagWithCount(TagResponse):
     """태그와 사용 횟수"""
     count: int
+
+
+class MovieTagsBatchRequest(BaseModel):
+    """여러 영화에 여러 태그 추가/제거 요청"""
+    user_movie_ids: List[int] = Field(..., min_length=1)
+    tag_ids: List[int] = Field(..., min_length=1)
@@ -4,6 +4,7 @@ User Pydantic schemas
 """
 from datetime import datetime
 from typing import Optional
+from uuid import UUID
 from pydantic import BaseModel, EmailStr
 
 
@@ -28,7 +29,7 @@ class UserUpdate(BaseModel):
 
 class UserResponse(UserBase):
     """User 응답 스키마"""
-    id: str  # UUID from Supabase
+    id: UUID  # UUID from Supabase
     yearly_goal: int
     created_at: datetime
     updated_at: datetime
@@ -0,0 +1,199 @@
+"""
+캐시 직렬화 코덱
+Redis에 저장하는 캐시 값의 직렬화/압축 포맷
+
+저장 포맷:
+    [format version: 1 byte][flags: 1 byte][payload]
+    - flags 상위 4bit: 직렬화 코덱 ID (json / orjson / msgpack)
+    - flags 하위 4bit: 압축 ID (none / zlib / lz4)
+
+헤더가 없는 값(이전 버전의 JSON 텍스트)도 읽을 수 있음
+"""
+import json
+import zlib
+from typing import Any, Optional
+
+from app.config import settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover - optional dependency
+    lz4_frame = None
+
+
+# 포맷 버전 (헤더 구조가 바뀌면 증가)
+FORMAT_VERSION = 1
+
+# 직렬화 코덱 ID
+CODEC_JSON = 0
+CODEC_ORJSON = 1
+CODEC_MSGPACK = 2
+
+# 압축 ID
+COMPRESSION_NONE = 0
+COMPRESSION_ZLIB = 1
+COMPRESSION_LZ4 = 2
+
+CODEC_IDS = {"json": CODEC_JSON, "orjson": CODEC_ORJSON, "msgpack": CODEC_MSGPACK}
+COMPRESSION_IDS = {"none": COMPRESSION_NONE, "zlib": COMPRESSION_ZLIB, "lz4": COMPRESSION_LZ4}
+
+
+class CacheCodec:
+    """캐시 값 인코더/디코더"""
+
+    def __init__(
+        self,
+        codec: str = "orjson",
+        compression: str = "zlib",
+        compression_threshold: int = 1024,
+    ):
+        """
+        Args:
+            codec: 직렬화 방식 ("json", "orjson", "msgpack")
+            compression: 압축 방식 ("none", "zlib", "lz4")
+            compression_threshold: 이 크기(bytes) 이상인 payload만 압축
+        """
+        if codec not in CODEC_IDS:
+            raise ValueError(f"Unknown cache codec: {codec}")
+        if compression not in COMPRESSION_IDS:
+            raise ValueError(f"Unknown cache compression: {compression}")
+
+        # 설치되지 않은 optional 라이브러리는 기본값으로 대체
+        if codec == "orjson" and orjson is None:
+            print("⚠️  orjson not installed, falling back to json cache codec")
+            codec = "json"
+        if codec == "msgpack" and msgpack is None:
+            print("⚠️  msgpack not installed, falling back to json cache codec")
+            codec = "json"
+        if compression == "lz4" and lz4_frame is None:
+            print("⚠️  lz4 not installed, falling back to zlib cache compression")
+            compression = "zlib"
+
+        self.codec_id = CODEC_IDS[codec]
+        self.compression_id = COMPRESSION_IDS[compression]
+        self.compression_threshold = compression_threshold
+
+    def encode(self, value: Any) -> bytes:
+        """
+        값을 캐시 저장용 bytes로 인코딩
+
+        Args:
+            value: JSON 호환 값 (dict, list 등)
+
+        Returns:
+            헤더가 포함된 bytes
+        """
+        payload = _serialize(self.codec_id, value)
+
+        compression_id = COMPRESSION_NONE
+        if self.compression_id != COMPRESSION_NONE and len(payload) >= self.compression_threshold:
+            compressed = _compress(self.compression_id, payload)
+            # 압축 효과가 없으면 원본 그대로 저장
+            if len(compressed) < len(payload):
+                payload = compressed
+                compression_id = self.compression_id
+
+        header = bytes((FORMAT_VERSION, (self.codec_id << 4) | compression_id))
+        return header + payload
+
+    def decode(self, data: Optional[bytes]) -> Optional[Any]:
+        """
+        캐시에서 읽은 bytes를 값으로 디코딩
+
+        현재 설정과 다른 코덱/압축으로 저장된 값도 헤더를 보고 디코딩
+
+        Args:
+            data: Redis에서 읽은 값
+
+        Returns:
+            디코딩된 값 (없거나 디코딩 실패 시 None)
+        """
+        if not data:
+            return None
+
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+
+        # 헤더 없는 이전 포맷 (JSON 텍스트)
+        if data[0] != FORMAT_VERSION:
+            try:
+                return json.loads(data)
+            except ValueError:
+                return None
+
+        if len(data) < 2:
+            return None
+
+        codec_id = data[1] >> 4
+        compression_id = data[1] & 0x0F
+
+        try:
+            payload = _decompress(compression_id, data[2:])
+            return _deserialize(codec_id, payload)
+        except Exception as e:
+            print(f"⚠️  Cache decode error: {e}")
+            return None
+
+
+def _serialize(codec_id: int, value: Any) -> bytes:
+    """직렬화"""
+    if codec_id == CODEC_ORJSON:
+        return orjson.dumps(value)
+    if codec_id == CODEC_MSGPACK:
+        return msgpack.packb(value, use_bin_type=True)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _deserialize(codec_id: int, payload: bytes) -> Any:
+    """역직렬화"""
+    if codec_id == CODEC_ORJSON:
+        if orjson is None:
+            return json.loads(payload)
+        return orjson.loads(payload)
+    if codec_id == CODEC_MSGPACK:
+        if msgpack is None:
+            raise RuntimeError("msgpack not installed")
+        return msgpack.unpackb(payload, raw=False)
+    if codec_id == CODEC_JSON:
+        return json.loads(payload)
+    raise ValueError(f"Unknown cache codec id: {codec_id}")
+
+
+def _compress(compression_id: int, payload: bytes) -> bytes:
+    """압축"""
+    if compression_id == COMPRESSION_LZ4:
+        return lz4_frame.compress(payload)
+    if compression_id == COMPRESSION_ZLIB:
+        return zlib.compress(payload)
+    return payload
+
+
+def _decompress(compression_id: int, payload: bytes) -> bytes:
+    """압축 해제"""
+    if compression_id == COMPRESSION_LZ4:
+        if lz4_frame is None:
+            raise RuntimeError("lz4 not installed")
+        return lz4_frame.decompress(payload)
+    if compression_id == COMPRESSION_ZLIB:
+        return zlib.decompress(payload)
+    if compression_id == COMPRESSION_NONE:
+        return payload
+    raise ValueError(f"Unknown cache compression id: {compression_id}")
+
+
+# Global codec instance (settings 기반)
+cache_codec = CacheCodec(
+    codec=settings.CACHE_CODEC,
+    compression=settings.CACHE_COMPRESSION,
+    compression_threshold=settings.CACHE_COMPRESSION_THRESHOLD,
+)
@@ -0,0 +1,150 @@
+"""
+캐시 네임스페이스 버전 관리
+provider별(kobis, tmdb, kmdb) 캐시 키에 버전을 붙여 O(1) 무효화
+
+캐시 키 형식:
+    {namespace}:v{schema}.{generation}:{suffix}
+    예) tmdb:v1.0:movie:496243
+
+- schema: 코드에 고정된 버전. MovieSearchResult/MovieMetadata 구성 방식이
+  바뀌면 NAMESPACE_SCHEMA_VERSIONS 값을 올려서 배포 → 이전 캐시는 자연 만료
+- generation: Redis 카운터. 운영 중 bump()로 올리면 네임스페이스 전체가 즉시 무효화
+
+영화 ID 단위 무효화는 태그 Set(cache:tag:movie:{source}:{id})에
+해당 영화가 포함된 캐시 키를 기록해두고 삭제 (KEYS/SCAN 사용 안 함)
+"""
+import time
+from typing import Dict, List, Tuple
+
+from app.config import settings
+from app.services.redis_service import redis_service
+
+
+# 코드 레벨 스키마 버전 (캐시 값의 구조/내용 생성 방식이 바뀌면 증가)
+NAMESPACE_SCHEMA_VERSIONS: Dict[str, int] = {
+    "kobis": 1,
+    "tmdb": 1,
+    "kmdb": 1,
+}
+
+
+class CacheNamespaceService:
+    """캐시 네임스페이스 서비스"""
+
+    def __init__(self):
+        # namespace -> (generation, 로컬 캐시 만료 시각)
+        self._generations: Dict[str, Tuple[int, float]] = {}
+
+    @staticmethod
+    def generation_key(namespace: str) -> str:
+        """네임스페이스 generation 카운터 키"""
+        return f"cache:ns:{namespace}:gen"
+
+    @staticmethod
+    def tag_key(source: str, movie_id) -> str:
+        """영화 ID 태그 Set 키"""
+        return f"cache:tag:movie:{source}:{movie_id}"
+
+    async def key(self, namespace: str, suffix: str) -> str:
+        """
+        버전이 적용된 캐시 키 생성
+
+        Args:
+            namespace: "kobis", "tmdb", "kmdb"
+            suffix: 네임스페이스 내부 키 (e.g., "movie:123")
+
+        Returns:
+            캐시 키
+        """
+        return (await self.keys([(namespace, suffix)]))[0]
+
+    async def keys(self, items: List[Tuple[str, str]]) -> List[str]:
+        """
+        여러 캐시 키를 한 번에 생성 (generation 조회는 최대 MGET 1회)
+
+        Args:
+            items: (namespace, suffix) 리스트
+
+        Returns:
+            items와 같은 순서의 캐시 키 리스트
+        """
+        generations = await self._get_generations({namespace for namespace, _ in items})
+        return [
+            f"{namespace}:v{NAMESPACE_SCHEMA_VERSIONS[namespace]}.{generations[namespace]}:{suffix}"
+            for namespace, suffix in items
+        ]
+
+    async def bump(self, namespace: str) -> int:
+        """
+        네임스페이스 generation 증가 (네임스페이스 전체 캐시 무효화, O(1))
+
+        다른 worker는 로컬 generation 캐시가 만료되는 시점
+        (CACHE_NAMESPACE_GENERATION_TTL초 이내)에 반영됨
+
+        Args:
+            namespace: "kobis", "tmdb", "kmdb"
+
+        Returns:
+            새 generation 값
+        """
+        self._validate(namespace)
+
+        generation = await redis_service.incr(self.generation_key(namespace))
+        self._generations[namespace] = (
+            generation,
+            time.monotonic() + settings.CACHE_NAMESPACE_GENERATION_TTL,
+        )
+        return generation
+
+    async def invalidate_movie(self, source: str, movie_id) -> int:
+        """
+        특정 영화가 포함된 캐시 항목 삭제 (태그 Set 기반)
+
+        Args:
+            source: "kobis", "tmdb", "kmdb"
+            movie_id: provider의 영화 ID
+
+        Returns:
+            삭제된 캐시 키 개수 (태그 Set 제외)
+        """
+        self._validate(source)
+
+        tag_key = self.tag_key(source, movie_id)
+        members = await redis_service.smembers(tag_key)
+        deleted = await redis_service.delete_many(list(members) + [tag_key])
+        return max(deleted - 1, 0) if members else 0
+
+    async def _get_generations(self, namespaces) -> Dict[str, int]:
+        """
+        네임스페이스별 generation 조회 (로컬 캐시 → Redis MGET)
+        """
+        now = time.monotonic()
+        generations: Dict[str, int] = {}
+        missing: List[str] = []
+
+        for namespace in namespaces:
+            self._validate(namespace)
+            cached = self._generations.get(namespace)
+            if cached and cached[1] > now:
+                generations[namespace] = cached[0]
+            else:
+                missing.append(namespace)
+
+        if missing:
+            values = await redis_service.mget([self.generation_key(namespace) for namespace in missing])
+            expires_at = now + settings.CACHE_NAMESPACE_GENERATION_TTL
+            for namespace, value in zip(missing, values):
+                generation = int(value) if value else 0
+                generations[namespace] = generation
+                self._generations[namespace] = (generation, expires_at)
+
+        return generations
+
+    @staticmethod
+    def _validate(namespace: str):
+        if namespace not in NAMESPACE_SCHEMA_VERSIONS:
+            raise ValueError(f"Unknown cache namespace: {namespace}")
+
+
+# Singleton instance
+cache_namespace = CacheNamespaceService()
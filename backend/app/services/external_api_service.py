@@ -2,41 +2,101 @@
 외부 API 통합 서비스
 KOBIS, TMDb, KMDb API를 사용하여 영화 메타데이터 검색
 """
+import asyncio
 import httpx
-from typing import List, Optional
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Tuple
 from app.config import settings
 from app.schemas.movie import MovieSearchResult, MovieMetadata
+from app.services.cache_namespace import cache_namespace
+from app.services.metrics_service import metrics_service
 from app.services.redis_service import redis_service
 
+# 외부 API 응답 캐시 TTL (24시간)
+CACHE_TTL = 86400
+
+# (metadata, error) - 배치 조회 결과 항목
+MetadataBatchEntry = Tuple[Optional[MovieMetadata], Optional[str]]
+
 
 class ExternalAPIService:
     """외부 API 통합 서비스"""
 
-    async def search_movies(self, query: str) -> List[MovieSearchResult]:
+    def __init__(self):
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    async def search_movies(self, query: str, sources: Optional[List[str]] = None) -> List[MovieSearchResult]:
         """
         여러 외부 API에서 영화 검색
 
+        - provider들의 캐시는 MGET 한 번으로 조회
+        - 캐시 miss인 provider만 병렬로 API 호출 후 MSET 한 번으로 저장
+
         Args:
             query: 검색어
+            sources: 검색할 provider 목록 (기본값: kobis, tmdb, kmdb 전체)
 
         Returns:
-            영화 검색 결과 리스트
+            영화 검색 결과 리스트 (KOBIS → TMDb → KMDb 순서)
         """
+        fetchers = {
+            "kobis": self._fetch_kobis_search,  # 한국 영화
+            "tmdb": self._fetch_tmdb_search,  # 국제 영화
+            "kmdb": self._fetch_kmdb_search,  # 한국 영화 추가 정보
+        }
+        sources = [source for source in fetchers if sources is None or source in sources]
+        cache_keys = await cache_namespace.keys([(source, f"search:{query}") for source in sources])
+
+        # Check cache (single round trip)
+        cached_values = await redis_service.mget_json(cache_keys)
+
+        results_by_source: Dict[str, List[MovieSearchResult]] = {}
+        misses: List[str] = []
+        for source, cached in zip(sources, cached_values):
+            if cached:
+                results_by_source[source] = [MovieSearchResult.model_construct(**item) for item in cached]
+            else:
+                misses.append(source)
+
+        # Fetch misses concurrently
+        if misses:
+            fetched = await asyncio.gather(
+                *(self._search_limited(source, fetchers[source], query) for source in misses)
+            )
+
+            source_keys = dict(zip(sources, cache_keys))
+            to_cache = {}
+            tags: Dict[str, List[str]] = {}
+            for source, results in zip(misses, fetched):
+                results_by_source[source] = results or []
+                if results is not None:
+                    to_cache[source_keys[source]] = [r.model_dump() for r in results]
+                    self._add_search_tags(tags, source_keys[source], results)
+
+            # Cache for 24 hours
+            if to_cache:
+                await redis_service.mset_json(to_cache, ttl=CACHE_TTL, tags=tags)
+
         results = []
+        for source in sources:
+            results.extend(results_by_source[source])
 
-        # KOBIS에서 검색 (한국 영화)
-        kobis_results = await self.search_kobis(query)
-        results.extend(kobis_results)
+        return results
 
-        # TMDb에서 검색 (국제 영화)
-        tmdb_results = await self.search_tmdb(query)
-        results.extend(tmdb_results)
+    async def _search_limited(self, source: str, fetcher, query: str) -> Optional[List[MovieSearchResult]]:
+        """
+        provider별 Semaphore로 동시 요청 수를 제한하여 검색 API 호출
 
-        # KMDb에서 검색 (한국 영화 추가 정보)
-        kmdb_results = await self.search_kmdb(query)
-        results.extend(kmdb_results)
+        Args:
+            source: "kobis", "tmdb", "kmdb"
+            fetcher: _fetch_*_search 메서드
+            query: 검색어
 
-        return results
+        Returns:
+            영화 검색 결과 리스트 (API 실패 시 None)
+        """
+        async with self._get_semaphore(source):
+            return await fetcher(query)
 
     async def search_kobis(self, query: str) -> List[MovieSearchResult]:
         """
@@ -48,62 +108,83 @@ class ExternalAPIService:
         Returns:
             영화 검색 결과 리스트
         """
-        cache_key = f"kobis:search:{query}"
+        cache_key = await cache_namespace.key("kobis", f"search:{query}")
 
-        # Check cache
+        # Check cache (캐시 값은 검증을 거쳐 저장된 데이터이므로 재검증 생략)
         cached = await redis_service.get_json(cache_key)
         if cached:
-            return [MovieSearchResult(**item) for item in cached]
+            return [MovieSearchResult.model_construct(**item) for item in cached]
+
+        results = await self._fetch_kobis_search(query)
+        if results is None:
+            return []
 
+        # Cache for 24 hours
+        tags: Dict[str, List[str]] = {}
+        self._add_search_tags(tags, cache_key, results)
+        await redis_service.mset_json(
+            {cache_key: [r.model_dump() for r in results]},
+            ttl=CACHE_TTL,
+            tags=tags
+        )
+
+        return results
+
+    async def _fetch_kobis_search(self, query: str) -> Optional[List[MovieSearchResult]]:
+        """
+        KOBIS 검색 API 호출 (캐시 조회/저장 없음)
+
+        Args:
+            query: 검색어
+
+        Returns:
+            영화 검색 결과 리스트 (API 실패 시 None)
+        """
         # Fetch from API
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    "http://www.kobis.or.kr/kobisopenapi/webservice/rest/movie/searchMovieList.json",
-                    params={
-                        "key": settings.KOBIS_API_KEY,
-                        "movieNm": query,
-                    }
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                results = []
-                movies = data.get("movieListResult", {}).get("movieList", [])
-
-                for movie in movies:
-                    # Get director
-                    directors = movie.get("directors", [])
-                    director = directors[0].get("peopleNm") if directors else "Unknown"
-
-                    result = MovieSearchResult(
-                        title=movie.get("movieNm", ""),
-                        original_title=movie.get("movieNmEn"),
-                        director=director,
-                        year=int(movie.get("prdtYear", 0)),
-                        runtime=None,  # KOBIS doesn't provide runtime in search
-                        genre=movie.get("repGenreNm"),
-                        poster_url=None,  # KOBIS doesn't provide poster
-                        synopsis=None,
-                        kobis_code=movie.get("movieCd"),
-                        tmdb_id=None,
-                        kmdb_id=None,
-                        source="kobis"
-                    )
-                    results.append(result)
-
-                # Cache for 24 hours
-                await redis_service.set_json(
-                    cache_key,
-                    [r.model_dump() for r in results],
-                    ttl=86400
+            data = await self._request(
+                "kobis",
+                "search",
+                f"{settings.KOBIS_BASE_URL}/movie/searchMovieList.json",
+                params={
+                    "key": settings.KOBIS_API_KEY,
+                    "movieNm": query,
+                }
+            )
+
+            results = []
+            movies = data.get("movieListResult", {}).get("movieList", [])
+
+            for movie in movies:
+                # Get director
+                directors = movie.get("directors", [])
+                director = directors[0].get("peopleNm") if directors else "Unknown"
+
+                # Get year (미확정 영화는 빈 문자열)
+                year_str = movie.get("prdtYear", "")
+                year = int(year_str) if year_str.isdigit() else 0
+
+                result = MovieSearchResult(
+                    title=movie.get("movieNm", ""),
+                    original_title=movie.get("movieNmEn"),
+                    director=director,
+                    year=year,
+                    runtime=None,  # KOBIS doesn't provide runtime in search
+                    genre=movie.get("repGenreNm"),
+                    poster_url=None,  # KOBIS doesn't provide poster
+                    synopsis=None,
+                    kobis_code=movie.get("movieCd"),
+                    tmdb_id=None,
+                    kmdb_id=None,
+                    source="kobis"
                 )
+                results.append(result)
 
-                return results
+            return results
 
         except Exception as e:
             print(f"KOBIS API error: {e}")
-            return []
+            return None
 
     async def search_tmdb(self, query: str) -> List[MovieSearchResult]:
         """
@@ -115,67 +196,84 @@ class ExternalAPIService:
         Returns:
             영화 검색 결과 리스트
         """
-        cache_key = f"tmdb:search:{query}"
+        cache_key = await cache_namespace.key("tmdb", f"search:{query}")
 
-        # Check cache
+        # Check cache (캐시 값은 검증을 거쳐 저장된 데이터이므로 재검증 생략)
         cached = await redis_service.get_json(cache_key)
         if cached:
-            return [MovieSearchResult(**item) for item in cached]
+            return [MovieSearchResult.model_construct(**item) for item in cached]
+
+        results = await self._fetch_tmdb_search(query)
+        if results is None:
+            return []
 
+        # Cache for 24 hours
+        tags: Dict[str, List[str]] = {}
+        self._add_search_tags(tags, cache_key, results)
+        await redis_service.mset_json(
+            {cache_key: [r.model_dump() for r in results]},
+            ttl=CACHE_TTL,
+            tags=tags
+        )
+
+        return results
+
+    async def _fetch_tmdb_search(self, query: str) -> Optional[List[MovieSearchResult]]:
+        """
+        TMDb 검색 API 호출 (캐시 조회/저장 없음)
+
+        Args:
+            query: 검색어
+
+        Returns:
+            영화 검색 결과 리스트 (API 실패 시 None)
+        """
         # Fetch from API
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    "https://api.themoviedb.org/3/search/movie",
-                    params={
-                        "api_key": settings.TMDB_API_KEY,
-                        "query": query,
-                        "language": "ko-KR",
-                    }
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                results = []
-                movies = data.get("results", [])
-
-                for movie in movies:
-                    # Get release year
-                    release_date = movie.get("release_date", "")
-                    year = int(release_date[:4]) if release_date else 0
-
-                    # Get poster URL
-                    poster_path = movie.get("poster_path")
-                    poster_url = f"https://image.tmdb.org/t/p/w500{poster_path}" if poster_path else None
-
-                    result = MovieSearchResult(
-                        title=movie.get("title", ""),
-                        original_title=movie.get("original_title"),
-                        director="Unknown",  # TMDb search doesn't include director
-                        year=year,
-                        runtime=None,  # Need to fetch details for runtime
-                        genre=None,  # Genre requires separate API call
-                        poster_url=poster_url,
-                        synopsis=movie.get("overview"),
-                        kobis_code=None,
-                        tmdb_id=movie.get("id"),
-                        kmdb_id=None,
-                        source="tmdb"
-                    )
-                    results.append(result)
-
-                # Cache for 24 hours
-                await redis_service.set_json(
-                    cache_key,
-                    [r.model_dump() for r in results],
-                    ttl=86400
+            data = await self._request(
+                "tmdb",
+                "search",
+                f"{settings.TMDB_BASE_URL}/search/movie",
+                params={
+                    "api_key": settings.TMDB_API_KEY,
+                    "query": query,
+                    "language": "ko-KR",
+                }
+            )
+
+            results = []
+            movies = data.get("results", [])
+
+            for movie in movies:
+                # Get release year
+                release_date = movie.get("release_date", "")
+                year = int(release_date[:4]) if release_date else 0
+
+                # Get poster URL
+                poster_path = movie.get("poster_path")
+                poster_url = f"https://image.tmdb.org/t/p/w500{poster_path}" if poster_path else None
+
+                result = MovieSearchResult(
+                    title=movie.get("title", ""),
+                    original_title=movie.get("original_title"),
+                    director="Unknown",  # TMDb search doesn't include director
+                    year=year,
+                    runtime=None,  # Need to fetch details for runtime
+                    genre=None,  # Genre requires separate API call
+                    poster_url=poster_url,
+                    synopsis=movie.get("overview"),
+                    kobis_code=None,
+                    tmdb_id=movie.get("id"),
+                    kmdb_id=None,
+                    source="tmdb"
                 )
+                results.append(result)
 
-                return results
+            return results
 
         except Exception as e:
             print(f"TMDb API error: {e}")
-            return []
+            return None
 
     async def search_kmdb(self, query: str) -> List[MovieSearchResult]:
         """
@@ -187,79 +285,101 @@ class ExternalAPIService:
         Returns:
             영화 검색 결과 리스트
         """
-        cache_key = f"kmdb:search:{query}"
+        cache_key = await cache_namespace.key("kmdb", f"search:{query}")
 
-        # Check cache
+        # Check cache (캐시 값은 검증을 거쳐 저장된 데이터이므로 재검증 생략)
         cached = await redis_service.get_json(cache_key)
         if cached:
-            return [MovieSearchResult(**item) for item in cached]
+            return [MovieSearchResult.model_construct(**item) for item in cached]
+
+        results = await self._fetch_kmdb_search(query)
+        if results is None:
+            return []
 
+        # Cache for 24 hours
+        tags: Dict[str, List[str]] = {}
+        self._add_search_tags(tags, cache_key, results)
+        await redis_service.mset_json(
+            {cache_key: [r.model_dump() for r in results]},
+            ttl=CACHE_TTL,
+            tags=tags
+        )
+
+        return results
+
+    async def _fetch_kmdb_search(self, query: str) -> Optional[List[MovieSearchResult]]:
+        """
+        KMDb 검색 API 호출 (캐시 조회/저장 없음)
+
+        Args:
+            query: 검색어
+
+        Returns:
+            영화 검색 결과 리스트 (API 실패 시 None)
+        """
         # Fetch from API
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    "http://api.koreafilm.or.kr/openapi-data2/wisenut/search_api/search_json2.jsp",
-                    params={
-                        "collection": "kmdb_new2",
-                        "ServiceKey": settings.KMDB_API_KEY,
-                        "title": query,
-                        "listCount": 10,
-                    }
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                results = []
-                movies = data.get("Data", [{}])[0].get("Result", [])
-
-                for movie in movies:
-                    # Get director
-                    directors = movie.get("directors", {}).get("director", [])
-                    director = directors[0].get("directorNm") if directors else "Unknown"
-
-                    # Get year
-                    year_str = movie.get("prodYear", "0")
-                    year = int(year_str) if year_str.isdigit() else 0
-
-                    # Get runtime
-                    runtime_str = movie.get("runtime", "0")
-                    runtime = int(runtime_str) if runtime_str.isdigit() else None
-
-                    # Get poster
-                    posters = movie.get("posters", "").split("|")
-                    poster_url = posters[0] if posters and posters[0] else None
-
-                    # Get genre
-                    genre = movie.get("genre", "")
-
-                    result = MovieSearchResult(
-                        title=movie.get("title", "").replace("!HS", "").replace("!HE", ""),
-                        original_title=movie.get("titleEng"),
-                        director=director,
-                        year=year,
-                        runtime=runtime,
-                        genre=genre,
-                        poster_url=poster_url,
-                        synopsis=movie.get("plots", {}).get("plot", [{}])[0].get("plotText") if movie.get("plots") else None,
-                        kobis_code=None,
-                        tmdb_id=None,
-                        kmdb_id=movie.get("DOCID"),
-                        source="kmdb"
-                    )
-                    results.append(result)
-
-                # Cache for 24 hours
-                await redis_service.set_json(
-                    cache_key,
-                    [r.model_dump() for r in results],
-                    ttl=86400
+            data = await self._request(
+                "kmdb",
+                "search",
+                f"{settings.KMDB_BASE_URL}/search_json2.jsp",
+                params={
+                    "collection": "kmdb_new2",
+                    "ServiceKey": settings.KMDB_API_KEY,
+                    "title": query,
+                    "listCount": 10,
+                }
+            )
+
+            results = []
+            movies = data.get("Data", [{}])[0].get("Result", [])
+
+            for movie in movies:
+                # Get director
+                directors = movie.get("directors", {}).get("director", [])
+                director = directors[0].get("directorNm") if directors else "Unknown"
+
+                # Get year
+                year_str = movie.get("prodYear", "0")
+                year = int(year_str) if year_str.isdigit() else 0
+
+                # Get runtime
+                runtime_str = movie.get("runtime", "0")
+                runtime = int(runtime_str) if runtime_str.isdigit() else None
+
+                # Get poster
+                posters = movie.get("posters", "").split("|")
+                poster_url = posters[0] if posters and posters[0] else None
+
+                # Get genre
+                genre = movie.get("genre", "")
+
+                # Get synopsis (plots.plot이 빈 리스트인 경우 있음)
+                plots = movie.get("plots", {}).get("plot", [])
+                synopsis = plots[0].get("plotText") if plots else None
+
+                # 검색어 강조 표시(!HS ... !HE)와 앞뒤 공백 제거
+                result = MovieSearchResult(
+                    title=movie.get("title", "").replace("!HS", "").replace("!HE", "").strip(),
+                    original_title=movie.get("titleEng"),
+                    director=director,
+                    year=year,
+                    runtime=runtime,
+                    genre=genre,
+                    poster_url=poster_url,
+                    synopsis=synopsis,
+                    kobis_code=None,
+                    tmdb_id=None,
+                    kmdb_id=movie.get("DOCID"),
+                    source="kmdb"
                 )
+                results.append(result)
 
-                return results
+            return results
 
         except Exception as e:
             print(f"KMDb API error: {e}")
-            return []
+            return None
 
     async def get_movie_metadata(self, kobis_code: Optional[str] = None, tmdb_id: Optional[int] = None) -> Optional[MovieMetadata]:
         """
@@ -288,67 +408,84 @@ class ExternalAPIService:
         Returns:
             영화 메타데이터
         """
-        cache_key = f"tmdb:movie:{tmdb_id}"
+        cache_key = await cache_namespace.key("tmdb", f"movie:{tmdb_id}")
 
-        # Check cache
+        # Check cache (캐시 값은 검증을 거쳐 저장된 데이터이므로 재검증 생략)
         cached = await redis_service.get_json(cache_key)
         if cached:
-            return MovieMetadata(**cached)
+            return MovieMetadata.model_construct(**cached)
 
-        # Fetch from API
-        try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    f"https://api.themoviedb.org/3/movie/{tmdb_id}",
-                    params={
-                        "api_key": settings.TMDB_API_KEY,
-                        "language": "ko-KR",
-                        "append_to_response": "credits"
-                    }
-                )
-                response.raise_for_status()
-                movie = response.json()
+        metadata = await self._fetch_tmdb_metadata(tmdb_id)
+        if metadata:
+            # Cache for 24 hours
+            await redis_service.mset_json(
+                {cache_key: metadata.model_dump()},
+                ttl=CACHE_TTL,
+                tags={cache_namespace.tag_key("tmdb", tmdb_id): [cache_key]}
+            )
 
-                # Get director from credits
-                credits = movie.get("credits", {})
-                crew = credits.get("crew", [])
-                directors = [c for c in crew if c.get("job") == "Director"]
-                director = directors[0].get("name") if directors else "Unknown"
+        return metadata
 
-                # Get release year
-                release_date = movie.get("release_date", "")
-                year = int(release_date[:4]) if release_date else 0
-
-                # Get poster and backdrop URLs
-                poster_path = movie.get("poster_path")
-                poster_url = f"https://image.tmdb.org/t/p/w500{poster_path}" if poster_path else None
-
-                backdrop_path = movie.get("backdrop_path")
-                backdrop_url = f"https://image.tmdb.org/t/p/original{backdrop_path}" if backdrop_path else None
-
-                # Get genres
-                genres = movie.get("genres", [])
-                genre = ", ".join([g.get("name") for g in genres])
-
-                metadata = MovieMetadata(
-                    title=movie.get("title", ""),
-                    original_title=movie.get("original_title"),
-                    director=director,
-                    year=year,
-                    runtime=movie.get("runtime", 0),
-                    genre=genre,
-                    poster_url=poster_url,
-                    backdrop_url=backdrop_url,
-                    synopsis=movie.get("overview"),
-                    kobis_code=None,
-                    tmdb_id=tmdb_id,
-                    kmdb_id=None
-                )
+    async def _fetch_tmdb_metadata(self, tmdb_id: int) -> Optional[MovieMetadata]:
+        """
+        TMDb 상세 정보 API 호출 (캐시 조회/저장 없음)
 
-                # Cache for 24 hours
-                await redis_service.set_json(cache_key, metadata.model_dump(), ttl=86400)
+        Args:
+            tmdb_id: TMDb 영화 ID
 
-                return metadata
+        Returns:
+            영화 메타데이터
+        """
+        # Fetch from API
+        try:
+            movie = await self._request(
+                "tmdb",
+                "movie",
+                f"{settings.TMDB_BASE_URL}/movie/{tmdb_id}",
+                params={
+                    "api_key": settings.TMDB_API_KEY,
+                    "language": "ko-KR",
+                    "append_to_response": "credits"
+                }
+            )
+
+            # Get director from credits
+            credits = movie.get("credits", {})
+            crew = credits.get("crew", [])
+            directors = [c for c in crew if c.get("job") == "Director"]
+            director = directors[0].get("name") if directors else "Unknown"
+
+            # Get release year
+            release_date = movie.get("release_date", "")
+            year = int(release_date[:4]) if release_date else 0
+
+            # Get poster and backdrop URLs
+            poster_path = movie.get("poster_path")
+            poster_url = f"https://image.tmdb.org/t/p/w500{poster_path}" if poster_path else None
+
+            backdrop_path = movie.get("backdrop_path")
+            backdrop_url = f"https://image.tmdb.org/t/p/original{backdrop_path}" if backdrop_path else None
+
+            # Get genres
+            genres = movie.get("genres", [])
+            genre = ", ".join([g.get("name") for g in genres])
+
+            metadata = MovieMetadata(
+                title=movie.get("title", ""),
+                original_title=movie.get("original_title"),
+                director=director,
+                year=year,
+                runtime=movie.get("runtime", 0),
+                genre=genre,
+                poster_url=poster_url,
+                backdrop_url=backdrop_url,
+                synopsis=movie.get("overview"),
+                kobis_code=None,
+                tmdb_id=tmdb_id,
+                kmdb_id=None
+            )
+
+            return metadata
 
         except Exception as e:
             print(f"TMDb metadata error: {e}")
@@ -364,67 +501,330 @@ class ExternalAPIService:
         Returns:
             영화 메타데이터
         """
-        cache_key = f"kobis:movie:{kobis_code}"
+        cache_key = await cache_namespace.key("kobis", f"movie:{kobis_code}")
 
-        # Check cache
+        # Check cache (캐시 값은 검증을 거쳐 저장된 데이터이므로 재검증 생략)
         cached = await redis_service.get_json(cache_key)
         if cached:
-            return MovieMetadata(**cached)
+            return MovieMetadata.model_construct(**cached)
+
+        metadata = await self._fetch_kobis_metadata(kobis_code)
+        if metadata:
+            # Cache for 24 hours
+            await redis_service.mset_json(
+                {cache_key: metadata.model_dump()},
+                ttl=CACHE_TTL,
+                tags={cache_namespace.tag_key("kobis", kobis_code): [cache_key]}
+            )
+
+        return metadata
+
+    async def _fetch_kobis_metadata(self, kobis_code: str) -> Optional[MovieMetadata]:
+        """
+        KOBIS 상세 정보 API 호출 (캐시 조회/저장 없음)
 
+        Args:
+            kobis_code: KOBIS 영화 코드
+
+        Returns:
+            영화 메타데이터
+        """
         # Fetch from API
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    "http://www.kobis.or.kr/kobisopenapi/webservice/rest/movie/searchMovieInfo.json",
+            data = await self._request(
+                "kobis",
+                "movie",
+                f"{settings.KOBIS_BASE_URL}/movie/searchMovieInfo.json",
+                params={
+                    "key": settings.KOBIS_API_KEY,
+                    "movieCd": kobis_code,
+                }
+            )
+
+            movie = data.get("movieInfoResult", {}).get("movieInfo", {})
+
+            # Get director
+            directors = movie.get("directors", [])
+            director = directors[0].get("peopleNm") if directors else "Unknown"
+
+            # Get year
+            year_str = movie.get("prdtYear", "0")
+            year = int(year_str) if year_str else 0
+
+            # Get runtime
+            runtime_str = movie.get("showTm", "0")
+            runtime = int(runtime_str) if runtime_str else 0
+
+            # Get genres
+            genres = movie.get("genres", [])
+            genre = ", ".join([g.get("genreNm") for g in genres])
+
+            metadata = MovieMetadata(
+                title=movie.get("movieNm", ""),
+                original_title=movie.get("movieNmEn"),
+                director=director,
+                year=year,
+                runtime=runtime,
+                genre=genre,
+                poster_url=None,  # KOBIS doesn't provide poster
+                backdrop_url=None,
+                synopsis=None,  # KOBIS doesn't provide synopsis
+                kobis_code=kobis_code,
+                tmdb_id=None,
+                kmdb_id=None
+            )
+
+            return metadata
+
+        except Exception as e:
+            print(f"KOBIS metadata error: {e}")
+            return None
+
+    async def get_metadata_batch(
+        self,
+        items: List[Tuple[str, str]],
+        force_refresh: bool = False,
+    ) -> List[MetadataBatchEntry]:
+        """
+        여러 영화의 메타데이터를 한 번에 가져오기
+
+        - 캐시는 MGET 한 번으로 조회
+        - 캐시 miss는 provider별 동시 요청 수 제한 하에 병렬로 외부 API 호출
+        - 결과는 요청 순서대로 반환 (항목별 에러 포함)
+
+        Args:
+            items: (source, id) 튜플 리스트 (source: "kobis" or "tmdb")
+            force_refresh: True면 캐시를 조회하지 않고 모두 다시 가져와서 캐시 갱신 (prefetch용)
+
+        Returns:
+            (metadata, error) 튜플 리스트 (items와 같은 순서)
+        """
+        results: List[MetadataBatchEntry] = [(None, None)] * len(items)
+
+        # 유효성 검사
+        valid: List[Tuple[int, str, str]] = []
+        for index, (source, movie_id) in enumerate(items):
+            if source == "tmdb":
+                if not str(movie_id).isdigit():
+                    results[index] = (None, "Invalid TMDb id")
+                    continue
+                valid.append((index, source, str(int(movie_id))))
+            elif source == "kobis":
+                valid.append((index, source, str(movie_id)))
+            else:
+                results[index] = (None, "Invalid source. Must be 'kobis' or 'tmdb'")
+
+        # 캐시 키 생성 (중복 키는 한 번만 조회)
+        valid_keys = await cache_namespace.keys(
+            [(source, f"movie:{movie_id}") for _, source, movie_id in valid]
+        )
+        key_positions: Dict[str, List[int]] = {}
+        key_targets: Dict[str, Tuple[str, str]] = {}
+        for (index, source, movie_id), cache_key in zip(valid, valid_keys):
+            key_positions.setdefault(cache_key, []).append(index)
+            key_targets[cache_key] = (source, movie_id)
+
+        cache_keys = list(key_positions.keys())
+        if force_refresh:
+            cached_values = [None] * len(cache_keys)
+        else:
+            cached_values = await redis_service.mget_json(cache_keys)
+
+        resolved: Dict[str, Optional[MovieMetadata]] = {}
+        misses: List[str] = []
+        for cache_key, cached in zip(cache_keys, cached_values):
+            if cached:
+                resolved[cache_key] = MovieMetadata.model_construct(**cached)
+            else:
+                misses.append(cache_key)
+
+        # 캐시 miss는 외부 API에서 병렬로 가져오기
+        if misses:
+            fetched = await asyncio.gather(
+                *(self._fetch_limited(*key_targets[cache_key]) for cache_key in misses)
+            )
+            resolved.update(zip(misses, fetched))
+
+            # Cache for 24 hours (single round trip)
+            to_cache = {
+                cache_key: metadata.model_dump()
+                for cache_key, metadata in zip(misses, fetched)
+                if metadata
+            }
+            tags = {
+                cache_namespace.tag_key(*key_targets[cache_key]): [cache_key]
+                for cache_key in to_cache
+            }
+            if to_cache:
+                await redis_service.mset_json(to_cache, ttl=CACHE_TTL, tags=tags)
+
+        for cache_key, positions in key_positions.items():
+            metadata = resolved.get(cache_key)
+            entry = (metadata, None) if metadata else (None, "Movie metadata not found")
+            for index in positions:
+                results[index] = entry
+
+        return results
+
+    async def get_kobis_box_office(self, weekly: bool = False) -> List[str]:
+        """
+        KOBIS 박스오피스 영화 코드 목록 가져오기
+
+        - 일별: 어제 기준 (당일 집계는 제공되지 않음)
+        - 주간: 지난주 기준 (월~일)
+
+        Args:
+            weekly: True면 주간, False면 일별 박스오피스
+
+        Returns:
+            KOBIS 영화 코드 리스트 (순위 순)
+        """
+        if weekly:
+            url = f"{settings.KOBIS_BASE_URL}/boxoffice/searchWeeklyBoxOfficeList.json"
+            target_date = date.today() - timedelta(days=7)
+            params = {"weekGb": "0"}
+            list_key = "weeklyBoxOfficeList"
+        else:
+            url = f"{settings.KOBIS_BASE_URL}/boxoffice/searchDailyBoxOfficeList.json"
+            target_date = date.today() - timedelta(days=1)
+            params = {}
+            list_key = "dailyBoxOfficeList"
+
+        try:
+            async with self._get_semaphore("kobis"):
+                data = await self._request(
+                    "kobis",
+                    "boxoffice",
+                    url,
                     params={
                         "key": settings.KOBIS_API_KEY,
-                        "movieCd": kobis_code,
+                        "targetDt": target_date.strftime("%Y%m%d"),
+                        **params,
                     }
                 )
-                response.raise_for_status()
-                data = response.json()
 
-                movie = data.get("movieInfoResult", {}).get("movieInfo", {})
+            movies = data.get("boxOfficeResult", {}).get(list_key, [])
+            return [movie.get("movieCd") for movie in movies if movie.get("movieCd")]
 
-                # Get director
-                directors = movie.get("directors", [])
-                director = directors[0].get("peopleNm") if directors else "Unknown"
+        except Exception as e:
+            print(f"KOBIS box office error: {e}")
+            return []
 
-                # Get year
-                year_str = movie.get("prdtYear", "0")
-                year = int(year_str) if year_str else 0
+    async def get_tmdb_movie_list(self, list_name: str) -> List[int]:
+        """
+        TMDb 영화 목록(현재 상영작, 트렌딩) ID 가져오기
 
-                # Get runtime
-                runtime_str = movie.get("showTm", "0")
-                runtime = int(runtime_str) if runtime_str else 0
+        Args:
+            list_name: "now_playing" or "trending"
 
-                # Get genres
-                genres = movie.get("genres", [])
-                genre = ", ".join([g.get("genreNm") for g in genres])
+        Returns:
+            TMDb 영화 ID 리스트
+        """
+        if list_name == "now_playing":
+            url = f"{settings.TMDB_BASE_URL}/movie/now_playing"
+            params = {"region": settings.PREFETCH_TMDB_REGION}
+        elif list_name == "trending":
+            url = f"{settings.TMDB_BASE_URL}/trending/movie/day"
+            params = {}
+        else:
+            raise ValueError(f"Invalid TMDb list: {list_name}")
 
-                metadata = MovieMetadata(
-                    title=movie.get("movieNm", ""),
-                    original_title=movie.get("movieNmEn"),
-                    director=director,
-                    year=year,
-                    runtime=runtime,
-                    genre=genre,
-                    poster_url=None,  # KOBIS doesn't provide poster
-                    backdrop_url=None,
-                    synopsis=None,  # KOBIS doesn't provide synopsis
-                    kobis_code=kobis_code,
-                    tmdb_id=None,
-                    kmdb_id=None
+        try:
+            async with self._get_semaphore("tmdb"):
+                data = await self._request(
+                    "tmdb",
+                    "list",
+                    url,
+                    params={
+                        "api_key": settings.TMDB_API_KEY,
+                        "language": "ko-KR",
+                        **params,
+                    }
                 )
 
-                # Cache for 24 hours
-                await redis_service.set_json(cache_key, metadata.model_dump(), ttl=86400)
-
-                return metadata
+            return [movie.get("id") for movie in data.get("results", []) if movie.get("id")]
 
         except Exception as e:
-            print(f"KOBIS metadata error: {e}")
-            return None
+            print(f"TMDb {list_name} error: {e}")
+            return []
+
+    async def _request(self, provider: str, endpoint: str, url: str, params: Dict[str, Any]) -> Any:
+        """
+        외부 API GET 호출 (provider/endpoint별 호출 수, latency, outcome 메트릭 기록)
+
+        Args:
+            provider: "kobis", "tmdb", "kmdb"
+            endpoint: 메트릭 라벨 (e.g., "search", "movie")
+            url: 요청 URL
+            params: 쿼리 파라미터
+
+        Returns:
+            응답 JSON
+
+        Raises:
+            httpx.HTTPError: 요청 실패 또는 4xx/5xx 응답
+        """
+        with metrics_service.track_external(provider, endpoint):
+            async with httpx.AsyncClient(timeout=10.0) as client:
+                response = await client.get(url, params=params)
+            response.raise_for_status()
+            return response.json()
+
+    async def _fetch_limited(self, source: str, movie_id: str) -> Optional[MovieMetadata]:
+        """
+        provider별 Semaphore로 동시 요청 수를 제한하여 메타데이터 가져오기
+
+        Args:
+            source: "kobis" or "tmdb"
+            movie_id: 영화 ID
+
+        Returns:
+            영화 메타데이터
+        """
+        async with self._get_semaphore(source):
+            if source == "tmdb":
+                return await self._fetch_tmdb_metadata(int(movie_id))
+            return await self._fetch_kobis_metadata(movie_id)
+
+    @staticmethod
+    def _add_search_tags(tags: Dict[str, List[str]], cache_key: str, results: List[MovieSearchResult]):
+        """
+        검색 결과에 포함된 영화 ID별 태그 Set에 검색 캐시 키 추가
+
+        Args:
+            tags: {태그 Set 키: 캐시 키 리스트} (in-place 업데이트)
+            cache_key: 검색 캐시 키
+            results: 검색 결과
+        """
+        for result in results:
+            for source, movie_id in (
+                ("kobis", result.kobis_code),
+                ("tmdb", result.tmdb_id),
+                ("kmdb", result.kmdb_id),
+            ):
+                if movie_id:
+                    tags.setdefault(cache_namespace.tag_key(source, movie_id), []).append(cache_key)
+
+    def _get_semaphore(self, source: str) -> asyncio.Semaphore:
+        """
+        provider별 Semaphore 가져오기 (이벤트 루프 안에서 지연 생성)
+
+        Args:
+            source: "kobis", "tmdb", "kmdb"
+
+        Returns:
+            asyncio.Semaphore
+        """
+        semaphore = self._semaphores.get(source)
+        if semaphore is None:
+            limits = {
+                "kobis": settings.KOBIS_MAX_CONCURRENCY,
+                "tmdb": settings.TMDB_MAX_CONCURRENCY,
+                "kmdb": settings.KMDB_MAX_CONCURRENCY,
+            }
+            semaphore = asyncio.Semaphore(limits[source])
+            self._semaphores[source] = semaphore
+        return semaphore
 
 
 # Singleton instance
@@ -0,0 +1,172 @@
+"""
+Library Export Service
+사용자 라이브러리를 CSV / NDJSON으로 스트리밍 내보내기
+
+- 서버 사이드 커서(yield_per)로 EXPORT_BATCH_SIZE개씩 읽어서 바로 전송 → 라이브러리 크기와 무관하게 메모리 일정
+- 태그/컬렉션/이미지는 상관 서브쿼리(array_agg)로 같은 행에 포함 (추가 쿼리 없음)
+- CSV 컬럼명은 가져오기(library_import_service)와 호환
+"""
+import csv
+import io
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterator
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+
+from app.database import SessionLocal
+from app.models.collection import Collection
+from app.models.collection_movie import CollectionMovie
+from app.models.movie import Movie
+from app.models.movie_tag import MovieTag
+from app.models.tag import Tag
+from app.models.user_image import UserImage
+from app.models.user_movie import UserMovie
+
+
+# 서버 사이드 커서에서 한 번에 가져오는 행 수
+EXPORT_BATCH_SIZE = 500
+
+# 내보내기 컬럼 (CSV 헤더 순서)
+EXPORT_COLUMNS = [
+    "title", "original_title", "year", "director", "tmdb_id", "kobis_code",
+    "status", "rating", "watch_date", "review", "detailed_review",
+    "watch_location", "watch_method", "watched_with", "is_best_movie", "progress",
+    "tags", "collections", "images", "created_at",
+]
+
+# CSV에서 리스트 값을 합칠 때 사용하는 구분자
+CSV_LIST_SEPARATORS = {"tags": ", ", "collections": ", ", "images": " "}
+
+
+class LibraryExportService:
+    """라이브러리 내보내기 서비스 클래스"""
+
+    def iter_ndjson(self, user_id: str) -> Iterator[str]:
+        """
+        NDJSON 스트림 (영화 1개 = 1줄)
+
+        Args:
+            user_id: 사용자 ID
+
+        Yields:
+            JSON 문자열 (줄바꿈 포함)
+        """
+        for record in self._iter_records(user_id):
+            yield json.dumps(record, ensure_ascii=False, default=_json_default) + "\n"
+
+    def iter_csv(self, user_id: str) -> Iterator[str]:
+        """
+        CSV 스트림 (엑셀 호환을 위해 UTF-8 BOM 포함)
+
+        Args:
+            user_id: 사용자 ID
+
+        Yields:
+            CSV 청크 (헤더 + EXPORT_BATCH_SIZE행 단위)
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        buffer.write("\ufeff")
+        writer.writerow(EXPORT_COLUMNS)
+
+        for count, record in enumerate(self._iter_records(user_id), start=1):
+            writer.writerow([_csv_value(column, record[column]) for column in EXPORT_COLUMNS])
+
+            if count % EXPORT_BATCH_SIZE == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate(0)
+
+        yield buffer.getvalue()
+
+    @staticmethod
+    def _iter_records(user_id: str) -> Iterator[Dict[str, Any]]:
+        """
+        라이브러리 행을 서버 사이드 커서로 순회
+
+        StreamingResponse가 요청 처리 이후에도 순회하므로 요청 세션이 아닌 별도 세션 사용
+
+        Yields:
+            {EXPORT_COLUMNS: 값}
+        """
+        tags = (
+            select(func.array_agg(aggregate_order_by(Tag.name, Tag.name)))
+            .join(MovieTag, MovieTag.tag_id == Tag.id)
+            .where(MovieTag.user_movie_id == UserMovie.id)
+            .scalar_subquery()
+        )
+        collections = (
+            select(func.array_agg(aggregate_order_by(Collection.name, Collection.name)))
+            .join(CollectionMovie, CollectionMovie.collection_id == Collection.id)
+            .where(CollectionMovie.user_movie_id == UserMovie.id)
+            .scalar_subquery()
+        )
+        images = (
+            select(func.array_agg(aggregate_order_by(UserImage.image_url, UserImage.id)))
+            .where(UserImage.user_movie_id == UserMovie.id)
+            .scalar_subquery()
+        )
+
+        statement = (
+            select(
+                Movie.title_ko.label("title"),
+                Movie.title_original.label("original_title"),
+                Movie.production_year.label("year"),
+                Movie.director,
+                Movie.tmdb_id,
+                Movie.kobis_code,
+                UserMovie.status,
+                UserMovie.rating,
+                UserMovie.watch_date,
+                UserMovie.one_line_review.label("review"),
+                UserMovie.detailed_review,
+                UserMovie.watch_location,
+                UserMovie.watch_method,
+                UserMovie.watched_with,
+                UserMovie.is_best_movie,
+                UserMovie.progress,
+                tags.label("tags"),
+                collections.label("collections"),
+                images.label("images"),
+                UserMovie.created_at,
+            )
+            .join(Movie, Movie.id == UserMovie.movie_id)
+            .where(UserMovie.user_id == user_id)
+            .order_by(UserMovie.created_at, UserMovie.id)
+            .execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+
+        db = SessionLocal()
+        try:
+            for row in db.execute(statement):
+                yield dict(row._mapping)
+        finally:
+            db.close()
+
+
+def _json_default(value: Any) -> Any:
+    """JSON 직렬화 (date, datetime, Decimal)"""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _csv_value(column: str, value: Any) -> Any:
+    """CSV 셀 값 (리스트는 구분자로 합침, None은 빈 칸)"""
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return CSV_LIST_SEPARATORS.get(column, ", ").join(value)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+# Global service instance
+library_export_service = LibraryExportService()
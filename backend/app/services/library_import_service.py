@@ -0,0 +1,574 @@
+"""
+Library Import Service
+CSV/JSON 파일(Letterboxd, Watcha 내보내기 등)로 사용자 라이브러리 일괄 가져오기
+
+처리 순서:
+1. 파싱: 컬럼명 정규화 (COLUMN_ALIASES) → LibraryImportRow
+2. 영화 매칭: 외부 ID(tmdb_id/kobis_code) → 로컬 movies 카탈로그(제목 + 연도)
+   → 외부 API 검색 (provider별 Semaphore로 동시 요청 수 제한, 검색/메타데이터 캐시 사용)
+   → 검색으로 찾은 영화는 카탈로그에 1건씩 별도 트랜잭션으로 resolve (movie_catalog_service.resolve_each)
+3. 저장: user_movies / tags / movie_tags를 multi-row INSERT ... ON CONFLICT로 배치 저장
+   (이미 라이브러리에 있는 영화는 건너뜀)
+
+진행 상황은 이벤트(dict)를 yield하는 async generator로 전달 (API는 NDJSON 스트리밍)
+"""
+import asyncio
+import csv
+import io
+import json
+import time
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import func, or_, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.movie import Movie
+from app.models.movie_external_id import MovieExternalId
+from app.models.movie_tag import MovieTag
+from app.models.tag import Tag
+from app.models.user_movie import UserMovie
+from app.schemas.movie import LibraryImportRow, MovieMetadata, MovieSearchResult
+from app.services.external_api_service import external_api_service
+from app.services.movie_catalog_service import movie_catalog_service
+
+
+# 필드별 허용 컬럼명 (소문자, 앞에 있을수록 우선)
+# - Letterboxd: Date, Name, Year, Letterboxd URI, Rating, Rewatch, Tags, Watched Date, Review
+# - Watcha: 제목, 개봉연도, 별점, 본 날짜, 코멘트
+COLUMN_ALIASES: Dict[str, List[str]] = {
+    "title": ["title", "name", "movie", "film", "제목", "영화", "영화명", "영화 제목"],
+    "year": ["year", "release year", "연도", "개봉연도", "개봉 연도", "제작연도"],
+    "status": ["status", "상태"],
+    "rating": ["rating", "score", "별점", "평점", "내 별점"],
+    "watch_date": ["watched date", "watch_date", "watched_date", "watched", "date", "본 날짜", "관람일", "감상일"],
+    "review": ["review", "one_line_review", "comment", "한줄평", "코멘트"],
+    "tags": ["tags", "tag", "태그"],
+    "tmdb_id": ["tmdb_id", "tmdb id", "tmdbid"],
+    "kobis_code": ["kobis_code", "kobis code", "moviecd"],
+}
+
+# 상태 값 정규화
+STATUS_ALIASES: Dict[str, str] = {
+    "completed": "completed",
+    "watched": "completed",
+    "본 영화": "completed",
+    "watching": "watching",
+    "보는중": "watching",
+    "보는 중": "watching",
+    "watchlist": "watchlist",
+    "wishlist": "watchlist",
+    "want to watch": "watchlist",
+    "보고싶어요": "watchlist",
+}
+
+DATE_FORMATS = ["%Y-%m-%d", "%Y.%m.%d", "%Y/%m/%d", "%Y%m%d"]
+
+# 외부 API 검색을 한 번에 몇 개의 제목씩 병렬 처리할지 (진행 상황 보고 단위)
+SEARCH_CHUNK_SIZE = 50
+
+# 태그 이름 최대 길이 (tags.name)
+TAG_NAME_MAX_LENGTH = 50
+
+
+class LibraryImportService:
+    """라이브러리 가져오기 서비스 클래스"""
+
+    def parse(
+        self,
+        content: bytes,
+        filename: Optional[str] = None,
+        default_status: str = "completed",
+    ) -> Tuple[List[Tuple[int, LibraryImportRow]], List[Dict[str, Any]]]:
+        """
+        업로드 파일 파싱 (CSV 또는 JSON)
+
+        Args:
+            content: 파일 내용
+            filename: 파일명 (확장자로 형식 판단, 없으면 내용으로 판단)
+            default_status: status 컬럼이 없는 항목의 상태
+
+        Returns:
+            ([(행 번호, LibraryImportRow)], [{"row": 행 번호, "error": 메시지}])
+
+        Raises:
+            ValueError: 파일 형식을 읽을 수 없는 경우
+        """
+        text = _decode(content)
+
+        is_json = (filename or "").lower().endswith(".json") or text.lstrip()[:1] in ("[", "{")
+        records = _read_json(text) if is_json else _read_csv(text)
+
+        rows: List[Tuple[int, LibraryImportRow]] = []
+        errors: List[Dict[str, Any]] = []
+
+        for index, record in enumerate(records, start=1):
+            try:
+                rows.append((index, _to_row(record, default_status)))
+            except (ValidationError, ValueError, TypeError) as e:
+                errors.append({"row": index, "error": _error_message(e)})
+
+        return rows, errors
+
+    async def run(
+        self,
+        db: Session,
+        user_id: str,
+        rows: List[Tuple[int, LibraryImportRow]],
+        errors: List[Dict[str, Any]],
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        가져오기 실행 (진행 상황 이벤트를 yield)
+
+        동기 DB 작업은 asyncio.to_thread로 실행 (같은 세션을 순차적으로만 사용)
+
+        Args:
+            db: DB 세션
+            user_id: 사용자 ID
+            rows: parse() 결과
+            errors: parse() 에러 목록
+
+        Yields:
+            {"stage": "parsed", "total", "invalid"}
+            {"stage": "matching", "matched", "total"}
+            {"stage": "saving", "saved", "total"}
+            {"stage": "done", "imported", "skipped", "unmatched", "errors", "elapsed"}
+        """
+        started = time.monotonic()
+        yield {"stage": "parsed", "total": len(rows), "invalid": len(errors)}
+
+        # 1. 외부 ID + 로컬 카탈로그 매칭 (쿼리 2번)
+        movie_ids: Dict[int, int] = await asyncio.to_thread(self._match_local, db, rows)
+        yield {"stage": "matching", "matched": len(movie_ids), "total": len(rows)}
+
+        # 2. 외부 API 매칭 (제목 단위로 중복 제거 후 청크별 병렬 처리)
+        pending: Dict[Any, List[int]] = {}
+        for index, row in rows:
+            if index in movie_ids:
+                continue
+            if row.tmdb_id:
+                key = ("tmdb", str(row.tmdb_id))
+            elif row.kobis_code:
+                key = ("kobis", row.kobis_code)
+            else:
+                key = (_normalize_title(row.title), row.year)
+            pending.setdefault(key, []).append(index)
+
+        titles = {index: row.title for index, row in rows}
+        keys = list(pending.keys())
+        for start in range(0, len(keys), SEARCH_CHUNK_SIZE):
+            chunk = keys[start:start + SEARCH_CHUNK_SIZE]
+            metadata_list = await self._fetch_metadata(chunk, titles, pending)
+
+            resolved = [(key, metadata) for key, metadata in zip(chunk, metadata_list) if metadata]
+            if resolved:
+                # 카탈로그 resolve는 건별로 commit (가져오기 트랜잭션에서 advisory lock을 쌓지 않음)
+                catalog_ids = await asyncio.to_thread(
+                    movie_catalog_service.resolve_each, [metadata for _, metadata in resolved]
+                )
+                for (key, _), movie_id in zip(resolved, catalog_ids):
+                    for index in pending[key]:
+                        movie_ids[index] = movie_id
+
+            yield {"stage": "matching", "matched": len(movie_ids), "total": len(rows)}
+
+        # 3. 저장 (배치 단위 multi-row INSERT)
+        entries = _merge_by_movie(rows, movie_ids)
+        imported = 0
+        batch_size = settings.LIBRARY_IMPORT_BATCH_SIZE
+        for start in range(0, len(entries), batch_size):
+            batch = entries[start:start + batch_size]
+            imported += await asyncio.to_thread(self._save_batch, db, user_id, batch)
+            yield {"stage": "saving", "saved": start + len(batch), "total": len(entries)}
+
+        await asyncio.to_thread(db.commit)
+
+        unmatched = [
+            {"row": index, "title": row.title, "year": row.year}
+            for index, row in rows
+            if index not in movie_ids
+        ]
+        yield {
+            "stage": "done",
+            "imported": imported,
+            "skipped": len(entries) - imported,
+            "unmatched": unmatched,
+            "errors": errors,
+            "elapsed": round(time.monotonic() - started, 2),
+        }
+
+    @staticmethod
+    def _match_local(db: Session, rows: List[Tuple[int, LibraryImportRow]]) -> Dict[int, int]:
+        """
+        외부 ID와 로컬 movies 카탈로그로 매칭
+
+        Returns:
+            {행 번호: movies.id}
+        """
+        matched: Dict[int, int] = {}
+
+        # 외부 ID 매칭 (movie_external_ids)
+        external_keys = {}
+        for index, row in rows:
+            if row.tmdb_id:
+                external_keys[index] = ("tmdb", str(row.tmdb_id))
+            elif row.kobis_code:
+                external_keys[index] = ("kobis", row.kobis_code)
+
+        if external_keys:
+            mapping = {
+                (source, external_id): movie_id
+                for movie_id, source, external_id in db.execute(
+                    select(MovieExternalId.movie_id, MovieExternalId.source, MovieExternalId.external_id)
+                    .where(tuple_(MovieExternalId.source, MovieExternalId.external_id).in_(set(external_keys.values())))
+                )
+            }
+            for index, key in external_keys.items():
+                if key in mapping:
+                    matched[index] = mapping[key]
+
+        # 제목 + 연도 매칭 (title_ko 또는 title_original)
+        titles = {_normalize_title(row.title) for index, row in rows if index not in external_keys}
+        if not titles:
+            return matched
+
+        candidates: Dict[str, List[Tuple[Optional[int], int]]] = {}
+        for movie_id, title_ko, title_original, year in db.execute(
+            select(Movie.id, Movie.title_ko, Movie.title_original, Movie.production_year)
+            .where(or_(func.lower(Movie.title_ko).in_(titles), func.lower(Movie.title_original).in_(titles)))
+            .order_by(Movie.id)
+        ):
+            for title in {_normalize_title(title_ko or ""), _normalize_title(title_original or "")}:
+                if title in titles:
+                    candidates.setdefault(title, []).append((year, movie_id))
+
+        for index, row in rows:
+            if index in external_keys:
+                continue
+            movie_id = _pick_local(candidates.get(_normalize_title(row.title), []), row.year)
+            if movie_id:
+                matched[index] = movie_id
+
+        return matched
+
+    async def _fetch_metadata(
+        self,
+        keys: List[Any],
+        titles: Dict[int, str],
+        pending: Dict[Any, List[int]],
+    ) -> List[Optional[MovieMetadata]]:
+        """
+        매칭 키 목록의 메타데이터를 외부 API에서 가져오기
+
+        - 외부 ID 키는 그대로, 제목 키는 검색으로 (source, id)를 찾은 뒤
+        - get_metadata_batch로 한 번에 조회 (캐시 MGET 1회 + provider별 동시 요청 제한)
+
+        Returns:
+            keys와 같은 순서의 메타데이터 (매칭 실패 시 None)
+        """
+        targets = await asyncio.gather(*(
+            self._search_target(key, titles[pending[key][0]]) for key in keys
+        ))
+
+        lookups = list(dict.fromkeys(target for target in targets if target))
+        entries = await external_api_service.get_metadata_batch(lookups) if lookups else []
+        metadata_by_target = {target: metadata for target, (metadata, _) in zip(lookups, entries)}
+
+        return [metadata_by_target.get(target) if target else None for target in targets]
+
+    @staticmethod
+    async def _search_target(key: Any, title: str) -> Optional[Tuple[str, str]]:
+        """
+        매칭 키 → 메타데이터 조회 대상 (source, id)
+
+        제목 키는 TMDb를 먼저 검색하고, 결과가 없으면 KOBIS 검색
+        """
+        if key[0] in ("tmdb", "kobis"):
+            return key
+
+        _, year = key
+        for sources in (["tmdb"], ["kobis"]):
+            results = await external_api_service.search_movies(title, sources=sources)
+            target = _pick_search_result(results, title, year)
+            if target:
+                return target
+
+        return None
+
+    @staticmethod
+    def _save_batch(db: Session, user_id: str, batch: List[Tuple[int, LibraryImportRow]]) -> int:
+        """
+        user_movies / tags / movie_tags 배치 저장
+
+        Args:
+            batch: [(movies.id, 병합된 LibraryImportRow)]
+
+        Returns:
+            새로 추가된 user_movies 수 (이미 라이브러리에 있던 영화 제외)
+        """
+        inserted = db.execute(
+            pg_insert(UserMovie)
+            .values([
+                {
+                    "user_id": user_id,
+                    "movie_id": movie_id,
+                    "status": row.status,
+                    "rating": round(row.rating, 1) if row.rating is not None else None,
+                    "watch_date": row.watch_date,
+                    "one_line_review": row.review,
+                }
+                for movie_id, row in batch
+            ])
+            .on_conflict_do_nothing(constraint="uq_user_movie")
+            .returning(UserMovie.id, UserMovie.movie_id)
+        ).all()
+
+        user_movie_ids = {movie_id: user_movie_id for user_movie_id, movie_id in inserted}
+
+        # 태그 (새로 추가된 영화만)
+        movie_tag_names = {
+            movie_id: row.tags for movie_id, row in batch if movie_id in user_movie_ids and row.tags
+        }
+        names = {name for tags in movie_tag_names.values() for name in tags}
+        if names:
+            tag_ids = LibraryImportService._get_or_create_tags(db, user_id, names)
+            movie_tags = [
+                {"user_movie_id": user_movie_ids[movie_id], "tag_id": tag_ids[name]}
+                for movie_id, tags in movie_tag_names.items()
+                for name in tags
+                if name in tag_ids
+            ]
+            if movie_tags:
+                db.execute(
+                    pg_insert(MovieTag)
+                    .values(movie_tags)
+                    .on_conflict_do_nothing(constraint="uq_user_movie_tag")
+                )
+
+        return len(inserted)
+
+    @staticmethod
+    def _get_or_create_tags(db: Session, user_id: str, names) -> Dict[str, int]:
+        """
+        태그 이름 → ID (사전 정의 태그 또는 본인 커스텀 태그, 없으면 커스텀 태그 생성)
+
+        Returns:
+            {태그 이름: tags.id}
+        """
+        query = (
+            select(Tag.name, Tag.id)
+            .where(Tag.name.in_(names), or_(Tag.is_predefined == True, Tag.user_id == user_id))
+            .order_by(Tag.is_predefined.desc())
+        )
+
+        tag_ids: Dict[str, int] = {}
+        for name, tag_id in db.execute(query):
+            tag_ids.setdefault(name, tag_id)
+
+        missing = [name for name in names if name not in tag_ids]
+        if missing:
+            db.execute(
+                pg_insert(Tag)
+                .values([{"name": name, "user_id": user_id, "is_predefined": False} for name in missing])
+                .on_conflict_do_nothing(constraint="uq_tag_name_user")
+            )
+            for name, tag_id in db.execute(query.where(Tag.name.in_(missing))):
+                tag_ids.setdefault(name, tag_id)
+
+        return tag_ids
+
+
+def _decode(content: bytes) -> str:
+    """파일 인코딩 처리 (UTF-8 BOM, 한글 Windows 엑셀 CP949)"""
+    for encoding in ("utf-8-sig", "cp949"):
+        try:
+            return content.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    raise ValueError("Unsupported file encoding (UTF-8 or CP949 expected)")
+
+
+def _read_csv(text: str) -> List[Dict[str, Any]]:
+    """CSV → 레코드 리스트"""
+    reader = csv.DictReader(io.StringIO(text))
+    if not reader.fieldnames:
+        raise ValueError("CSV header not found")
+    return list(reader)
+
+
+def _read_json(text: str) -> List[Dict[str, Any]]:
+    """JSON → 레코드 리스트 (배열, 또는 {"movies": [...]} / {"items": [...]})"""
+    try:
+        data = json.loads(text)
+    except ValueError:
+        raise ValueError("Invalid JSON file")
+
+    if isinstance(data, dict):
+        data = data.get("movies", data.get("items"))
+    if not isinstance(data, list):
+        raise ValueError("JSON must be an array of movies")
+
+    return [record if isinstance(record, dict) else {} for record in data]
+
+
+def _to_row(record: Dict[str, Any], default_status: str) -> LibraryImportRow:
+    """레코드(원본 컬럼명) → LibraryImportRow"""
+    columns = {str(key).strip().lower(): value for key, value in record.items() if key is not None}
+
+    values: Dict[str, Any] = {}
+    for field, aliases in COLUMN_ALIASES.items():
+        for alias in aliases:
+            value = columns.get(alias)
+            if isinstance(value, str):
+                value = value.strip()
+            if value not in (None, ""):
+                values[field] = value
+                break
+
+    if "year" in values:
+        values["year"] = int(str(values["year"])[:4])
+    if "watch_date" in values:
+        values["watch_date"] = _parse_date(values["watch_date"])
+    if "tags" in values:
+        tags = values["tags"]
+        if isinstance(tags, str):
+            tags = tags.split(",")
+        values["tags"] = list(dict.fromkeys(
+            str(tag).strip()[:TAG_NAME_MAX_LENGTH] for tag in tags if str(tag).strip()
+        ))
+
+    status = STATUS_ALIASES.get(str(values.get("status", "")).lower())
+    values["status"] = status or default_status
+
+    return LibraryImportRow(**values)
+
+
+def _parse_date(value: Any) -> date:
+    """날짜 문자열 파싱 (YYYY-MM-DD, YYYY.MM.DD, YYYY/MM/DD, YYYYMMDD)"""
+    value = str(value)[:10]
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, date_format).date()
+        except ValueError:
+            continue
+    raise ValueError(f"Invalid date: {value}")
+
+
+def _error_message(error: Exception) -> str:
+    """파싱 에러 메시지"""
+    if isinstance(error, ValidationError):
+        return "; ".join(
+            f"{'.'.join(str(loc) for loc in item['loc'])}: {item['msg']}" for item in error.errors()
+        )
+    return str(error)
+
+
+def _normalize_title(title: str) -> str:
+    """제목 비교용 정규화 (소문자 + 공백 정리)"""
+    return " ".join(title.lower().split())
+
+
+def _pick_local(candidates: List[Tuple[Optional[int], int]], year: Optional[int]) -> Optional[int]:
+    """
+    로컬 카탈로그 후보 중 선택 (연도가 있으면 같은 연도 → ±1년 순서)
+
+    Args:
+        candidates: [(production_year, movies.id)]
+        year: 파일의 연도
+    """
+    if not candidates:
+        return None
+    if year is None:
+        return candidates[0][1]
+
+    for tolerance in (0, 1):
+        for candidate_year, movie_id in candidates:
+            if candidate_year and abs(candidate_year - year) <= tolerance:
+                return movie_id
+
+    return None
+
+
+def _pick_search_result(
+    results: List[MovieSearchResult],
+    title: str,
+    year: Optional[int],
+) -> Optional[Tuple[str, str]]:
+    """
+    검색 결과 중 메타데이터를 가져올 영화 선택
+
+    - 연도가 있으면 같은 연도(±1년)인 결과만, 제목이 일치하는 결과 우선
+    - 연도가 없으면 제목이 일치하는 결과만
+
+    Returns:
+        (source, id) 또는 None
+    """
+    normalized = _normalize_title(title)
+    best = None
+    best_score = -1
+
+    for result in results:
+        if result.tmdb_id:
+            target = ("tmdb", str(result.tmdb_id))
+        elif result.kobis_code:
+            target = ("kobis", result.kobis_code)
+        else:
+            continue
+
+        title_match = normalized in (
+            _normalize_title(result.title or ""),
+            _normalize_title(result.original_title or ""),
+        )
+        if year is not None:
+            if not result.year or abs(result.year - year) > 1:
+                continue
+            score = (2 if title_match else 0) + (1 if result.year == year else 0)
+        else:
+            if not title_match:
+                continue
+            score = 0
+
+        if score > best_score:
+            best, best_score = target, score
+
+    return best
+
+
+def _merge_by_movie(
+    rows: List[Tuple[int, LibraryImportRow]],
+    movie_ids: Dict[int, int],
+) -> List[Tuple[int, LibraryImportRow]]:
+    """
+    같은 영화로 매칭된 행 병합 (Letterboxd 다이어리의 재관람 기록 등)
+
+    최근 관람 기록의 별점/날짜/상태를 사용하고 태그는 합침
+
+    Returns:
+        [(movies.id, LibraryImportRow)]
+    """
+    merged: Dict[int, LibraryImportRow] = {}
+    for index, row in rows:
+        movie_id = movie_ids.get(index)
+        if movie_id is None:
+            continue
+
+        current = merged.get(movie_id)
+        if current is None:
+            merged[movie_id] = row
+            continue
+
+        latest, other = (row, current) if (row.watch_date or date.min) >= (current.watch_date or date.min) else (current, row)
+        merged[movie_id] = latest.model_copy(update={
+            "rating": latest.rating if latest.rating is not None else other.rating,
+            "review": latest.review or other.review,
+            "tags": list(dict.fromkeys(current.tags + row.tags)),
+        })
+
+    return list(merged.items())
+
+
+# Global service instance
+library_import_service = LibraryImportService()
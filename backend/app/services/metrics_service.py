@@ -0,0 +1,197 @@
+"""
+Prometheus 메트릭
+HTTP 요청, 외부 API 호출, Redis 캐시 hit/miss 메트릭 정의 및 /metrics 출력
+
+- HTTP: route(path 템플릿)별 latency/응답 크기 histogram, 처리 중 요청 수
+- 외부 API: provider/endpoint/outcome별 호출 수, latency histogram
+- 캐시: 네임스페이스(키 prefix: kobis, tmdb, kmdb, resp)별 hit/miss
+- DB: route별 요청당 쿼리 수 / DB 시간 (query_counter 미들웨어)
+
+여러 worker(uvicorn --workers, gunicorn)로 실행할 때는 PROMETHEUS_MULTIPROC_DIR
+환경 변수를 설정하면 모든 worker의 값을 합쳐서 출력
+"""
+import os
+import time
+from contextlib import contextmanager
+from typing import Iterator, Tuple
+
+import httpx
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+
+# Latency buckets (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 응답 크기 buckets (bytes)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+# 요청당 쿼리 수 buckets
+QUERY_COUNT_BUCKETS = (1, 2, 3, 5, 10, 20, 50, 100)
+
+# 매칭되는 route가 없는 요청의 route 라벨 (404 경로로 라벨이 무한히 늘어나지 않도록)
+UNMATCHED_ROUTE = "unmatched"
+
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP requests",
+    ["method", "route", "status"],
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+)
+HTTP_RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes",
+    "HTTP response body size (after compression)",
+    ["method", "route"],
+    buckets=SIZE_BUCKETS,
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests being processed",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+
+EXTERNAL_API_REQUESTS = Counter(
+    "external_api_requests_total",
+    "External API calls",
+    ["provider", "endpoint", "outcome"],
+)
+EXTERNAL_API_DURATION = Histogram(
+    "external_api_request_duration_seconds",
+    "External API call latency",
+    ["provider", "endpoint"],
+    buckets=LATENCY_BUCKETS,
+)
+
+DB_QUERIES_PER_REQUEST = Histogram(
+    "db_queries_per_request",
+    "SQL statements executed per HTTP request",
+    ["route"],
+    buckets=QUERY_COUNT_BUCKETS,
+)
+DB_DURATION_PER_REQUEST = Histogram(
+    "db_duration_per_request_seconds",
+    "Total SQL execution time per HTTP request",
+    ["route"],
+    buckets=LATENCY_BUCKETS,
+)
+
+CACHE_REQUESTS = Counter(
+    "cache_requests_total",
+    "Redis cache lookups",
+    ["namespace", "result"],
+)
+
+
+class MetricsService:
+    """메트릭 기록/출력 서비스"""
+
+    def observe_request(self, method: str, route: str, status: int, duration: float, size: int):
+        """
+        HTTP 요청 1건 기록
+
+        Args:
+            method: HTTP 메서드
+            route: route path 템플릿 (e.g., "/api/v1/movies/{user_movie_id}")
+            status: 응답 상태 코드
+            duration: 처리 시간 (초)
+            size: 응답 본문 크기 (bytes)
+        """
+        HTTP_REQUESTS.labels(method, route, str(status)).inc()
+        HTTP_REQUEST_DURATION.labels(method, route).observe(duration)
+        HTTP_RESPONSE_SIZE.labels(method, route).observe(size)
+
+    @contextmanager
+    def track_in_progress(self, method: str) -> Iterator[None]:
+        """처리 중 요청 수 (블록 동안 +1)"""
+        gauge = HTTP_REQUESTS_IN_PROGRESS.labels(method)
+        gauge.inc()
+        try:
+            yield
+        finally:
+            gauge.dec()
+
+    @contextmanager
+    def track_external(self, provider: str, endpoint: str) -> Iterator[None]:
+        """
+        외부 API 호출 1건 기록 (블록에서 발생한 예외로 outcome 결정)
+
+        outcome: success, timeout, http_4xx, http_5xx, error
+
+        Args:
+            provider: "kobis", "tmdb", "kmdb"
+            endpoint: provider 내부 API 구분 (e.g., "search", "movie")
+        """
+        outcome = "success"
+        start = time.perf_counter()
+        try:
+            yield
+        except httpx.TimeoutException:
+            outcome = "timeout"
+            raise
+        except httpx.HTTPStatusError as e:
+            outcome = f"http_{e.response.status_code // 100}xx"
+            raise
+        except Exception:
+            outcome = "error"
+            raise
+        finally:
+            EXTERNAL_API_DURATION.labels(provider, endpoint).observe(time.perf_counter() - start)
+            EXTERNAL_API_REQUESTS.labels(provider, endpoint, outcome).inc()
+
+    def observe_queries(self, route: str, count: int, duration: float):
+        """
+        요청 1건의 SQL 쿼리 수 / DB 시간 기록
+
+        Args:
+            route: route path 템플릿
+            count: 쿼리 수
+            duration: 쿼리 실행 시간 합계 (초)
+        """
+        DB_QUERIES_PER_REQUEST.labels(route).observe(count)
+        DB_DURATION_PER_REQUEST.labels(route).observe(duration)
+
+    def record_cache(self, namespace: str, hits: int, misses: int):
+        """
+        캐시 조회 결과 기록
+
+        Args:
+            namespace: 캐시 키 prefix
+            hits: hit 개수
+            misses: miss 개수
+        """
+        if hits:
+            CACHE_REQUESTS.labels(namespace, "hit").inc(hits)
+        if misses:
+            CACHE_REQUESTS.labels(namespace, "miss").inc(misses)
+
+    @staticmethod
+    def render() -> Tuple[bytes, str]:
+        """
+        Prometheus text format 출력
+
+        Returns:
+            (본문, Content-Type)
+        """
+        if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+            return generate_latest(registry), CONTENT_TYPE_LATEST
+        return generate_latest(), CONTENT_TYPE_LATEST
+
+
+# Global service instance
+metrics_service = MetricsService()
@@ -0,0 +1,276 @@
+"""
+Movie Catalog Service
+외부 API 메타데이터 → movies 테이블 저장 (identity resolution + upsert)
+
+movie_external_ids 테이블이 (source, external_id) → movies.id 매핑을 담당하며
+UNIQUE(source, external_id)로 같은 영화가 다른 경로(KOBIS/TMDb/KMDb)로
+들어와도 하나의 movies row로 모임
+"""
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+from typing import Any, Dict, List, Tuple
+
+from app.database import SessionLocal
+from app.models.movie import Movie
+from app.schemas.movie import MovieMetadata
+
+
+# resolve 시 채우는 movies 컬럼 (기존 영화는 비어있는 값만 채움)
+CATALOG_COLUMNS = [
+    "title_ko", "title_original", "director", "production_year", "runtime", "genre",
+    "poster_url", "backdrop_url", "synopsis", "kobis_code", "tmdb_id", "kmdb_id",
+]
+
+# 외부 ID 순서
+SOURCE_PRIORITY = ["tmdb", "kobis", "kmdb"]
+
+
+def _column_type(column: str) -> str:
+    """movies 컬럼의 PostgreSQL 타입 (INSERT ... SELECT 바인드 파라미터 캐스팅용)"""
+    return Movie.__table__.c[column].type.compile(dialect=postgresql.dialect())
+
+
+# 외부 ID 단위 advisory lock (트랜잭션 종료 시 해제)
+# 정렬된 순서로 잡아서 외부 ID가 겹치는 요청끼리 deadlock 없이 직렬화
+LOCK_EXTERNAL_IDS_SQL = text("""
+    SELECT pg_advisory_xact_lock(lock_key)
+    FROM (
+        SELECT DISTINCT hashtext(key) AS lock_key
+        FROM unnest(CAST(:keys AS text[])) AS key
+    ) keys
+    ORDER BY lock_key
+""")
+
+
+def _fill_expression(column: str) -> str:
+    """
+    기존 영화의 비어있는 컬럼만 채우는 SET 표현식
+
+    UNIQUE 컬럼(kobis_code)은 다른 영화가 이미 같은 값을 갖고 있으면 채우지 않음
+    (서로 다른 경로로 먼저 생성된 두 영화가 나중에 같은 메타데이터로 만나는 경우)
+    """
+    value = f"CAST(:{column} AS {_column_type(column)})"
+    if Movie.__table__.c[column].unique:
+        value = (
+            f"(SELECT {value} WHERE NOT EXISTS "
+            f"(SELECT 1 FROM movies other WHERE other.{column} = {value}))"
+        )
+    return f"{column} = COALESCE(movies.{column}, {value})"
+
+
+def _build_resolve_sql(id_count: int) -> str:
+    """
+    영화 resolve/생성 SQL (1 statement)
+
+    1. existing: 외부 ID 중 하나라도 매핑된 영화가 있으면 그 영화 사용
+    2. claim: 없으면 새 movies.id를 발급해 모든 외부 ID를 선점
+       (UNIQUE(source, external_id) + ON CONFLICT DO NOTHING, 정렬된 순서로 INSERT해서 deadlock 방지)
+    3. inserted: 선점에 성공한 경우에만 movies INSERT
+    4. updated: 기존 영화는 비어있는 컬럼만 채움
+    5. linked: 기존 영화에 새로 알게 된 외부 ID 연결
+
+    호출 전에 LOCK_EXTERNAL_IDS_SQL로 외부 ID 락을 잡아야 함 (락 대기 후 실행되는
+    새 statement는 상대 트랜잭션이 commit한 매핑을 existing으로 찾음)
+    락 없이 선점을 빼앗기면 아무 row도 반환하지 않음 → 호출자가 재실행
+    """
+    id_values = ", ".join(f"(:source_{i}, :external_id_{i})" for i in range(id_count))
+    insert_columns = ", ".join(CATALOG_COLUMNS)
+    insert_values = ", ".join(f"CAST(:{column} AS {_column_type(column)})" for column in CATALOG_COLUMNS)
+    update_values = ",\n            ".join(_fill_expression(column) for column in CATALOG_COLUMNS)
+
+    return f"""
+    WITH ids(source, external_id) AS (
+        VALUES {id_values}
+    ),
+    existing AS (
+        SELECT mei.movie_id
+        FROM movie_external_ids mei
+        JOIN ids ON ids.source = mei.source AND ids.external_id = mei.external_id
+        ORDER BY mei.movie_id
+        LIMIT 1
+    ),
+    new_movie AS (
+        SELECT nextval(pg_get_serial_sequence('movies', 'id'))::integer AS id
+        WHERE NOT EXISTS (SELECT 1 FROM existing)
+    ),
+    claim AS (
+        INSERT INTO movie_external_ids (movie_id, source, external_id)
+        SELECT new_movie.id, ids.source, ids.external_id
+        FROM new_movie, ids
+        ORDER BY ids.source, ids.external_id
+        ON CONFLICT (source, external_id) DO NOTHING
+        RETURNING movie_id
+    ),
+    inserted AS (
+        INSERT INTO movies (id, {insert_columns})
+        SELECT claimed.movie_id, {insert_values}
+        FROM (SELECT DISTINCT movie_id FROM claim) claimed
+        RETURNING movies.*
+    ),
+    updated AS (
+        UPDATE movies SET
+            {update_values},
+            updated_at = now()
+        FROM existing
+        WHERE movies.id = existing.movie_id
+        RETURNING movies.*
+    ),
+    linked AS (
+        INSERT INTO movie_external_ids (movie_id, source, external_id)
+        SELECT existing.movie_id, ids.source, ids.external_id
+        FROM existing, ids
+        ORDER BY ids.source, ids.external_id
+        ON CONFLICT (source, external_id) DO NOTHING
+    )
+    SELECT * FROM inserted
+    UNION ALL
+    SELECT * FROM updated
+    """
+
+
+class MovieCatalogService:
+    """영화 카탈로그 서비스 클래스"""
+
+    # 외부 ID 개수별 resolve SQL 캐시
+    _resolve_sql_cache: Dict[int, str] = {}
+
+    @staticmethod
+    def movie_values_from_metadata(metadata: MovieMetadata) -> Dict[str, Any]:
+        """
+        MovieMetadata를 movies 테이블 컬럼 값으로 변환
+
+        Args:
+            metadata: 외부 API 메타데이터
+
+        Returns:
+            {컬럼명: 값} (CATALOG_COLUMNS 전체, 빈 값은 None)
+        """
+        return {
+            "title_ko": metadata.title,
+            "title_original": metadata.original_title,
+            "director": metadata.director,
+            "production_year": metadata.year or None,
+            "runtime": metadata.runtime or None,
+            "genre": metadata.genre or None,
+            "poster_url": metadata.poster_url,
+            "backdrop_url": metadata.backdrop_url,
+            "synopsis": metadata.synopsis,
+            "kobis_code": metadata.kobis_code,
+            "tmdb_id": metadata.tmdb_id,
+            "kmdb_id": metadata.kmdb_id,
+        }
+
+    @staticmethod
+    def external_ids_from_metadata(metadata: MovieMetadata) -> List[Tuple[str, str]]:
+        """
+        메타데이터의 외부 ID 목록 (SOURCE_PRIORITY 순서)
+
+        Returns:
+            [(source, external_id), ...]
+        """
+        ids = {
+            "tmdb": str(metadata.tmdb_id) if metadata.tmdb_id else None,
+            "kobis": metadata.kobis_code,
+            "kmdb": metadata.kmdb_id,
+        }
+        return [(source, ids[source]) for source in SOURCE_PRIORITY if ids[source]]
+
+    @staticmethod
+    def resolve_from_metadata(db: Session, metadata: MovieMetadata) -> Movie:
+        """
+        메타데이터로 canonical 영화 조회 또는 생성 (commit은 호출자가 담당)
+
+        - 외부 ID(tmdb/kobis/kmdb) 중 하나라도 매핑되어 있으면 그 영화를 사용하고
+          비어있는 컬럼만 채움
+        - 없으면 새 영화를 만들고 모든 외부 ID를 연결
+        - 같은 외부 ID를 가진 동시 요청은 advisory lock으로 직렬화되어
+          중복 영화가 생기지 않음 (락은 commit/rollback 시 해제)
+
+        Args:
+            db: DB 세션
+            metadata: 외부 API 메타데이터
+
+        Returns:
+            Movie
+        """
+        values = MovieCatalogService.movie_values_from_metadata(metadata)
+        external_ids = MovieCatalogService.external_ids_from_metadata(metadata)
+
+        # 외부 ID가 없으면 resolve할 수 없으므로 그대로 생성
+        if not external_ids:
+            movie = Movie(**{key: value for key, value in values.items() if value is not None})
+            db.add(movie)
+            db.flush()
+            return movie
+
+        sql = MovieCatalogService._resolve_sql_cache.get(len(external_ids))
+        if sql is None:
+            sql = _build_resolve_sql(len(external_ids))
+            MovieCatalogService._resolve_sql_cache[len(external_ids)] = sql
+
+        params = dict(values)
+        for index, (source, external_id) in enumerate(external_ids):
+            params[f"source_{index}"] = source
+            params[f"external_id_{index}"] = external_id
+
+        db.execute(
+            LOCK_EXTERNAL_IDS_SQL,
+            {"keys": [f"movie:{source}:{external_id}" for source, external_id in external_ids]},
+        )
+
+        statement = (
+            select(Movie)
+            .from_statement(text(sql).bindparams(**params))
+            .execution_options(populate_existing=True)
+        )
+
+        for _ in range(2):
+            movie = db.execute(statement).scalars().first()
+            if movie:
+                return movie
+
+        raise RuntimeError(f"Failed to resolve movie: {external_ids}")
+
+    @staticmethod
+    def resolve_each(metadata_list: List[MovieMetadata]) -> List[int]:
+        """
+        여러 메타데이터를 1건씩 별도 트랜잭션으로 resolve (별도 세션, 건마다 commit)
+
+        resolve_from_metadata의 advisory lock은 트랜잭션이 끝날 때까지 유지되므로
+        한 트랜잭션에서 여러 영화를 resolve하면 락이 쌓여 from-metadata 요청을 오래 막고,
+        같은 영화들을 다른 순서로 resolve하는 트랜잭션과 deadlock이 생길 수 있음
+        → 1건마다 commit해서 락은 resolve statement 동안만 유지
+
+        Args:
+            metadata_list: 외부 API 메타데이터 리스트
+
+        Returns:
+            metadata_list와 같은 순서의 movies.id
+        """
+        db = SessionLocal()
+        try:
+            movie_ids = []
+            for metadata in metadata_list:
+                movie_ids.append(MovieCatalogService.resolve_from_metadata(db, metadata).id)
+                db.commit()
+            return movie_ids
+        finally:
+            db.close()
+
+    @staticmethod
+    def upsert_many_from_metadata(metadata_list: List[MovieMetadata]) -> List[int]:
+        """
+        여러 메타데이터를 resolve/upsert (resolve_each로 1건씩 commit)
+
+        Args:
+            metadata_list: 외부 API 메타데이터 리스트
+
+        Returns:
+            upsert된 영화 ID 리스트 (같은 영화로 resolve된 메타데이터는 한 번만)
+        """
+        return list(dict.fromkeys(MovieCatalogService.resolve_each(metadata_list)))
+
+
+# Global service instance
+movie_catalog_service = MovieCatalogService()
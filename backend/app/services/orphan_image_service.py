@@ -0,0 +1,135 @@
+"""
+Orphan Image Service
+업로드만 되고 user_images에 등록되지 않은(또는 등록이 삭제된) S3 객체 정리
+
+- 업로드 폴더를 list_objects_v2 페이지(최대 1000개) 단위로 훑으면서 페이지마다 user_images를 1번 조회
+- ORPHAN_IMAGE_GRACE_HOURS 이내에 업로드된 객체는 등록 전일 수 있으므로 건너뜀
+- 원본이 없어지는(또는 orphan인) 썸네일도 함께 삭제
+- 삭제는 DeleteObjects로 1000개씩 (scripts/sweep_orphan_images.py)
+
+S3 목록은 키 사전순이므로 폴더의 원본({folder}/{hex}...)이 같은 폴더의 thumbnails/ 보다 먼저 나옴
+→ 폴더별로 살아있는 원본 이름만 기억하면 썸네일의 원본 존재 여부를 한 번의 순회로 판단 가능
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Set, Tuple
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.user_image import UserImage
+from app.services.s3_service import DELETE_OBJECTS_MAX_KEYS, USER_IMAGE_FOLDER, s3_service
+
+
+def _is_thumbnail(file_key: str) -> bool:
+    return file_key.rpartition("/")[0].endswith("/thumbnails")
+
+
+def _owner(file_key: str) -> Tuple[str, str]:
+    """
+    (원본 폴더, 원본 이름에서 확장자를 뺀 stem)
+
+    e.g., a/b/abc.jpg → ("a/b", "abc"), a/b/thumbnails/abc_240.webp → ("a/b", "abc")
+    """
+    folder, _, name = file_key.rpartition("/")
+    stem = name.rsplit(".", 1)[0]
+    if _is_thumbnail(file_key):
+        folder = folder[:-len("/thumbnails")]
+        stem = stem.rsplit("_", 1)[0]
+    return folder, stem
+
+
+class OrphanImageService:
+    """Orphan 이미지 정리 서비스 클래스"""
+
+    async def sweep(
+        self,
+        prefix: str = USER_IMAGE_FOLDER,
+        grace_hours: Optional[int] = None,
+        dry_run: bool = False,
+    ) -> Dict[str, int]:
+        """
+        prefix 아래의 orphan 객체 삭제
+
+        Args:
+            prefix: S3 폴더 경로
+            grace_hours: 최근 업로드 보호 시간 (기본값: ORPHAN_IMAGE_GRACE_HOURS)
+            dry_run: True면 삭제하지 않고 개수만 집계
+
+        Returns:
+            {"scanned", "orphans", "orphan_thumbnails", "deleted", "failed"}
+        """
+        hours = settings.ORPHAN_IMAGE_GRACE_HOURS if grace_hours is None else grace_hours
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
+        root = prefix.rstrip("/")
+        stats = {"scanned": 0, "orphans": 0, "orphan_thumbnails": 0, "deleted": 0, "failed": 0}
+
+        # 폴더별로 남겨둘 원본 stem (사용자 폴더는 목록이 지나가면 버림)
+        live: Dict[str, Set[str]] = {}
+        current_folder: Optional[str] = None
+        pending: List[str] = []
+
+        async for page in s3_service.list_objects(f"{root}/"):
+            stats["scanned"] += len(page)
+
+            candidates = [
+                obj["Key"] for obj in page
+                if not _is_thumbnail(obj["Key"]) and obj["LastModified"] < cutoff
+            ]
+            referenced = await asyncio.to_thread(self._referenced_keys, candidates) if candidates else set()
+            candidates = set(candidates)
+
+            for obj in page:
+                file_key = obj["Key"]
+                folder, stem = _owner(file_key)
+
+                if folder != current_folder:
+                    # 사용자 폴더의 키는 연속으로 나오므로 폴더가 바뀌면 이전 폴더 정보는 필요 없음
+                    # (root 폴더의 이전 버전 키는 사용자 폴더 사이에 섞여 나오므로 유지)
+                    if current_folder is not None and current_folder != root:
+                        live.pop(current_folder, None)
+                    current_folder = folder
+
+                if _is_thumbnail(file_key):
+                    if stem not in live.get(folder, ()):
+                        stats["orphan_thumbnails"] += 1
+                        pending.append(file_key)
+                elif file_key in candidates and file_key not in referenced:
+                    stats["orphans"] += 1
+                    pending.append(file_key)
+                else:
+                    live.setdefault(folder, set()).add(stem)
+
+            while len(pending) >= DELETE_OBJECTS_MAX_KEYS:
+                await self._delete(pending[:DELETE_OBJECTS_MAX_KEYS], stats, dry_run)
+                pending = pending[DELETE_OBJECTS_MAX_KEYS:]
+
+        if pending:
+            await self._delete(pending, stats, dry_run)
+
+        return stats
+
+    @staticmethod
+    async def _delete(file_keys: List[str], stats: Dict[str, int], dry_run: bool):
+        """DeleteObjects 1회 (dry_run이면 일부만 출력)"""
+        if dry_run:
+            for file_key in file_keys[:5]:
+                print(f"  [dry-run] {file_key}")
+            return
+
+        deleted, failed = await s3_service.delete_files(file_keys)
+        stats["deleted"] += deleted
+        stats["failed"] += len(failed)
+
+    @staticmethod
+    def _referenced_keys(file_keys: List[str]) -> Set[str]:
+        """user_images에 등록된 file_key (별도 세션, ix_user_images_file_key 사용)"""
+        db = SessionLocal()
+        try:
+            rows = db.query(UserImage.file_key).filter(UserImage.file_key.in_(file_keys)).distinct().all()
+            return {file_key for (file_key,) in rows}
+        finally:
+            db.close()
+
+
+# Global service instance
+orphan_image_service = OrphanImageService()
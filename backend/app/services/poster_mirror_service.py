@@ -0,0 +1,344 @@
+"""
+Poster Mirror Service
+TMDb/KMDb 포스터·배경 이미지를 우리 버킷(CDN)으로 복사하고 movies에 미러 URL 기록
+
+- 처음 사용될 때 (POST /movies/from-metadata) 백그라운드로, 또는 prefetch 이후 / scripts/mirror_posters.py로 일괄 실행
+- 크기별 variant를 thumbnail_service의 process pool에서 생성 (포맷은 THUMBNAIL_FORMAT)
+- 중복 제거:
+    - source URL: image_mirrors에 이미 있으면 다운로드하지 않음, 진행 중인 같은 URL은 결과를 공유 (프로세스 내)
+      다른 프로세스와는 Redis 락으로 동시에 다운로드하지 않음
+    - content hash: 객체 키가 SHA-256 기반이므로 같은 이미지는 URL이 달라도 한 번만 저장
+- source URL은 클라이언트가 보낸 값일 수 있으므로 POSTER_MIRROR_ALLOWED_HOSTS의 https URL만 다운로드 (redirect 포함)
+"""
+import asyncio
+import hashlib
+import secrets
+from typing import Any, Dict, List, Optional, Set
+
+import httpx
+from sqlalchemy import and_, or_, update
+from sqlalchemy.dialects.postgresql import insert
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.image_mirror import ImageMirror
+from app.models.movie import Movie
+from app.services.redis_service import redis_service
+from app.services.s3_service import s3_service
+from app.services.thumbnail_service import (
+    CONTENT_TYPES,
+    THUMBNAIL_CACHE_CONTROL,
+    image_format,
+    thumbnail_service,
+)
+
+
+# 같은 source URL을 여러 프로세스가 동시에 다운로드하지 않기 위한 락
+MIRROR_LOCK_PREFIX = "poster_mirror:lock:"
+MIRROR_LOCK_TTL = 60
+
+# kind별 (movies 원본 컬럼, 미러 컬럼)
+MIRROR_COLUMNS = {
+    "poster": ("poster_url", "poster_mirror_url"),
+    "backdrop": ("backdrop_url", "backdrop_mirror_url"),
+}
+
+
+def allowed_source_url(source_url: str) -> Optional[str]:
+    """
+    다운로드할 URL (허용되지 않으면 None)
+
+    - POSTER_MIRROR_ALLOWED_HOSTS의 호스트, 기본 포트, 사용자 정보 없음
+    - KMDb는 포스터 URL을 http로 주므로 허용 호스트의 http URL은 https로 요청
+
+    Args:
+        source_url: 원본 이미지 URL (또는 redirect Location)
+    """
+    try:
+        url = httpx.URL(source_url)
+    except Exception:
+        return None
+
+    if url.scheme not in ("http", "https") or url.userinfo or url.port is not None:
+        return None
+    if url.host.lower() not in {host.lower() for host in settings.POSTER_MIRROR_ALLOWED_HOSTS}:
+        return None
+    return str(url.copy_with(scheme="https"))
+
+
+def _widths(kind: str) -> List[int]:
+    """kind별 variant 너비 (오름차순)"""
+    widths = settings.POSTER_MIRROR_WIDTHS if kind == "poster" else settings.BACKDROP_MIRROR_WIDTHS
+    return sorted(set(widths))
+
+
+class PosterMirrorService:
+    """포스터 미러링 서비스 클래스"""
+
+    def __init__(self):
+        self._client: Optional[httpx.AsyncClient] = None
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    @property
+    def enabled(self) -> bool:
+        """POSTER_MIRROR_ENABLED이고 S3가 설정된 경우에만 동작"""
+        return settings.POSTER_MIRROR_ENABLED and s3_service.client is not None
+
+    @staticmethod
+    def mirror_key(content_hash: str, kind: str, width: int, fmt: str) -> str:
+        """
+        content hash 기반 객체 키
+
+        e.g., filmory/mirrors/posters/3f/3fa9..._500.webp
+        """
+        return f"{settings.POSTER_MIRROR_FOLDER}/{kind}s/{content_hash[:2]}/{content_hash}_{width}.{fmt}"
+
+    async def mirror(self, source_url: str, kind: str = "poster") -> Optional[str]:
+        """
+        이미지 1개 미러링 (같은 URL의 동시 요청은 하나의 작업을 공유)
+
+        Args:
+            source_url: 원본 이미지 URL
+            kind: "poster" 또는 "backdrop"
+
+        Returns:
+            미러 URL (다른 프로세스가 처리 중이면 None)
+
+        Raises:
+            ValueError: 허용되지 않은 URL (POSTER_MIRROR_ALLOWED_HOSTS)
+        """
+        # 이미 우리 버킷의 이미지
+        if s3_service.key_from_url(source_url) is not None:
+            return source_url
+
+        if allowed_source_url(source_url) is None:
+            raise ValueError(f"Image host not allowed: {source_url}")
+
+        task = self._inflight.get(source_url)
+        if task is None:
+            task = asyncio.create_task(self._mirror(source_url, kind))
+            self._inflight[source_url] = task
+            task.add_done_callback(lambda _: self._inflight.pop(source_url, None))
+        return await asyncio.shield(task)
+
+    async def _mirror(self, source_url: str, kind: str) -> Optional[str]:
+        # 1. 이미 미러된 source URL
+        mirror_url = await asyncio.to_thread(self._find_mirror, ImageMirror.source_url == source_url)
+        if mirror_url:
+            return mirror_url
+
+        # 2. 다른 프로세스가 같은 URL을 처리 중이면 건너뜀 (다음 실행에서 1번으로 처리됨)
+        #    (락 값은 이 작업의 토큰 → TTL이 지난 뒤 다른 프로세스가 잡은 락은 해제하지 않음)
+        lock_key = f"{MIRROR_LOCK_PREFIX}{hashlib.sha1(source_url.encode()).hexdigest()}"
+        lock_token = secrets.token_hex(16)
+        if not await redis_service.set(lock_key, lock_token, ttl=MIRROR_LOCK_TTL, nx=True):
+            return None
+
+        try:
+            data = await self._download(source_url)
+            content_hash = hashlib.sha256(data).hexdigest()
+
+            # 3. 같은 내용이 다른 URL로 이미 미러되어 있으면 업로드 없이 매핑만 추가
+            mirror_url = await asyncio.to_thread(
+                self._find_mirror,
+                and_(ImageMirror.content_hash == content_hash, ImageMirror.kind == kind),
+            )
+            if mirror_url is None:
+                fmt = image_format(settings.THUMBNAIL_FORMAT)
+                widths = _widths(kind)
+                variants = await thumbnail_service.render(data, widths, fmt)
+                await asyncio.gather(*[
+                    s3_service.upload(
+                        self.mirror_key(content_hash, kind, width, fmt),
+                        content,
+                        CONTENT_TYPES[fmt],
+                        cache_control=THUMBNAIL_CACHE_CONTROL,
+                    )
+                    for width, content in variants.items()
+                ])
+                mirror_url = s3_service.object_url(self.mirror_key(content_hash, kind, widths[-1], fmt))
+
+            await asyncio.to_thread(self._save_mirror, source_url, content_hash, kind, mirror_url)
+            return mirror_url
+        finally:
+            await redis_service.delete_if_equals(lock_key, lock_token)
+
+    async def _download(self, source_url: str) -> bytes:
+        """
+        원본 이미지 다운로드
+
+        - redirect는 자동으로 따라가지 않고 hop마다 allowed_source_url로 검사
+        - POSTER_MIRROR_MAX_BYTES 초과 시 중단
+
+        Raises:
+            ValueError: 허용되지 않은 URL/redirect, redirect 횟수 초과, 크기 초과
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=settings.POSTER_MIRROR_TIMEOUT,
+                follow_redirects=False,
+                limits=httpx.Limits(max_connections=settings.POSTER_MIRROR_CONCURRENCY * 2),
+            )
+
+        url = allowed_source_url(source_url)
+        for _ in range(settings.POSTER_MIRROR_MAX_REDIRECTS + 1):
+            if url is None:
+                raise ValueError(f"Image host not allowed: {source_url}")
+
+            async with self._client.stream("GET", url) as response:
+                if response.is_redirect:
+                    url = allowed_source_url(str(response.url.join(response.headers["location"])))
+                    continue
+
+                response.raise_for_status()
+                chunks = []
+                size = 0
+                async for chunk in response.aiter_bytes():
+                    size += len(chunk)
+                    if size > settings.POSTER_MIRROR_MAX_BYTES:
+                        raise ValueError(f"Image too large: {source_url}")
+                    chunks.append(chunk)
+                return b"".join(chunks)
+
+        raise ValueError(f"Too many redirects: {source_url}")
+
+    async def mirror_movies(
+        self,
+        movie_ids: Optional[List[int]] = None,
+        before_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        미러가 없는 영화들의 포스터/배경 이미지 미러링
+
+        Args:
+            movie_ids: 대상 영화 ID (None이면 미러가 없는 영화 중 최신순)
+            before_id: movies.id < before_id 인 영화만 (backfill 페이지네이션)
+            limit: 최대 영화 수 (기본값: POSTER_MIRROR_BATCH_SIZE)
+
+        Returns:
+            {"movies": 대상 영화 수, "mirrored": 미러링한 이미지 수, "failed": 실패 수, "last_id": 마지막 영화 ID}
+        """
+        movies = await asyncio.to_thread(
+            self._pending_movies, movie_ids, before_id, limit or settings.POSTER_MIRROR_BATCH_SIZE
+        )
+        semaphore = asyncio.Semaphore(settings.POSTER_MIRROR_CONCURRENCY)
+        counts = {"mirrored": 0, "failed": 0}
+
+        async def mirror_movie(movie: Dict[str, Any]):
+            values = {}
+            for kind, (source_column, mirror_column) in MIRROR_COLUMNS.items():
+                source_url = movie[source_column]
+                if not source_url or movie[mirror_column]:
+                    continue
+                try:
+                    async with semaphore:
+                        mirror_url = await self.mirror(source_url, kind)
+                except Exception as e:
+                    counts["failed"] += 1
+                    print(f"⚠️  Poster mirror failed (movie {movie['id']}, {source_url}): {e}")
+                    continue
+                if mirror_url:
+                    values[mirror_column] = mirror_url
+                    counts["mirrored"] += 1
+
+            if values:
+                await asyncio.to_thread(self._save_movie, movie["id"], values)
+
+        await asyncio.gather(*[mirror_movie(movie) for movie in movies])
+
+        return {
+            "movies": len(movies),
+            **counts,
+            "last_id": movies[-1]["id"] if movies else None,
+        }
+
+    def schedule(self, movie_ids: List[int]):
+        """
+        요청 응답을 기다리지 않고 백그라운드로 미러링 (처음 사용된 영화)
+
+        Args:
+            movie_ids: 대상 영화 ID
+        """
+        if not self.enabled or not movie_ids:
+            return
+
+        task = asyncio.create_task(self._mirror_in_background(movie_ids))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _mirror_in_background(self, movie_ids: List[int]):
+        try:
+            await self.mirror_movies(movie_ids=movie_ids)
+        except Exception as e:
+            print(f"⚠️  Poster mirror failed (movies {movie_ids}): {e}")
+
+    async def stop(self):
+        """백그라운드 작업 취소 + HTTP 클라이언트 종료 (shutdown 시 호출)"""
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @staticmethod
+    def _find_mirror(condition) -> Optional[str]:
+        """image_mirrors에서 미러 URL 조회 (별도 세션)"""
+        db = SessionLocal()
+        try:
+            row = db.query(ImageMirror.mirror_url).filter(condition).first()
+            return row[0] if row else None
+        finally:
+            db.close()
+
+    @staticmethod
+    def _save_mirror(source_url: str, content_hash: str, kind: str, mirror_url: str):
+        """source URL → 미러 매핑 저장 (이미 있으면 무시)"""
+        db = SessionLocal()
+        try:
+            db.execute(
+                insert(ImageMirror)
+                .values(source_url=source_url, content_hash=content_hash, kind=kind, mirror_url=mirror_url)
+                .on_conflict_do_nothing(index_elements=["source_url"])
+            )
+            db.commit()
+        finally:
+            db.close()
+
+    @staticmethod
+    def _pending_movies(movie_ids: Optional[List[int]], before_id: Optional[int], limit: int) -> List[Dict[str, Any]]:
+        """미러가 없는 영화 조회 (id 내림차순)"""
+        db = SessionLocal()
+        try:
+            query = db.query(
+                Movie.id, Movie.poster_url, Movie.poster_mirror_url, Movie.backdrop_url, Movie.backdrop_mirror_url
+            ).filter(
+                or_(
+                    and_(Movie.poster_url.isnot(None), Movie.poster_mirror_url.is_(None)),
+                    and_(Movie.backdrop_url.isnot(None), Movie.backdrop_mirror_url.is_(None)),
+                )
+            )
+            if movie_ids is not None:
+                query = query.filter(Movie.id.in_(movie_ids))
+            if before_id is not None:
+                query = query.filter(Movie.id < before_id)
+            return [dict(row._mapping) for row in query.order_by(Movie.id.desc()).limit(limit).all()]
+        finally:
+            db.close()
+
+    @staticmethod
+    def _save_movie(movie_id: int, values: Dict[str, str]):
+        """movies 미러 컬럼 갱신"""
+        db = SessionLocal()
+        try:
+            db.execute(update(Movie).where(Movie.id == movie_id).values(**values))
+            db.commit()
+        finally:
+            db.close()
+
+
+# Global service instance
+poster_mirror_service = PosterMirrorService()
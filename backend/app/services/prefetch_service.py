@@ -0,0 +1,128 @@
+"""
+Prefetch Service
+박스오피스/트렌딩 영화 메타데이터 캐시 워밍 및 movies 테이블 upsert
+
+- KOBIS 일별/주간 박스오피스
+- TMDb 현재 상영작(now_playing) / 트렌딩(trending)
+- POSTER_MIRROR_ENABLED=True면 upsert 후 포스터 미러링
+
+주기 실행은 앱 lifespan의 백그라운드 태스크(PREFETCH_ENABLED=True)
+또는 scripts/prefetch_catalog.py (cron)로 실행
+"""
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.config import settings
+from app.services.external_api_service import external_api_service
+from app.services.movie_catalog_service import movie_catalog_service
+from app.services.poster_mirror_service import poster_mirror_service
+from app.services.redis_service import redis_service
+
+
+# 여러 worker 중 하나만 실행하기 위한 락 키
+PREFETCH_LOCK_KEY = "prefetch:lock"
+
+
+class PrefetchService:
+    """Prefetch 서비스 클래스"""
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+
+    async def run_once(self) -> Dict[str, Any]:
+        """
+        Prefetch 1회 실행
+
+        Returns:
+            {
+                "targets": 대상 영화 수,
+                "cached": 메타데이터를 가져와 캐시한 영화 수,
+                "upserted": movies 테이블에 upsert한 영화 수,
+                "mirrored": 미러링한 포스터/배경 이미지 수,
+                "elapsed": 소요 시간 (초)
+            }
+        """
+        started = time.monotonic()
+
+        # 1. 대상 영화 ID 수집 (병렬)
+        daily, weekly, now_playing, trending = await asyncio.gather(
+            external_api_service.get_kobis_box_office(weekly=False),
+            external_api_service.get_kobis_box_office(weekly=True),
+            external_api_service.get_tmdb_movie_list("now_playing"),
+            external_api_service.get_tmdb_movie_list("trending"),
+        )
+
+        targets: List[Tuple[str, str]] = []
+        seen = set()
+        for source, ids in (("kobis", daily + weekly), ("tmdb", now_playing + trending)):
+            for movie_id in ids:
+                if (source, str(movie_id)) not in seen:
+                    seen.add((source, str(movie_id)))
+                    targets.append((source, str(movie_id)))
+
+        # 2. 메타데이터 가져오기 + 캐시 갱신 (TTL 리셋을 위해 캐시 무시)
+        entries = await external_api_service.get_metadata_batch(targets, force_refresh=True)
+        metadata_list = [metadata for metadata, _ in entries if metadata]
+
+        # 3. movies 테이블 upsert (동기 DB 작업은 스레드에서 실행, 영화 1편마다 commit)
+        movie_ids: List[int] = []
+        if metadata_list:
+            movie_ids = await asyncio.to_thread(movie_catalog_service.upsert_many_from_metadata, metadata_list)
+
+        # 4. 이번에 upsert한 영화의 포스터 미러링
+        mirrored = 0
+        if movie_ids and poster_mirror_service.enabled:
+            mirrored = (await poster_mirror_service.mirror_movies(movie_ids=movie_ids, limit=len(movie_ids)))["mirrored"]
+
+        result = {
+            "targets": len(targets),
+            "cached": len(metadata_list),
+            "upserted": len(movie_ids),
+            "mirrored": mirrored,
+            "elapsed": round(time.monotonic() - started, 2),
+        }
+        print(f"✅ Prefetch completed: {result}")
+        return result
+
+    async def run_locked(self) -> Optional[Dict[str, Any]]:
+        """
+        분산 락을 잡은 경우에만 Prefetch 실행 (다른 worker가 실행 중이면 건너뜀)
+
+        Returns:
+            run_once 결과 (락 획득 실패 시 None)
+        """
+        # 실행 주기보다 약간 짧게 락 유지 → 다음 주기에는 다시 경쟁
+        lock_ttl = max(settings.PREFETCH_INTERVAL_SECONDS - 60, 60)
+        if not await redis_service.set(PREFETCH_LOCK_KEY, "1", ttl=lock_ttl, nx=True):
+            return None
+
+        return await self.run_once()
+
+    def start(self):
+        """백그라운드 주기 실행 시작"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self):
+        """백그라운드 주기 실행 중지"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _loop(self):
+        """주기 실행 루프"""
+        while True:
+            try:
+                await self.run_locked()
+            except Exception as e:
+                print(f"⚠️  Prefetch failed: {e}")
+            await asyncio.sleep(settings.PREFETCH_INTERVAL_SECONDS)
+
+
+# Global service instance
+prefetch_service = PrefetchService()
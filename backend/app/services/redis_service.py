@@ -2,10 +2,12 @@
 Redis 캐싱 서비스
 JWKS, 외부 API 응답 캐싱
 """
-import json
-from typing import Optional
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Union
 import redis.asyncio as redis
 from app.config import settings
+from app.services.cache_codec import cache_codec
+from app.services.metrics_service import metrics_service
 
 
 class RedisService:
@@ -17,10 +19,10 @@ class RedisService:
     async def connect(self):
         """Redis 연결"""
         if not self.redis_client:
+            # 캐시 값은 cache_codec으로 인코딩된 bytes이므로 decode하지 않음
             self.redis_client = await redis.from_url(
                 settings.REDIS_URL,
-                encoding="utf-8",
-                decode_responses=True
+                decode_responses=False
             )
 
     async def disconnect(self):
@@ -41,9 +43,10 @@ class RedisService:
         if not self.redis_client:
             await self.connect()
 
-        return await self.redis_client.get(key)
+        value = await self.redis_client.get(key)
+        return value.decode("utf-8") if value is not None else None
 
-    async def set(self, key: str, value: str, ttl: int = 3600):
+    async def set(self, key: str, value: str, ttl: int = 3600, nx: bool = False) -> bool:
         """
         캐시에 값 저장
 
@@ -51,11 +54,65 @@ class RedisService:
             key: 캐시 키
             value: 저장할 값
             ttl: Time To Live (초 단위, default: 3600 = 1시간)
+            nx: True면 키가 없을 때만 저장 (간단한 분산 락 용도)
+
+        Returns:
+            bool: 저장 여부
+        """
+        if not self.redis_client:
+            await self.connect()
+
+        return bool(await self.redis_client.set(key, value, ex=ttl, nx=nx))
+
+    async def mget(self, keys: List[str]) -> List[Optional[str]]:
+        """
+        여러 문자열 값을 MGET 한 번으로 가져오기
+
+        Args:
+            keys: 캐시 키 리스트
+
+        Returns:
+            keys와 같은 순서의 값 리스트 (없으면 None)
+        """
+        if not keys:
+            return []
+
+        if not self.redis_client:
+            await self.connect()
+
+        values = await self.redis_client.mget(keys)
+        return [value.decode("utf-8") if value is not None else None for value in values]
+
+    async def incr(self, key: str) -> int:
+        """
+        카운터 증가 (INCR)
+
+        Args:
+            key: 카운터 키
+
+        Returns:
+            증가된 값
         """
         if not self.redis_client:
             await self.connect()
 
-        await self.redis_client.set(key, value, ex=ttl)
+        return await self.redis_client.incr(key)
+
+    async def smembers(self, key: str) -> List[str]:
+        """
+        Set 멤버 조회 (SMEMBERS)
+
+        Args:
+            key: Set 키
+
+        Returns:
+            멤버 리스트
+        """
+        if not self.redis_client:
+            await self.connect()
+
+        members = await self.redis_client.smembers(key)
+        return [member.decode("utf-8") for member in members]
 
     async def delete(self, key: str):
         """
@@ -69,35 +126,245 @@ class RedisService:
 
         await self.redis_client.delete(key)
 
-    async def get_json(self, key: str) -> Optional[dict]:
+    async def delete_if_equals(self, key: str, value: str) -> bool:
         """
-        JSON 형식으로 캐시 가져오기
+        값이 value와 같을 때만 삭제 (락 해제 시 다른 프로세스의 락을 지우지 않도록)
+
+        WATCH/MULTI로 GET과 DEL 사이에 값이 바뀌면 삭제하지 않음
 
         Args:
             key: 캐시 키
+            value: 기대하는 값 (락 토큰)
 
         Returns:
-            dict 형식의 캐시 (없으면 None)
+            bool: 삭제 여부
         """
-        value = await self.get(key)
-        if value:
+        if not self.redis_client:
+            await self.connect()
+
+        async with self.redis_client.pipeline(transaction=True) as pipe:
             try:
-                return json.loads(value)
-            except json.JSONDecodeError:
-                return None
-        return None
+                await pipe.watch(key)
+                current = await pipe.get(key)
+                if current is None or current.decode("utf-8") != value:
+                    await pipe.unwatch()
+                    return False
+                pipe.multi()
+                pipe.delete(key)
+                await pipe.execute()
+                return True
+            except redis.WatchError:
+                return False
 
-    async def set_json(self, key: str, value: dict, ttl: int = 3600):
+    async def get_json(self, key: str) -> Optional[Any]:
         """
-        JSON 형식으로 캐시 저장
+        JSON 호환 값으로 캐시 가져오기 (cache_codec 디코딩)
 
         Args:
             key: 캐시 키
-            value: dict 형식의 값
+
+        Returns:
+            디코딩된 캐시 값 (없으면 None)
+        """
+        if not self.redis_client:
+            await self.connect()
+
+        value = cache_codec.decode(await self.redis_client.get(key))
+        self._record_lookups([key], [value])
+        return value
+
+    async def set_json(self, key: str, value: Any, ttl: int = 3600):
+        """
+        JSON 호환 값을 캐시에 저장 (cache_codec 인코딩)
+
+        Args:
+            key: 캐시 키
+            value: dict/list 등 JSON 호환 값
             ttl: Time To Live (초 단위)
         """
-        json_str = json.dumps(value, ensure_ascii=False)
-        await self.set(key, json_str, ttl)
+        if not self.redis_client:
+            await self.connect()
+
+        await self.redis_client.set(key, cache_codec.encode(value), ex=ttl)
+
+    async def mget_json(self, keys: List[str]) -> List[Optional[Any]]:
+        """
+        여러 키를 MGET 한 번으로 가져오기
+
+        Args:
+            keys: 캐시 키 리스트
+
+        Returns:
+            keys와 같은 순서의 값 리스트 (없거나 디코딩 실패 시 None)
+        """
+        if not keys:
+            return []
+
+        if not self.redis_client:
+            await self.connect()
+
+        values = [cache_codec.decode(value) for value in await self.redis_client.mget(keys)]
+        self._record_lookups(keys, values)
+        return values
+
+    async def mset_json(
+        self,
+        mapping: Dict[str, Any],
+        ttl: Union[int, Dict[str, int]] = 3600,
+        tags: Optional[Dict[str, Iterable[str]]] = None,
+    ):
+        """
+        여러 키를 JSON 호환 값으로 한 번에 저장 (파이프라인, 1 round trip)
+
+        Redis MSET은 TTL을 지원하지 않으므로 SET EX를 파이프라인으로 묶어서 전송
+
+        Args:
+            mapping: {캐시 키: 값}
+            ttl: 모든 키에 적용할 TTL 또는 {캐시 키: TTL} (없는 키는 기본값 3600)
+            tags: {태그 Set 키: 캐시 키 리스트} - 태그 단위 무효화용 (SADD)
+        """
+        if not mapping:
+            return
+
+        async with self.pipeline() as pipe:
+            max_ttl = 0
+            for key, value in mapping.items():
+                key_ttl = ttl.get(key, 3600) if isinstance(ttl, dict) else ttl
+                max_ttl = max(max_ttl, key_ttl)
+                pipe.set(key, cache_codec.encode(value), ex=key_ttl)
+
+            # 태그 Set은 가장 긴 캐시 TTL 동안 유지
+            for tag_key, keys in (tags or {}).items():
+                keys = list(keys)
+                if keys:
+                    pipe.sadd(tag_key, *keys)
+                    pipe.expire(tag_key, max_ttl)
+
+    async def delete_many(self, keys: Iterable[str]) -> int:
+        """
+        여러 키를 DEL 한 번으로 삭제
+
+        Args:
+            keys: 캐시 키 리스트
+
+        Returns:
+            삭제된 키 개수
+        """
+        keys = list(keys)
+        if not keys:
+            return 0
+
+        if not self.redis_client:
+            await self.connect()
+
+        return await self.redis_client.delete(*keys)
+
+    @staticmethod
+    def _record_lookups(keys: List[str], values: List[Optional[Any]]):
+        """캐시 hit/miss 메트릭 기록 (네임스페이스 = 키의 첫 ':' 앞부분, e.g., "tmdb", "resp")"""
+        counts: Dict[str, List[int]] = {}
+        for key, value in zip(keys, values):
+            count = counts.setdefault(key.split(":", 1)[0], [0, 0])
+            count[0 if value is not None else 1] += 1
+        for namespace, (hits, misses) in counts.items():
+            metrics_service.record_cache(namespace, hits, misses)
+
+    async def lpush(self, key: str, *values: str) -> int:
+        """
+        리스트 왼쪽에 값 추가 (작업 큐 enqueue)
+
+        Returns:
+            추가 후 리스트 길이
+        """
+        if not self.redis_client:
+            await self.connect()
+
+        return await self.redis_client.lpush(key, *values)
+
+    async def blmove(self, source: str, destination: str, timeout: float) -> Optional[str]:
+        """
+        source 오른쪽 값을 destination 왼쪽으로 원자적으로 이동 (신뢰성 있는 작업 큐 dequeue)
+
+        처리 중인 작업은 destination(processing 리스트)에 남으므로 worker가 죽어도 유실되지 않음
+
+        Args:
+            source: 대기 큐 키
+            destination: 처리 중 리스트 키
+            timeout: 대기 시간 (초, 0이면 무한 대기)
+
+        Returns:
+            이동한 값 (timeout이면 None)
+        """
+        if not self.redis_client:
+            await self.connect()
+
+        value = await self.redis_client.blmove(source, destination, timeout, "RIGHT", "LEFT")
+        return value.decode("utf-8") if value is not None else None
+
+    async def lmove(self, source: str, destination: str) -> Optional[str]:
+        """
+        source 오른쪽 값을 destination 왼쪽으로 이동 (대기 없음, 처리 중 작업 복구용)
+
+        Returns:
+            이동한 값 (source가 비어 있으면 None)
+        """
+        if not self.redis_client:
+            await self.connect()
+
+        value = await self.redis_client.lmove(source, destination, "RIGHT", "LEFT")
+        return value.decode("utf-8") if value is not None else None
+
+    async def lrem(self, key: str, value: str, count: int = 1) -> int:
+        """
+        리스트에서 값 제거 (처리 완료된 작업 ack)
+
+        Returns:
+            제거된 개수
+        """
+        if not self.redis_client:
+            await self.connect()
+
+        return await self.redis_client.lrem(key, count, value)
+
+    async def llen(self, key: str) -> int:
+        """리스트 길이"""
+        if not self.redis_client:
+            await self.connect()
+
+        return await self.redis_client.llen(key)
+
+    @asynccontextmanager
+    async def pipeline(self, transaction: bool = False) -> AsyncIterator[redis.client.Pipeline]:
+        """
+        파이프라인 컨텍스트 매니저
+
+        블록 안에서 쌓은 명령을 블록 종료 시 한 번에 전송 (예외 발생 시 전송하지 않음)
+
+        Usage:
+            async with redis_service.pipeline() as pipe:
+                pipe.set("a", "1")
+                pipe.expire("b", 60)
+
+        Args:
+            transaction: True면 MULTI/EXEC로 감싸서 원자적으로 실행
+        """
+        if not self.redis_client:
+            await self.connect()
+
+        async with self.redis_client.pipeline(transaction=transaction) as pipe:
+            yield pipe
+            await pipe.execute()
+
+    def transaction(self):
+        """
+        트랜잭션(MULTI/EXEC) 파이프라인 컨텍스트 매니저
+
+        Usage:
+            async with redis_service.transaction() as tx:
+                tx.incr("counter")
+                tx.delete("cache")
+        """
+        return self.pipeline(transaction=True)
 
 
 # Singleton instance
@@ -0,0 +1,297 @@
+"""
+사용자별 응답 캐시
+읽기 비중이 높은 조회 API(/stats/*, /collections/, /tags/popular) 응답을 캐시
+
+캐시 키 형식:
+    resp:{user_id}:g{generation}:{name}:{params hash}
+
+- generation: 사용자별 Redis 카운터 (cache:user:{user_id}:gen)
+  movies/tags/collections/users의 변경 API가 invalidate_user()로 증가시키면
+  해당 사용자의 모든 캐시 키가 바뀌어 즉시 무효화 (KEYS/SCAN 사용 안 함)
+- 2단계 캐시: 로컬 메모리(LRU, RESPONSE_CACHE_LOCAL_TTL) → Redis (RESPONSE_CACHE_TTL)
+  generation은 항상 Redis에서 읽으므로 다른 worker의 변경도 바로 반영됨
+- ETag: 응답 본문 해시. If-None-Match가 일치하면 직렬화 없이 304 반환
+
+conditional(): 캐시하지 않는 목록 API(/movies/, /tags, /media/user-images)용 조건부 GET
+- ETag = generation + 파라미터 (+ validator 값) → 쿼리 실행 전에 계산
+- If-None-Match가 일치하면 endpoint를 실행하지 않고 304 반환
+
+Redis를 사용할 수 없으면 캐시 없이 원래 함수 실행
+"""
+import functools
+import hashlib
+import inspect
+import json
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from fastapi import Request, Response
+
+from app.config import settings
+from app.responses import get_adapter, pop_injected, with_injected
+from app.services.redis_service import redis_service
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+# 사용자 generation 카운터 TTL (캐시 항목 TTL보다 충분히 길게 유지)
+GENERATION_TTL = 7 * 86400
+
+# 캐시 키에서 제외하는 endpoint 파라미터 (의존성 주입 값)
+EXCLUDED_PARAMS = {"db", "user_id", "request", "response"}
+
+
+class CachedResponse:
+    """캐시 항목 (ETag + 응답 본문 + 디코딩된 값)"""
+
+    __slots__ = ("etag", "body", "data")
+
+    def __init__(self, etag: str, body: bytes, data: Any):
+        self.etag = etag
+        self.body = body
+        self.data = data
+
+    @classmethod
+    def from_data(cls, data: Any) -> "CachedResponse":
+        """JSON 호환 값으로 캐시 항목 생성 (ETag = 본문 해시)"""
+        body = orjson.dumps(data) if orjson else json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        etag = f'W/"{hashlib.blake2b(body, digest_size=12).hexdigest()}"'
+        return cls(etag, body, data)
+
+
+class ResponseCacheService:
+    """사용자별 응답 캐시 서비스"""
+
+    def __init__(self):
+        # 캐시 키 -> (만료 시각, CachedResponse)
+        self._local: "OrderedDict[str, Tuple[float, CachedResponse]]" = OrderedDict()
+
+    @staticmethod
+    def generation_key(user_id: str) -> str:
+        """사용자 generation 카운터 키"""
+        return f"cache:user:{user_id}:gen"
+
+    async def get_generation(self, user_id: str) -> Optional[int]:
+        """
+        사용자 generation 조회
+
+        Returns:
+            generation (Redis를 사용할 수 없으면 None)
+        """
+        try:
+            value = await redis_service.get(self.generation_key(user_id))
+            return int(value) if value else 0
+        except Exception as e:
+            print(f"⚠️  Response cache unavailable: {e}")
+            return None
+
+    async def invalidate_user(self, user_id: str):
+        """
+        사용자의 모든 캐시 응답 무효화 (generation 증가, O(1))
+
+        변경 API에서 commit 후 호출
+
+        Args:
+            user_id: 사용자 ID
+        """
+        if not settings.RESPONSE_CACHE_ENABLED:
+            return
+
+        key = self.generation_key(str(user_id))
+        try:
+            async with redis_service.pipeline() as pipe:
+                pipe.incr(key)
+                pipe.expire(key, GENERATION_TTL)
+        except Exception as e:
+            print(f"⚠️  Response cache invalidation failed: {e}")
+
+    def cached(self, name: str, response_model: Any, vary_by_date: bool = False) -> Callable:
+        """
+        조회 endpoint 응답 캐시 데코레이터
+
+        - endpoint는 user_id 파라미터를 가져야 함
+        - HTTP 요청: ETag 헤더 포함 Response 반환 (If-None-Match 일치 시 304)
+        - 다른 코드에서 직접 호출 (e.g., /home): request 없이 JSON 호환 값 반환
+
+        Usage:
+            @router.get("/monthly", response_model=List[MonthlyStats])
+            @response_cache.cached("stats:monthly", List[MonthlyStats])
+            async def get_monthly_stats(...):
+
+        Args:
+            name: 캐시 이름 (endpoint 구분용)
+            response_model: 응답 검증/직렬화 모델 (route의 response_model과 동일하게)
+            vary_by_date: 오늘 날짜를 캐시 키에 포함 (날짜에 따라 결과가 달라지는 통계)
+        """
+        adapter = get_adapter(response_model)
+
+        def decorator(func: Callable) -> Callable:
+            signature = inspect.signature(func)
+
+            @functools.wraps(func)
+            async def wrapper(**kwargs):
+                request: Optional[Request] = pop_injected(signature, kwargs, "request")
+
+                if not settings.RESPONSE_CACHE_ENABLED:
+                    return await func(**kwargs)
+
+                user_id = str(kwargs["user_id"])
+                generation = await self.get_generation(user_id)
+                if generation is None:
+                    return await func(**kwargs)
+
+                params = {key: value for key, value in kwargs.items() if key not in EXCLUDED_PARAMS}
+                if vary_by_date:
+                    params["_date"] = date.today().isoformat()
+                key = self._key(user_id, generation, name, params)
+
+                entry = await self._get(key)
+                if entry is None:
+                    result = await func(**kwargs)
+                    data = adapter.dump_python(adapter.validate_python(result, from_attributes=True), mode="json")
+                    entry = CachedResponse.from_data(data)
+                    await self._set(key, entry)
+
+                if request is None:
+                    return entry.data
+
+                return self.to_response(request, entry)
+
+            wrapper.__signature__ = with_injected(signature, Request)
+            return wrapper
+
+        return decorator
+
+    def conditional(self, name: str, validator: Optional[Callable[[Any, str], Any]] = None) -> Callable:
+        """
+        조건부 GET 데코레이터 (응답은 캐시하지 않고 ETag만 사용)
+
+        generation은 사용자 데이터 변경 시에만 바뀌므로, ETag가 일치하면
+        쿼리/직렬화 없이 304 반환. ETag가 다르면 원래 endpoint 실행 후 ETag 헤더 추가
+
+        Usage:
+            @router.get("/", response_model=List[UserMovieResponse])
+            @response_cache.conditional("movies:list", validator=_movies_validator)
+            async def get_user_movies(...):
+
+        Args:
+            name: ETag 이름 (endpoint 구분용)
+            validator: (db, user_id) → 값. 사용자 generation에 반영되지 않는 데이터
+                (e.g., 영화 메타데이터 갱신)를 ETag에 포함할 때 사용하는 가벼운 쿼리
+        """
+        def decorator(func: Callable) -> Callable:
+            signature = inspect.signature(func)
+
+            @functools.wraps(func)
+            async def wrapper(**kwargs):
+                request: Optional[Request] = pop_injected(signature, kwargs, "request")
+                response: Optional[Response] = pop_injected(signature, kwargs, "response")
+
+                # 다른 코드에서 직접 호출 (e.g., /home) 또는 캐시 비활성화
+                if request is None or not settings.RESPONSE_CACHE_ENABLED:
+                    return await func(**kwargs)
+
+                user_id = str(kwargs["user_id"])
+                generation = await self.get_generation(user_id)
+                if generation is None:
+                    return await func(**kwargs)
+
+                params = {key: value for key, value in kwargs.items() if key not in EXCLUDED_PARAMS}
+                if validator:
+                    params["_validator"] = validator(kwargs["db"], user_id)
+                etag = f'W/"{name}-g{generation}-{_digest(params)}"'
+
+                headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+                if _etag_matches(request, etag):
+                    return Response(status_code=304, headers=headers)
+
+                result = await func(**kwargs)
+                if isinstance(result, Response):
+                    # 직접 만든 Response에는 주입된 response의 헤더가 합쳐지지 않음
+                    result.headers.update(headers)
+                elif response is not None:
+                    response.headers.update(headers)
+                return result
+
+            wrapper.__signature__ = with_injected(signature, Request, Response)
+            return wrapper
+
+        return decorator
+
+    @staticmethod
+    def to_response(request: Request, entry: CachedResponse) -> Response:
+        """
+        캐시 항목 → HTTP 응답 (If-None-Match 일치 시 304)
+        """
+        headers = {"ETag": entry.etag, "Cache-Control": "private, no-cache"}
+
+        if _etag_matches(request, entry.etag):
+            return Response(status_code=304, headers=headers)
+
+        return Response(content=entry.body, media_type="application/json", headers=headers)
+
+    @staticmethod
+    def _key(user_id: str, generation: int, name: str, params: Dict[str, Any]) -> str:
+        """캐시 키 생성 (파라미터는 정렬 후 해시)"""
+        return f"resp:{user_id}:g{generation}:{name}:{_digest(params)}"
+
+    async def _get(self, key: str) -> Optional[CachedResponse]:
+        """로컬 → Redis 순서로 조회 (Redis hit은 로컬에도 저장)"""
+        now = time.monotonic()
+        local = self._local.get(key)
+        if local:
+            if local[0] > now:
+                self._local.move_to_end(key)
+                return local[1]
+            del self._local[key]
+
+        try:
+            cached = await redis_service.get_json(key)
+        except Exception as e:
+            print(f"⚠️  Response cache get error: {e}")
+            return None
+
+        if not cached:
+            return None
+
+        entry = CachedResponse.from_data(cached["data"])
+        self._set_local(key, entry)
+        return entry
+
+    async def _set(self, key: str, entry: CachedResponse):
+        """로컬 + Redis에 저장"""
+        self._set_local(key, entry)
+        try:
+            await redis_service.set_json(key, {"data": entry.data}, ttl=settings.RESPONSE_CACHE_TTL)
+        except Exception as e:
+            print(f"⚠️  Response cache set error: {e}")
+
+    def _set_local(self, key: str, entry: CachedResponse):
+        """로컬 LRU에 저장 (최대 개수 초과 시 오래된 항목 제거)"""
+        self._local[key] = (time.monotonic() + settings.RESPONSE_CACHE_LOCAL_TTL, entry)
+        self._local.move_to_end(key)
+        while len(self._local) > settings.RESPONSE_CACHE_LOCAL_MAX_ENTRIES:
+            self._local.popitem(last=False)
+
+
+def _digest(params: Dict[str, Any]) -> str:
+    """파라미터 해시 (키 정렬)"""
+    raw = json.dumps(params, sort_keys=True, default=str)
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match 헤더에 etag가 포함되어 있는지 확인"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return if_none_match.strip() == "*" or etag in [tag.strip() for tag in if_none_match.split(",")]
+
+
+# Global service instance
+response_cache = ResponseCacheService()
@@ -1,53 +1,171 @@
 """
 AWS S3 Upload Service
 S3 Presigned URL 생성 및 이미지 업로드 관리
+
+- Presigned URL / POST policy 서명은 로컬 연산 (자격 증명 + HMAC) → 네트워크 호출 없음, 이벤트 루프에서 바로 호출
+- 네트워크가 필요한 호출 (delete/head 등)은 전용 스레드 풀에서 실행 → 이벤트 루프 블로킹 방지
+- boto3 client는 프로세스당 하나만 생성하여 재사용 (client는 thread-safe, 커넥션 풀 공유)
+- content_sha256을 받으면 내용 기반 키 ({folder}/{sha256}.{ext}) → 같은 파일 재업로드 시 같은 객체
+  (S3가 checksum으로 내용을 검증하는 presigned PUT/POST만, multipart는 UUID 키)
+- AWS_S3_ENDPOINT_URL 설정 시 MinIO / moto server 같은 S3 호환 로컬 stand-in 사용
 """
+import asyncio
+import base64
+import math
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import boto3
-from botocore.exceptions import ClientError
-from typing import Dict, Optional
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 import uuid
 from datetime import datetime
 
 from app.config import settings
 
 
+# DeleteObjects 요청 1회당 최대 키 수 (S3 제한)
+DELETE_OBJECTS_MAX_KEYS = 1000
+
+# 사용자 이미지(티켓, 포토카드) 업로드 폴더 ({USER_IMAGE_FOLDER}/{user_id}/...)
+USER_IMAGE_FOLDER = "filmory/user-images"
+
+
 class S3Service:
     """AWS S3 서비스 클래스"""
 
     def __init__(self):
         """S3 클라이언트 초기화"""
+        self._executor: Optional[ThreadPoolExecutor] = None
+
         if not settings.AWS_ACCESS_KEY_ID or not settings.AWS_SECRET_ACCESS_KEY:
             self.client = None
             print("⚠️  AWS S3 credentials not configured")
         else:
-            self.client = boto3.client(
-                's3',
+            # 전용 session에서 client 생성 (기본 session은 thread-safe하지 않음)
+            session = boto3.session.Session(
                 aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
                 aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                region_name=settings.AWS_REGION
+                region_name=settings.AWS_REGION,
+            )
+            self.client = session.client(
+                's3',
+                endpoint_url=settings.AWS_S3_ENDPOINT_URL or None,
+                config=Config(
+                    signature_version="s3v4",
+                    # 스레드 풀 크기만큼 커넥션을 유지해야 풀 대기가 생기지 않음
+                    max_pool_connections=settings.S3_MAX_CONCURRENCY,
+                    connect_timeout=settings.S3_CONNECT_TIMEOUT,
+                    read_timeout=settings.S3_READ_TIMEOUT,
+                    retries={"max_attempts": 3, "mode": "standard"},
+                    # 로컬 stand-in은 virtual-hosted 도메인을 해석할 수 없으므로 path-style 사용
+                    s3={"addressing_style": "path" if settings.AWS_S3_ENDPOINT_URL else "auto"},
+                ),
             )
             self.bucket_name = settings.AWS_S3_BUCKET
             print(f"✅ S3 client initialized: {self.bucket_name}")
 
+    async def _run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        블로킹 boto3 호출을 S3 전용 스레드 풀에서 실행
+
+        기본 executor (asyncio.to_thread)를 DB 작업과 공유하지 않도록 별도 풀 사용
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=settings.S3_MAX_CONCURRENCY,
+                thread_name_prefix="s3",
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    def object_url(self, file_key: str) -> str:
+        """
+        S3 객체의 최종 URL (GET 요청용)
+
+        Args:
+            file_key: S3 객체 키
+
+        Returns:
+            AWS_S3_PUBLIC_URL (CDN 등) > AWS_S3_ENDPOINT_URL (path-style) > AWS 기본 도메인 순
+        """
+        if settings.AWS_S3_PUBLIC_URL:
+            return f"{settings.AWS_S3_PUBLIC_URL.rstrip('/')}/{file_key}"
+        if settings.AWS_S3_ENDPOINT_URL:
+            return f"{settings.AWS_S3_ENDPOINT_URL.rstrip('/')}/{self.bucket_name}/{file_key}"
+        return f"https://{self.bucket_name}.s3.{settings.AWS_REGION}.amazonaws.com/{file_key}"
+
+    def key_from_url(self, file_url: str) -> Optional[str]:
+        """
+        object_url의 역변환 (우리 버킷 URL이 아니면 None)
+
+        Args:
+            file_url: S3 객체 URL (PUBLIC_URL / ENDPOINT_URL / AWS 기본 도메인)
+
+        Returns:
+            S3 객체 키
+        """
+        prefixes = [f"https://{self.bucket_name}.s3.{settings.AWS_REGION}.amazonaws.com/"]
+        if settings.AWS_S3_PUBLIC_URL:
+            prefixes.append(f"{settings.AWS_S3_PUBLIC_URL.rstrip('/')}/")
+        if settings.AWS_S3_ENDPOINT_URL:
+            prefixes.append(f"{settings.AWS_S3_ENDPOINT_URL.rstrip('/')}/{self.bucket_name}/")
+
+        for prefix in prefixes:
+            if file_url.startswith(prefix) and len(file_url) > len(prefix):
+                return file_url[len(prefix):].split("?", 1)[0]
+        return None
+
+    def _new_file_key(self, file_name: str, folder: str, content_sha256: Optional[str] = None) -> str:
+        """
+        S3 객체 키 생성
+
+        Args:
+            file_name: 원본 파일명 (확장자만 사용)
+            folder: S3 폴더 경로
+            content_sha256: 파일 내용의 SHA-256 (hex), 지정 시 내용 기반 키
+
+        Returns:
+            "{folder}/{sha256}.{ext}" 또는 "{folder}/{uuid}_{timestamp}.{ext}"
+        """
+        # 파일 확장자 추출
+        file_extension = file_name.split('.')[-1].lower() if '.' in file_name else 'jpg'
+
+        if content_sha256:
+            return f"{folder}/{content_sha256}.{file_extension}"
+
+        # 고유한 파일명 생성 (UUID + timestamp)
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        unique_filename = f"{uuid.uuid4().hex}_{timestamp}.{file_extension}"
+
+        # S3 객체 키 (경로 포함)
+        return f"{folder}/{unique_filename}"
+
     def generate_presigned_url(
         self,
         file_name: str,
         file_type: str,
         folder: str = "images",
-        expiration: int = 900  # 15분
-    ) -> Optional[Dict[str, str]]:
+        expiration: int = 900,  # 15분
+        content_sha256: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         S3 Presigned URL 생성
 
+        서명만 로컬에서 계산하므로 (네트워크 호출 없음) async endpoint에서 직접 호출해도 됨
+
         Args:
             file_name: 원본 파일명
             file_type: MIME type (e.g., 'image/jpeg')
             folder: S3 폴더 경로 (기본값: 'images')
             expiration: URL 유효 시간 (초, 기본값: 900초 = 15분)
+            content_sha256: 파일 내용의 SHA-256 (hex)
+                지정 시 내용 기반 키 + x-amz-checksum-sha256 서명 (S3가 내용이 다르면 거부)
 
         Returns:
             {
                 "upload_url": "S3 업로드 URL (PUT 요청용)",
+                "upload_headers": "PUT 요청에 포함해야 하는 헤더",
                 "file_url": "업로드된 파일의 최종 URL (GET 요청용)",
                 "file_key": "S3 객체 키"
             }
@@ -55,44 +173,343 @@ class S3Service:
         if not self.client:
             raise Exception("S3 client not initialized. Check AWS credentials.")
 
-        # 파일 확장자 추출
-        file_extension = file_name.split('.')[-1] if '.' in file_name else 'jpg'
-
-        # 고유한 파일명 생성 (UUID + timestamp)
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        unique_filename = f"{uuid.uuid4().hex}_{timestamp}.{file_extension}"
-
-        # S3 객체 키 (경로 포함)
-        file_key = f"{folder}/{unique_filename}"
+        file_key = self._new_file_key(file_name, folder, content_sha256)
+        params = {
+            'Bucket': self.bucket_name,
+            'Key': file_key,
+            'ContentType': file_type
+        }
+        upload_headers = {"Content-Type": file_type}
+        if content_sha256:
+            checksum = base64.b64encode(bytes.fromhex(content_sha256)).decode()
+            params['ChecksumSHA256'] = checksum
+            upload_headers["x-amz-checksum-sha256"] = checksum
 
         try:
             # Presigned URL 생성 (PUT 요청용)
             upload_url = self.client.generate_presigned_url(
                 'put_object',
-                Params={
-                    'Bucket': self.bucket_name,
-                    'Key': file_key,
-                    'ContentType': file_type
-                },
+                Params=params,
                 ExpiresIn=expiration
             )
 
-            # 최종 파일 URL (GET 요청용)
-            file_url = f"https://{self.bucket_name}.s3.{settings.AWS_REGION}.amazonaws.com/{file_key}"
-
             return {
                 "upload_url": upload_url,
-                "file_url": file_url,
+                "upload_headers": upload_headers,
+                "file_url": self.object_url(file_key),
                 "file_key": file_key
             }
 
-        except ClientError as e:
+        except (ClientError, BotoCoreError) as e:
             print(f"❌ S3 Presigned URL 생성 실패: {e}")
             raise Exception(f"Failed to generate presigned URL: {str(e)}")
 
-    def delete_file(self, file_key: str) -> bool:
+    def generate_presigned_post(
+        self,
+        file_name: str,
+        file_type: str,
+        max_bytes: int,
+        folder: str = "images",
+        expiration: int = 900,
+        content_sha256: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        S3 Presigned POST 생성 (브라우저 form 업로드용)
+
+        PUT과 달리 policy 조건을 S3가 검증하므로, 크기/타입이 다르면 저장 전에 거부됨 (403)
+        - content-length-range: 1 ~ max_bytes
+        - Content-Type: file_type과 정확히 일치
+        - x-amz-checksum-sha256: content_sha256 지정 시 (내용이 다르면 S3가 거부)
+
+        Args:
+            file_name: 원본 파일명
+            file_type: MIME type
+            max_bytes: 허용할 최대 파일 크기 (bytes)
+            folder: S3 폴더 경로
+            expiration: policy 유효 시간 (초)
+            content_sha256: 파일 내용의 SHA-256 (hex), 지정 시 내용 기반 키 + checksum 필드/조건
+
+        Returns:
+            {
+                "upload_url": "POST 요청 URL",
+                "fields": "form에 포함할 필드 (policy, 서명 등)",
+                "file_url": "업로드된 파일의 최종 URL",
+                "file_key": "S3 객체 키"
+            }
+        """
+        if not self.client:
+            raise Exception("S3 client not initialized. Check AWS credentials.")
+
+        file_key = self._new_file_key(file_name, folder, content_sha256)
+        fields = {"Content-Type": file_type}
+        conditions = [
+            {"Content-Type": file_type},
+            ["content-length-range", 1, max_bytes],
+        ]
+        if content_sha256:
+            # 내용 기반 키는 내용이 검증되어야 함 (다른 내용이 같은 키로 저장되지 않도록)
+            checksum = base64.b64encode(bytes.fromhex(content_sha256)).decode()
+            fields["x-amz-checksum-sha256"] = checksum
+            conditions.append({"x-amz-checksum-sha256": checksum})
+
+        try:
+            post = self.client.generate_presigned_post(
+                Bucket=self.bucket_name,
+                Key=file_key,
+                Fields=fields,
+                Conditions=conditions,
+                ExpiresIn=expiration
+            )
+
+            return {
+                "upload_url": post["url"],
+                "fields": post["fields"],
+                "file_url": self.object_url(file_key),
+                "file_key": file_key
+            }
+
+        except (ClientError, BotoCoreError) as e:
+            print(f"❌ S3 Presigned POST 생성 실패: {e}")
+            raise Exception(f"Failed to generate presigned POST: {str(e)}")
+
+    async def create_multipart_upload(
+        self,
+        file_name: str,
+        file_type: str,
+        file_size: int,
+        part_size: int,
+        folder: str = "images",
+        expiration: int = 3600
+    ) -> Dict[str, Any]:
+        """
+        Multipart 업로드 시작 + part별 presigned URL 생성
+
+        UploadId 발급만 S3 호출 (스레드 풀), part URL 서명은 로컬 연산
+
+        multipart의 SHA-256 checksum은 part checksum의 checksum이라 파일 전체 SHA-256을 S3가 검증할 수 없음
+        → 내용 기반 키를 사용하지 않고 항상 UUID 키
+
+        Args:
+            file_name: 원본 파일명
+            file_type: MIME type
+            file_size: 전체 파일 크기 (bytes, part 수 계산용)
+            part_size: part 크기 (bytes, S3 최소 5MB - 마지막 part 제외)
+            folder: S3 폴더 경로
+            expiration: part URL 유효 시간 (초)
+
+        Returns:
+            {"upload_id", "file_url", "file_key", "part_size", "parts": [{"part_number", "upload_url"}]}
+        """
+        if not self.client:
+            raise Exception("S3 client not initialized. Check AWS credentials.")
+
+        file_key = self._new_file_key(file_name, folder)
+        # S3 part 수 제한 (10,000개)을 넘지 않도록 part 크기 조정
+        part_size = max(part_size, math.ceil(file_size / 10000))
+        part_count = max(1, math.ceil(file_size / part_size))
+
+        try:
+            response = await self._run(
+                self.client.create_multipart_upload,
+                Bucket=self.bucket_name,
+                Key=file_key,
+                ContentType=file_type
+            )
+            upload_id = response["UploadId"]
+
+            parts = [
+                {
+                    "part_number": part_number,
+                    "upload_url": self.client.generate_presigned_url(
+                        'upload_part',
+                        Params={
+                            'Bucket': self.bucket_name,
+                            'Key': file_key,
+                            'UploadId': upload_id,
+                            'PartNumber': part_number
+                        },
+                        ExpiresIn=expiration
+                    )
+                }
+                for part_number in range(1, part_count + 1)
+            ]
+
+            return {
+                "upload_id": upload_id,
+                "file_url": self.object_url(file_key),
+                "file_key": file_key,
+                "part_size": part_size,
+                "parts": parts
+            }
+
+        except (ClientError, BotoCoreError) as e:
+            print(f"❌ S3 Multipart 업로드 시작 실패: {e}")
+            raise Exception(f"Failed to create multipart upload: {str(e)}")
+
+    def _list_parts(self, file_key: str, upload_id: str) -> List[Dict[str, Any]]:
+        """업로드된 part 목록 [{"PartNumber", "ETag", "Size"}] (list_parts는 최대 1000개씩 페이지네이션)"""
+        paginator = self.client.get_paginator("list_parts")
+        return [
+            part
+            for page in paginator.paginate(Bucket=self.bucket_name, Key=file_key, UploadId=upload_id)
+            for part in page.get("Parts", [])
+        ]
+
+    async def complete_multipart_upload(
+        self,
+        file_key: str,
+        upload_id: str,
+        parts: List[Dict[str, Any]],
+        max_bytes: int
+    ) -> Dict[str, str]:
+        """
+        Multipart 업로드 완료
+
+        part URL에는 크기 조건을 걸 수 없으므로, 완료 전에 업로드된 크기를 확인하고
+        max_bytes를 넘으면 업로드를 취소 (객체가 생성되지 않음)
+
+        크기를 확인한 뒤 part가 다시 업로드되어도 (part URL은 유효 시간 동안 재사용 가능)
+        완료에는 list_parts로 확인한 (PartNumber, ETag)만 사용 → 바뀐 part가 있으면 S3가 완료를 거부
+
+        Args:
+            file_key: S3 객체 키
+            upload_id: create_multipart_upload의 UploadId
+            parts: [{"part_number": 1, "etag": "..."}] (업로드된 part 전체와 일치해야 함)
+            max_bytes: 허용할 최대 파일 크기 (bytes)
+
+        Returns:
+            {"file_url", "file_key"}
+
+        Raises:
+            ValueError: 크기 초과, part 목록 불일치, 존재하지 않는 업로드/part 등 요청 오류
+        """
+        if not self.client:
+            raise Exception("S3 client not initialized. Check AWS credentials.")
+
+        try:
+            uploaded = await self._run(self._list_parts, file_key, upload_id)
+            uploaded_size = sum(part["Size"] for part in uploaded)
+            if uploaded_size > max_bytes:
+                await self.abort_multipart_upload(file_key, upload_id)
+                raise ValueError(f"File too large ({uploaded_size} > {max_bytes} bytes)")
+
+            # 클라이언트가 보낸 part 목록이 크기를 확인한 part와 같아야 함 (ETag 따옴표 유무는 무시)
+            requested = {(part["part_number"], part["etag"].strip('"')) for part in parts}
+            listed = {(part["PartNumber"], part["ETag"].strip('"')) for part in uploaded}
+            if requested != listed:
+                raise ValueError("Parts do not match the uploaded parts")
+
+            await self._run(
+                self.client.complete_multipart_upload,
+                Bucket=self.bucket_name,
+                Key=file_key,
+                UploadId=upload_id,
+                MultipartUpload={
+                    "Parts": [
+                        {"PartNumber": part["PartNumber"], "ETag": part["ETag"]}
+                        for part in sorted(uploaded, key=lambda p: p["PartNumber"])
+                    ]
+                }
+            )
+            return {"file_url": self.object_url(file_key), "file_key": file_key}
+
+        except ClientError as e:
+            code = e.response.get("Error", {}).get("Code", "")
+            if code in ("NoSuchUpload", "InvalidPart", "InvalidPartOrder", "EntityTooSmall"):
+                raise ValueError(f"Invalid multipart upload: {code}")
+            print(f"❌ S3 Multipart 업로드 완료 실패: {e}")
+            raise Exception(f"Failed to complete multipart upload: {str(e)}")
+        except BotoCoreError as e:
+            print(f"❌ S3 Multipart 업로드 완료 실패: {e}")
+            raise Exception(f"Failed to complete multipart upload: {str(e)}")
+
+    async def abort_multipart_upload(self, file_key: str, upload_id: str) -> bool:
+        """
+        Multipart 업로드 취소 (업로드된 part 삭제)
+
+        Args:
+            file_key: S3 객체 키
+            upload_id: create_multipart_upload의 UploadId
+
+        Returns:
+            bool: 취소 성공 여부
+        """
+        if not self.client:
+            raise Exception("S3 client not initialized. Check AWS credentials.")
+
+        try:
+            await self._run(
+                self.client.abort_multipart_upload,
+                Bucket=self.bucket_name,
+                Key=file_key,
+                UploadId=upload_id
+            )
+            return True
+
+        except (ClientError, BotoCoreError) as e:
+            print(f"❌ S3 Multipart 업로드 취소 실패: {e}")
+            return False
+
+    async def download(self, file_key: str) -> bytes:
         """
-        S3 파일 삭제
+        S3 객체 다운로드 (스레드 풀에서 실행)
+
+        Args:
+            file_key: S3 객체 키
+
+        Returns:
+            객체 내용
+
+        Raises:
+            ClientError: 객체가 없거나 권한이 없는 경우 (NoSuchKey 등)
+        """
+        if not self.client:
+            raise Exception("S3 client not initialized. Check AWS credentials.")
+
+        def _get() -> bytes:
+            response = self.client.get_object(Bucket=self.bucket_name, Key=file_key)
+            with response["Body"] as body:
+                return body.read()
+
+        return await self._run(_get)
+
+    async def upload(
+        self,
+        file_key: str,
+        data: bytes,
+        content_type: str,
+        cache_control: Optional[str] = None
+    ) -> str:
+        """
+        S3 객체 업로드 (스레드 풀에서 실행, 같은 키면 덮어씀)
+
+        Args:
+            file_key: S3 객체 키
+            data: 객체 내용
+            content_type: MIME type
+            cache_control: Cache-Control 헤더 (CDN/브라우저 캐시)
+
+        Returns:
+            업로드된 객체의 최종 URL
+        """
+        if not self.client:
+            raise Exception("S3 client not initialized. Check AWS credentials.")
+
+        params = {
+            "Bucket": self.bucket_name,
+            "Key": file_key,
+            "Body": data,
+            "ContentType": content_type,
+        }
+        if cache_control:
+            params["CacheControl"] = cache_control
+
+        await self._run(self.client.put_object, **params)
+        return self.object_url(file_key)
+
+    async def delete_file(self, file_key: str) -> bool:
+        """
+        S3 파일 삭제 (스레드 풀에서 실행)
 
         Args:
             file_key: S3 객체 키 (e.g., 'images/abc123.jpg')
@@ -104,20 +521,70 @@ class S3Service:
             raise Exception("S3 client not initialized. Check AWS credentials.")
 
         try:
-            self.client.delete_object(
+            await self._run(
+                self.client.delete_object,
                 Bucket=self.bucket_name,
                 Key=file_key
             )
             print(f"✅ S3 파일 삭제 성공: {file_key}")
             return True
 
-        except ClientError as e:
+        except (ClientError, BotoCoreError) as e:
             print(f"❌ S3 파일 삭제 실패: {e}")
             return False
 
-    def check_bucket_exists(self) -> bool:
+    async def delete_files(self, file_keys: List[str]) -> Tuple[int, List[str]]:
+        """
+        여러 S3 파일 삭제 (DeleteObjects, 요청 1회당 최대 1000개)
+
+        Args:
+            file_keys: S3 객체 키 리스트
+
+        Returns:
+            (삭제 요청한 키 수, 삭제 실패한 키 리스트)
+        """
+        if not self.client:
+            raise Exception("S3 client not initialized. Check AWS credentials.")
+
+        failed: List[str] = []
+        for start in range(0, len(file_keys), DELETE_OBJECTS_MAX_KEYS):
+            chunk = file_keys[start:start + DELETE_OBJECTS_MAX_KEYS]
+            response = await self._run(
+                self.client.delete_objects,
+                Bucket=self.bucket_name,
+                Delete={"Objects": [{"Key": key} for key in chunk], "Quiet": True}
+            )
+            # Quiet 모드에서는 실패한 키만 반환됨
+            for error in response.get("Errors", []):
+                print(f"❌ S3 파일 삭제 실패: {error.get('Key')} ({error.get('Code')})")
+                failed.append(error.get("Key"))
+
+        return len(file_keys) - len(failed), failed
+
+    async def list_objects(self, prefix: str) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        prefix 아래 객체 목록을 페이지(최대 1000개) 단위로 반환 (각 페이지 요청은 스레드 풀에서 실행)
+
+        Args:
+            prefix: S3 키 prefix
+
+        Yields:
+            [{"Key", "LastModified", "Size", ...}, ...]
         """
-        S3 버킷 존재 여부 확인
+        if not self.client:
+            raise Exception("S3 client not initialized. Check AWS credentials.")
+
+        paginator = self.client.get_paginator("list_objects_v2")
+        pages = iter(paginator.paginate(Bucket=self.bucket_name, Prefix=prefix))
+        while True:
+            page = await self._run(next, pages, None)
+            if page is None:
+                break
+            yield page.get("Contents", [])
+
+    async def check_bucket_exists(self) -> bool:
+        """
+        S3 버킷 존재 여부 확인 (스레드 풀에서 실행)
 
         Returns:
             bool: 버킷 존재 여부
@@ -126,11 +593,17 @@ class S3Service:
             return False
 
         try:
-            self.client.head_bucket(Bucket=self.bucket_name)
+            await self._run(self.client.head_bucket, Bucket=self.bucket_name)
             return True
-        except ClientError:
+        except (ClientError, BotoCoreError):
             return False
 
+    def close(self):
+        """스레드 풀 종료 (shutdown 시 호출, 진행 중인 호출은 완료까지 대기)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
 
 # Global S3 service instance
 s3_service = S3Service()
@@ -0,0 +1,170 @@
+"""
+Slow query log
+SQLAlchemy engine 이벤트로 SLOW_QUERY_THRESHOLD_MS보다 느린 SQL을 NDJSON 파일에 기록
+
+기록 항목 (1줄 = 느린 쿼리 1건):
+    {"ts", "fingerprint", "statement", "duration_ms", "params", "explain"}
+
+- fingerprint: 리터럴/바인드 파라미터/IN 목록 길이를 정규화한 SQL의 해시
+  → 같은 모양의 쿼리를 하나로 집계 (scripts/slow_query_report.py)
+- params: 값이 아닌 모양만 기록 (e.g., {"user_id": "str", "ids": "list[12]"}) - 개인정보 보호
+- explain: SLOW_QUERY_EXPLAIN_SAMPLE_RATE 비율로 EXPLAIN 결과 포함
+  SELECT는 EXPLAIN (ANALYZE, BUFFERS), 그 외(INSERT/UPDATE/CTE 등)는 재실행하지 않도록 EXPLAIN만
+  같은 연결의 별도 cursor + SAVEPOINT에서 실행하므로 원래 트랜잭션/결과에 영향 없음
+
+SLOW_QUERY_LOG_ENABLED=True일 때만 설치 (database.py)
+"""
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+
+
+# 정규화 패턴 (순서대로 적용)
+_NORMALIZE_PATTERNS = [
+    (re.compile(r"'(?:[^']|'')*'"), "?"),  # 문자열 리터럴
+    (re.compile(r"%\(\w+\)s"), "?"),  # pyformat 바인드 파라미터 (psycopg2)
+    (re.compile(r"\b\d+(?:\.\d+)?\b"), "?"),  # 숫자 리터럴
+    (re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)"), "(?+)"),  # IN 목록 / VALUES 행 (길이 무시)
+    (re.compile(r"(?:\(\?\+\)\s*,\s*)+\(\?\+\)"), "(?+)+"),  # 다중 VALUES 행 (행 수 무시)
+    (re.compile(r"\s+"), " "),
+]
+
+# EXPLAIN 가능한 문장 (DDL 등은 제외)
+_EXPLAINABLE = re.compile(r"^\s*(SELECT|INSERT|UPDATE|DELETE|WITH)\b", re.IGNORECASE)
+
+# EXPLAIN ANALYZE로 재실행해도 안전한 문장 (읽기 전용)
+_READ_ONLY = re.compile(r"^\s*SELECT\b", re.IGNORECASE)
+
+# EXPLAIN 실행 SAVEPOINT 이름
+_SAVEPOINT = "slow_query_explain"
+
+
+def normalize(statement: str) -> str:
+    """SQL 정규화 (리터럴/파라미터 → ?, 공백 정리)"""
+    for pattern, replacement in _NORMALIZE_PATTERNS:
+        statement = pattern.sub(replacement, statement)
+    return statement.strip()
+
+
+def fingerprint(normalized: str) -> str:
+    """정규화된 SQL의 fingerprint (16자리 hex)"""
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def param_shape(value: Any) -> str:
+    """바인드 파라미터 값의 모양 (값 자체는 기록하지 않음)"""
+    if value is None:
+        return "null"
+    if isinstance(value, (list, tuple, set)):
+        return f"{type(value).__name__}[{len(value)}]"
+    if isinstance(value, (str, bytes)) and len(value) > 64:
+        return f"{type(value).__name__}({len(value)})"
+    return type(value).__name__
+
+
+def params_shape(parameters: Any, executemany: bool) -> Any:
+    """바인드 파라미터 전체의 모양 (executemany는 첫 행 모양 + 행 수)"""
+    if executemany and parameters:
+        return {"rows": len(parameters), "row": params_shape(parameters[0], False)}
+    if isinstance(parameters, dict):
+        return {name: param_shape(value) for name, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [param_shape(value) for value in parameters]
+    return None
+
+
+class SlowQueryLog:
+    """Slow query log 서비스"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    def install(self, engine: Engine):
+        """engine에 slow query 이벤트 등록"""
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        print(
+            f"✅ Slow query log enabled (>{settings.SLOW_QUERY_THRESHOLD_MS}ms → {settings.SLOW_QUERY_LOG_FILE})"
+        )
+
+    @staticmethod
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("slow_query_start_time", []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        duration_ms = (time.perf_counter() - conn.info["slow_query_start_time"].pop()) * 1000
+        if duration_ms < settings.SLOW_QUERY_THRESHOLD_MS:
+            return
+
+        try:
+            normalized = normalize(statement)
+            record = {
+                "ts": datetime.now(timezone.utc).isoformat(),
+                "fingerprint": fingerprint(normalized),
+                "statement": normalized,
+                "duration_ms": round(duration_ms, 2),
+                "params": params_shape(parameters, executemany),
+                "explain": None,
+            }
+            if (
+                not executemany
+                and _EXPLAINABLE.match(statement)
+                and random.random() < settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE
+            ):
+                record["explain"] = self._explain(cursor.connection, statement, parameters)
+
+            self._write(record)
+            print(f"🐢 Slow query {duration_ms:.0f}ms [{record['fingerprint']}] {normalized[:160]}")
+        except Exception as e:
+            # 로깅 실패가 요청을 실패시키지 않도록
+            print(f"⚠️  Slow query log error: {e}")
+
+    @staticmethod
+    def _explain(dbapi_connection, statement: str, parameters: Any) -> Optional[str]:
+        """
+        EXPLAIN 실행 (별도 cursor + SAVEPOINT)
+
+        Returns:
+            실행 계획 텍스트 (실패 시 None)
+        """
+        options = "ANALYZE, BUFFERS" if _READ_ONLY.match(statement) else "COSTS"
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute(f"SAVEPOINT {_SAVEPOINT}")
+            try:
+                cursor.execute(f"EXPLAIN ({options}) {statement}", parameters)
+                plan = "\n".join(row[0] for row in cursor.fetchall())
+            except Exception as e:
+                cursor.execute(f"ROLLBACK TO SAVEPOINT {_SAVEPOINT}")
+                print(f"⚠️  Slow query EXPLAIN failed: {e}")
+                plan = None
+            cursor.execute(f"RELEASE SAVEPOINT {_SAVEPOINT}")
+            return plan
+        finally:
+            cursor.close()
+
+    def _write(self, record: Dict[str, Any]):
+        """NDJSON 파일에 1줄 추가 (여러 스레드에서 호출)"""
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        path = settings.SLOW_QUERY_LOG_FILE
+        with self._lock:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(line)
+
+
+# Global service instance
+slow_query_log = SlowQueryLog()
@@ -0,0 +1,300 @@
+"""
+Thumbnail Service
+사용자 이미지(티켓, 포토카드) 썸네일 생성 파이프라인
+
+흐름:
+    POST /media/user-images → enqueue(image_id) → Redis 큐 (thumbnail:queue)
+    → scripts/thumbnail_worker.py: S3 원본 다운로드 → process pool에서 리사이즈/인코딩
+    → 크기별 썸네일 업로드 → user_images.thumbnail_url 갱신
+
+- 큐는 BLMOVE로 processing 리스트에 옮겨 처리 → worker가 재시작되면 처리 중이던 작업을 다시 큐에 넣음
+- 썸네일 키는 원본 키에서 결정적으로 생성 → 같은 작업을 여러 번 실행해도 같은 결과 (idempotent)
+- 디코딩/리사이즈/인코딩은 CPU 작업이므로 이벤트 루프가 아닌 process pool에서 실행
+"""
+import asyncio
+import json
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import update
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.user_image import UserImage
+from app.services.redis_service import redis_service
+from app.services.response_cache import response_cache
+from app.services.s3_service import s3_service
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # pragma: no cover - optional dependency
+    Image = None
+
+
+THUMBNAIL_QUEUE_KEY = "thumbnail:queue"
+THUMBNAIL_PROCESSING_KEY = "thumbnail:processing:{worker_id}"
+THUMBNAIL_FAILED_KEY = "thumbnail:failed"
+
+# 썸네일은 키가 바뀌지 않는 한 내용이 같으므로 오래 캐시
+THUMBNAIL_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+CONTENT_TYPES = {"webp": "image/webp", "avif": "image/avif"}
+
+
+def image_format(requested: str) -> str:
+    """
+    사용할 인코딩 포맷 (AVIF 인코더가 없으면 webp)
+
+    Args:
+        requested: 설정된 포맷 ("webp" 또는 "avif")
+    """
+    if Image is None:
+        raise RuntimeError("Pillow is not installed (pip install Pillow)")
+
+    fmt = requested.lower()
+    Image.init()
+    if fmt not in CONTENT_TYPES or fmt.upper() not in Image.SAVE:
+        return "webp"
+    return fmt
+
+
+def render_variants(data: bytes, widths: List[int], fmt: str, quality: int) -> Dict[int, bytes]:
+    """
+    원본 이미지를 너비별로 리사이즈하여 인코딩 (process pool에서 실행되므로 모듈 함수)
+
+    원본보다 큰 너비는 확대하지 않고 원본 크기로 인코딩
+
+    Args:
+        data: 원본 이미지 bytes
+        widths: 썸네일 너비 목록 (px)
+        fmt: "webp" 또는 "avif"
+        quality: 인코딩 품질 (0-100)
+
+    Returns:
+        {너비: 인코딩된 bytes}
+    """
+    with Image.open(BytesIO(data)) as original:
+        # JPEG는 디코딩 단계에서 축소 (큰 사진의 디코딩 비용 감소)
+        original.draft("RGB", (max(widths), max(widths)))
+        # 휴대폰 사진의 EXIF 회전 반영
+        image = ImageOps.exif_transpose(original)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "transparency" in image.info or image.mode in ("LA", "PA") else "RGB")
+
+        variants = {}
+        for width in sorted(set(widths)):
+            resized = image.copy()
+            if resized.width > width:
+                height = max(1, round(resized.height * width / resized.width))
+                resized = resized.resize((width, height), Image.LANCZOS)
+
+            buffer = BytesIO()
+            resized.save(buffer, format=fmt.upper(), quality=quality)
+            variants[width] = buffer.getvalue()
+
+        return variants
+
+
+class ThumbnailService:
+    """썸네일 생성 서비스 클래스"""
+
+    def __init__(self):
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @staticmethod
+    def thumbnail_key(file_key: str, width: int, fmt: str) -> str:
+        """
+        원본 키에서 썸네일 키 생성
+
+        e.g., filmory/user-images/abc_20250101.jpg → filmory/user-images/thumbnails/abc_20250101_240.webp
+        """
+        folder, _, file_name = file_key.rpartition("/")
+        stem = file_name.rsplit(".", 1)[0]
+        prefix = f"{folder}/thumbnails" if folder else "thumbnails"
+        return f"{prefix}/{stem}_{width}.{fmt}"
+
+    def thumbnail_keys(self, file_key: str) -> List[str]:
+        """
+        원본의 모든 썸네일 키 (원본 삭제 시 함께 삭제, 포맷 설정이 바뀐 경우를 위해 모든 포맷 포함)
+
+        Args:
+            file_key: 원본 S3 객체 키
+        """
+        return [
+            self.thumbnail_key(file_key, width, fmt)
+            for width in sorted(set(settings.THUMBNAIL_WIDTHS))
+            for fmt in CONTENT_TYPES
+        ]
+
+    async def enqueue(self, image_id: int) -> bool:
+        """
+        썸네일 생성 작업 등록 (Redis 장애 시 이미지 등록은 계속 진행)
+
+        Args:
+            image_id: user_images.id
+
+        Returns:
+            bool: 등록 여부
+        """
+        if not settings.THUMBNAIL_ENABLED:
+            return False
+
+        try:
+            await redis_service.lpush(THUMBNAIL_QUEUE_KEY, json.dumps({"image_id": image_id, "attempts": 0}))
+            return True
+        except Exception as e:
+            print(f"⚠️  Thumbnail enqueue failed (image {image_id}): {e}")
+            return False
+
+    async def process(self, image_id: int, force: bool = False) -> Optional[str]:
+        """
+        이미지 1개의 썸네일 생성
+
+        Args:
+            image_id: user_images.id
+            force: True면 thumbnail_url이 이미 있어도 다시 생성
+
+        Returns:
+            thumbnail_url (이미지가 삭제되었거나 우리 버킷의 이미지가 아니면 None)
+        """
+        image = await asyncio.to_thread(self._load_image, image_id)
+        if image is None:
+            return None
+
+        user_id, file_key, image_url, current_thumbnail_url = image
+        file_key = file_key or s3_service.key_from_url(image_url)
+        if file_key is None:
+            print(f"⚠️  Thumbnail skipped (image {image_id}): not an object in our bucket")
+            return None
+
+        fmt = image_format(settings.THUMBNAIL_FORMAT)
+        widths = sorted(set(settings.THUMBNAIL_WIDTHS))
+        thumbnail_url = s3_service.object_url(self.thumbnail_key(file_key, widths[0], fmt))
+        if current_thumbnail_url == thumbnail_url and not force:
+            return thumbnail_url
+
+        # 1. 원본 다운로드
+        data = await s3_service.download(file_key)
+
+        # 2. 리사이즈/인코딩 (process pool)
+        variants = await self.render(data, widths, fmt)
+
+        # 3. 크기별 업로드 (병렬)
+        await asyncio.gather(*[
+            s3_service.upload(
+                self.thumbnail_key(file_key, width, fmt),
+                content,
+                CONTENT_TYPES[fmt],
+                cache_control=THUMBNAIL_CACHE_CONTROL,
+            )
+            for width, content in variants.items()
+        ])
+
+        # 4. thumbnail_url 갱신 (목록 화면용 가장 작은 크기)
+        await asyncio.to_thread(self._save_thumbnail_url, image_id, thumbnail_url)
+        await response_cache.invalidate_user(str(user_id))
+        return thumbnail_url
+
+    async def render(self, data: bytes, widths: List[int], fmt: str) -> Dict[int, bytes]:
+        """
+        render_variants를 process pool에서 실행 (포스터 미러링도 같은 pool 사용)
+
+        Args:
+            data: 원본 이미지 bytes
+            widths: 너비 목록 (px)
+            fmt: image_format()으로 확인한 포맷
+
+        Returns:
+            {너비: 인코딩된 bytes}
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), render_variants, data, widths, fmt, settings.THUMBNAIL_QUALITY
+        )
+
+    async def run_worker(self, worker_id: str, stop: Optional[asyncio.Event] = None):
+        """
+        큐 소비 루프 (scripts/thumbnail_worker.py)
+
+        Args:
+            worker_id: processing 리스트 이름 (재시작 시 같은 값을 사용해야 처리 중이던 작업을 복구)
+            stop: set되면 진행 중인 작업을 마치고 종료
+        """
+        stop = stop or asyncio.Event()
+        processing_key = THUMBNAIL_PROCESSING_KEY.format(worker_id=worker_id)
+
+        # 이전 실행에서 처리 중이던 작업을 대기 큐로 되돌림
+        recovered = 0
+        while await redis_service.lmove(processing_key, THUMBNAIL_QUEUE_KEY) is not None:
+            recovered += 1
+        if recovered:
+            print(f"✅ Thumbnail worker recovered {recovered} in-flight job(s)")
+
+        await asyncio.gather(*[
+            self._consume(processing_key, stop)
+            for _ in range(settings.THUMBNAIL_WORKER_CONCURRENCY)
+        ])
+
+    async def _consume(self, processing_key: str, stop: asyncio.Event):
+        """작업 1개씩 꺼내서 처리 (실패 시 재시도 또는 failed 리스트로 이동)"""
+        while not stop.is_set():
+            payload = await redis_service.blmove(THUMBNAIL_QUEUE_KEY, processing_key, timeout=1)
+            if payload is None:
+                continue
+
+            job: Dict[str, Any] = json.loads(payload)
+            try:
+                thumbnail_url = await self.process(job["image_id"])
+                print(f"✅ Thumbnail image {job['image_id']}: {thumbnail_url}")
+            except Exception as e:
+                job["attempts"] = job.get("attempts", 0) + 1
+                job["error"] = str(e)
+                retry = job["attempts"] < settings.THUMBNAIL_MAX_ATTEMPTS
+                print(f"⚠️  Thumbnail failed (image {job['image_id']}, attempt {job['attempts']}): {e}")
+                await redis_service.lpush(THUMBNAIL_QUEUE_KEY if retry else THUMBNAIL_FAILED_KEY, json.dumps(job))
+            finally:
+                await redis_service.lrem(processing_key, payload)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=settings.THUMBNAIL_PROCESSES)
+        return self._executor
+
+    def close(self):
+        """process pool 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    @staticmethod
+    def _load_image(image_id: int) -> Optional[tuple]:
+        """(user_id, file_key, image_url, thumbnail_url) 조회 (별도 세션)"""
+        db = SessionLocal()
+        try:
+            row = (
+                db.query(UserImage.user_id, UserImage.file_key, UserImage.image_url, UserImage.thumbnail_url)
+                .filter(UserImage.id == image_id)
+                .first()
+            )
+            return tuple(row) if row else None
+        finally:
+            db.close()
+
+    @staticmethod
+    def _save_thumbnail_url(image_id: int, thumbnail_url: str):
+        """thumbnail_url 갱신 (별도 세션)"""
+        db = SessionLocal()
+        try:
+            db.execute(
+                update(UserImage)
+                .where(UserImage.id == image_id)
+                .values(thumbnail_url=thumbnail_url)
+            )
+            db.commit()
+        finally:
+            db.close()
+
+
+# Global service instance
+thumbnail_service = ThumbnailService()
@@ -0,0 +1,140 @@
+"""
+영화 목록 응답 직렬화 벤치마크 (DB 없이 ORM 대신 속성 객체 사용)
+
+Usage:
+    cd backend
+    python -m benchmarks.bench_serialization [--movies 1000] [--repeat 50]
+
+비교 경로:
+    - before: FastAPI 기본 (검증 → dump_python(mode="json") → JSONResponse / json.dumps)
+    - orjson: 기본 경로 + ORJSONResponse (main.py의 default_response_class)
+    - model_response: pydantic-core dump_json 한 번 (app.responses.serialize)
+    - jsonable_encoder: response_model 없는 endpoint 경로 (참고용)
+그리고 gzip 압축 후 크기/시간
+"""
+import argparse
+import gzip
+import statistics
+import time
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+from typing import Callable, List
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from app.config import settings
+from app.responses import get_adapter, serialize
+from app.schemas.movie import UserMovieResponse
+
+
+SYNOPSIS = (
+    "서울의 한 작은 극장에서 일하는 영사기사가 오래된 필름 속에서 사라진 배우의 흔적을 발견하고, "
+    "그 필름이 상영되었던 모든 극장을 찾아 나서며 벌어지는 이야기. "
+) * 3
+
+
+def make_library(count: int) -> List[SimpleNamespace]:
+    """UserMovieResponse 형태의 ORM 유사 객체 count개"""
+    now = datetime(2026, 1, 1, 12, 0, 0)
+    library = []
+    for i in range(count):
+        movie = SimpleNamespace(
+            id=i + 1,
+            title=f"영화 제목 {i}",
+            original_title=f"Movie Title {i}",
+            director="홍길동",
+            year=1990 + i % 35,
+            runtime=90 + i % 60,
+            genre="드라마, 스릴러",
+            poster_url=f"https://image.tmdb.org/t/p/w500/poster{i}.jpg",
+            backdrop_url=f"https://image.tmdb.org/t/p/original/backdrop{i}.jpg",
+            synopsis=SYNOPSIS,
+            kobis_code=f"2020{i:04d}",
+            tmdb_id=100000 + i,
+            kmdb_id=None,
+            created_at=now,
+            updated_at=now,
+        )
+        library.append(SimpleNamespace(
+            id=i + 1,
+            user_id="7f9c1e2a-0000-4000-8000-000000000001",
+            movie_id=movie.id,
+            movie=movie,
+            status=("completed", "watching", "watchlist")[i % 3],
+            rating=i % 5 + 1,
+            review="좋았다" if i % 2 else None,
+            watch_date=date(2025, 1, 1) + timedelta(days=i % 365),
+            progress=None,
+            is_favorite=i % 7 == 0,
+            is_life_movie=i % 50 == 0,
+            created_at=now,
+            updated_at=now,
+        ))
+    return library
+
+
+def measure(func: Callable[[], bytes], repeat: int) -> tuple:
+    """(중앙값 ms, 결과 bytes)"""
+    body = func()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), body
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--movies", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    model = List[UserMovieResponse]
+    adapter = get_adapter(model)
+    library = make_library(args.movies)
+
+    def fastapi_default() -> bytes:
+        value = adapter.validate_python(library, from_attributes=True)
+        return JSONResponse(adapter.dump_python(value, mode="json")).body
+
+    def fastapi_orjson() -> bytes:
+        value = adapter.validate_python(library, from_attributes=True)
+        return ORJSONResponse(adapter.dump_python(value, mode="json")).body
+
+    def fast_path() -> bytes:
+        return serialize(model, library)
+
+    def encoder() -> bytes:
+        value = adapter.validate_python(library, from_attributes=True)
+        return JSONResponse(jsonable_encoder(value)).body
+
+    print(f"{args.movies} movies, median of {args.repeat} runs\n")
+    print(f"{'path':<18}{'ms':>10}{'bytes':>12}")
+
+    baseline = None
+    body = b""
+    for name, func in [
+        ("before", fastapi_default),
+        ("orjson", fastapi_orjson),
+        ("model_response", fast_path),
+        ("jsonable_encoder", encoder),
+    ]:
+        elapsed, body_ = measure(func, args.repeat)
+        baseline = baseline or elapsed
+        print(f"{name:<18}{elapsed:>10.2f}{len(body_):>12,}  ({baseline / elapsed:.1f}x)")
+        if name == "model_response":
+            body = body_
+
+    elapsed, compressed = measure(
+        lambda: gzip.compress(body, compresslevel=settings.GZIP_COMPRESS_LEVEL), args.repeat
+    )
+    print(
+        f"\ngzip (level {settings.GZIP_COMPRESS_LEVEL}): {len(body):,} → {len(compressed):,} bytes "
+        f"({len(compressed) / len(body):.0%}), {elapsed:.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+"""
+벤치마크용 합성 데이터 생성기 (결정적: 같은 seed → 같은 데이터)
+
+- 영화 카탈로그: --catalog편 (movies + movie_external_ids)
+- 사용자: --users명, 라이브러리 크기는 lognormal 분포 (대부분 수십 편, 일부 헤비 유저 수백~수천 편)
+- 영화 선택은 Zipf 분포 (인기작은 많은 사용자 라이브러리에 중복 등장)
+- 사용자별 커스텀 태그 / 영화 태그, 수동 컬렉션, 자동 컬렉션(auto_rule, auto_collection_service로 동기화)
+
+벤치마크 데이터는 다음으로 구분되어 --reset으로 실제 데이터와 섞이지 않게 삭제 가능:
+    users.email: bench-NNNNN@bench.example.com
+    movies.kobis_code: BENCHNNNNNN, movies.tmdb_id: 9000000 + N
+
+Usage:
+    cd backend
+    python -m benchmarks.datagen [--users 200] [--catalog 5000] [--seed 42] [--reset]
+"""
+import argparse
+import heapq
+import math
+import random
+import time
+import uuid
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any, Dict, List
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models import (
+    Collection,
+    CollectionMovie,
+    Movie,
+    MovieExternalId,
+    MovieTag,
+    Tag,
+    User,
+    UserMovie,
+)
+from app.services.auto_collection_service import auto_collection_service
+
+
+EMAIL_DOMAIN = "bench.example.com"
+KOBIS_PREFIX = "BENCH"
+TMDB_ID_OFFSET = 9_000_000
+
+# uuid5 namespace (seed와 함께 사용자 ID 생성)
+USER_NAMESPACE = uuid.UUID("6c1b0a52-3f55-4c4e-9d0e-6d2f0b1e8a01")
+
+GENRES = ["드라마", "액션", "코미디", "스릴러", "로맨스", "애니메이션", "SF", "공포", "범죄", "판타지", "다큐멘터리"]
+NATIONS = ["한국", "미국", "일본", "프랑스", "영국", "홍콩"]
+TITLE_WORDS = ["밤", "바다", "기억", "도시", "여름", "비밀", "마지막", "그림자", "약속", "겨울", "소년", "정원", "기차", "편지"]
+PEOPLE = ["김지훈", "이서연", "박민준", "최유진", "정하늘", "강도윤", "윤서아", "장태오", "임지안", "한결"]
+TAG_NAMES = ["인생영화", "재관람", "극장에서", "혼영", "가족과", "명대사", "OST", "원작소설", "감독전작", "N차관람"]
+LOCATIONS = ["CGV 용산", "메가박스 코엑스", "롯데시네마 월드타워", "집", None]
+
+# 자동 컬렉션 규칙 템플릿 (validate_auto_rule을 통과하는 규칙)
+AUTO_RULES: List[Dict[str, Any]] = [
+    {"status": "completed", "rating": {"min": 4.0}},
+    {"genre": "드라마"},
+    {"genre": "액션", "status": "completed"},
+    {"year": {"min": 2020}},
+    {"is_best_movie": True},
+]
+
+# 상태 분포 (completed, watching, watchlist)
+STATUS_WEIGHTS = [("completed", 0.7), ("watching", 0.1), ("watchlist", 0.2)]
+
+# 라이브러리 크기 lognormal 파라미터 (중앙값 약 60편)
+LIBRARY_MU = math.log(60)
+LIBRARY_SIGMA = 1.0
+
+
+def user_id_for(seed: int, index: int) -> uuid.UUID:
+    """벤치마크 사용자 ID (seed/번호에서 결정)"""
+    return uuid.uuid5(USER_NAMESPACE, f"{seed}:{index}")
+
+
+def reset(db: Session):
+    """벤치마크 데이터 삭제 (사용자 삭제 시 user_movies/tags/collections는 CASCADE)"""
+    db.execute(delete(User).where(User.email.like(f"%@{EMAIL_DOMAIN}")))
+    db.execute(delete(Movie).where(Movie.kobis_code.like(f"{KOBIS_PREFIX}%")))
+    db.commit()
+
+
+def generate_catalog(db: Session, rng: random.Random, size: int) -> List[Dict[str, Any]]:
+    """
+    영화 카탈로그 생성
+
+    Returns:
+        [{"id", "year", "genre"}] (인기 순위 순 - 앞쪽일수록 Zipf 가중치가 큼)
+    """
+    rows = []
+    for n in range(size):
+        year = rng.randint(1970, 2025)
+        words = rng.sample(TITLE_WORDS, 2)
+        rows.append({
+            "kobis_code": f"{KOBIS_PREFIX}{n:06d}",
+            "tmdb_id": TMDB_ID_OFFSET + n,
+            "title_ko": f"{words[0]}의 {words[1]} {n}",
+            "title_en": f"The {words[1]} {n}",
+            "title_original": f"The {words[1]} {n}",
+            "release_date": date(year, 1, 1) + timedelta(days=rng.randint(0, 364)),
+            "production_year": year,
+            "runtime": rng.randint(80, 180),
+            "genre": ", ".join(rng.sample(GENRES, rng.choice([1, 1, 2, 2, 3]))),
+            "nation": rng.choice(NATIONS),
+            "director": rng.choice(PEOPLE),
+            "actors": ", ".join(rng.sample(PEOPLE, 4)),
+            "poster_url": f"https://image.tmdb.org/t/p/w500/bench{n}.jpg",
+            "backdrop_url": f"https://image.tmdb.org/t/p/original/bench{n}.jpg",
+            "synopsis": f"{words[0]}과 {words[1]}에 관한 이야기. " * rng.randint(3, 12),
+        })
+
+    inserted = db.execute(
+        pg_insert(Movie).values(rows).returning(Movie.id, Movie.tmdb_id, Movie.production_year, Movie.genre)
+    ).all()
+    db.execute(pg_insert(MovieExternalId).values([
+        {"movie_id": movie_id, "source": source, "external_id": external_id}
+        for movie_id, tmdb_id, _, _ in inserted
+        for source, external_id in (
+            ("kobis", f"{KOBIS_PREFIX}{tmdb_id - TMDB_ID_OFFSET:06d}"),
+            ("tmdb", str(tmdb_id)),
+        )
+    ]))
+
+    inserted.sort(key=lambda row: row[1])
+    return [{"id": movie_id, "year": year, "genre": genre} for movie_id, _, year, genre in inserted]
+
+
+def pick_movies(rng: random.Random, catalog: List[Dict[str, Any]], weights: List[float], count: int) -> List[Dict[str, Any]]:
+    """Zipf 가중치로 중복 없이 count편 선택 (Efraimidis-Spirakis)"""
+    count = min(count, len(catalog))
+    chosen = heapq.nlargest(count, range(len(catalog)), key=lambda i: rng.random() ** (1 / weights[i]))
+    return [catalog[i] for i in chosen]
+
+
+def generate_user(db: Session, rng: random.Random, seed: int, index: int, catalog, weights) -> Dict[str, int]:
+    """
+    사용자 1명과 라이브러리/태그/컬렉션 생성
+
+    Returns:
+        생성된 row 수 {"user_movies", "movie_tags", "collections"}
+    """
+    user_id = user_id_for(seed, index)
+    db.execute(pg_insert(User).values(
+        id=user_id,
+        email=f"bench-{index:05d}@{EMAIL_DOMAIN}",
+        display_name=f"벤치 사용자 {index}",
+        yearly_goal=rng.choice([50, 100, 150]),
+    ))
+
+    # 라이브러리
+    size = max(1, int(rng.lognormvariate(LIBRARY_MU, LIBRARY_SIGMA)))
+    movies = pick_movies(rng, catalog, weights, size)
+    statuses, status_weights = zip(*STATUS_WEIGHTS)
+    today = date.today()
+    rows = []
+    for movie in movies:
+        status = rng.choices(statuses, status_weights)[0]
+        completed = status == "completed"
+        rows.append({
+            "user_id": user_id,
+            "movie_id": movie["id"],
+            "status": status,
+            "watch_date": today - timedelta(days=rng.randint(0, 3 * 365)) if completed else None,
+            "rating": Decimal(rng.choice([2, 3, 3, 4, 4, 4, 5, 5, 6, 6, 7, 7, 8, 8, 9, 10])) / 2 if completed else None,
+            "one_line_review": "다시 보고 싶은 영화" if completed and rng.random() < 0.3 else None,
+            "watch_location": rng.choice(LOCATIONS) if completed else None,
+            "watch_method": rng.choice(["theater", "ott", "tv"]) if completed else None,
+            "is_best_movie": completed and rng.random() < 0.03,
+            "progress": rng.randint(5, 95) if status == "watching" else 0,
+        })
+    user_movie_ids = [row[0] for row in db.execute(
+        pg_insert(UserMovie).values(rows).returning(UserMovie.id)
+    ).all()]
+
+    # 커스텀 태그 + 영화 태그 (영화당 0~3개)
+    tag_names = rng.sample(TAG_NAMES, rng.randint(0, len(TAG_NAMES) // 2))
+    movie_tags = []
+    if tag_names:
+        tag_ids = [row[0] for row in db.execute(
+            pg_insert(Tag)
+            .values([{"name": name, "user_id": user_id, "is_predefined": False} for name in tag_names])
+            .returning(Tag.id)
+        ).all()]
+        for user_movie_id in user_movie_ids:
+            for tag_id in rng.sample(tag_ids, min(len(tag_ids), rng.choice([0, 0, 1, 1, 2, 3]))):
+                movie_tags.append({"user_movie_id": user_movie_id, "tag_id": tag_id})
+        if movie_tags:
+            db.execute(pg_insert(MovieTag).values(movie_tags))
+
+    # 수동 컬렉션
+    manual_count = rng.choice([0, 1, 1, 2, 3, 5])
+    for n in range(manual_count):
+        collection_id = db.execute(
+            pg_insert(Collection)
+            .values(user_id=user_id, name=f"내 컬렉션 {n + 1}", description=None, is_auto=False)
+            .returning(Collection.id)
+        ).scalar_one()
+        members = rng.sample(user_movie_ids, min(len(user_movie_ids), rng.randint(1, 30)))
+        db.execute(pg_insert(CollectionMovie).values([
+            {"collection_id": collection_id, "user_movie_id": user_movie_id, "sort_order": order}
+            for order, user_movie_id in enumerate(members)
+        ]))
+
+    # 자동 컬렉션 (규칙 검증 후 동기화)
+    auto_rules = rng.sample(AUTO_RULES, rng.choice([0, 1, 1, 2]))
+    auto_collection_ids = []
+    for n, rule in enumerate(auto_rules):
+        auto_collection_service.validate_auto_rule(rule)
+        auto_collection_ids.append(db.execute(
+            pg_insert(Collection)
+            .values(user_id=user_id, name=f"자동 컬렉션 {n + 1}", is_auto=True, auto_rule=rule)
+            .returning(Collection.id)
+        ).scalar_one())
+
+    db.commit()
+    for collection_id in auto_collection_ids:
+        auto_collection_service.sync_auto_collection(collection_id, db)
+
+    return {
+        "user_movies": len(user_movie_ids),
+        "movie_tags": len(movie_tags),
+        "collections": manual_count + len(auto_rules),
+    }
+
+
+def generate(users: int, catalog_size: int, seed: int) -> Dict[str, int]:
+    """
+    벤치마크 데이터 생성 (기존 벤치마크 데이터는 삭제 후 다시 생성)
+
+    Returns:
+        생성된 row 수 합계
+    """
+    rng = random.Random(seed)
+    totals = {"users": users, "movies": catalog_size, "user_movies": 0, "movie_tags": 0, "collections": 0}
+
+    db = SessionLocal()
+    try:
+        reset(db)
+        catalog = generate_catalog(db, rng, catalog_size)
+        db.commit()
+
+        # Zipf (s=1.1) 인기도 가중치
+        weights = [1 / (rank ** 1.1) for rank in range(1, catalog_size + 1)]
+        for index in range(users):
+            counts = generate_user(db, rng, seed, index, catalog, weights)
+            for name, count in counts.items():
+                totals[name] += count
+    finally:
+        db.close()
+
+    return totals
+
+
+def bench_user_ids(db: Session) -> List[uuid.UUID]:
+    """DB에 있는 벤치마크 사용자 ID (이메일 순)"""
+    return list(db.scalars(
+        select(User.id).where(User.email.like(f"%@{EMAIL_DOMAIN}")).order_by(User.email)
+    ))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate deterministic benchmark data")
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--catalog", type=int, default=5000, help="number of catalog movies")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--reset", action="store_true", help="only delete benchmark data")
+    args = parser.parse_args()
+
+    if args.reset:
+        db = SessionLocal()
+        try:
+            reset(db)
+        finally:
+            db.close()
+        print("✅ Benchmark data deleted")
+        return
+
+    start = time.perf_counter()
+    totals = generate(args.users, args.catalog, args.seed)
+    print(f"✅ Generated in {time.perf_counter() - start:.1f}s: " + ", ".join(f"{k}={v:,}" for k, v in totals.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,399 @@
+"""
+부하 테스트 드라이버
+datagen으로 만든 벤치마크 사용자들의 트래픽 믹스를 재생하여 endpoint별 p50/p95/p99, 처리량 측정
+
+- in-process (기본): httpx.ASGITransport로 앱을 같은 프로세스에서 호출 (네트워크/uvicorn 제외)
+- --base-url: uvicorn으로 띄운 앱을 HTTP로 호출
+- 외부 API/JWKS는 devtools.fake_providers를 내장 실행 (--provider-latency-ms로 지연 설정)
+- 결과 JSON을 benchmarks/results/에 저장하고 baseline(benchmarks/baseline.json)과 비교
+  p95가 --max-regression 비율보다 느려진 endpoint가 있으면 exit code 1
+
+Usage:
+    cd backend
+    python -m benchmarks.datagen --users 200
+    python -m benchmarks.load [--requests 5000] [--concurrency 16] [--provider-latency-ms 50]
+
+    # uvicorn 대상 (앱 환경 변수는 --fake-port의 fake provider를 가리켜야 함, 시작 시 출력)
+    python -m benchmarks.load --base-url http://127.0.0.1:8000 --fake-port 8765
+
+    # baseline 갱신
+    python -m benchmarks.load --update-baseline
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from devtools.fake_providers import FakeProviderServer, issue_token
+
+
+BENCHMARK_DIR = Path(__file__).parent
+DEFAULT_BASELINE = BENCHMARK_DIR / "baseline.json"
+RESULTS_DIR = BENCHMARK_DIR / "results"
+
+# 외부 API 메타데이터 조회 대상 TMDb ID 범위 (datagen 카탈로그와 같은 범위)
+TMDB_ID_OFFSET = 9_000_000
+
+
+@dataclass
+class BenchUser:
+    """벤치마크 사용자 (토큰 + 라이브러리 ID)"""
+    id: str
+    token: str
+    user_movie_ids: List[int]
+
+
+# (method, path, json body)
+RequestSpec = Tuple[str, str, Optional[Dict[str, Any]]]
+
+
+@dataclass
+class Scenario:
+    """트래픽 믹스 항목 (name은 결과/baseline의 키)"""
+    name: str
+    weight: float
+    build: Callable[[random.Random, BenchUser], RequestSpec]
+
+
+def _tmdb_id(rng: random.Random, catalog: int) -> int:
+    """인기작 위주의 TMDb ID (캐시 hit/miss가 섞이도록 Zipf 유사 분포)"""
+    return TMDB_ID_OFFSET + min(catalog - 1, int(rng.paretovariate(1.2)) - 1)
+
+
+def traffic_mix(catalog: int) -> List[Scenario]:
+    """
+    기본 트래픽 믹스 (앱 화면 기준: 홈/라이브러리 조회 위주, 일부 수정/외부 메타데이터)
+
+    Args:
+        catalog: 메타데이터 조회 대상 카탈로그 크기
+    """
+    return [
+        Scenario("GET /home", 10, lambda rng, user: ("GET", "/api/v1/home", None)),
+        Scenario("GET /users/me", 8, lambda rng, user: ("GET", "/api/v1/users/me", None)),
+        Scenario("GET /movies/", 15, lambda rng, user: ("GET", "/api/v1/movies/", None)),
+        Scenario("GET /movies/{id}", 15, lambda rng, user: (
+            "GET", f"/api/v1/movies/{rng.choice(user.user_movie_ids)}", None,
+        )),
+        Scenario("PUT /movies/{id}", 4, lambda rng, user: (
+            "PUT", f"/api/v1/movies/{rng.choice(user.user_movie_ids)}", {"rating": rng.randint(1, 5)},
+        )),
+        Scenario("GET /stats/", 8, lambda rng, user: ("GET", "/api/v1/stats/", None)),
+        Scenario("GET /stats/genres", 5, lambda rng, user: ("GET", "/api/v1/stats/genres", None)),
+        Scenario("GET /stats/monthly", 5, lambda rng, user: (
+            "GET", f"/api/v1/stats/monthly?year={date.today().year}", None,
+        )),
+        Scenario("GET /collections/", 8, lambda rng, user: ("GET", "/api/v1/collections/", None)),
+        Scenario("GET /tags", 5, lambda rng, user: ("GET", "/api/v1/tags", None)),
+        Scenario("GET /tags/popular", 5, lambda rng, user: ("GET", "/api/v1/tags/popular", None)),
+        Scenario("GET /movies/metadata/tmdb/{id}", 8, lambda rng, user: (
+            "GET", f"/api/v1/movies/metadata/tmdb/{_tmdb_id(rng, catalog)}", None,
+        )),
+        Scenario("POST /movies/metadata:batch", 4, lambda rng, user: (
+            "POST", "/api/v1/movies/metadata:batch",
+            {"items": [{"source": "tmdb", "id": str(_tmdb_id(rng, catalog))} for _ in range(20)]},
+        )),
+    ]
+
+
+def load_users(limit: int) -> List[BenchUser]:
+    """DB에서 벤치마크 사용자와 라이브러리 ID 조회 + 토큰 발급"""
+    from sqlalchemy import select
+
+    from app.database import SessionLocal
+    from app.models import UserMovie
+    from benchmarks.datagen import bench_user_ids
+
+    db = SessionLocal()
+    try:
+        user_ids = bench_user_ids(db)[:limit]
+        library: Dict[Any, List[int]] = {user_id: [] for user_id in user_ids}
+        for user_id, user_movie_id in db.execute(
+            select(UserMovie.user_id, UserMovie.id).where(UserMovie.user_id.in_(user_ids))
+        ):
+            library[user_id].append(user_movie_id)
+    finally:
+        db.close()
+
+    return [
+        BenchUser(id=str(user_id), token=issue_token(str(user_id), expires_in=86400), user_movie_ids=ids)
+        for user_id, ids in library.items()
+        if ids
+    ]
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """nearest-rank percentile (sorted_values는 정렬된 값)"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+class Recorder:
+    """endpoint별 latency / 상태 코드 집계"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = {}
+        self.statuses: Dict[str, Dict[str, int]] = {}
+        self.errors: Dict[str, int] = {}
+
+    def record(self, name: str, status: str, latency: float, error: bool):
+        self.latencies.setdefault(name, []).append(latency)
+        statuses = self.statuses.setdefault(name, {})
+        statuses[status] = statuses.get(status, 0) + 1
+        if error:
+            self.errors[name] = self.errors.get(name, 0) + 1
+
+    def summary(self, elapsed: float) -> Dict[str, Dict[str, Any]]:
+        """endpoint별 {count, errors, rps, mean_ms, p50_ms, p95_ms, p99_ms, max_ms, statuses}"""
+        endpoints = {}
+        for name, values in sorted(self.latencies.items()):
+            values = sorted(values)
+            endpoints[name] = {
+                "count": len(values),
+                "errors": self.errors.get(name, 0),
+                "rps": round(len(values) / elapsed, 2),
+                "mean_ms": round(sum(values) / len(values) * 1000, 2),
+                "p50_ms": round(percentile(values, 0.50) * 1000, 2),
+                "p95_ms": round(percentile(values, 0.95) * 1000, 2),
+                "p99_ms": round(percentile(values, 0.99) * 1000, 2),
+                "max_ms": round(values[-1] * 1000, 2),
+                "statuses": dict(sorted(self.statuses[name].items())),
+            }
+        return endpoints
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    users: List[BenchUser],
+    scenarios: List[Scenario],
+    concurrency: int,
+    total_requests: int,
+    duration: Optional[float],
+    seed: int,
+    recorder: Optional[Recorder],
+) -> float:
+    """
+    concurrency개의 worker로 트래픽 믹스 재생
+
+    Args:
+        total_requests: 총 요청 수 (duration이 있으면 무시)
+        duration: 실행 시간 (초)
+        recorder: None이면 기록하지 않음 (warmup)
+
+    Returns:
+        실행 시간 (초)
+    """
+    weights = [scenario.weight for scenario in scenarios]
+    remaining = total_requests
+    start = time.perf_counter()
+    deadline = start + duration if duration else None
+
+    def take() -> bool:
+        nonlocal remaining
+        if deadline is not None:
+            return time.perf_counter() < deadline
+        if remaining <= 0:
+            return False
+        remaining -= 1
+        return True
+
+    async def worker(worker_id: int):
+        # worker별 Random (실행마다 같은 요청 순서)
+        rng = random.Random(f"{seed}:{worker_id}")
+        while take():
+            scenario = rng.choices(scenarios, weights)[0]
+            user = rng.choice(users)
+            method, path, body = scenario.build(rng, user)
+            headers = {"Authorization": f"Bearer {user.token}", "Accept-Encoding": "gzip"}
+
+            request_start = time.perf_counter()
+            try:
+                response = await client.request(method, path, json=body, headers=headers)
+                await response.aread()
+                status, error = str(response.status_code), response.status_code >= 500
+            except Exception as e:
+                status, error = type(e).__name__, True
+            if recorder is not None:
+                recorder.record(scenario.name, status, time.perf_counter() - request_start, error)
+
+    await asyncio.gather(*(worker(n) for n in range(concurrency)))
+    return time.perf_counter() - start
+
+
+async def run(args) -> Dict[str, Any]:
+    """앱 대상 선택 (in-process / uvicorn) 후 warmup + 측정"""
+    users = load_users(args.users)
+    if not users:
+        raise SystemExit("No benchmark users found. Run `python -m benchmarks.datagen` first.")
+    scenarios = traffic_mix(args.catalog)
+    recorder = Recorder()
+    timeout = httpx.Timeout(30.0)
+
+    async def measure(client: httpx.AsyncClient) -> float:
+        if args.warmup:
+            await run_load(client, users, scenarios, args.concurrency, args.warmup, None, args.seed + 1, None)
+        return await run_load(
+            client, users, scenarios, args.concurrency, args.requests, args.duration, args.seed, recorder
+        )
+
+    if args.base_url:
+        limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+        async with httpx.AsyncClient(base_url=args.base_url, timeout=timeout, limits=limits) as client:
+            elapsed = await measure(client)
+    else:
+        from app.main import app
+
+        async with app.router.lifespan_context(app):
+            # 앱 예외는 uvicorn처럼 500 응답으로 기록
+            transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=timeout) as client:
+                elapsed = await measure(client)
+
+    endpoints = recorder.summary(elapsed)
+    total = sum(endpoint["count"] for endpoint in endpoints.values())
+    return {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "mode": "uvicorn" if args.base_url else "in-process",
+            "python": platform.python_version(),
+            "users": len(users),
+            "concurrency": args.concurrency,
+            "provider_latency_ms": args.provider_latency_ms,
+            "seed": args.seed,
+        },
+        "total": {
+            "count": total,
+            "errors": sum(endpoint["errors"] for endpoint in endpoints.values()),
+            "elapsed_s": round(elapsed, 2),
+            "rps": round(total / elapsed, 2),
+        },
+        "endpoints": endpoints,
+    }
+
+
+# baseline과 비교 가능하려면 같아야 하는 실행 조건
+COMPARABLE_META = ("mode", "concurrency", "provider_latency_ms")
+
+
+def compare(result: Dict[str, Any], baseline: Dict[str, Any], max_regression: float) -> List[str]:
+    """
+    baseline 대비 회귀 목록
+
+    - endpoint별 p95가 baseline * (1 + max_regression)보다 느림
+    - 전체 처리량이 baseline * (1 - max_regression)보다 낮음
+    - baseline에서 없던 5xx/예외 발생
+    """
+    regressions = []
+    for name, current in result["endpoints"].items():
+        base = baseline["endpoints"].get(name)
+        if not base:
+            continue
+        if current["p95_ms"] > base["p95_ms"] * (1 + max_regression):
+            regressions.append(f"{name}: p95 {base['p95_ms']:.1f}ms → {current['p95_ms']:.1f}ms")
+        if current["errors"] and not base["errors"]:
+            regressions.append(f"{name}: {current['errors']} errors (baseline 0)")
+
+    base_rps, current_rps = baseline["total"]["rps"], result["total"]["rps"]
+    if current_rps < base_rps * (1 - max_regression):
+        regressions.append(f"throughput: {base_rps:.1f} → {current_rps:.1f} req/s")
+    return regressions
+
+
+def print_report(result: Dict[str, Any], baseline: Optional[Dict[str, Any]]):
+    """endpoint별 결과 표 (baseline이 있으면 p95 변화율 포함)"""
+    meta, total = result["meta"], result["total"]
+    print(
+        f"\n{meta['mode']}, {meta['users']} users, concurrency {meta['concurrency']}, "
+        f"provider latency {meta['provider_latency_ms']}ms"
+    )
+    print(f"{'endpoint':<34}{'count':>7}{'err':>5}{'rps':>8}{'p50':>9}{'p95':>9}{'p99':>9}{'Δp95':>8}")
+    for name, endpoint in result["endpoints"].items():
+        delta = ""
+        base = baseline["endpoints"].get(name) if baseline else None
+        if base and base["p95_ms"]:
+            delta = f"{endpoint['p95_ms'] / base['p95_ms'] - 1:+.0%}"
+        print(
+            f"{name:<34}{endpoint['count']:>7}{endpoint['errors']:>5}{endpoint['rps']:>8.1f}"
+            f"{endpoint['p50_ms']:>9.1f}{endpoint['p95_ms']:>9.1f}{endpoint['p99_ms']:>9.1f}{delta:>8}"
+        )
+    print(f"\ntotal: {total['count']} requests, {total['errors']} errors, {total['rps']:.1f} req/s in {total['elapsed_s']}s")
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BENCHMARK_DIR, text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a traffic mix and record per-endpoint latency")
+    parser.add_argument("--base-url", help="target a running server instead of the in-process app")
+    parser.add_argument("--users", type=int, default=100, help="number of benchmark users to use")
+    parser.add_argument("--catalog", type=int, default=5000, help="TMDb id range for metadata scenarios")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--duration", type=float, help="run for N seconds instead of --requests")
+    parser.add_argument("--warmup", type=int, default=200, help="unrecorded requests before measuring")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--provider-latency-ms", type=float, default=50.0)
+    parser.add_argument("--fake-port", type=int, default=0, help="fake provider port (fixed for --base-url)")
+    parser.add_argument("--output", help="result JSON path (default: benchmarks/results/load-<timestamp>.json)")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE))
+    parser.add_argument("--max-regression", type=float, default=0.25, help="allowed p95/throughput regression")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    with FakeProviderServer(port=args.fake_port, latency_ms={"default": args.provider_latency_ms}) as server:
+        # app.config는 import 시점에 환경 변수를 읽으므로 app import 전에 설정
+        os.environ.update(server.env())
+        if args.base_url:
+            print("Start the app with:\n  " + " ".join(f"{k}={v}" for k, v in server.env().items()))
+        result = asyncio.run(run(args))
+
+    output = Path(args.output) if args.output else RESULTS_DIR / f"load-{datetime.now():%Y%m%d-%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+    baseline_path = Path(args.baseline)
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8")) if baseline_path.exists() else None
+    print_report(result, baseline)
+    print(f"Saved {output}")
+
+    if args.update_baseline:
+        baseline_path.write_text(json.dumps(result, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        print(f"✅ Baseline updated: {baseline_path}")
+        return
+
+    mismatched = [
+        key for key in COMPARABLE_META if baseline and baseline["meta"].get(key) != result["meta"][key]
+    ]
+    if mismatched:
+        print(f"\n⚠️  Not compared: baseline differs in {', '.join(mismatched)}")
+    elif baseline:
+        regressions = compare(result, baseline, args.max_regression)
+        if regressions:
+            print(f"\n⚠️  Regressions beyond {args.max_regression:.0%}:")
+            for line in regressions:
+                print(f"  - {line}")
+            sys.exit(1)
+        print(f"\n✅ No regressions beyond {args.max_regression:.0%} vs baseline ({baseline['meta'].get('commit')})")
+
+
+if __name__ == "__main__":
+    main()
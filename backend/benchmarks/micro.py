@@ -0,0 +1,330 @@
+"""
+요청당 고정 비용 마이크로벤치마크 (pytest-benchmark 방식: calibration → rounds → 통계)
+
+대상:
+    - auth: get_current_user (Redis에 캐시된 JWKS + 파싱된 키 캐시), jwt.decode만
+    - schemas: MovieSearchResult / UserMovieResponse 대량 목록 검증, 직렬화
+    - stats: 장르 문자열 집계 (count_genres), 연속 관람일 계산 (streak_from_dates)
+    - auto_collection: validate_auto_rule
+
+각 benchmark는 1 round가 --min-round-ms 이상이 되도록 반복 횟수를 정하고(calibration)
+--rounds번 측정한 1회당 시간의 min/median/mean/stddev/IQR을 JSON으로 저장
+baseline(benchmarks/micro_baseline.json)보다 --compare-stat(기본 min: 노이즈에 가장 덜 민감)이
+--max-regression 넘게 느려지면 exit code 1
+
+auth benchmark는 앱과 같은 REDIS_URL의 Redis가 필요 (없으면 건너뜀)
+
+Usage:
+    cd backend
+    python -m benchmarks.micro [-k schemas] [--rounds 30] [--max-regression 0.2]
+    python -m benchmarks.micro --update-baseline
+"""
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from fastapi.security import HTTPAuthorizationCredentials
+from pydantic import TypeAdapter
+
+from app.api.v1.stats import count_genres, streak_from_dates
+from app.config import settings
+from app.middleware import auth_middleware
+from app.responses import get_adapter, serialize
+from app.schemas.movie import MovieSearchResult, UserMovieResponse
+from app.services.auto_collection_service import AutoCollectionService
+from app.services.redis_service import redis_service
+from benchmarks.bench_serialization import SYNOPSIS, make_library
+from benchmarks.load import _git_commit
+from devtools.fake_providers import GENRES, SigningKey
+
+
+BENCHMARK_DIR = Path(__file__).parent
+DEFAULT_BASELINE = BENCHMARK_DIR / "micro_baseline.json"
+RESULTS_DIR = BENCHMARK_DIR / "results"
+
+LIST_SIZE = 1000
+
+
+@dataclass
+class Benchmark:
+    """
+    측정 대상 1개
+
+    Attributes:
+        name: 결과/baseline 키 (group.name[param])
+        func: 측정 함수 (인자 없음, is_async면 coroutine 함수)
+        is_async: True면 이벤트 루프 안에서 반복 실행
+    """
+    name: str
+    func: Callable[[], Any]
+    is_async: bool = False
+
+
+class BenchmarkSkipped(Exception):
+    """환경 문제로 측정할 수 없는 benchmark (e.g., Redis 없음)"""
+
+
+def run_benchmark(
+    benchmark: Benchmark,
+    loop: asyncio.AbstractEventLoop,
+    rounds: int,
+    min_round_time: float,
+) -> Dict[str, Any]:
+    """
+    calibration 후 rounds번 측정
+
+    Returns:
+        {"rounds", "iterations", "min", "max", "mean", "stddev", "median", "iqr", "ops"} (시간은 초, 1회 기준)
+    """
+    if benchmark.is_async:
+        async def repeat(iterations: int):
+            for _ in range(iterations):
+                await benchmark.func()
+
+        def timed(iterations: int) -> float:
+            start = time.perf_counter()
+            loop.run_until_complete(repeat(iterations))
+            return time.perf_counter() - start
+    else:
+        func = benchmark.func
+
+        def timed(iterations: int) -> float:
+            start = time.perf_counter()
+            for _ in range(iterations):
+                func()
+            return time.perf_counter() - start
+
+    # Calibration (warmup 겸용): 1 round가 min_round_time 이상이 되는 반복 횟수
+    iterations = 1
+    while True:
+        elapsed = timed(iterations)
+        if elapsed >= min_round_time or iterations >= 1_000_000:
+            break
+        iterations = max(iterations * 2, int(iterations * min_round_time / max(elapsed, 1e-9)))
+
+    samples = sorted(timed(iterations) / iterations for _ in range(rounds))
+    quartiles = statistics.quantiles(samples, n=4) if len(samples) > 1 else [samples[0]] * 3
+    median = statistics.median(samples)
+    return {
+        "rounds": rounds,
+        "iterations": iterations,
+        "min": samples[0],
+        "max": samples[-1],
+        "mean": statistics.fmean(samples),
+        "stddev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "median": median,
+        "iqr": quartiles[2] - quartiles[0],
+        "ops": 1 / median if median else 0.0,
+    }
+
+
+def auth_benchmarks(loop: asyncio.AbstractEventLoop) -> List[Benchmark]:
+    """get_current_user: JWKS는 Redis 캐시에서, 서명 키는 프로세스 캐시에서"""
+    key = SigningKey()
+    token = key.issue_token("7f9c1e2a-0000-4000-8000-000000000001", expires_in=86400)
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    try:
+        loop.run_until_complete(redis_service.connect())
+        loop.run_until_complete(redis_service.set_json("supabase_jwks", {"keys": [key.jwk]}, ttl=3600))
+    except Exception as e:
+        raise BenchmarkSkipped(f"Redis unavailable ({settings.REDIS_URL}): {e}")
+
+    # 첫 호출에서 키 파싱 → 이후는 캐시된 PyJWK
+    loop.run_until_complete(auth_middleware.get_current_user(credentials))
+    signing_key = loop.run_until_complete(auth_middleware.get_signing_key(token))
+
+    import jwt
+
+    return [
+        Benchmark("auth.get_current_user[cached_jwks]", lambda: auth_middleware.get_current_user(credentials), True),
+        Benchmark("auth.jwt_decode", lambda: jwt.decode(
+            token, signing_key.key, algorithms=[settings.JWT_ALGORITHM], audience=settings.JWT_AUDIENCE,
+        )),
+    ]
+
+
+def schema_benchmarks() -> List[Benchmark]:
+    """외부 API 검색 결과 / 라이브러리 목록 검증과 직렬화"""
+    search_rows = [
+        {
+            "title": f"영화 제목 {i}",
+            "original_title": f"Movie Title {i}",
+            "director": "홍길동",
+            "year": 1990 + i % 35,
+            "runtime": 90 + i % 60,
+            "genre": "드라마",
+            "poster_url": f"https://image.tmdb.org/t/p/w500/poster{i}.jpg",
+            "synopsis": SYNOPSIS,
+            "kobis_code": None,
+            "tmdb_id": 100000 + i,
+            "kmdb_id": None,
+            "source": "tmdb",
+        }
+        for i in range(LIST_SIZE)
+    ]
+    search_adapter = TypeAdapter(List[MovieSearchResult])
+    search_results = search_adapter.validate_python(search_rows)
+
+    library_model = List[UserMovieResponse]
+    library_adapter = get_adapter(library_model)
+    library = make_library(LIST_SIZE)
+    library_responses = library_adapter.validate_python(library, from_attributes=True)
+
+    return [
+        Benchmark(f"schemas.movie_search_result.validate[{LIST_SIZE}]", lambda: search_adapter.validate_python(search_rows)),
+        Benchmark(
+            f"schemas.movie_search_result.construct[{LIST_SIZE}]",
+            lambda: [MovieSearchResult.model_construct(**row) for row in search_rows],
+        ),
+        Benchmark(f"schemas.movie_search_result.dump_json[{LIST_SIZE}]", lambda: search_adapter.dump_json(search_results)),
+        Benchmark(
+            f"schemas.user_movie_response.validate[{LIST_SIZE}]",
+            lambda: library_adapter.validate_python(library, from_attributes=True),
+        ),
+        Benchmark(f"schemas.user_movie_response.dump_json[{LIST_SIZE}]", lambda: library_adapter.dump_json(library_responses)),
+        Benchmark(f"schemas.user_movie_response.serialize[{LIST_SIZE}]", lambda: serialize(library_model, library)),
+    ]
+
+
+def stats_benchmarks() -> List[Benchmark]:
+    """통계 계산 (DB 조회 결과 이후의 Python 처리)"""
+    genre_strings = [
+        ", ".join(GENRES[(i + offset) % len(GENRES)] for offset in range(1 + i % 3)) if i % 20 else None
+        for i in range(5000)
+    ]
+
+    today = date(2026, 1, 1)
+    # 최근 1년 연속 관람 + 그 이전 2년은 띄엄띄엄 (내림차순, DISTINCT 결과와 같은 모양)
+    watch_dates = [today - timedelta(days=n) for n in range(365)]
+    watch_dates += [today - timedelta(days=n) for n in range(367, 365 * 3, 3)]
+
+    return [
+        Benchmark("stats.count_genres[5000]", lambda: count_genres(genre_strings)),
+        Benchmark(f"stats.streak_from_dates[{len(watch_dates)}]", lambda: streak_from_dates(watch_dates, today)),
+    ]
+
+
+def auto_collection_benchmarks() -> List[Benchmark]:
+    """auto_rule 검증 (컬렉션 생성/수정 요청마다 실행)"""
+    rule = {
+        "status": "completed",
+        "rating": {"min": 4.0, "max": 5.0},
+        "year": {"min": 2000, "max": 2025},
+        "genre": "드라마",
+        "director": "홍길동",
+        "is_best_movie": True,
+    }
+    return [
+        Benchmark("auto_collection.validate_auto_rule", lambda: AutoCollectionService.validate_auto_rule(rule)),
+    ]
+
+
+def compare(result: Dict[str, Any], baseline: Dict[str, Any], max_regression: float, stat: str = "min") -> List[str]:
+    """baseline 대비 stat이 max_regression 넘게 느려진 benchmark 목록"""
+    base_stats = {bench["name"]: bench["stats"] for bench in baseline["benchmarks"]}
+    regressions = []
+    for bench in result["benchmarks"]:
+        base = base_stats.get(bench["name"])
+        if base and bench["stats"][stat] > base[stat] * (1 + max_regression):
+            regressions.append(
+                f"{bench['name']}: {stat} {_format_time(base[stat])} → {_format_time(bench['stats'][stat])}"
+            )
+    return regressions
+
+
+def _format_time(seconds: float) -> str:
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds * 1e6:.2f}µs"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Microbenchmarks for per-request fixed costs")
+    parser.add_argument("-k", dest="keyword", help="only benchmarks whose name contains this")
+    parser.add_argument("--rounds", type=int, default=30)
+    parser.add_argument("--min-round-ms", type=float, default=20.0, help="calibrate iterations per round")
+    parser.add_argument("--output", help="result JSON path (default: benchmarks/results/micro-<timestamp>.json)")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE))
+    parser.add_argument("--max-regression", type=float, default=0.2, help="allowed slowdown")
+    parser.add_argument("--compare-stat", choices=["min", "median", "mean"], default="min")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    loop = asyncio.new_event_loop()
+    benchmarks: List[Benchmark] = []
+    skipped: List[str] = []
+    for factory in (lambda: auth_benchmarks(loop), schema_benchmarks, stats_benchmarks, auto_collection_benchmarks):
+        try:
+            benchmarks.extend(factory())
+        except BenchmarkSkipped as e:
+            skipped.append(str(e))
+    if args.keyword:
+        benchmarks = [bench for bench in benchmarks if args.keyword in bench.name]
+
+    baseline_path = Path(args.baseline)
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8")) if baseline_path.exists() else None
+    base_values = {
+        bench["name"]: bench["stats"][args.compare_stat] for bench in baseline["benchmarks"]
+    } if baseline else {}
+
+    print(f"{'benchmark':<48}{'median':>11}{'min':>11}{'iqr':>11}{'ops/s':>12}{'Δ' + args.compare_stat:>10}")
+    results = []
+    for bench in benchmarks:
+        stats = run_benchmark(bench, loop, args.rounds, args.min_round_ms / 1000)
+        results.append({"name": bench.name, "stats": stats})
+        base = base_values.get(bench.name)
+        delta = f"{stats[args.compare_stat] / base - 1:+.0%}" if base else ""
+        print(
+            f"{bench.name:<48}{_format_time(stats['median']):>11}{_format_time(stats['min']):>11}"
+            f"{_format_time(stats['iqr']):>11}{stats['ops']:>12,.0f}{delta:>10}"
+        )
+    for reason in skipped:
+        print(f"⚠️  Skipped: {reason}")
+
+    if redis_service.redis_client:
+        loop.run_until_complete(redis_service.disconnect())
+    loop.close()
+
+    result = {
+        "machine_info": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "system": platform.system(),
+        },
+        "commit_info": {"id": _git_commit()},
+        "datetime": datetime.now().isoformat(timespec="seconds"),
+        "benchmarks": results,
+    }
+
+    output = Path(args.output) if args.output else RESULTS_DIR / f"micro-{datetime.now():%Y%m%d-%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2) + "\n", encoding="utf-8")
+    print(f"\nSaved {output}")
+
+    if args.update_baseline:
+        baseline_path.write_text(json.dumps(result, indent=2) + "\n", encoding="utf-8")
+        print(f"✅ Baseline updated: {baseline_path}")
+        return
+
+    if baseline:
+        regressions = compare(result, baseline, args.max_regression, args.compare_stat)
+        if regressions:
+            print(f"\n⚠️  Regressions beyond {args.max_regression:.0%}:")
+            for line in regressions:
+                print(f"  - {line}")
+            sys.exit(1)
+        print(f"✅ No regressions beyond {args.max_regression:.0%} vs baseline ({baseline['commit_info'].get('id')})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3 @@
+"""
+로컬 개발/벤치마크용 도구 (운영 코드에서 import하지 않음)
+"""
@@ -0,0 +1,665 @@
+"""
+외부 provider 로컬 stand-in (KOBIS / TMDb / KMDb / Supabase JWKS)
+API 키/네트워크 없이 ExternalAPIService와 인증을 실행하기 위한 가짜 서버
+
+- 녹화된 응답(fixture)이 있으면 그대로 응답, 없으면 요청 값(검색어, 영화 ID)에서 결정적으로 생성
+  --record: fixture가 없는 요청은 실제 API로 전달하고 응답을 fixture로 저장 (API 키 필요)
+- provider별 장애 주입: 응답 지연 (latency + jitter), 에러 응답 비율, 응답 없는 hang 비율,
+  초당 요청 수 제한 (초과 시 429 + Retry-After)
+- provider별 요청 수/결과 집계 (GET /_control/stats) → 캐시/fan-out 동작을 요청 수로 검증
+- 실행 중 설정 변경: POST /_control/config, 집계 초기화: POST /_control/reset
+- JWKS: 프로세스 시작 시 생성한 RSA 키 (issue_token()으로 해당 키로 서명한 토큰 발급)
+  키가 바뀌어도 앱은 모르는 kid를 만나면 JWKS를 다시 가져오므로 캐시를 비울 필요 없음
+
+Usage:
+    cd backend
+    python -m devtools.fake_providers [--port 8765] [--latency-ms 50] [--jitter-ms 20]
+        [--error-rate 0.1] [--rate-limit tmdb=40] [--fixtures-only] [--record]
+
+    # 앱 설정 (.env)
+    KOBIS_BASE_URL=http://127.0.0.1:8765/kobis
+    TMDB_BASE_URL=http://127.0.0.1:8765/tmdb
+    KMDB_BASE_URL=http://127.0.0.1:8765/kmdb
+    SUPABASE_JWKS_URL=http://127.0.0.1:8765/auth/jwks.json
+
+    # 코드에서 (벤치마크 등)
+    with FakeProviderServer(latency_ms={"tmdb": 80}) as server:
+        os.environ.update(server.env())
+        server.config.error_rate["kmdb"] = 1.0  # 실행 중 장애 주입
+        assert server.stats["tmdb"]["synthetic"] == 1
+"""
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import math
+import os
+import random
+import socket
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+import jwt
+import uvicorn
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+
+PROVIDERS = ("kobis", "tmdb", "kmdb", "auth")
+
+# 실제 API base URL (--record 시 fixture가 없는 요청을 전달)
+UPSTREAM_BASE_URLS = {
+    "kobis": "http://www.kobis.or.kr/kobisopenapi/webservice/rest",
+    "tmdb": "https://api.themoviedb.org/3",
+    "kmdb": "http://api.koreafilm.or.kr/openapi-data2/wisenut/search_api",
+}
+
+# provider별 API 키 파라미터 / 환경 변수 (fixture 키와 파일에서 제외, --record 시 실제 키로 교체)
+API_KEY_PARAMS = {
+    "kobis": ("key", "KOBIS_API_KEY"),
+    "tmdb": ("api_key", "TMDB_API_KEY"),
+    "kmdb": ("ServiceKey", "KMDB_API_KEY"),
+}
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+GENRES = ["드라마", "액션", "코미디", "스릴러", "로맨스", "애니메이션", "SF", "공포", "범죄", "판타지", "다큐멘터리"]
+TITLE_WORDS = ["밤", "바다", "기억", "도시", "여름", "비밀", "마지막", "그림자", "약속", "겨울", "소년", "정원", "기차", "편지"]
+PEOPLE = ["김지훈", "이서연", "박민준", "최유진", "정하늘", "강도윤", "윤서아", "장태오", "임지안", "한결"]
+
+
+@dataclass
+class FakeProviderConfig:
+    """
+    가짜 provider 동작 설정
+
+    provider별 값(Dict)은 "default" 키가 지정하지 않은 provider에 적용됨
+
+    Attributes:
+        latency_ms: provider별 기본 지연 (ms)
+        jitter_ms: 지연에 더할 랜덤 값 상한 (ms)
+        error_rate: provider별 에러 응답 비율 (0~1)
+        error_status: 에러 응답 상태 코드
+        hang_rate: provider별 hang 비율 (hang_seconds 동안 응답하지 않음 → 클라이언트 timeout)
+        hang_seconds: hang 시간 (초)
+        rate_limit_rps: provider별 초당 요청 수 제한 (0이면 무제한, 초과 시 429)
+        fixtures_dir: 녹화된 응답 디렉토리 (없으면 생성 응답만 사용)
+        fixtures_only: fixture가 없는 요청은 404 (생성 응답 사용 안 함)
+        record: fixture가 없는 요청을 실제 API로 전달하고 저장
+        upstream_keys: --record용 실제 API 키 {provider: key}
+        results_per_search: 생성 검색 응답의 결과 수
+        seed: 응답 데이터/지연/장애 생성 seed
+    """
+    latency_ms: Dict[str, float] = field(default_factory=lambda: {"default": 0.0})
+    jitter_ms: float = 0.0
+    error_rate: Dict[str, float] = field(default_factory=lambda: {"default": 0.0})
+    error_status: int = 503
+    hang_rate: Dict[str, float] = field(default_factory=lambda: {"default": 0.0})
+    hang_seconds: float = 15.0
+    rate_limit_rps: Dict[str, float] = field(default_factory=lambda: {"default": 0.0})
+    fixtures_dir: Optional[Path] = FIXTURES_DIR
+    fixtures_only: bool = False
+    record: bool = False
+    upstream_keys: Dict[str, str] = field(default_factory=dict)
+    results_per_search: int = 10
+    seed: int = 42
+
+    @staticmethod
+    def value(values: Dict[str, float], provider: str) -> float:
+        """provider별 설정 값 ("default" fallback)"""
+        return values.get(provider, values.get("default", 0.0))
+
+    def delay(self, provider: str, rng: random.Random) -> float:
+        """provider 응답 지연 (초)"""
+        return (self.value(self.latency_ms, provider) + rng.uniform(0, self.jitter_ms)) / 1000
+
+    def update(self, changes: Dict[str, Any]):
+        """
+        실행 중 설정 변경 (POST /_control/config)
+
+        provider별 값은 병합 (e.g., {"error_rate": {"kmdb": 1.0}}는 kmdb만 변경)
+        """
+        for name, value in changes.items():
+            if name not in self.__dataclass_fields__ or name in ("fixtures_dir", "upstream_keys"):
+                raise ValueError(f"Unknown or read-only setting: {name}")
+            current = getattr(self, name)
+            if isinstance(current, dict):
+                current.update(value)
+            else:
+                setattr(self, name, value)
+
+
+class FixtureStore:
+    """
+    녹화된 provider 응답 (provider/경로/API 키를 제외한 쿼리 파라미터별 JSON 파일 1개)
+
+    파일: {fixtures_dir}/{provider}/{경로}--{파라미터 hash}.json
+        {"request": {"path", "params"}, "status": 200, "body": {...}}
+    """
+
+    def __init__(self, directory: Optional[Path]):
+        self.directory = directory
+
+    def path_for(self, provider: str, path: str, params: Dict[str, str]) -> Path:
+        slug = path.strip("/").replace("/", "_").replace(".", "_") or "index"
+        digest = hashlib.blake2b(
+            json.dumps(params, sort_keys=True, ensure_ascii=False).encode(), digest_size=6
+        ).hexdigest()
+        return self.directory / provider / f"{slug}--{digest}.json"
+
+    def load(self, provider: str, path: str, params: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        if self.directory is None:
+            return None
+        fixture_path = self.path_for(provider, path, params)
+        if not fixture_path.exists():
+            return None
+        return json.loads(fixture_path.read_text(encoding="utf-8"))
+
+    def save(self, provider: str, path: str, params: Dict[str, str], status: int, body: Any):
+        fixture_path = self.path_for(provider, path, params)
+        fixture_path.parent.mkdir(parents=True, exist_ok=True)
+        fixture = {"request": {"path": path, "params": params}, "status": status, "body": body}
+        fixture_path.write_text(json.dumps(fixture, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+
+class RateLimiter:
+    """provider별 token bucket (버스트는 1초 분량)"""
+
+    def __init__(self):
+        self._buckets: Dict[str, Tuple[float, float]] = {}  # provider -> (tokens, 갱신 시각)
+
+    def acquire(self, provider: str, rps: float) -> Optional[int]:
+        """
+        요청 1개 허용 여부
+
+        Returns:
+            None이면 허용, 아니면 Retry-After (초)
+        """
+        if rps <= 0:
+            return None
+        now = time.monotonic()
+        tokens, updated = self._buckets.get(provider, (rps, now))
+        tokens = min(rps, tokens + (now - updated) * rps)
+        if tokens < 1:
+            self._buckets[provider] = (tokens, now)
+            return max(1, math.ceil((1 - tokens) / rps))
+        self._buckets[provider] = (tokens - 1, now)
+        return None
+
+    def reset(self):
+        self._buckets.clear()
+
+
+class SigningKey:
+    """가짜 Supabase 서명 키 (RS256)"""
+
+    def __init__(self):
+        self.private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        numbers = self.private_key.public_key().public_numbers()
+        n = _b64url(numbers.n.to_bytes((numbers.n.bit_length() + 7) // 8, "big"))
+        e = _b64url(numbers.e.to_bytes((numbers.e.bit_length() + 7) // 8, "big"))
+        self.kid = "fake-" + hashlib.sha256(n.encode()).hexdigest()[:16]
+        self.jwk = {"kty": "RSA", "kid": self.kid, "alg": "RS256", "use": "sig", "n": n, "e": e}
+
+    def issue_token(self, user_id: str, expires_in: int = 3600) -> str:
+        """
+        Supabase access token 형태의 JWT 발급
+
+        Args:
+            user_id: sub claim (users.id UUID 문자열)
+            expires_in: 유효 기간 (초)
+
+        Returns:
+            서명된 JWT
+        """
+        # app.config는 import 시점에 환경 변수를 읽으므로 server.env() 적용 후 import되도록 지연 import
+        from app.config import settings
+
+        now = int(time.time())
+        payload = {
+            "sub": user_id,
+            "aud": settings.JWT_AUDIENCE,
+            "role": "authenticated",
+            "iat": now,
+            "exp": now + expires_in,
+        }
+        return jwt.encode(payload, self.private_key, algorithm="RS256", headers={"kid": self.kid})
+
+
+_signing_key: Optional[SigningKey] = None
+
+
+def signing_key() -> SigningKey:
+    """프로세스 공용 서명 키 (첫 사용 시 생성)"""
+    global _signing_key
+    if _signing_key is None:
+        _signing_key = SigningKey()
+    return _signing_key
+
+
+def issue_token(user_id: str, expires_in: int = 3600) -> str:
+    """프로세스 공용 키로 JWT 발급 (FakeProviderServer의 JWKS로 검증됨)"""
+    return signing_key().issue_token(user_id, expires_in)
+
+
+def _b64url(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _rng(*parts: Any) -> random.Random:
+    """요청 값에서 결정적인 Random (프로세스/실행과 무관하게 같은 값)"""
+    digest = hashlib.blake2b("|".join(map(str, parts)).encode(), digest_size=8).digest()
+    return random.Random(int.from_bytes(digest, "big"))
+
+
+def fake_movie(source: str, movie_id: Any) -> Dict[str, Any]:
+    """
+    영화 ID에서 결정적으로 생성한 영화 정보 (provider 공통 필드)
+
+    Returns:
+        {"title", "title_en", "year", "runtime", "genres", "director", "actors", "synopsis", "release_date"}
+    """
+    rng = _rng(source, movie_id)
+    words = rng.sample(TITLE_WORDS, 2)
+    year = rng.randint(1980, 2025)
+    release = date(year, 1, 1) + timedelta(days=rng.randint(0, 364))
+    return {
+        "title": f"{words[0]}의 {words[1]}",
+        "title_en": f"The {words[1].title()} {movie_id}",
+        "year": year,
+        "runtime": rng.randint(80, 170),
+        "genres": rng.sample(GENRES, rng.randint(1, 3)),
+        "director": rng.choice(PEOPLE),
+        "actors": rng.sample(PEOPLE, 3),
+        "synopsis": f"{words[0]}과 {words[1]}에 관한 이야기. " * rng.randint(2, 6),
+        "release_date": release.isoformat(),
+    }
+
+
+def _search_ids(source: str, query: str, count: int) -> List[int]:
+    """검색어에서 결정적인 결과 ID 목록"""
+    rng = _rng(source, "search", query)
+    return [rng.randint(1, 999_999) for _ in range(count)]
+
+
+def create_app(config: Optional[FakeProviderConfig] = None) -> FastAPI:
+    """
+    가짜 provider FastAPI 앱 생성
+
+    경로는 실제 API 경로에 provider prefix를 붙인 형태
+    (e.g., KOBIS_BASE_URL=http://host/kobis → /kobis/movie/searchMovieList.json)
+
+    Args:
+        config: 지연/응답 설정
+
+    Returns:
+        FastAPI 앱
+    """
+    config = config or FakeProviderConfig()
+    jitter_rng = random.Random(config.seed)
+    fault_rng = random.Random(config.seed + 1)
+    fixtures = FixtureStore(config.fixtures_dir)
+    limiter = RateLimiter()
+    stats: Dict[str, Counter] = {provider: Counter() for provider in PROVIDERS}
+
+    app = FastAPI(title="Fake providers", docs_url=None, redoc_url=None, openapi_url=None)
+    app.state.config = config
+    app.state.stats = stats
+
+    @app.middleware("http")
+    async def simulate(request: Request, call_next):
+        """장애 주입 → 지연 → fixture / 녹화 / 생성 응답 (provider 경로만)"""
+        provider, _, path = request.url.path.strip("/").partition("/")
+        if provider not in PROVIDERS:
+            return await call_next(request)
+        counter = stats[provider]
+        counter["requests"] += 1
+
+        retry_after = limiter.acquire(provider, config.value(config.rate_limit_rps, provider))
+        if retry_after is not None:
+            counter["rate_limited"] += 1
+            return JSONResponse(
+                {"error": "rate limit exceeded"}, status_code=429, headers={"Retry-After": str(retry_after)}
+            )
+        if fault_rng.random() < config.value(config.hang_rate, provider):
+            counter["hang"] += 1
+            await asyncio.sleep(config.hang_seconds)
+            return JSONResponse({"error": "upstream timeout"}, status_code=504)
+
+        delay = config.delay(provider, jitter_rng)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if fault_rng.random() < config.value(config.error_rate, provider):
+            counter["error"] += 1
+            return JSONResponse({"error": "injected failure"}, status_code=config.error_status)
+
+        if provider == "auth":
+            counter["synthetic"] += 1
+            return await call_next(request)
+
+        key_param = API_KEY_PARAMS[provider][0]
+        params = {name: value for name, value in sorted(request.query_params.items()) if name != key_param}
+        fixture = fixtures.load(provider, path, params)
+        if fixture is not None:
+            counter["fixture"] += 1
+            return JSONResponse(fixture["body"], status_code=fixture["status"])
+
+        if config.record:
+            counter["recorded"] += 1
+            status_code, body = await _fetch_upstream(provider, path, params, config.upstream_keys.get(provider))
+            if status_code < 500:
+                fixtures.save(provider, path, params, status_code, body)
+            return JSONResponse(body, status_code=status_code)
+
+        if config.fixtures_only:
+            counter["missing"] += 1
+            return JSONResponse({"error": f"no fixture for {provider}/{path}", "params": params}, status_code=404)
+
+        counter["synthetic"] += 1
+        return await call_next(request)
+
+    # --- Control ---
+    @app.get("/_control/stats")
+    async def control_stats():
+        return {provider: dict(counter) for provider, counter in stats.items()}
+
+    @app.post("/_control/config")
+    async def control_config(request: Request):
+        try:
+            config.update(await request.json())
+        except (ValueError, TypeError) as e:
+            return JSONResponse({"error": str(e)}, status_code=400)
+        return {"ok": True}
+
+    @app.post("/_control/reset")
+    async def control_reset():
+        for counter in stats.values():
+            counter.clear()
+        limiter.reset()
+        return {"ok": True}
+
+    # --- Supabase ---
+    @app.get("/auth/jwks.json")
+    async def jwks():
+        return {"keys": [signing_key().jwk]}
+
+    # --- KOBIS ---
+    @app.get("/kobis/movie/searchMovieList.json")
+    async def kobis_search(movieNm: str = ""):
+        movies = []
+        for movie_id in _search_ids("kobis", movieNm, config.results_per_search):
+            code = f"2{movie_id:07d}"
+            movie = fake_movie("kobis", code)
+            movies.append({
+                "movieCd": code,
+                "movieNm": f"{movieNm} {movie['title']}".strip(),
+                "movieNmEn": movie["title_en"],
+                "prdtYear": str(movie["year"]),
+                "repGenreNm": movie["genres"][0],
+                "directors": [{"peopleNm": movie["director"]}],
+            })
+        return {"movieListResult": {"totCnt": len(movies), "movieList": movies}}
+
+    @app.get("/kobis/movie/searchMovieInfo.json")
+    async def kobis_movie(movieCd: str):
+        movie = fake_movie("kobis", movieCd)
+        return {"movieInfoResult": {"movieInfo": {
+            "movieCd": movieCd,
+            "movieNm": movie["title"],
+            "movieNmEn": movie["title_en"],
+            "prdtYear": str(movie["year"]),
+            "showTm": str(movie["runtime"]),
+            "openDt": movie["release_date"].replace("-", ""),
+            "genres": [{"genreNm": genre} for genre in movie["genres"]],
+            "directors": [{"peopleNm": movie["director"]}],
+            "actors": [{"peopleNm": actor} for actor in movie["actors"]],
+        }}}
+
+    @app.get("/kobis/boxoffice/searchDailyBoxOfficeList.json")
+    async def kobis_daily_box_office(targetDt: str = ""):
+        codes = [f"2{movie_id:07d}" for movie_id in _search_ids("kobis", f"boxoffice:{targetDt}", 10)]
+        return {"boxOfficeResult": {"dailyBoxOfficeList": [
+            {"rank": str(rank), "movieCd": code} for rank, code in enumerate(codes, start=1)
+        ]}}
+
+    @app.get("/kobis/boxoffice/searchWeeklyBoxOfficeList.json")
+    async def kobis_weekly_box_office(targetDt: str = ""):
+        codes = [f"2{movie_id:07d}" for movie_id in _search_ids("kobis", f"weekly:{targetDt}", 10)]
+        return {"boxOfficeResult": {"weeklyBoxOfficeList": [
+            {"rank": str(rank), "movieCd": code} for rank, code in enumerate(codes, start=1)
+        ]}}
+
+    # --- TMDb ---
+    def tmdb_summary(tmdb_id: int) -> Dict[str, Any]:
+        movie = fake_movie("tmdb", tmdb_id)
+        return {
+            "id": tmdb_id,
+            "title": movie["title"],
+            "original_title": movie["title_en"],
+            "release_date": movie["release_date"],
+            "overview": movie["synopsis"],
+            "poster_path": f"/fake{tmdb_id}.jpg",
+        }
+
+    @app.get("/tmdb/search/movie")
+    async def tmdb_search(query: str = ""):
+        ids = _search_ids("tmdb", query, config.results_per_search)
+        return {"page": 1, "results": [tmdb_summary(tmdb_id) for tmdb_id in ids], "total_results": len(ids)}
+
+    @app.get("/tmdb/movie/now_playing")
+    async def tmdb_now_playing():
+        ids = _search_ids("tmdb", f"now_playing:{date.today()}", 20)
+        return {"page": 1, "results": [tmdb_summary(tmdb_id) for tmdb_id in ids]}
+
+    @app.get("/tmdb/trending/movie/day")
+    async def tmdb_trending():
+        ids = _search_ids("tmdb", f"trending:{date.today()}", 20)
+        return {"page": 1, "results": [tmdb_summary(tmdb_id) for tmdb_id in ids]}
+
+    @app.get("/tmdb/movie/{tmdb_id}")
+    async def tmdb_movie(tmdb_id: int):
+        movie = fake_movie("tmdb", tmdb_id)
+        return {
+            **tmdb_summary(tmdb_id),
+            "runtime": movie["runtime"],
+            "backdrop_path": f"/fake{tmdb_id}_backdrop.jpg",
+            "genres": [{"id": GENRES.index(genre), "name": genre} for genre in movie["genres"]],
+            "credits": {
+                "cast": [{"name": actor} for actor in movie["actors"]],
+                "crew": [{"job": "Director", "name": movie["director"]}],
+            },
+        }
+
+    # --- KMDb ---
+    @app.get("/kmdb/search_json2.jsp")
+    async def kmdb_search(title: str = "", listCount: int = 10):
+        results = []
+        for movie_id in _search_ids("kmdb", title, min(listCount, config.results_per_search)):
+            docid = f"K{movie_id:06d}"
+            movie = fake_movie("kmdb", docid)
+            results.append({
+                "DOCID": docid,
+                "title": f" !HS{title}!HE {movie['title']}",
+                "titleEng": movie["title_en"],
+                "prodYear": str(movie["year"]),
+                "runtime": str(movie["runtime"]),
+                "genre": ",".join(movie["genres"]),
+                "directors": {"director": [{"directorNm": movie["director"]}]},
+                "plots": {"plot": [{"plotLang": "한국어", "plotText": movie["synopsis"]}]},
+                "posters": f"http://file.koreafilm.or.kr/thm/02/fake/{docid}.jpg",
+            })
+        return {"TotalCount": len(results), "Data": [{"Count": len(results), "Result": results}]}
+
+    return app
+
+
+async def _fetch_upstream(provider: str, path: str, params: Dict[str, str], api_key: Optional[str]) -> Tuple[int, Any]:
+    """실제 API 호출 (--record), API 키는 설정된 실제 키로 교체"""
+    key_param = API_KEY_PARAMS[provider][0]
+    async with httpx.AsyncClient(timeout=10.0) as client:
+        response = await client.get(
+            f"{UPSTREAM_BASE_URLS[provider]}/{path}", params={**params, key_param: api_key or ""}
+        )
+    try:
+        return response.status_code, response.json()
+    except ValueError:
+        return 502, {"error": "upstream returned non-JSON", "status": response.status_code}
+
+
+class FakeProviderServer:
+    """
+    가짜 provider 서버를 백그라운드 스레드에서 실행 (테스트/벤치마크에 내장)
+
+    server.config는 실행 중인 서버와 공유되므로 직접 변경하면 다음 요청부터 적용
+
+    Usage:
+        with FakeProviderServer(latency_ms={"default": 50}) as server:
+            os.environ.update(server.env())  # app import 전에 설정
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_ms: Optional[Dict[str, float]] = None,
+        jitter_ms: float = 0.0,
+        seed: int = 42,
+        config: Optional[FakeProviderConfig] = None,
+    ):
+        self.host = host
+        self.port = port or _free_port(host)
+        self.config = config or FakeProviderConfig(
+            latency_ms=latency_ms or {"default": 0.0}, jitter_ms=jitter_ms, seed=seed
+        )
+        self.app = create_app(self.config)
+        self._server: Optional[uvicorn.Server] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def stats(self) -> Dict[str, Counter]:
+        """provider별 요청 수 {provider: Counter(requests, fixture, synthetic, error, rate_limited, ...)}"""
+        return self.app.state.stats
+
+    def reset_stats(self):
+        for counter in self.stats.values():
+            counter.clear()
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def env(self) -> Dict[str, str]:
+        """이 서버를 가리키는 앱 설정 (환경 변수)"""
+        return {
+            "KOBIS_BASE_URL": f"{self.url}/kobis",
+            "TMDB_BASE_URL": f"{self.url}/tmdb",
+            "KMDB_BASE_URL": f"{self.url}/kmdb",
+            "SUPABASE_JWKS_URL": f"{self.url}/auth/jwks.json",
+            "KOBIS_API_KEY": "fake",
+            "TMDB_API_KEY": "fake",
+            "KMDB_API_KEY": "fake",
+        }
+
+    def start(self) -> "FakeProviderServer":
+        config = uvicorn.Config(self.app, host=self.host, port=self.port, log_level="warning")
+        self._server = uvicorn.Server(config)
+        self._thread = threading.Thread(target=self._server.run, name="fake-providers", daemon=True)
+        self._thread.start()
+        deadline = time.monotonic() + 10
+        while not self._server.started:
+            if time.monotonic() > deadline or not self._thread.is_alive():
+                raise RuntimeError(f"Fake provider server failed to start on {self.url}")
+            time.sleep(0.01)
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.should_exit = True
+            self._thread.join(timeout=5)
+            self._server = None
+
+    def __enter__(self) -> "FakeProviderServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def _free_port(host: str) -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for KOBIS, TMDb, KMDb and the Supabase JWKS")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="response delay for every provider")
+    parser.add_argument(
+        "--provider-latency", action="append", default=[], metavar="PROVIDER=MS",
+        help="per-provider delay, e.g. --provider-latency kmdb=300 (repeatable)",
+    )
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of provider calls that fail")
+    parser.add_argument(
+        "--provider-error-rate", action="append", default=[], metavar="PROVIDER=RATE",
+        help="per-provider error rate, e.g. --provider-error-rate kmdb=0.5",
+    )
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--hang-rate", type=float, default=0.0, help="fraction of calls that never answer in time")
+    parser.add_argument("--hang-seconds", type=float, default=15.0)
+    parser.add_argument(
+        "--rate-limit", action="append", default=[], metavar="PROVIDER=RPS",
+        help="requests/second before 429, e.g. --rate-limit tmdb=40 (default=N for all)",
+    )
+    parser.add_argument("--fixtures", default=str(FIXTURES_DIR), help="recorded responses directory")
+    parser.add_argument("--fixtures-only", action="store_true", help="404 instead of generated responses")
+    parser.add_argument("--record", action="store_true", help="forward fixture misses to the real APIs and save them")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    config = FakeProviderConfig(
+        latency_ms=_provider_values(args.latency_ms, args.provider_latency),
+        jitter_ms=args.jitter_ms,
+        error_rate=_provider_values(args.error_rate, args.provider_error_rate),
+        error_status=args.error_status,
+        hang_rate={"default": args.hang_rate},
+        hang_seconds=args.hang_seconds,
+        rate_limit_rps=_provider_values(0.0, args.rate_limit),
+        fixtures_dir=Path(args.fixtures),
+        fixtures_only=args.fixtures_only,
+        record=args.record,
+        # --record: 실제 API 키는 이 프로세스의 환경 변수에서
+        upstream_keys={
+            provider: os.environ[env_name]
+            for provider, (_, env_name) in API_KEY_PARAMS.items()
+            if os.environ.get(env_name)
+        },
+        seed=args.seed,
+    )
+    server = FakeProviderServer(args.host, args.port, config=config)
+    for name, value in server.env().items():
+        print(f"{name}={value}")
+    uvicorn.run(server.app, host=args.host, port=args.port, log_level="info")
+
+
+def _provider_values(default: float, items: List[str]) -> Dict[str, float]:
+    """["kmdb=300", "default=50"] → {"default": 50.0, "kmdb": 300.0}"""
+    values = {"default": default}
+    for item in items:
+        provider, _, value = item.partition("=")
+        values[provider] = float(value)
+    return values
+
+
+if __name__ == "__main__":
+    main()
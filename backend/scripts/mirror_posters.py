@@ -0,0 +1,54 @@
+"""
+포스터/배경 이미지 미러링 backfill
+
+미러가 없는 영화를 최신순으로 POSTER_MIRROR_BATCH_SIZE개씩 처리
+(POSTER_MIRROR_ENABLED 설정과 관계없이 실행, S3 설정 필요)
+
+Usage:
+    cd backend
+    python -m scripts.mirror_posters
+    python -m scripts.mirror_posters --movie-id 12 --movie-id 34
+"""
+import argparse
+import asyncio
+
+from app.services.poster_mirror_service import poster_mirror_service
+from app.services.redis_service import redis_service
+from app.services.s3_service import s3_service
+from app.services.thumbnail_service import thumbnail_service
+
+
+async def main(args: argparse.Namespace):
+    if s3_service.client is None:
+        raise SystemExit("S3 is not configured (AWS_ACCESS_KEY_ID / AWS_SECRET_ACCESS_KEY / AWS_S3_BUCKET)")
+
+    await redis_service.connect()
+    totals = {"movies": 0, "mirrored": 0, "failed": 0}
+    try:
+        if args.movie_id:
+            result = await poster_mirror_service.mirror_movies(movie_ids=args.movie_id)
+            for key in totals:
+                totals[key] += result[key]
+        else:
+            # 실패한 영화에서 멈추지 않도록 id 기준으로 페이지네이션
+            before_id = None
+            while True:
+                result = await poster_mirror_service.mirror_movies(before_id=before_id)
+                for key in totals:
+                    totals[key] += result[key]
+                if result["last_id"] is None:
+                    break
+                before_id = result["last_id"]
+                print(f"  ... {totals}")
+        print(f"✅ Poster mirror completed: {totals}")
+    finally:
+        await poster_mirror_service.stop()
+        thumbnail_service.close()
+        s3_service.close()
+        await redis_service.disconnect()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mirror movie posters/backdrops to our bucket")
+    parser.add_argument("--movie-id", type=int, action="append", help="대상 영화 ID (여러 번 지정 가능)")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,25 @@
+"""
+박스오피스/트렌딩 영화 Prefetch (cron용)
+
+Usage:
+    cd backend
+    python -m scripts.prefetch_catalog
+
+앱 프로세스 안에서 주기 실행하려면 PREFETCH_ENABLED=True 설정
+"""
+import asyncio
+
+from app.services.prefetch_service import prefetch_service
+from app.services.redis_service import redis_service
+
+
+async def main():
+    await redis_service.connect()
+    try:
+        await prefetch_service.run_once()
+    finally:
+        await redis_service.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
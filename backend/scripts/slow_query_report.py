@@ -0,0 +1,87 @@
+"""
+Slow query 리포트
+slow query log(NDJSON)를 fingerprint별로 집계하여 총 소요 시간 순으로 출력
+
+Usage:
+    cd backend
+    python -m scripts.slow_query_report [--top 20] [--explain] [--since 2026-01-01] [files ...]
+
+파일을 지정하지 않으면 SLOW_QUERY_LOG_FILE 사용 (여러 worker/서버의 로그를 함께 지정 가능)
+"""
+import argparse
+import json
+import statistics
+from typing import Any, Dict, List
+
+from app.config import settings
+
+
+def load(paths: List[str], since: str = None) -> Dict[str, Dict[str, Any]]:
+    """
+    로그 파일을 fingerprint별로 집계
+
+    Returns:
+        {fingerprint: {"statement", "durations", "params", "explain", "last_seen"}}
+    """
+    groups: Dict[str, Dict[str, Any]] = {}
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if since and record["ts"] < since:
+                    continue
+
+                group = groups.setdefault(record["fingerprint"], {
+                    "statement": record["statement"],
+                    "durations": [],
+                    "params": record["params"],
+                    "explain": None,
+                    "last_seen": record["ts"],
+                })
+                group["durations"].append(record["duration_ms"])
+                group["last_seen"] = max(group["last_seen"], record["ts"])
+                # 가장 최근 EXPLAIN 유지
+                if record.get("explain"):
+                    group["explain"] = record["explain"]
+    return groups
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rank slow query fingerprints by total time")
+    parser.add_argument("files", nargs="*", help=f"log files (default: {settings.SLOW_QUERY_LOG_FILE})")
+    parser.add_argument("--top", type=int, default=20, help="number of fingerprints to show")
+    parser.add_argument("--since", help="only records at or after this ISO timestamp")
+    parser.add_argument("--explain", action="store_true", help="print the latest sampled EXPLAIN per fingerprint")
+    args = parser.parse_args()
+
+    groups = load(args.files or [settings.SLOW_QUERY_LOG_FILE], args.since)
+    if not groups:
+        print("No slow queries recorded")
+        return
+
+    ranked = sorted(groups.items(), key=lambda item: sum(item[1]["durations"]), reverse=True)
+    grand_total = sum(sum(group["durations"]) for group in groups.values())
+
+    print(f"{len(groups)} fingerprints, {sum(len(g['durations']) for g in groups.values())} slow queries, "
+          f"{grand_total / 1000:.1f}s total\n")
+    print(f"{'#':>3} {'total ms':>10} {'share':>6} {'count':>6} {'avg':>8} {'p95':>8} {'max':>8}  fingerprint")
+
+    for rank, (fp, group) in enumerate(ranked[:args.top], start=1):
+        durations = sorted(group["durations"])
+        total = sum(durations)
+        p95 = durations[min(len(durations) - 1, int(len(durations) * 0.95))]
+        print(
+            f"{rank:>3} {total:>10.0f} {total / grand_total:>6.0%} {len(durations):>6} "
+            f"{statistics.mean(durations):>8.0f} {p95:>8.0f} {durations[-1]:>8.0f}  {fp}"
+        )
+        print(f"    {group['statement'][:300]}")
+        print(f"    params: {json.dumps(group['params'], ensure_ascii=False)}  last: {group['last_seen']}")
+        if args.explain and group["explain"]:
+            print("    " + group["explain"].replace("\n", "\n    "))
+        print()
+
+
+if __name__ == "__main__":
+    main()
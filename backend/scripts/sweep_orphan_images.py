@@ -0,0 +1,39 @@
+"""
+Orphan 이미지 정리 (cron용)
+
+업로드 후 ORPHAN_IMAGE_GRACE_HOURS가 지나도 user_images에 등록되지 않은 원본과,
+원본이 없는 썸네일을 DeleteObjects(1000개씩)로 삭제
+
+Usage:
+    cd backend
+    python -m scripts.sweep_orphan_images --dry-run
+    python -m scripts.sweep_orphan_images --grace-hours 48
+"""
+import argparse
+import asyncio
+
+from app.services.orphan_image_service import orphan_image_service
+from app.services.s3_service import USER_IMAGE_FOLDER, s3_service
+
+
+async def main(args: argparse.Namespace):
+    if s3_service.client is None:
+        raise SystemExit("S3 is not configured (AWS_ACCESS_KEY_ID / AWS_SECRET_ACCESS_KEY / AWS_S3_BUCKET)")
+
+    try:
+        result = await orphan_image_service.sweep(
+            prefix=args.prefix,
+            grace_hours=args.grace_hours,
+            dry_run=args.dry_run,
+        )
+        print(f"✅ Orphan sweep {'(dry-run) ' if args.dry_run else ''}completed: {result}")
+    finally:
+        s3_service.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Delete S3 images not registered in user_images")
+    parser.add_argument("--prefix", default=USER_IMAGE_FOLDER)
+    parser.add_argument("--grace-hours", type=int, help="최근 업로드 보호 시간 (기본값: ORPHAN_IMAGE_GRACE_HOURS)")
+    parser.add_argument("--dry-run", action="store_true", help="삭제하지 않고 대상만 집계")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,49 @@
+"""
+사용자 이미지 썸네일 생성 worker
+
+POST /media/user-images가 Redis 큐(thumbnail:queue)에 넣은 작업을 처리
+
+Usage:
+    cd backend
+    python -m scripts.thumbnail_worker                      # worker id: hostname
+    python -m scripts.thumbnail_worker --worker-id thumb-1  # 여러 worker 실행 시 각각 고유한 id
+    python -m scripts.thumbnail_worker --image-id 42 --force  # 큐 없이 1개만 (재)생성
+
+worker id는 재시작 후에도 같은 값을 사용해야 처리 중이던 작업이 복구됨
+"""
+import argparse
+import asyncio
+import signal
+import socket
+
+from app.services.redis_service import redis_service
+from app.services.s3_service import s3_service
+from app.services.thumbnail_service import thumbnail_service
+
+
+async def main(args: argparse.Namespace):
+    await redis_service.connect()
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    try:
+        if args.image_id is not None:
+            thumbnail_url = await thumbnail_service.process(args.image_id, force=args.force)
+            print(f"✅ Thumbnail image {args.image_id}: {thumbnail_url}")
+        else:
+            print(f"✅ Thumbnail worker started: {args.worker_id}")
+            await thumbnail_service.run_worker(args.worker_id, stop)
+    finally:
+        thumbnail_service.close()
+        s3_service.close()
+        await redis_service.disconnect()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="User image thumbnail worker")
+    parser.add_argument("--worker-id", default=socket.gethostname())
+    parser.add_argument("--image-id", type=int, help="큐 없이 이미지 1개만 처리")
+    parser.add_argument("--force", action="store_true", help="thumbnail_url이 있어도 다시 생성")
+    asyncio.run(main(parser.parse_args()))
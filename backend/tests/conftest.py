@@ -0,0 +1,259 @@
+"""
+pytest 공통 fixture
+
+- QUERY_REPEAT_STRICT: 한 요청에서 같은 SQL이 반복 실행되면(N+1 의심) 요청이 예외로 실패
+- query_budget: endpoint별 쿼리 수 상한 검사
+- fake_redis: redis_service를 fakeredis로 교체 (테스트마다 빈 상태)
+- s3: s3_service를 moto(mock_s3) 버킷으로 교체
+- db / user / other_user_movie / client: 로컬 PostgreSQL이 필요 (DATABASE_URL, 연결할 수 없으면 skip)
+
+Usage:
+    @pytest.mark.asyncio
+    async def test_stats_overview(client, query_budget):
+        with query_budget(3):
+            response = await client.get("/api/v1/stats/")
+        assert response.status_code == 200
+"""
+import os
+import uuid
+from contextlib import contextmanager
+from datetime import date, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+# app import 전에 설정 (Settings는 import 시점에 환경 변수를 읽음)
+os.environ.setdefault("QUERY_REPEAT_STRICT", "true")
+os.environ.setdefault("DATABASE_URL", "postgresql://postgres:@localhost/filmory_test")
+os.environ.setdefault("SUPABASE_URL", "http://supabase.test")
+os.environ.setdefault("SUPABASE_JWKS_URL", "http://supabase.test/auth/v1/.well-known/jwks.json")
+os.environ.setdefault("DEBUG", "false")
+
+import fakeredis.aioredis  # noqa: E402
+import httpx  # noqa: E402
+import pytest_asyncio  # noqa: E402
+from moto import mock_s3  # noqa: E402
+from sqlalchemy import delete, text  # noqa: E402
+from sqlalchemy.exc import OperationalError  # noqa: E402
+
+from app.config import settings  # noqa: E402
+from app.database import SessionLocal, engine  # noqa: E402
+from app.middleware.query_counter import count_queries, format_repeated  # noqa: E402
+
+# 테스트 데이터 식별용 (정리 시 사용)
+TEST_EMAIL_DOMAIN = "test.example.com"
+TEST_KOBIS_PREFIX = "TEST"
+
+TEST_BUCKET = "filmory-test"
+
+
+@pytest.fixture
+def query_budget():
+    """
+    블록 안의 SQL 쿼리 수가 max_queries 이하인지 검사
+
+    Args (fixture 반환 함수):
+        max_queries: 허용 쿼리 수
+
+    Yields:
+        QueryStats (count, duration, statements)
+    """
+    @contextmanager
+    def budget(max_queries: int):
+        with count_queries() as stats:
+            yield stats
+        assert stats.count <= max_queries, (
+            f"{stats.count} queries (budget {max_queries}): "
+            f"{format_repeated(stats.statements.most_common())}"
+        )
+
+    return budget
+
+
+@pytest_asyncio.fixture
+async def fake_redis():
+    """redis_service / 로컬 캐시를 비운 fakeredis로 교체"""
+    from app.services.cache_namespace import cache_namespace
+    from app.services.redis_service import redis_service
+    from app.services.response_cache import response_cache
+
+    client = fakeredis.aioredis.FakeRedis(decode_responses=False)
+    previous = redis_service.redis_client
+    redis_service.redis_client = client
+    response_cache._local.clear()
+    cache_namespace._generations.clear()
+    try:
+        yield client
+    finally:
+        redis_service.redis_client = previous
+        response_cache._local.clear()
+        cache_namespace._generations.clear()
+        await client.aclose()
+
+
+@pytest.fixture
+def s3(monkeypatch):
+    """
+    moto 버킷을 사용하는 s3_service
+
+    Yields:
+        boto3 S3 client (버킷: TEST_BUCKET)
+    """
+    from app.services.s3_service import S3Service, s3_service
+
+    monkeypatch.setattr(settings, "AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setattr(settings, "AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setattr(settings, "AWS_S3_BUCKET", TEST_BUCKET)
+    monkeypatch.setattr(settings, "AWS_REGION", "us-east-1")
+    monkeypatch.setattr(settings, "AWS_S3_ENDPOINT_URL", None)
+
+    with mock_s3():
+        service = S3Service()
+        service.client.create_bucket(Bucket=TEST_BUCKET)
+        monkeypatch.setattr(s3_service, "client", service.client)
+        monkeypatch.setattr(s3_service, "bucket_name", TEST_BUCKET, raising=False)
+        yield service.client
+
+
+@pytest.fixture
+def db():
+    """DB 세션 (PostgreSQL에 연결할 수 없으면 skip)"""
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+    except OperationalError as e:
+        pytest.skip(f"PostgreSQL unavailable: {e.orig}")
+
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def user(db):
+    """
+    테스트 사용자 + 라이브러리 (영화 12편, 태그 2개, 수동/자동 컬렉션, 인생 영화 1편)
+
+    테스트가 끝나면 사용자(CASCADE)와 테스트 영화 삭제
+
+    Returns:
+        SimpleNamespace(id, movie_ids, user_movie_ids, tag_ids, collection_ids)
+    """
+    from app.models.collection import Collection
+    from app.models.collection_movie import CollectionMovie
+    from app.models.movie import Movie
+    from app.models.movie_tag import MovieTag
+    from app.models.tag import Tag
+    from app.models.user import User
+    from app.models.user_movie import UserMovie
+    from app.services.auto_collection_service import auto_collection_service
+
+    user_id = uuid.uuid4()
+    code = f"{TEST_KOBIS_PREFIX}{user_id.hex[:8]}"
+    db.add(User(id=user_id, email=f"{user_id.hex}@{TEST_EMAIL_DOMAIN}", display_name="테스트 사용자"))
+
+    movies = [
+        Movie(
+            kobis_code=f"{code}{n:02d}",
+            title_ko=f"테스트 영화 {n}",
+            title_original=f"Test Movie {n}",
+            production_year=2015 + n % 10,
+            runtime=90 + n,
+            genre=["드라마", "액션", "코미디"][n % 3],
+            director=f"감독 {n % 4}",
+        )
+        for n in range(12)
+    ]
+    db.add_all(movies)
+    db.flush()
+
+    today = date.today()
+    user_movies = [
+        UserMovie(
+            user_id=user_id,
+            movie_id=movie.id,
+            status=["completed", "completed", "watching", "watchlist"][n % 4],
+            watch_date=today - timedelta(days=20 * n) if n % 4 < 2 else None,
+            rating=Decimal(3 + n % 3) if n % 4 < 2 else None,
+            one_line_review="다시 보고 싶은 영화" if n == 0 else None,
+            is_best_movie=n == 0,
+        )
+        for n, movie in enumerate(movies)
+    ]
+    db.add_all(user_movies)
+    tags = [Tag(name=name, user_id=user_id, is_predefined=False) for name in ("테스트태그1", "테스트태그2")]
+    db.add_all(tags)
+    db.flush()
+
+    db.add_all([
+        MovieTag(user_movie_id=user_movie.id, tag_id=tags[n % 2].id)
+        for n, user_movie in enumerate(user_movies)
+    ])
+    manual = Collection(user_id=user_id, name="내 컬렉션", is_auto=False)
+    auto = Collection(user_id=user_id, name="자동 컬렉션", is_auto=True, auto_rule={"genre": "드라마"})
+    db.add_all([manual, auto])
+    db.flush()
+    db.add_all([
+        CollectionMovie(collection_id=manual.id, user_movie_id=user_movie.id, sort_order=n)
+        for n, user_movie in enumerate(user_movies[:5])
+    ])
+    db.commit()
+    auto_collection_service.sync_auto_collection(auto.id, db)
+
+    seeded = SimpleNamespace(
+        id=str(user_id),
+        movie_ids=[movie.id for movie in movies],
+        user_movie_ids=[user_movie.id for user_movie in user_movies],
+        tag_ids=[tag.id for tag in tags],
+        collection_ids=[manual.id, auto.id],
+    )
+    try:
+        yield seeded
+    finally:
+        db.rollback()
+        db.execute(delete(User).where(User.id == user_id))
+        db.execute(delete(Movie).where(Movie.kobis_code.like(f"{code}%")))
+        db.commit()
+
+
+@pytest.fixture
+def other_user_movie(db, user):
+    """
+    다른 사용자의 라이브러리 영화 (watchlist, 소유권 검사용)
+
+    Returns:
+        user_movie_id
+    """
+    from app.models.user import User
+    from app.models.user_movie import UserMovie
+
+    other_id = uuid.uuid4()
+    db.add(User(id=other_id, email=f"{other_id.hex}@{TEST_EMAIL_DOMAIN}", display_name="다른 사용자"))
+    db.flush()
+    user_movie = UserMovie(user_id=other_id, movie_id=user.movie_ids[0], status="watchlist")
+    db.add(user_movie)
+    db.commit()
+    try:
+        yield user_movie.id
+    finally:
+        db.rollback()
+        db.execute(delete(User).where(User.id == other_id))
+        db.commit()
+
+
+@pytest_asyncio.fixture
+async def client(user, fake_redis):
+    """테스트 사용자로 인증된 ASGI 클라이언트 (JWT 검증은 dependency override)"""
+    from app.main import app
+    from app.middleware.auth_middleware import get_current_user
+
+    app.dependency_overrides[get_current_user] = lambda: user.id
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as http_client:
+            yield http_client
+    finally:
+        app.dependency_overrides.pop(get_current_user, None)
@@ -0,0 +1,63 @@
+"""cache_codec 인코딩/디코딩 (헤더, 코덱/압축 조합, 이전 포맷 호환)"""
+import json
+
+import pytest
+
+from app.services.cache_codec import (
+    CODEC_IDS,
+    COMPRESSION_IDS,
+    COMPRESSION_NONE,
+    FORMAT_VERSION,
+    CacheCodec,
+)
+
+VALUE = {"title": "기생충", "year": 2019, "genres": ["드라마", "스릴러"], "rating": 4.5, "poster": None}
+LARGE_VALUE = {"results": [dict(VALUE, id=n) for n in range(100)]}
+
+
+@pytest.mark.parametrize("codec", CODEC_IDS)
+@pytest.mark.parametrize("compression", COMPRESSION_IDS)
+def test_round_trip(codec, compression):
+    cache_codec = CacheCodec(codec=codec, compression=compression)
+
+    for value in (VALUE, LARGE_VALUE, [], "text"):
+        assert cache_codec.decode(cache_codec.encode(value)) == value
+
+
+@pytest.mark.parametrize("compression", ["zlib", "lz4"])
+def test_compression_threshold(compression):
+    cache_codec = CacheCodec(codec="json", compression=compression, compression_threshold=1024)
+
+    small = cache_codec.encode(VALUE)
+    large = cache_codec.encode(LARGE_VALUE)
+
+    assert small[:2] == bytes((FORMAT_VERSION, COMPRESSION_NONE))
+    assert large[0] == FORMAT_VERSION
+    assert large[1] & 0x0F == COMPRESSION_IDS[compression]
+    assert len(large) < len(json.dumps(LARGE_VALUE, ensure_ascii=False).encode("utf-8"))
+
+
+def test_decode_uses_stored_header():
+    """현재 설정과 다른 코덱/압축으로 저장된 값도 디코딩 (설정 변경 중 rolling deploy)"""
+    stored = CacheCodec(codec="msgpack", compression="lz4", compression_threshold=0).encode(LARGE_VALUE)
+
+    assert CacheCodec(codec="json", compression="none").decode(stored) == LARGE_VALUE
+
+
+def test_decode_legacy_json():
+    cache_codec = CacheCodec()
+
+    assert cache_codec.decode(json.dumps(VALUE, ensure_ascii=False).encode("utf-8")) == VALUE
+    assert cache_codec.decode(json.dumps(VALUE)) == VALUE
+
+
+@pytest.mark.parametrize("data", [None, b"", b"not json", bytes((FORMAT_VERSION,)), bytes((FORMAT_VERSION, 0x01)) + b"xx"])
+def test_decode_invalid_returns_none(data):
+    assert CacheCodec().decode(data) is None
+
+
+def test_unknown_settings_rejected():
+    with pytest.raises(ValueError):
+        CacheCodec(codec="pickle")
+    with pytest.raises(ValueError):
+        CacheCodec(compression="gzip")
@@ -0,0 +1,66 @@
+"""cache_namespace 키 버전 / generation 무효화 / 영화 태그 무효화"""
+import pytest
+
+from app.services.cache_namespace import NAMESPACE_SCHEMA_VERSIONS, CacheNamespaceService, cache_namespace
+from app.services.redis_service import redis_service
+
+
+@pytest.mark.asyncio
+async def test_key_format(fake_redis):
+    keys = await cache_namespace.keys([("tmdb", "movie:1"), ("kobis", "search:abc")])
+
+    assert keys == [
+        f"tmdb:v{NAMESPACE_SCHEMA_VERSIONS['tmdb']}.0:movie:1",
+        f"kobis:v{NAMESPACE_SCHEMA_VERSIONS['kobis']}.0:search:abc",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bump_changes_only_that_namespace(fake_redis):
+    tmdb_before = await cache_namespace.key("tmdb", "movie:1")
+    kmdb_before = await cache_namespace.key("kmdb", "movie:1")
+
+    assert await cache_namespace.bump("tmdb") == 1
+
+    assert await cache_namespace.key("tmdb", "movie:1") != tmdb_before
+    assert await cache_namespace.key("kmdb", "movie:1") == kmdb_before
+
+
+@pytest.mark.asyncio
+async def test_bump_reaches_other_workers_after_local_ttl(fake_redis):
+    other_worker = CacheNamespaceService()
+    before = await other_worker.key("tmdb", "movie:1")
+
+    await cache_namespace.bump("tmdb")
+    assert await other_worker.key("tmdb", "movie:1") == before
+
+    # 로컬 generation 캐시 만료 (CACHE_NAMESPACE_GENERATION_TTL 경과)
+    other_worker._generations.clear()
+    assert await other_worker.key("tmdb", "movie:1") == await cache_namespace.key("tmdb", "movie:1")
+
+
+@pytest.mark.asyncio
+async def test_invalidate_movie_deletes_tagged_keys(fake_redis):
+    search_key = await cache_namespace.key("tmdb", "search:parasite")
+    movie_key = await cache_namespace.key("tmdb", "movie:496243")
+    other_key = await cache_namespace.key("tmdb", "movie:1")
+    await redis_service.mset_json(
+        {search_key: [{"id": 496243}], movie_key: {"id": 496243}, other_key: {"id": 1}},
+        tags={cache_namespace.tag_key("tmdb", 496243): [search_key, movie_key]},
+    )
+
+    assert await cache_namespace.invalidate_movie("tmdb", 496243) == 2
+
+    assert await redis_service.mget_json([search_key, movie_key, other_key]) == [None, None, {"id": 1}]
+    assert not await fake_redis.exists(cache_namespace.tag_key("tmdb", 496243))
+    assert await cache_namespace.invalidate_movie("tmdb", 496243) == 0
+
+
+@pytest.mark.asyncio
+async def test_unknown_namespace_rejected(fake_redis):
+    with pytest.raises(ValueError):
+        await cache_namespace.key("imdb", "movie:1")
+    with pytest.raises(ValueError):
+        await cache_namespace.bump("imdb")
+    with pytest.raises(ValueError):
+        await cache_namespace.invalidate_movie("imdb", 1)
@@ -0,0 +1,76 @@
+"""목록 API 조건부 GET (If-None-Match → 쿼리/직렬화 없이 304)"""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import update
+
+from app.models.movie import Movie
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path,params,max_queries", [
+    # ETag validator (라이브러리 영화 max(updated_at)) 1번
+    ("/api/v1/movies/", {}, 1),
+    ("/api/v1/tags", {}, 0),
+])
+async def test_matching_etag_returns_304(client, query_budget, path, params, max_queries):
+    first = await client.get(path, params=params)
+    assert first.status_code == 200
+
+    with query_budget(max_queries):
+        response = await client.get(path, params=params, headers={"If-None-Match": first.headers["etag"]})
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == first.headers["etag"]
+
+
+@pytest.mark.asyncio
+async def test_user_images_304(client, user, query_budget):
+    params = {"user_movie_id": user.user_movie_ids[0]}
+    first = await client.get("/api/v1/media/user-images", params=params)
+
+    with query_budget(0):
+        response = await client.get("/api/v1/media/user-images", params=params, headers={"If-None-Match": first.headers["etag"]})
+
+    assert response.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_etag_varies_by_params(client):
+    completed = await client.get("/api/v1/movies/", params={"status_filter": "completed"})
+    watchlist = await client.get("/api/v1/movies/", params={"status_filter": "watchlist"})
+
+    assert completed.headers["etag"] != watchlist.headers["etag"]
+    response = await client.get(
+        "/api/v1/movies/", params={"status_filter": "watchlist"}, headers={"If-None-Match": completed.headers["etag"]}
+    )
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_tag_mutation_changes_etag(client):
+    first = await client.get("/api/v1/tags")
+
+    created = await client.post("/api/v1/tags", json={"name": "새 태그", "type": "custom"})
+    assert created.status_code == 201
+
+    response = await client.get("/api/v1/tags", headers={"If-None-Match": first.headers["etag"]})
+    assert response.status_code == 200
+    assert len(response.json()["data"]) == len(first.json()["data"]) + 1
+
+
+@pytest.mark.asyncio
+async def test_movie_metadata_update_changes_etag(client, user, db):
+    """영화 메타데이터 갱신은 사용자 generation을 바꾸지 않으므로 validator로 감지"""
+    first = await client.get("/api/v1/movies/")
+
+    db.execute(
+        update(Movie)
+        .where(Movie.id == user.movie_ids[0])
+        .values(runtime=200, updated_at=datetime.now() + timedelta(seconds=1))
+    )
+    db.commit()
+
+    response = await client.get("/api/v1/movies/", headers={"If-None-Match": first.headers["etag"]})
+    assert response.status_code == 200
+    assert response.headers["etag"] != first.headers["etag"]
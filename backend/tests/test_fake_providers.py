@@ -0,0 +1,61 @@
+"""녹화된 fixture를 제공하는 가짜 provider 서버로 외부 API 파싱 검증 (네트워크 없이)"""
+import pytest
+
+from app.config import settings
+from app.services.external_api_service import external_api_service
+from devtools.fake_providers import FakeProviderConfig, FakeProviderServer
+
+
+@pytest.fixture(scope="module")
+def provider_server():
+    with FakeProviderServer(config=FakeProviderConfig(fixtures_only=True)) as server:
+        yield server
+
+
+@pytest.fixture
+def providers(provider_server, fake_redis, monkeypatch):
+    """설정의 provider URL/키를 가짜 서버로 변경"""
+    for name, value in provider_server.env().items():
+        if hasattr(settings, name) and name != "SUPABASE_JWKS_URL":
+            monkeypatch.setattr(settings, name, value)
+    provider_server.reset_stats()
+    return provider_server
+
+
+@pytest.mark.asyncio
+async def test_kobis_edge_cases(providers):
+    results = await external_api_service.search_kobis("edge cases")
+
+    assert [result.kobis_code for result in results] == ["20990001", "20990002", "20990003"]
+    no_year = results[0]
+    assert (no_year.title, no_year.year, no_year.director) == ("제작연도 없음", 0, "Unknown")
+    assert results[1].director == "감독1"
+    assert results[2].year == 2019
+    assert providers.stats["kobis"]["fixture"] == 1
+
+
+@pytest.mark.asyncio
+async def test_kmdb_edge_cases(providers):
+    results = await external_api_service.search_kmdb("edge cases")
+
+    assert [result.kmdb_id for result in results] == ["K99001", "K99002"]
+    edge, normal = results
+    assert edge.title == "엣지 케이스"
+    assert (edge.year, edge.runtime, edge.synopsis) == (0, None, None)
+    assert (normal.year, normal.runtime, normal.synopsis) == (2019, 131, "줄거리")
+    assert normal.poster_url.startswith("http://file.koreafilm.or.kr/")
+
+
+@pytest.mark.asyncio
+async def test_search_results_are_cached(providers):
+    first = await external_api_service.search_kobis("edge cases")
+    second = await external_api_service.search_kobis("edge cases")
+
+    assert second == first
+    assert providers.stats["kobis"]["requests"] == 1
+
+
+@pytest.mark.asyncio
+async def test_missing_fixture_returns_empty(providers):
+    assert await external_api_service.search_kobis("no such fixture") == []
+    assert providers.stats["kobis"]["missing"] == 1
@@ -0,0 +1,52 @@
+"""홈 집계 API: 섹션 하나가 실패해도 나머지 섹션은 개별 API와 같은 payload로 반환"""
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import text
+
+from app.api.v1 import stats
+
+# 홈 섹션 → 같은 payload를 반환하는 개별 API
+SECTION_PATHS = {
+    "stats": "/api/v1/stats/",
+    "monthly": "/api/v1/stats/monthly?months=6",
+    "best_movies": "/api/v1/stats/best-movies",
+    "collections": "/api/v1/collections/",
+    "movies": "/api/v1/movies/",
+}
+
+
+async def _failing_sql(db, user_id):
+    # 트랜잭션이 abort 상태가 됨 → 다음 섹션 전에 롤백되어야 함
+    db.execute(text("SELECT * FROM no_such_table"))
+
+
+async def _failing_http(db, user_id):
+    raise HTTPException(status_code=503, detail="genre stats unavailable")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("failure,error", [
+    (_failing_sql, "Internal error"),
+    (_failing_http, "genre stats unavailable"),
+])
+async def test_failing_section_keeps_other_sections(client, monkeypatch, failure, error):
+    monkeypatch.setattr(stats, "get_genre_stats", failure)
+
+    response = await client.get("/api/v1/home")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["errors"] == {"genres": error}
+    assert body["genres"] is None
+    assert body["user"]["display_name"] == "테스트 사용자"
+    for name, path in SECTION_PATHS.items():
+        assert body[name] == (await client.get(path)).json(), name
+
+
+@pytest.mark.asyncio
+async def test_include_sections(client):
+    response = await client.get("/api/v1/home", params={"include": "best_movies,collections"})
+
+    body = response.json()
+    assert [name for name, value in body.items() if value is not None and name != "errors"] == ["best_movies", "collections"]
+    assert (await client.get("/api/v1/home", params={"include": "nope"})).status_code == 400
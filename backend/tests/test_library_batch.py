@@ -0,0 +1,162 @@
+"""라이브러리 일괄 작업 (컬렉션 영화 추가/제거, 태그 적용/제거, 상태 일괄 변경)
+
+- 다른 사용자의 user_movie가 섞이면 404 + 아무것도 쓰지 않음
+- 이미 있는 조합은 건너뜀
+- 검증 1 + 쓰기 1 = 2 statement
+"""
+import pytest
+from sqlalchemy import func, select
+
+from app.models.collection_movie import CollectionMovie
+from app.models.movie_tag import MovieTag
+from app.models.user_movie import UserMovie
+
+
+def _collection_movies(db, collection_id):
+    db.rollback()
+    return set(db.execute(
+        select(CollectionMovie.user_movie_id).where(CollectionMovie.collection_id == collection_id)
+    ).scalars())
+
+
+def _movie_tag_count(db, user_movie_ids):
+    db.rollback()
+    return db.execute(select(func.count()).where(MovieTag.user_movie_id.in_(user_movie_ids))).scalar()
+
+
+@pytest.mark.asyncio
+async def test_collection_batch_add(client, db, query_budget, user):
+    manual = user.collection_ids[0]
+    existing, new = user.user_movie_ids[4], user.user_movie_ids[5]
+
+    with query_budget(2):
+        response = await client.post(
+            f"/api/v1/collections/{manual}/movies/batch", json={"user_movie_ids": [existing, new, new]}
+        )
+
+    assert response.status_code == 200
+    assert (response.json()["data"]["added"], response.json()["data"]["skipped"]) == ([new], [existing])
+    assert _collection_movies(db, manual) == set(user.user_movie_ids[:6])
+
+
+@pytest.mark.asyncio
+async def test_collection_batch_add_rejects_auto_collection(client, db, query_budget, user):
+    auto = user.collection_ids[1]
+    before = _collection_movies(db, auto)
+
+    with query_budget(1):
+        response = await client.post(
+            f"/api/v1/collections/{auto}/movies/batch", json={"user_movie_ids": [user.user_movie_ids[1]]}
+        )
+
+    assert response.status_code == 400
+    assert _collection_movies(db, auto) == before
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("action", ["batch", "batch-delete"])
+async def test_collection_batch_rejects_foreign_movie(client, db, query_budget, user, other_user_movie, action):
+    manual = user.collection_ids[0]
+    before = _collection_movies(db, manual)
+
+    with query_budget(1):
+        response = await client.post(
+            f"/api/v1/collections/{manual}/movies/{action}",
+            json={"user_movie_ids": [user.user_movie_ids[0], user.user_movie_ids[8], other_user_movie]},
+        )
+
+    assert response.status_code == 404
+    assert str(other_user_movie) in response.json()["detail"]
+    assert _collection_movies(db, manual) == before
+
+
+@pytest.mark.asyncio
+async def test_collection_batch_remove(client, db, query_budget, user):
+    manual = user.collection_ids[0]
+    in_collection, not_in_collection = user.user_movie_ids[0], user.user_movie_ids[6]
+
+    with query_budget(2):
+        response = await client.post(
+            f"/api/v1/collections/{manual}/movies/batch-delete",
+            json={"user_movie_ids": [in_collection, not_in_collection]},
+        )
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert (data["removed"], data["not_in_collection"]) == ([in_collection], [not_in_collection])
+    assert _collection_movies(db, manual) == set(user.user_movie_ids[1:5])
+
+
+@pytest.mark.asyncio
+async def test_tags_batch_apply(client, db, query_budget, user):
+    # user_movie n에는 tag n % 2가 이미 있음
+    user_movie_ids = user.user_movie_ids[:2]
+
+    with query_budget(2):
+        response = await client.post("/api/v1/tags/movies/batch", json={
+            "user_movie_ids": user_movie_ids + user_movie_ids, "tag_ids": [user.tag_ids[0]],
+        })
+
+    assert response.status_code == 200
+    assert (response.json()["data"]["added"], response.json()["data"]["skipped"]) == (1, 1)
+    assert _movie_tag_count(db, user_movie_ids) == 3
+
+
+@pytest.mark.asyncio
+async def test_tags_batch_remove(client, db, query_budget, user):
+    user_movie_ids = user.user_movie_ids[:4]
+
+    with query_budget(2):
+        response = await client.post("/api/v1/tags/movies/batch-delete", json={
+            "user_movie_ids": user_movie_ids, "tag_ids": [user.tag_ids[1]],
+        })
+
+    assert response.status_code == 200
+    assert response.json()["data"]["removed"] == 2
+    assert _movie_tag_count(db, user_movie_ids) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("action", ["batch", "batch-delete"])
+async def test_tags_batch_rejects_foreign_movie(client, db, query_budget, user, other_user_movie, action):
+    user_movie_ids = user.user_movie_ids[:4]
+    before = _movie_tag_count(db, user_movie_ids)
+
+    with query_budget(1):
+        response = await client.post(f"/api/v1/tags/movies/{action}", json={
+            "user_movie_ids": user_movie_ids + [other_user_movie], "tag_ids": user.tag_ids,
+        })
+
+    assert response.status_code == 404
+    assert _movie_tag_count(db, user_movie_ids + [other_user_movie]) == before
+
+
+@pytest.mark.asyncio
+async def test_movies_batch_update(client, db, query_budget, user):
+    user_movie_ids = user.user_movie_ids[2:4]
+
+    with query_budget(2):
+        response = await client.patch("/api/v1/movies/batch", json={
+            "user_movie_ids": user_movie_ids + user_movie_ids[:1], "status": "completed", "rating": 5,
+        })
+
+    assert response.status_code == 200
+    assert response.json()["data"]["user_movie_ids"] == user_movie_ids
+    db.rollback()
+    rows = db.execute(select(UserMovie.status, UserMovie.rating).where(UserMovie.id.in_(user_movie_ids))).all()
+    assert {(status, float(rating)) for status, rating in rows} == {("completed", 5.0)}
+
+
+@pytest.mark.asyncio
+async def test_movies_batch_update_rejects_foreign_movie(client, db, query_budget, user, other_user_movie):
+    with query_budget(1):
+        response = await client.patch("/api/v1/movies/batch", json={
+            "user_movie_ids": [user.user_movie_ids[3], other_user_movie], "status": "completed",
+        })
+
+    assert response.status_code == 404
+    db.rollback()
+    rows = db.execute(
+        select(UserMovie.status).where(UserMovie.id.in_([user.user_movie_ids[3], other_user_movie]))
+    ).scalars().all()
+    assert rows == ["watchlist", "watchlist"]
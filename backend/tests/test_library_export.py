@@ -0,0 +1,56 @@
+"""라이브러리 내보내기 (NDJSON/CSV 스트리밍, 가져오기 호환)"""
+import json
+
+import pytest
+
+from app.services import library_export_service as export_module
+from app.services.library_export_service import EXPORT_COLUMNS, library_export_service
+from app.services.library_import_service import library_import_service
+
+
+def test_ndjson_includes_tags_and_collections(user):
+    records = [json.loads(line) for line in library_export_service.iter_ndjson(user.id)]
+
+    assert len(records) == len(user.user_movie_ids)
+    assert set(records[0]) == set(EXPORT_COLUMNS)
+    best = next(record for record in records if record["is_best_movie"])
+    assert best["title"] == "테스트 영화 0"
+    assert best["review"] == "다시 보고 싶은 영화"
+    assert best["tags"] == ["테스트태그1"]
+    assert best["collections"] == ["내 컬렉션", "자동 컬렉션"]
+    assert best["images"] is None
+
+
+def test_csv_is_streamed_in_batches(user, monkeypatch):
+    monkeypatch.setattr(export_module, "EXPORT_BATCH_SIZE", 5)
+
+    chunks = list(library_export_service.iter_csv(user.id))
+
+    # 12행 → 5, 5, 나머지 2행
+    assert len(chunks) == 3
+    assert chunks[0].startswith("\ufeff" + ",".join(EXPORT_COLUMNS))
+
+
+def test_csv_round_trips_through_import(user):
+    content = "".join(library_export_service.iter_csv(user.id)).encode("utf-8")
+
+    rows, errors = library_import_service.parse(content, "filmory-library.csv")
+
+    assert errors == []
+    assert len(rows) == len(user.user_movie_ids)
+    by_title = {row.title: row for _, row in rows}
+    best = by_title["테스트 영화 0"]
+    assert (best.year, best.status, best.rating, best.review) == (2015, "completed", 3.0, "다시 보고 싶은 영화")
+    assert best.tags == ["테스트태그1"]
+    assert by_title["테스트 영화 3"].status == "watchlist"
+    assert by_title["테스트 영화 3"].watch_date is None
+
+
+@pytest.mark.asyncio
+async def test_export_endpoint(client, user):
+    response = await client.get("/api/v1/movies/export", params={"format": "csv"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert 'filename="filmory-library.csv"' in response.headers["content-disposition"]
+    assert len(response.text.strip().splitlines()) == len(user.user_movie_ids) + 1
@@ -0,0 +1,139 @@
+"""library_import_service (CSV/JSON 파싱, 컬럼명 정규화, 행 단위 에러, 동시 가져오기)"""
+import asyncio
+import json
+import uuid
+from datetime import date
+
+import pytest
+from sqlalchemy import delete, func, select
+
+from app.database import SessionLocal
+from app.models.movie import Movie
+from app.models.user import User
+from app.models.user_movie import UserMovie
+from app.schemas.movie import MovieMetadata
+from app.services import library_import_service as import_module
+from app.services.library_import_service import library_import_service
+from tests.conftest import TEST_EMAIL_DOMAIN, TEST_KOBIS_PREFIX
+
+
+def test_parse_letterboxd_csv():
+    content = (
+        "Date,Name,Year,Letterboxd URI,Rating,Rewatch,Tags,Watched Date\n"
+        "2024-01-02,Parasite,2019,https://boxd.it/x,4.5,,\"thriller, korean, thriller\",2024-01-01\n"
+        "2024-02-03,Past Lives,2023,https://boxd.it/y,,,,\n"
+    ).encode("utf-8")
+
+    rows, errors = library_import_service.parse(content, "diary.csv")
+
+    assert errors == []
+    assert [index for index, _ in rows] == [1, 2]
+    parasite = rows[0][1]
+    assert (parasite.title, parasite.year, parasite.rating) == ("Parasite", 2019, 4.5)
+    assert parasite.watch_date == date(2024, 1, 1)
+    assert parasite.tags == ["thriller", "korean"]
+    assert parasite.status == "completed"
+    assert rows[1][1].rating is None
+
+
+def test_parse_watcha_cp949_csv():
+    content = "제목,개봉연도,별점,본 날짜,코멘트\n기생충,2019,5,2024.03.01,최고\n".encode("cp949")
+
+    rows, errors = library_import_service.parse(content, "watcha.csv", default_status="watchlist")
+
+    assert errors == []
+    row = rows[0][1]
+    assert (row.title, row.year, row.rating, row.review) == ("기생충", 2019, 5.0, "최고")
+    assert row.watch_date == date(2024, 3, 1)
+    assert row.status == "watchlist"
+
+
+def test_parse_json_items_and_status_aliases():
+    content = json.dumps({"items": [
+        {"title": "Dune", "status": "Want to watch", "tmdb_id": 438631},
+        {"movie": "Oldboy", "year": "2003-11-21", "status": "보는 중", "tags": ["복수", " "]},
+    ]}).encode("utf-8")
+
+    rows, errors = library_import_service.parse(content)
+
+    assert errors == []
+    dune, oldboy = rows[0][1], rows[1][1]
+    assert (dune.status, dune.tmdb_id) == ("watchlist", 438631)
+    assert (oldboy.title, oldboy.year, oldboy.status, oldboy.tags) == ("Oldboy", 2003, "watching", ["복수"])
+
+
+def test_invalid_rows_are_reported_not_raised():
+    content = (
+        "title,year,rating,watch_date\n"
+        "Good,2020,3,2024-01-01\n"
+        ",2020,3,\n"
+        "Bad rating,2020,9,\n"
+        "Bad date,2020,,someday\n"
+    ).encode("utf-8")
+
+    rows, errors = library_import_service.parse(content, "library.csv")
+
+    assert [index for index, _ in rows] == [1]
+    assert [error["row"] for error in errors] == [2, 3, 4]
+    assert "rating" in errors[1]["error"]
+    assert "Invalid date" in errors[2]["error"]
+
+
+@pytest.mark.parametrize("content,filename", [
+    (b"{not json", "library.json"),
+    (json.dumps({"data": []}).encode("utf-8"), "library.json"),
+    (b"", "library.csv"),
+    (b"\xff\xfe\x00\x00", "library.csv"),
+])
+def test_unreadable_file_raises(content, filename):
+    with pytest.raises(ValueError):
+        library_import_service.parse(content, filename)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_imports_with_overlapping_movies(db, user, monkeypatch):
+    """같은 영화를 반대 순서로 resolve하는 두 가져오기가 서로 막지 않음 (catalog resolve는 건별 commit)"""
+    tmdb_ids = [990000001, 990000002, 990000003]
+    other_id = uuid.uuid4()
+    db.add(User(id=other_id, email=f"{other_id.hex}@{TEST_EMAIL_DOMAIN}"))
+    db.commit()
+
+    async def fetch_metadata(keys, titles, pending):
+        # provider 검색 대기 (다른 가져오기와 청크가 엇갈리도록)
+        await asyncio.sleep(0.2)
+        return [
+            MovieMetadata(title=f"동시 가져오기 {key[1]}", director="감독", year=2020, runtime=100, genre="드라마",
+                          tmdb_id=int(key[1]), kobis_code=f"{TEST_KOBIS_PREFIX}{key[1]}")
+            for key in keys
+        ]
+
+    monkeypatch.setattr(import_module, "SEARCH_CHUNK_SIZE", 1)
+    monkeypatch.setattr(library_import_service, "_fetch_metadata", fetch_metadata)
+
+    async def run(user_id, ids):
+        content = json.dumps([{"title": f"영화 {tmdb_id}", "tmdb_id": tmdb_id} for tmdb_id in ids]).encode("utf-8")
+        rows, errors = library_import_service.parse(content)
+        session = SessionLocal()
+        try:
+            return [event async for event in library_import_service.run(session, user_id, rows, errors)][-1]
+        finally:
+            session.close()
+
+    try:
+        results = await asyncio.wait_for(
+            asyncio.gather(run(user.id, tmdb_ids), run(str(other_id), tmdb_ids[::-1])), timeout=30
+        )
+
+        assert [(result["stage"], result["imported"]) for result in results] == [("done", 3), ("done", 3)]
+        movie_ids = db.execute(select(Movie.id).where(Movie.tmdb_id.in_(tmdb_ids))).scalars().all()
+        assert len(movie_ids) == len(tmdb_ids)
+        for user_id in (user.id, other_id):
+            assert db.execute(
+                select(func.count()).select_from(UserMovie)
+                .where(UserMovie.user_id == user_id, UserMovie.movie_id.in_(movie_ids))
+            ).scalar() == len(tmdb_ids)
+    finally:
+        db.rollback()
+        db.execute(delete(User).where(User.id == other_id))
+        db.execute(delete(Movie).where(Movie.tmdb_id.in_(tmdb_ids)))
+        db.commit()
@@ -0,0 +1,167 @@
+"""Presigned POST policy / multipart 완료 검증 / 요청 크기 제한 (moto 버킷)"""
+import base64
+import json
+
+import pytest
+
+from app.api.v1.media import MULTIPART_MAX_PARTS
+from app.config import settings
+from tests.conftest import TEST_BUCKET
+
+PART = b"x" * 1024
+
+
+def _policy(fields: dict) -> dict:
+    return json.loads(base64.b64decode(fields["policy"]))
+
+
+async def _start_multipart(client, file_size: int = len(PART)) -> dict:
+    response = await client.post(
+        "/api/v1/media/upload/multipart",
+        json={"file_name": "poster.png", "file_type": "image/png", "file_size": file_size},
+    )
+    assert response.status_code == 200
+    return response.json()["data"]
+
+
+def _upload_part(s3, upload: dict, body: bytes = PART, part_number: int = 1) -> str:
+    return s3.upload_part(
+        Bucket=TEST_BUCKET, Key=upload["file_key"], UploadId=upload["upload_id"],
+        PartNumber=part_number, Body=body,
+    )["ETag"]
+
+
+def _open_uploads(s3) -> list:
+    return [upload["UploadId"] for upload in s3.list_multipart_uploads(Bucket=TEST_BUCKET).get("Uploads", [])]
+
+
+async def _complete(client, upload: dict, parts: list):
+    return await client.post("/api/v1/media/upload/multipart/complete", json={
+        "file_key": upload["file_key"], "upload_id": upload["upload_id"], "parts": parts,
+    })
+
+
+@pytest.mark.asyncio
+async def test_presigned_post_policy_conditions(client, s3):
+    response = await client.post("/api/v1/media/upload/batch", json={
+        "method": "post",
+        "files": [
+            {"file_name": "ticket.jpg", "file_type": "image/jpeg", "file_size": 2048},
+            {"file_name": "card.png", "file_type": "image/png"},
+        ],
+    })
+
+    assert response.status_code == 200
+    ticket, card = response.json()["data"]["uploads"]
+    assert ticket["max_file_size"] == 2048
+    assert card["max_file_size"] == settings.MEDIA_UPLOAD_MAX_BYTES
+
+    for upload, file_type in ((ticket, "image/jpeg"), (card, "image/png")):
+        conditions = _policy(upload["fields"])["conditions"]
+        assert ["content-length-range", 1, upload["max_file_size"]] in conditions
+        assert {"Content-Type": file_type} in conditions
+        assert upload["fields"]["Content-Type"] == file_type
+
+
+@pytest.mark.asyncio
+async def test_complete_multipart_upload(client, s3):
+    upload = await _start_multipart(client)
+    etag = _upload_part(s3, upload)
+
+    response = await _complete(client, upload, [{"part_number": 1, "etag": etag}])
+
+    assert response.status_code == 200
+    assert s3.head_object(Bucket=TEST_BUCKET, Key=upload["file_key"])["ContentLength"] == len(PART)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("parts", [
+    [{"part_number": 1, "etag": '"0123456789abcdef0123456789abcdef"'}],
+    [{"part_number": 1, "etag": "{etag}"}, {"part_number": 2, "etag": "{etag}"}],
+])
+async def test_complete_rejects_mismatched_parts(client, s3, parts):
+    upload = await _start_multipart(client)
+    etag = _upload_part(s3, upload)
+
+    response = await _complete(client, upload, [{**part, "etag": part["etag"].format(etag=etag)} for part in parts])
+
+    assert response.status_code == 400
+    assert "do not match" in response.json()["detail"]
+    # 업로드는 그대로 (올바른 목록으로 다시 완료 가능)
+    assert _open_uploads(s3) == [upload["upload_id"]]
+
+
+@pytest.mark.asyncio
+async def test_complete_rejects_oversized_upload(client, s3, monkeypatch):
+    upload = await _start_multipart(client)
+    # part URL에는 크기 조건이 없어 선언한 크기보다 큰 part가 올라올 수 있음
+    etag = _upload_part(s3, upload, body=PART * 4)
+    monkeypatch.setattr(settings, "MEDIA_MULTIPART_MAX_BYTES", len(PART) * 2)
+
+    response = await _complete(client, upload, [{"part_number": 1, "etag": etag}])
+
+    assert response.status_code == 400
+    assert "too large" in response.json()["detail"]
+    assert _open_uploads(s3) == []
+    assert s3.list_objects_v2(Bucket=TEST_BUCKET).get("KeyCount", 0) == 0
+
+
+@pytest.mark.asyncio
+async def test_batch_over_limit(client, s3, monkeypatch, query_budget):
+    monkeypatch.setattr(settings, "MEDIA_UPLOAD_BATCH_MAX_FILES", 2)
+    files = [{"file_name": f"{n}.jpg", "file_type": "image/jpeg"} for n in range(3)]
+
+    with query_budget(0):
+        response = await client.post("/api/v1/media/upload/batch", json={"files": files})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_multipart_create_over_limit(client, s3):
+    response = await client.post("/api/v1/media/upload/multipart", json={
+        "file_name": "poster.png", "file_type": "image/png", "file_size": settings.MEDIA_MULTIPART_MAX_BYTES + 1,
+    })
+
+    assert response.status_code == 400
+    assert _open_uploads(s3) == []
+
+
+@pytest.mark.asyncio
+async def test_multipart_complete_over_part_limit(client, s3):
+    upload = await _start_multipart(client)
+    parts = [{"part_number": n % 10000 + 1, "etag": "etag"} for n in range(MULTIPART_MAX_PARTS + 1)]
+
+    response = await _complete(client, upload, parts)
+
+    assert response.status_code == 400
+    assert f"최대 {MULTIPART_MAX_PARTS}개" in response.json()["detail"]
+    assert _open_uploads(s3) == [upload["upload_id"]]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("endpoint", ["complete", "abort"])
+async def test_multipart_rejects_foreign_key(client, s3, endpoint):
+    upload = await _start_multipart(client)
+    payload = {"file_key": "user-images/someone-else/poster.png", "upload_id": upload["upload_id"]}
+    if endpoint == "complete":
+        payload["parts"] = [{"part_number": 1, "etag": "etag"}]
+
+    response = await client.post(f"/api/v1/media/upload/multipart/{endpoint}", json=payload)
+
+    assert response.status_code == 400
+    assert _open_uploads(s3) == [upload["upload_id"]]
+
+
+@pytest.mark.asyncio
+async def test_multipart_abort(client, s3):
+    upload = await _start_multipart(client)
+    _upload_part(s3, upload)
+
+    response = await client.post("/api/v1/media/upload/multipart/abort", json={
+        "file_key": upload["file_key"], "upload_id": upload["upload_id"],
+    })
+
+    assert response.status_code == 200
+    assert response.json()["data"]["aborted"] is True
+    assert _open_uploads(s3) == []
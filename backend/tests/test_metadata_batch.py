@@ -0,0 +1,127 @@
+"""메타데이터 배치 조회 (요청 순서/중복, MGET 1회, 항목별 실패) - fakeredis + 가짜 provider"""
+import pytest
+
+from app.config import settings
+from app.services.external_api_service import external_api_service
+from app.services.redis_service import redis_service
+from devtools.fake_providers import FakeProviderServer, fake_movie
+
+
+@pytest.fixture(scope="module")
+def provider_server():
+    with FakeProviderServer() as server:
+        yield server
+
+
+@pytest.fixture
+def providers(provider_server, fake_redis, monkeypatch):
+    """설정의 provider URL/키를 가짜 서버로 변경 (장애 주입은 테스트 후 원복)"""
+    for name, value in provider_server.env().items():
+        if hasattr(settings, name) and name != "SUPABASE_JWKS_URL":
+            monkeypatch.setattr(settings, name, value)
+    provider_server.reset_stats()
+    error_rate = dict(provider_server.config.error_rate)
+    try:
+        yield provider_server
+    finally:
+        provider_server.config.error_rate = error_rate
+
+
+@pytest.fixture
+def mget_calls(monkeypatch):
+    """redis_service.mget_json 호출별 키 목록"""
+    calls = []
+    mget_json = redis_service.mget_json
+
+    async def spy(keys):
+        calls.append(list(keys))
+        return await mget_json(keys)
+
+    monkeypatch.setattr(redis_service, "mget_json", spy)
+    return calls
+
+
+def _titles(entries):
+    return [metadata.title if metadata else error for metadata, error in entries]
+
+
+@pytest.mark.asyncio
+async def test_order_with_duplicates(providers, mget_calls):
+    items = [("tmdb", "101"), ("kobis", "20990101"), ("tmdb", "101"), ("foo", "1"), ("kobis", "20990102"), ("kobis", "20990101")]
+
+    entries = await external_api_service.get_metadata_batch(items)
+
+    tmdb, kobis_a, kobis_b = fake_movie("tmdb", 101), fake_movie("kobis", "20990101"), fake_movie("kobis", "20990102")
+    assert _titles(entries) == [
+        tmdb["title"], kobis_a["title"], tmdb["title"],
+        "Invalid source. Must be 'kobis' or 'tmdb'",
+        kobis_b["title"], kobis_a["title"],
+    ]
+    # 중복 항목은 한 번만 조회/요청
+    assert [len(keys) for keys in mget_calls] == [3]
+    assert (providers.stats["tmdb"]["requests"], providers.stats["kobis"]["requests"]) == (1, 2)
+
+
+@pytest.mark.asyncio
+async def test_cache_hits_and_misses(providers, mget_calls):
+    await external_api_service.get_metadata_batch([("tmdb", "102"), ("kobis", "20990103")])
+    providers.reset_stats()
+    mget_calls.clear()
+
+    entries = await external_api_service.get_metadata_batch(
+        [("kobis", "20990104"), ("tmdb", "102"), ("kobis", "20990103")]
+    )
+
+    assert _titles(entries) == [
+        fake_movie("kobis", "20990104")["title"], fake_movie("tmdb", 102)["title"], fake_movie("kobis", "20990103")["title"],
+    ]
+    assert [len(keys) for keys in mget_calls] == [3]
+    # 캐시 miss만 외부 API 호출
+    assert (providers.stats["tmdb"]["requests"], providers.stats["kobis"]["requests"]) == (0, 1)
+
+
+@pytest.mark.asyncio
+async def test_failing_item_does_not_fail_batch(providers):
+    providers.config.error_rate["kobis"] = 1.0
+
+    entries = await external_api_service.get_metadata_batch([("kobis", "20990105"), ("tmdb", "103"), ("tmdb", "abc")])
+
+    assert _titles(entries) == ["Movie metadata not found", fake_movie("tmdb", 103)["title"], "Invalid TMDb id"]
+    assert providers.stats["kobis"]["error"] >= 1
+
+    # 실패한 항목은 캐시되지 않음 (복구 후 다시 조회)
+    providers.config.error_rate["kobis"] = 0.0
+    providers.reset_stats()
+    entries = await external_api_service.get_metadata_batch([("kobis", "20990105"), ("tmdb", "103")])
+
+    assert _titles(entries) == [fake_movie("kobis", "20990105")["title"], fake_movie("tmdb", 103)["title"]]
+    assert (providers.stats["tmdb"]["requests"], providers.stats["kobis"]["requests"]) == (0, 1)
+
+
+@pytest.mark.asyncio
+async def test_batch_endpoint(client, providers):
+    providers.config.error_rate["kobis"] = 1.0
+
+    response = await client.post("/api/v1/movies/metadata:batch", json={"items": [
+        {"source": "tmdb", "id": "104"},
+        {"source": "kobis", "id": "20990106"},
+        {"source": "tmdb", "id": "104"},
+    ]})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [(item["source"], item["id"]) for item in body] == [("tmdb", "104"), ("kobis", "20990106"), ("tmdb", "104")]
+    assert body[0]["metadata"]["title"] == body[2]["metadata"]["title"] == fake_movie("tmdb", 104)["title"]
+    assert (body[1]["metadata"], body[1]["error"]) == (None, "Movie metadata not found")
+
+
+@pytest.mark.asyncio
+async def test_batch_endpoint_over_limit(client, providers, monkeypatch):
+    monkeypatch.setattr(settings, "METADATA_BATCH_MAX_ITEMS", 2)
+
+    response = await client.post("/api/v1/movies/metadata:batch", json={
+        "items": [{"source": "tmdb", "id": str(n)} for n in range(3)],
+    })
+
+    assert response.status_code == 400
+    assert providers.stats["tmdb"]["requests"] == 0
@@ -0,0 +1,147 @@
+"""영화 카탈로그 identity resolution (movie_external_ids, 동시 resolve, 마이그레이션 backfill)"""
+import importlib.util
+import threading
+from pathlib import Path
+
+import pytest
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import delete, select, text
+
+from app.database import SessionLocal, engine
+from app.models.movie import Movie
+from app.models.movie_external_id import MovieExternalId
+from app.schemas.movie import MovieMetadata
+from app.services.movie_catalog_service import movie_catalog_service
+from tests.conftest import TEST_KOBIS_PREFIX
+
+TMDB_IDS = [990200001, 990200002, 990200003]
+KOBIS_CODES = [f"{TEST_KOBIS_PREFIX}CAT{n}" for n in range(3)]
+
+MIGRATION = Path(__file__).parent.parent / "alembic" / "versions" / "20261019_1000_3f2a9c1d7b4e_movie_external_ids.py"
+
+
+def _metadata(title="카탈로그 테스트", **ids) -> MovieMetadata:
+    return MovieMetadata(title=title, director="감독", year=2020, runtime=100, genre="드라마", **ids)
+
+
+@pytest.fixture
+def catalog(db):
+    """테스트 영화 정리"""
+    yield db
+    db.rollback()
+    db.execute(delete(Movie).where(Movie.tmdb_id.in_(TMDB_IDS) | Movie.kobis_code.in_(KOBIS_CODES)))
+    db.execute(delete(MovieExternalId).where(
+        MovieExternalId.external_id.in_([str(tmdb_id) for tmdb_id in TMDB_IDS] + KOBIS_CODES)
+    ))
+    db.commit()
+
+
+def _external_ids(db, movie_id):
+    return set(db.execute(
+        select(MovieExternalId.source, MovieExternalId.external_id).where(MovieExternalId.movie_id == movie_id)
+    ).all())
+
+
+def test_tmdb_then_kobis_resolve_to_one_movie(catalog):
+    db = catalog
+    from_tmdb = movie_catalog_service.resolve_from_metadata(db, _metadata(tmdb_id=TMDB_IDS[0]))
+    db.commit()
+    movie_id = from_tmdb.id
+
+    # KOBIS 메타데이터에 TMDb ID가 함께 있으면 같은 영화로 모이고 kobis_code가 채워짐
+    from_kobis = movie_catalog_service.resolve_from_metadata(
+        db, _metadata(title="다른 제목", kobis_code=KOBIS_CODES[0], tmdb_id=TMDB_IDS[0])
+    )
+    db.commit()
+    kobis_only = movie_catalog_service.resolve_from_metadata(db, _metadata(kobis_code=KOBIS_CODES[0]))
+    db.commit()
+
+    assert from_kobis.id == kobis_only.id == movie_id
+    assert (from_kobis.title_ko, from_kobis.kobis_code) == ("카탈로그 테스트", KOBIS_CODES[0])
+    assert _external_ids(db, movie_id) == {("tmdb", str(TMDB_IDS[0])), ("kobis", KOBIS_CODES[0])}
+    assert db.execute(select(Movie.id).where(Movie.tmdb_id == TMDB_IDS[0])).scalars().all() == [movie_id]
+
+
+def test_concurrent_resolutions_create_one_movie(catalog):
+    barrier = threading.Barrier(2)
+    movie_ids, errors = [], []
+
+    def resolve(metadata):
+        session = SessionLocal()
+        try:
+            barrier.wait()
+            movie_ids.append(movie_catalog_service.resolve_from_metadata(session, metadata).id)
+            session.commit()
+        except Exception as e:  # pragma: no cover - 실패 시 assert에서 보고
+            errors.append(e)
+        finally:
+            session.close()
+
+    threads = [
+        threading.Thread(target=resolve, args=(_metadata(tmdb_id=TMDB_IDS[1]),)),
+        threading.Thread(target=resolve, args=(_metadata(tmdb_id=TMDB_IDS[1], kobis_code=KOBIS_CODES[1]),)),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=30)
+
+    assert errors == []
+    assert len(set(movie_ids)) == 1
+    rows = catalog.execute(select(Movie.id).where(Movie.tmdb_id == TMDB_IDS[1])).scalars().all()
+    assert rows == movie_ids[:1]
+    assert _external_ids(catalog, rows[0]) == {("tmdb", str(TMDB_IDS[1])), ("kobis", KOBIS_CODES[1])}
+
+
+def test_kobis_code_of_other_movie_not_overwritten(catalog):
+    db = catalog
+    # 서로 다른 경로로 먼저 생성된 두 영화 (TMDb 경로가 먼저)
+    tmdb_movie = movie_catalog_service.resolve_from_metadata(db, _metadata(tmdb_id=TMDB_IDS[2]))
+    kobis_movie = movie_catalog_service.resolve_from_metadata(db, _metadata(kobis_code=KOBIS_CODES[2]))
+    db.commit()
+    tmdb_movie_id, kobis_movie_id = tmdb_movie.id, kobis_movie.id
+
+    resolved = movie_catalog_service.resolve_from_metadata(
+        db, _metadata(tmdb_id=TMDB_IDS[2], kobis_code=KOBIS_CODES[2])
+    )
+    db.commit()
+
+    assert resolved.id == tmdb_movie_id
+    assert resolved.kobis_code is None
+    assert db.get(Movie, kobis_movie_id).kobis_code == KOBIS_CODES[2]
+    assert _external_ids(db, kobis_movie_id) == {("kobis", KOBIS_CODES[2])}
+
+
+def test_migration_backfill(db):
+    """중복 외부 ID는 가장 먼저 생성된 영화로 매핑 (임시 schema에서 실행 후 rollback)"""
+    spec = importlib.util.spec_from_file_location("movie_external_ids_migration", MIGRATION)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        try:
+            connection.execute(text("CREATE SCHEMA migration_test"))
+            connection.execute(text("SET LOCAL search_path TO migration_test"))
+            connection.execute(text(
+                "CREATE TABLE movies (id serial PRIMARY KEY, tmdb_id integer, kobis_code varchar(20), kmdb_id varchar(50))"
+            ))
+            connection.execute(text("""
+                INSERT INTO movies (id, tmdb_id, kobis_code, kmdb_id) VALUES
+                    (1, 100, NULL, NULL),
+                    (2, 100, 'K1', NULL),
+                    (3, NULL, 'K1', 'M1'),
+                    (4, NULL, NULL, NULL)
+            """))
+
+            with Operations.context(MigrationContext.configure(connection)):
+                migration.upgrade()
+
+            rows = connection.execute(
+                text("SELECT source, external_id, movie_id FROM movie_external_ids ORDER BY source, external_id")
+            ).all()
+        finally:
+            transaction.rollback()
+
+    assert [tuple(row) for row in rows] == [("kmdb", "M1", 3), ("kobis", "K1", 2), ("tmdb", "100", 1)]
@@ -0,0 +1,99 @@
+"""Orphan 이미지 정리 (moto 버킷 + user_images)"""
+import pytest
+
+from app.models.user_image import UserImage
+from app.services.orphan_image_service import orphan_image_service
+from app.services.s3_service import DELETE_OBJECTS_MAX_KEYS, s3_service
+from app.services.thumbnail_service import thumbnail_service
+from tests.conftest import TEST_BUCKET
+
+PREFIX = "sweep-test/user-images"
+
+
+def _put(s3, *keys):
+    for key in keys:
+        s3.put_object(Bucket=TEST_BUCKET, Key=key, Body=b"x")
+
+
+def _keys(s3):
+    paginator = s3.get_paginator("list_objects_v2")
+    return {obj["Key"] for page in paginator.paginate(Bucket=TEST_BUCKET, Prefix=PREFIX) for obj in page.get("Contents", [])}
+
+
+def _register(db, user, *file_keys):
+    db.add_all([
+        UserImage(user_id=user.id, user_movie_id=user.user_movie_ids[0], image_type="ticket", image_url="x", file_key=key)
+        for key in file_keys
+    ])
+    db.commit()
+
+
+@pytest.mark.asyncio
+async def test_grace_window_protects_recent_uploads(s3, db):
+    _put(s3, f"{PREFIX}/user-a/{'a' * 64}.jpg")
+
+    stats = await orphan_image_service.sweep(prefix=PREFIX)
+
+    assert stats == {"scanned": 1, "orphans": 0, "orphan_thumbnails": 0, "deleted": 0, "failed": 0}
+    assert len(_keys(s3)) == 1
+
+
+@pytest.mark.asyncio
+async def test_deletes_in_batches_of_1000(s3, db, user, monkeypatch):
+    orphans = [f"{PREFIX}/user-a/{n:064x}.jpg" for n in range(2 * DELETE_OBJECTS_MAX_KEYS + 1)]
+    kept = f"{PREFIX}/user-a/{'f' * 64}.jpg"
+    _put(s3, *orphans, kept)
+    _register(db, user, kept)
+
+    batches = []
+    delete_files = s3_service.delete_files
+
+    async def spy(file_keys):
+        batches.append(len(file_keys))
+        return await delete_files(file_keys)
+
+    monkeypatch.setattr(s3_service, "delete_files", spy)
+
+    dry_run = await orphan_image_service.sweep(prefix=PREFIX, grace_hours=0, dry_run=True)
+    assert (dry_run["orphans"], dry_run["deleted"], batches) == (len(orphans), 0, [])
+
+    stats = await orphan_image_service.sweep(prefix=PREFIX, grace_hours=0)
+
+    assert stats["scanned"] == len(orphans) + 1
+    assert stats["deleted"] == len(orphans)
+    assert batches == [DELETE_OBJECTS_MAX_KEYS, DELETE_OBJECTS_MAX_KEYS, 1]
+    assert _keys(s3) == {kept}
+
+
+@pytest.mark.asyncio
+async def test_orphan_thumbnails(s3, db, user):
+    kept = f"{PREFIX}/user-a/{'1' * 64}.jpg"
+    orphan = f"{PREFIX}/user-a/{'2' * 64}.jpg"
+    # 원본이 이미 삭제된 썸네일
+    missing = f"{PREFIX}/user-a/{'3' * 64}.jpg"
+    _put(s3, kept, orphan, *thumbnail_service.thumbnail_keys(kept), *thumbnail_service.thumbnail_keys(orphan))
+    _put(s3, *thumbnail_service.thumbnail_keys(missing))
+    _register(db, user, kept)
+
+    stats = await orphan_image_service.sweep(prefix=PREFIX, grace_hours=0)
+
+    thumbnails = len(thumbnail_service.thumbnail_keys(kept))
+    assert (stats["orphans"], stats["orphan_thumbnails"]) == (1, 2 * thumbnails)
+    assert _keys(s3) == {kept, *thumbnail_service.thumbnail_keys(kept)}
+
+
+@pytest.mark.asyncio
+async def test_legacy_root_keys_between_user_folders(s3, db, user):
+    """root 폴더의 이전 버전 키는 사용자 폴더 사이에 섞여 나오고, 썸네일은 모든 사용자 폴더 뒤에 나옴"""
+    legacy_kept = f"{PREFIX}/5legacy_20240101.jpg"
+    legacy_orphan = f"{PREFIX}/6legacy_20240101.jpg"
+    user_folders = [f"{PREFIX}/0user/{'a' * 64}.jpg", f"{PREFIX}/9user/{'b' * 64}.jpg"]
+    _put(s3, legacy_kept, legacy_orphan, *user_folders)
+    _put(s3, *thumbnail_service.thumbnail_keys(legacy_kept), *thumbnail_service.thumbnail_keys(legacy_orphan))
+    _register(db, user, legacy_kept, *user_folders)
+
+    stats = await orphan_image_service.sweep(prefix=PREFIX, grace_hours=0)
+
+    assert stats["orphans"] == 1
+    assert stats["orphan_thumbnails"] == len(thumbnail_service.thumbnail_keys(legacy_orphan))
+    assert _keys(s3) == {legacy_kept, *user_folders, *thumbnail_service.thumbnail_keys(legacy_kept)}
@@ -0,0 +1,107 @@
+"""Prefetch (대상 중복 제거, 캐시 강제 갱신, movies upsert, 분산 락)"""
+import pytest
+from sqlalchemy import delete, select
+
+from app.config import settings
+from app.models.movie import Movie
+from app.services.cache_namespace import cache_namespace
+from app.services.external_api_service import external_api_service
+from app.services.prefetch_service import PREFETCH_LOCK_KEY, PrefetchService
+from app.services.redis_service import redis_service
+from devtools.fake_providers import FakeProviderServer
+from tests.conftest import TEST_KOBIS_PREFIX
+
+KOBIS_CODES = [f"{TEST_KOBIS_PREFIX}PF{n}" for n in range(3)]
+TMDB_IDS = [990100001, 990100002]
+
+
+@pytest.fixture(scope="module")
+def provider_server():
+    with FakeProviderServer() as server:
+        yield server
+
+
+@pytest.fixture
+def providers(provider_server, fake_redis, monkeypatch):
+    """가짜 provider + 대상 목록 고정 (일별/주간, now_playing/trending이 서로 겹치도록)"""
+    for name, value in provider_server.env().items():
+        if hasattr(settings, name) and name != "SUPABASE_JWKS_URL":
+            monkeypatch.setattr(settings, name, value)
+    monkeypatch.setattr(settings, "POSTER_MIRROR_ENABLED", False)
+
+    async def box_office(weekly=False):
+        return KOBIS_CODES[1:] if weekly else KOBIS_CODES[:2]
+
+    async def movie_list(kind):
+        return TMDB_IDS if kind == "now_playing" else [TMDB_IDS[1]]
+
+    monkeypatch.setattr(external_api_service, "get_kobis_box_office", box_office)
+    monkeypatch.setattr(external_api_service, "get_tmdb_movie_list", movie_list)
+    provider_server.reset_stats()
+    return provider_server
+
+
+@pytest.fixture
+def cleanup(db):
+    yield
+    db.rollback()
+    db.execute(delete(Movie).where(Movie.kobis_code.in_(KOBIS_CODES) | Movie.tmdb_id.in_(TMDB_IDS)))
+    db.commit()
+
+
+@pytest.mark.asyncio
+async def test_run_once_deduplicates_targets(providers, db, cleanup, monkeypatch):
+    requested = []
+    get_metadata_batch = external_api_service.get_metadata_batch
+
+    async def spy(items, force_refresh=False):
+        requested.append((list(items), force_refresh))
+        return await get_metadata_batch(items, force_refresh=force_refresh)
+
+    monkeypatch.setattr(external_api_service, "get_metadata_batch", spy)
+
+    result = await PrefetchService().run_once()
+
+    expected = [("kobis", code) for code in KOBIS_CODES] + [("tmdb", str(tmdb_id)) for tmdb_id in TMDB_IDS]
+    assert requested == [(expected, True)]
+    assert (result["targets"], result["cached"], result["upserted"]) == (5, 5, 5)
+    assert providers.stats["kobis"]["requests"] == len(KOBIS_CODES)
+
+    movies = db.execute(
+        select(Movie.kobis_code, Movie.tmdb_id).where(Movie.kobis_code.in_(KOBIS_CODES) | Movie.tmdb_id.in_(TMDB_IDS))
+    ).all()
+    assert len(movies) == 5
+
+
+@pytest.mark.asyncio
+async def test_force_refresh_overwrites_cache(providers, db, cleanup):
+    cache_key = await cache_namespace.key("kobis", f"movie:{KOBIS_CODES[0]}")
+    stale = {"title": "오래된 제목", "director": "?", "year": 1900, "runtime": 1, "genre": "?", "kobis_code": KOBIS_CODES[0]}
+    await redis_service.mset_json({cache_key: stale})
+
+    # 일반 조회는 캐시 사용
+    [(metadata, _)] = await external_api_service.get_metadata_batch([("kobis", KOBIS_CODES[0])])
+    assert metadata.title == "오래된 제목"
+
+    await PrefetchService().run_once()
+
+    refreshed = await redis_service.get_json(cache_key)
+    assert refreshed["title"] != "오래된 제목"
+    assert refreshed["kobis_code"] == KOBIS_CODES[0]
+
+
+@pytest.mark.asyncio
+async def test_lock_skips_second_worker(fake_redis, monkeypatch):
+    runs = []
+
+    async def run_once(self):
+        runs.append(self)
+        return {"targets": 0}
+
+    monkeypatch.setattr(PrefetchService, "run_once", run_once)
+    first, second = PrefetchService(), PrefetchService()
+
+    assert await first.run_locked() == {"targets": 0}
+    assert await second.run_locked() is None
+    assert runs == [first]
+    assert 0 < await fake_redis.ttl(PREFETCH_LOCK_KEY) <= settings.PREFETCH_INTERVAL_SECONDS
@@ -0,0 +1,61 @@
+"""
+조회 API 쿼리 수 상한 (QUERY_REPEAT_STRICT)
+
+- 테스트 사용자 라이브러리(12편)가 QUERY_REPEAT_THRESHOLD(5)보다 크므로
+  영화/컬렉션별로 쿼리를 반복하는 N+1은 예외(NPlusOneError)로 실패
+- 상한은 현재 쿼리 수 그대로 (쿼리가 늘어나면 의도한 변경인지 확인 후 조정)
+"""
+import pytest
+
+from app.config import settings
+
+
+# (경로, 첫 요청 쿼리 수 상한)
+BUDGETS = [
+    ("/api/v1/stats/", 6),
+    ("/api/v1/stats/best-movies", 1),
+    # user 1 + stats 6 + monthly/genres/best_movies/collections/movies 각 1
+    ("/api/v1/home", 12),
+    # 목록 1 + ETag validator 1
+    ("/api/v1/movies/", 2),
+    ("/api/v1/collections/", 1),
+]
+
+# 응답 캐시를 사용하는 API (두 번째 요청은 DB를 사용하지 않음)
+CACHED_PATHS = ["/api/v1/stats/", "/api/v1/stats/best-movies", "/api/v1/collections/"]
+
+
+def test_strict_mode_enabled():
+    assert settings.QUERY_REPEAT_STRICT is True
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path,max_queries", BUDGETS)
+async def test_query_budget(client, query_budget, path, max_queries):
+    with query_budget(max_queries):
+        response = await client.get(path)
+
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", CACHED_PATHS)
+async def test_cached_response_skips_database(client, query_budget, path):
+    first = await client.get(path)
+
+    with query_budget(0):
+        second = await client.get(path)
+
+    assert second.status_code == 200
+    assert second.json() == first.json()
+
+
+@pytest.mark.asyncio
+async def test_home_sections(client, user):
+    response = await client.get("/api/v1/home")
+
+    body = response.json()
+    assert body["errors"] == {}
+    assert len(body["movies"]) == len(user.user_movie_ids)
+    assert [movie["title"] for movie in body["best_movies"]] == ["테스트 영화 0"]
+    assert {collection["movie_count"] for collection in body["collections"]} == {5, 4}
@@ -0,0 +1,64 @@
+"""redis_service 배치 API (mget_json / mset_json / delete_many / pipeline)"""
+import pytest
+
+from app.services.redis_service import redis_service
+
+
+@pytest.mark.asyncio
+async def test_mset_json_round_trip(fake_redis):
+    await redis_service.mset_json({"tmdb:1": {"title": "하나"}, "tmdb:2": [1, 2]}, ttl=60)
+
+    values = await redis_service.mget_json(["tmdb:1", "tmdb:missing", "tmdb:2"])
+
+    assert values == [{"title": "하나"}, None, [1, 2]]
+    assert 0 < await fake_redis.ttl("tmdb:1") <= 60
+
+
+@pytest.mark.asyncio
+async def test_mset_json_per_key_ttl_and_tags(fake_redis):
+    await redis_service.mset_json(
+        {"a": 1, "b": 2},
+        ttl={"a": 30},
+        tags={"tag:movie": ["a", "b"], "tag:empty": []},
+    )
+
+    assert 0 < await fake_redis.ttl("a") <= 30
+    assert 30 < await fake_redis.ttl("b") <= 3600
+    assert set(await redis_service.smembers("tag:movie")) == {"a", "b"}
+    # 태그 Set은 가장 긴 캐시 TTL 동안 유지
+    assert 30 < await fake_redis.ttl("tag:movie") <= 3600
+    assert not await fake_redis.exists("tag:empty")
+
+
+@pytest.mark.asyncio
+async def test_empty_batches_skip_redis(fake_redis):
+    assert await redis_service.mget_json([]) == []
+    assert await redis_service.mget([]) == []
+    assert await redis_service.delete_many([]) == 0
+    await redis_service.mset_json({})
+
+    assert await fake_redis.dbsize() == 0
+
+
+@pytest.mark.asyncio
+async def test_delete_many(fake_redis):
+    await redis_service.mset_json({"a": 1, "b": 2, "c": 3})
+
+    assert await redis_service.delete_many(key for key in ["a", "c", "missing"]) == 2
+    assert await redis_service.mget_json(["a", "b", "c"]) == [None, 2, None]
+
+
+@pytest.mark.asyncio
+async def test_pipeline_discards_commands_on_error(fake_redis):
+    with pytest.raises(RuntimeError):
+        async with redis_service.pipeline() as pipe:
+            pipe.set("a", "1")
+            raise RuntimeError("boom")
+
+    assert await redis_service.get("a") is None
+
+    async with redis_service.transaction() as tx:
+        tx.set("a", "1")
+        tx.incr("counter")
+
+    assert await redis_service.mget(["a", "counter"]) == ["1", "1"]
@@ -0,0 +1,54 @@
+"""사용자별 응답 캐시 (ETag/304, 변경 API의 generation 무효화)"""
+import pytest
+
+from app.services.response_cache import response_cache
+
+
+@pytest.mark.asyncio
+async def test_cached_endpoint_returns_304_for_matching_etag(client, query_budget):
+    first = await client.get("/api/v1/stats/best-movies")
+    etag = first.headers["etag"]
+
+    with query_budget(0):
+        response = await client.get("/api/v1/stats/best-movies", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+
+@pytest.mark.asyncio
+async def test_mutation_invalidates_cached_stats(client, user):
+    before = await client.get("/api/v1/stats/")
+    assert before.json()["average_rating"] == 4.0
+
+    updated = await client.put(f"/api/v1/movies/{user.user_movie_ids[0]}", json={"rating": 5})
+    assert updated.status_code == 200
+
+    after = await client.get("/api/v1/stats/", headers={"If-None-Match": before.headers["etag"]})
+    assert after.status_code == 200
+    assert after.headers["etag"] != before.headers["etag"]
+    assert after.json()["average_rating"] > before.json()["average_rating"]
+
+
+@pytest.mark.asyncio
+async def test_invalidate_user_only_affects_that_user(client, user, fake_redis):
+    other_user = "00000000-0000-0000-0000-000000000000"
+
+    await response_cache.invalidate_user(user.id)
+
+    assert await response_cache.get_generation(user.id) == 1
+    assert await response_cache.get_generation(other_user) == 0
+
+
+@pytest.mark.asyncio
+async def test_cache_disabled_without_redis(client, fake_redis, monkeypatch):
+    async def unavailable(*args, **kwargs):
+        raise ConnectionError("redis down")
+
+    monkeypatch.setattr(fake_redis, "get", unavailable)
+
+    response = await client.get("/api/v1/stats/best-movies")
+
+    assert response.status_code == 200
+    assert "etag" not in response.headers
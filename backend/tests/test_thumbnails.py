@@ -0,0 +1,148 @@
+"""썸네일 파이프라인 (moto 버킷 + fakeredis 큐)"""
+import asyncio
+import json
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from app.config import settings
+from app.models.user_image import UserImage
+from app.services.s3_service import USER_IMAGE_FOLDER, s3_service
+from app.services.thumbnail_service import (
+    THUMBNAIL_FAILED_KEY,
+    THUMBNAIL_PROCESSING_KEY,
+    THUMBNAIL_QUEUE_KEY,
+    ThumbnailService,
+    render_variants,
+)
+from tests.conftest import TEST_BUCKET
+
+# EXIF Orientation 태그
+ORIENTATION = 0x0112
+
+
+def _jpeg(size, orientation=None) -> bytes:
+    buffer = BytesIO()
+    exif = Image.Exif()
+    if orientation:
+        exif[ORIENTATION] = orientation
+    Image.new("RGB", size, (200, 30, 30)).save(buffer, format="JPEG", exif=exif)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def thumbnails():
+    service = ThumbnailService()
+    yield service
+    service.close()
+
+
+@pytest.fixture
+def image(db, user, s3):
+    """moto 버킷에 원본을 올리고 user_images에 등록"""
+    file_key = f"{USER_IMAGE_FOLDER}/{user.id}/{'c' * 64}.jpg"
+    s3.put_object(Bucket=TEST_BUCKET, Key=file_key, Body=_jpeg((800, 600)))
+    row = UserImage(
+        user_id=user.id,
+        user_movie_id=user.user_movie_ids[0],
+        image_type="ticket",
+        image_url=s3_service.object_url(file_key),
+        file_key=file_key,
+    )
+    db.add(row)
+    db.commit()
+    return row
+
+
+def test_render_variants_does_not_upscale():
+    variants = render_variants(_jpeg((300, 150)), [100, 600], "webp", 80)
+
+    sizes = {width: Image.open(BytesIO(data)).size for width, data in variants.items()}
+    assert sizes == {100: (100, 50), 600: (300, 150)}
+
+
+def test_render_variants_applies_exif_orientation():
+    # Orientation 6: 90도 회전해서 보여야 하는 사진 (가로로 저장된 세로 사진)
+    variants = render_variants(_jpeg((200, 100), orientation=6), [50], "webp", 80)
+
+    assert Image.open(BytesIO(variants[50])).size == (50, 100)
+
+
+@pytest.mark.asyncio
+async def test_process_uploads_every_width(thumbnails, image, s3, db, fake_redis):
+    thumbnail_url = await thumbnails.process(image.id)
+
+    widths = sorted(set(settings.THUMBNAIL_WIDTHS))
+    keys = [thumbnails.thumbnail_key(image.file_key, width, "webp") for width in widths]
+    assert thumbnail_url == s3_service.object_url(keys[0])
+    for key, width in zip(keys, widths):
+        obj = s3.get_object(Bucket=TEST_BUCKET, Key=key)
+        assert obj["ContentType"] == "image/webp"
+        assert Image.open(BytesIO(obj["Body"].read())).width == width
+
+    db.expire_all()
+    assert db.get(UserImage, image.id).thumbnail_url == thumbnail_url
+
+
+@pytest.mark.asyncio
+async def test_process_is_idempotent(thumbnails, image, fake_redis, monkeypatch):
+    first = await thumbnails.process(image.id)
+
+    uploads = []
+
+    async def upload(*args, **kwargs):
+        uploads.append(args[0])
+
+    monkeypatch.setattr(s3_service, "upload", upload)
+
+    assert await thumbnails.process(image.id) == first
+    assert uploads == []
+
+    await thumbnails.process(image.id, force=True)
+    assert len(uploads) == len(set(settings.THUMBNAIL_WIDTHS))
+
+
+@pytest.mark.asyncio
+async def test_worker_recovers_in_flight_jobs(thumbnails, fake_redis):
+    processing_key = THUMBNAIL_PROCESSING_KEY.format(worker_id="w1")
+    jobs = [json.dumps({"image_id": image_id, "attempts": 0}) for image_id in (1, 2)]
+    await fake_redis.lpush(processing_key, *jobs)
+
+    stop = asyncio.Event()
+    stop.set()
+    await thumbnails.run_worker("w1", stop)
+
+    assert await fake_redis.llen(processing_key) == 0
+    # lpush로 쌓인 순서 그대로 (오른쪽 = 먼저 처리)
+    assert [job.decode() for job in await fake_redis.lrange(THUMBNAIL_QUEUE_KEY, 0, -1)] == jobs[::-1]
+
+
+@pytest.mark.asyncio
+async def test_failing_job_moves_to_failed_list(thumbnails, fake_redis, monkeypatch):
+    monkeypatch.setattr(settings, "THUMBNAIL_WORKER_CONCURRENCY", 1)
+    calls = []
+
+    async def process(image_id, force=False):
+        calls.append(image_id)
+        raise RuntimeError("decode error")
+
+    monkeypatch.setattr(thumbnails, "process", process)
+    await thumbnails.enqueue(7)
+
+    stop = asyncio.Event()
+    worker = asyncio.create_task(thumbnails.run_worker("w1", stop))
+    for _ in range(100):
+        if await fake_redis.llen(THUMBNAIL_FAILED_KEY):
+            break
+        await asyncio.sleep(0.05)
+    stop.set()
+    await asyncio.wait_for(worker, timeout=5)
+
+    failed = [json.loads(job) for job in await fake_redis.lrange(THUMBNAIL_FAILED_KEY, 0, -1)]
+    assert calls == [7] * settings.THUMBNAIL_MAX_ATTEMPTS
+    assert [(job["image_id"], job["attempts"], job["error"]) for job in failed] == [
+        (7, settings.THUMBNAIL_MAX_ATTEMPTS, "decode error")
+    ]
+    assert await fake_redis.llen(THUMBNAIL_QUEUE_KEY) == 0
+    assert await fake_redis.llen(THUMBNAIL_PROCESSING_KEY.format(worker_id="w1")) == 0
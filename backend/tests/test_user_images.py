@@ -0,0 +1,90 @@
+"""사용자 이미지 내용 기반 키 / 등록 소유권 / 공유 키 삭제 (moto 버킷)"""
+import hashlib
+
+import pytest
+
+from app.services.s3_service import USER_IMAGE_FOLDER
+from app.services.thumbnail_service import thumbnail_service
+from tests.conftest import TEST_BUCKET
+
+CONTENT = b"\xff\xd8\xff\xe0 ticket"
+SHA256 = hashlib.sha256(CONTENT).hexdigest()
+
+
+def _exists(s3, key: str) -> bool:
+    return s3.list_objects_v2(Bucket=TEST_BUCKET, Prefix=key).get("KeyCount", 0) > 0
+
+
+async def _upload(client, s3) -> dict:
+    response = await client.post(
+        "/api/v1/media/upload",
+        json={"file_name": "Ticket.JPG", "file_type": "image/jpeg", "content_sha256": SHA256},
+    )
+    assert response.status_code == 200
+    upload = response.json()["data"]
+    s3.put_object(Bucket=TEST_BUCKET, Key=upload["file_key"], Body=CONTENT)
+    return upload
+
+
+async def _register(client, user_movie_id: int, upload: dict):
+    return await client.post("/api/v1/media/user-images", json={
+        "user_movie_id": user_movie_id,
+        "image_type": "ticket",
+        "image_url": upload["file_url"],
+        "file_key": upload["file_key"],
+    })
+
+
+@pytest.mark.asyncio
+async def test_content_addressed_key(client, user, s3):
+    upload = await _upload(client, s3)
+
+    assert upload["file_key"] == f"{USER_IMAGE_FOLDER}/{user.id}/{SHA256}.jpg"
+    assert upload["already_uploaded"] is False
+
+    assert (await _register(client, user.user_movie_ids[0], upload)).status_code == 201
+    again = await _upload(client, s3)
+    assert again["file_key"] == upload["file_key"]
+    assert again["already_uploaded"] is True
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("file_key", [
+    f"{USER_IMAGE_FOLDER}/00000000-0000-0000-0000-000000000000/{SHA256}.jpg",
+    f"{USER_IMAGE_FOLDER}/{{user_id}}/../00000000-0000-0000-0000-000000000000/{SHA256}.jpg",
+    f"other-folder/{SHA256}.jpg",
+])
+async def test_register_rejects_foreign_keys(client, user, s3, file_key):
+    file_key = file_key.replace("{user_id}", user.id)
+    response = await _register(client, user.user_movie_ids[0], {"file_url": f"https://cdn.test/{file_key}", "file_key": file_key})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_register_requires_own_movie(client, user, s3):
+    upload = await _upload(client, s3)
+
+    response = await _register(client, -1, upload)
+
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_shared_key_deleted_with_last_image(client, user, s3):
+    upload = await _upload(client, s3)
+    thumbnails = thumbnail_service.thumbnail_keys(upload["file_key"])
+    for key in thumbnails:
+        s3.put_object(Bucket=TEST_BUCKET, Key=key, Body=b"thumbnail")
+    image_ids = [
+        (await _register(client, user_movie_id, upload)).json()["data"]["id"]
+        for user_movie_id in user.user_movie_ids[:2]
+    ]
+
+    assert (await client.delete(f"/api/v1/media/user-images/{image_ids[0]}")).status_code == 200
+    assert _exists(s3, upload["file_key"])
+    assert all(_exists(s3, key) for key in thumbnails)
+
+    assert (await client.delete(f"/api/v1/media/user-images/{image_ids[1]}")).status_code == 200
+    assert not _exists(s3, upload["file_key"])
+    assert not any(_exists(s3, key) for key in thumbnails)
@@ -0,0 +1,87 @@
+"""라이브러리 영화 추가/수정 (POST /movies/, PUT /movies/{id})"""
+import uuid
+
+import pytest
+from sqlalchemy import select
+
+from app.models.movie import Movie
+from app.models.user_movie import UserMovie
+from tests.conftest import TEST_KOBIS_PREFIX
+
+
+@pytest.fixture
+def new_movie(db, user):
+    """라이브러리에 없는 영화 (user fixture 정리 시 함께 삭제되는 kobis_code)"""
+    movie = Movie(kobis_code=f"{TEST_KOBIS_PREFIX}{uuid.UUID(user.id).hex[:8]}99", title_ko="새 영화")
+    db.add(movie)
+    db.commit()
+    return movie.id
+
+
+@pytest.mark.asyncio
+async def test_add_movie_maps_review_and_life_movie(client, db, query_budget, new_movie):
+    with query_budget(1):
+        response = await client.post("/api/v1/movies/", json={
+            "movie_id": new_movie, "status": "completed", "rating": 4,
+            "review": "한줄평", "is_life_movie": True,
+        })
+
+    assert response.status_code == 201
+    body = response.json()
+    assert (body["review"], body["is_life_movie"]) == ("한줄평", True)
+    row = db.execute(
+        select(UserMovie.one_line_review, UserMovie.is_best_movie).where(UserMovie.id == body["id"])
+    ).one()
+    assert tuple(row) == ("한줄평", True)
+
+
+@pytest.mark.asyncio
+async def test_add_unknown_movie(client, query_budget):
+    with query_budget(1):
+        response = await client.post("/api/v1/movies/", json={"movie_id": 2_000_000_000, "status": "watchlist"})
+
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_add_duplicate_movie(client, query_budget, user):
+    with query_budget(1):
+        response = await client.post("/api/v1/movies/", json={"movie_id": user.movie_ids[0], "status": "watchlist"})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_update_movie_maps_review_and_life_movie(client, db, query_budget, user):
+    user_movie_id = user.user_movie_ids[1]
+    with query_budget(1):
+        response = await client.put(f"/api/v1/movies/{user_movie_id}", json={"review": "수정", "is_life_movie": True})
+
+    assert response.status_code == 200
+    assert (response.json()["review"], response.json()["is_life_movie"]) == ("수정", True)
+    row = db.execute(
+        select(UserMovie.one_line_review, UserMovie.is_best_movie, UserMovie.status).where(UserMovie.id == user_movie_id)
+    ).one()
+    assert tuple(row) == ("수정", True, "completed")
+
+
+@pytest.mark.asyncio
+async def test_update_other_users_movie(client, db, query_budget, other_user_movie):
+    with query_budget(1):
+        response = await client.put(f"/api/v1/movies/{other_user_movie}", json={"status": "completed"})
+
+    assert response.status_code == 404
+    assert db.get(UserMovie, other_user_movie).status == "watchlist"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method,path,payload", [
+    ("post", "/api/v1/movies/", {"status": "watchlist", "is_favorite": True}),
+    ("put", "/api/v1/movies/{id}", {"is_favorite": True}),
+])
+async def test_is_favorite_rejected(client, query_budget, user, new_movie, method, path, payload):
+    payload = {"movie_id": new_movie, **payload} if method == "post" else payload
+    with query_budget(0):
+        response = await client.request(method, path.format(id=user.user_movie_ids[0]), json=payload)
+
+    assert response.status_code == 422